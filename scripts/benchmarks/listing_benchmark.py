@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the per-PR cost of listing closed PRs.
+
+Compares building a PyGithub PullRequest object for every scanned PR, as the
+listing once did, with the raw JSON listing of GitHubRepository, which
+rejects PRs outside the window on their raw timestamps and projects only
+the fields of PullRequestBasicInfo. Both read the same synthetic pages of the
+pulls list endpoint from memory, so no request is sent.
+
+Usage:
+    python scripts/benchmarks/listing_benchmark.py [--prs 10000] [--in-range 0.2]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the parent directory to Python path to enable relative imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from github import Github
+from github.PullRequest import PullRequest
+
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.repositories.github_repository import GitHubRepository
+from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+
+PER_PAGE = 100
+REPO_ID = RepositoryIdentifier(owner="octo-org", name="octo-repo")
+NEWEST_UPDATE = datetime(2025, 6, 30, tzinfo=timezone.utc)
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _user_payload(login: str) -> Dict[str, Any]:
+    url = f"https://api.github.com/users/{login}"
+    return {
+        "login": login, "id": 1, "node_id": "MDQ6VXNlcjE=", "avatar_url": "https://avatars.githubusercontent.com/u/1",
+        "gravatar_id": "", "url": url, "html_url": f"https://github.com/{login}",
+        "followers_url": f"{url}/followers", "following_url": f"{url}/following{{/other_user}}",
+        "gists_url": f"{url}/gists{{/gist_id}}", "starred_url": f"{url}/starred{{/owner}}{{/repo}}",
+        "subscriptions_url": f"{url}/subscriptions", "organizations_url": f"{url}/orgs",
+        "repos_url": f"{url}/repos", "events_url": f"{url}/events{{/privacy}}",
+        "received_events_url": f"{url}/received_events", "type": "User", "site_admin": False
+    }
+
+
+def _repo_payload() -> Dict[str, Any]:
+    url = f"https://api.github.com/repos/{REPO_ID.to_string()}"
+    return {
+        "id": 2, "node_id": "MDEwOlJlcG9zaXRvcnky", "name": REPO_ID.name, "full_name": REPO_ID.to_string(),
+        "private": False, "owner": _user_payload(REPO_ID.owner), "html_url": f"https://github.com/{REPO_ID.to_string()}",
+        "description": "Benchmark repository", "fork": False, "url": url,
+        "pulls_url": f"{url}/pulls{{/number}}", "issues_url": f"{url}/issues{{/number}}",
+        "created_at": "2015-01-01T00:00:00Z", "updated_at": "2025-06-30T00:00:00Z",
+        "pushed_at": "2025-06-30T00:00:00Z", "default_branch": "main", "language": "Python",
+        "stargazers_count": 1000, "watchers_count": 1000, "forks_count": 100, "open_issues_count": 10,
+        "visibility": "public", "topics": ["benchmark"], "archived": False, "disabled": False
+    }
+
+
+def _pr_payload(number: int, updated_at: datetime, closed_at: datetime) -> Dict[str, Any]:
+    """Build a pulls list item with the fields GitHub returns for it."""
+    url = f"https://api.github.com/repos/{REPO_ID.to_string()}/pulls/{number}"
+    repo = _repo_payload()
+    return {
+        "url": url, "id": 1000 + number, "node_id": f"PR_{number}", "number": number, "state": "closed",
+        "locked": False, "title": f"Change number {number}", "user": _user_payload(f"author{number % 50}"),
+        "body": "Benchmark pull request body.\n" * 5, "html_url": f"https://github.com/{REPO_ID.to_string()}/pull/{number}",
+        "diff_url": f"{url}.diff", "patch_url": f"{url}.patch", "issue_url": f"{url}/issue",
+        "commits_url": f"{url}/commits", "review_comments_url": f"{url}/comments",
+        "review_comment_url": f"{url}/comments{{/number}}", "comments_url": f"{url}/issue-comments",
+        "statuses_url": f"{url}/statuses",
+        "created_at": _timestamp(closed_at - timedelta(days=2)), "updated_at": _timestamp(updated_at),
+        "closed_at": _timestamp(closed_at), "merged_at": _timestamp(closed_at) if number % 3 else None,
+        "merge_commit_sha": f"{number:040x}", "assignee": None, "assignees": [], "requested_reviewers": [],
+        "requested_teams": [], "labels": [{"id": 3, "name": "enhancement", "color": "a2eeef", "default": True}],
+        "milestone": None, "draft": False,
+        "head": {"label": f"octo-org:feature-{number}", "ref": f"feature-{number}", "sha": f"{number:040x}",
+                 "user": _user_payload(REPO_ID.owner), "repo": repo},
+        "base": {"label": "octo-org:main", "ref": "main", "sha": f"{number + 1:040x}",
+                 "user": _user_payload(REPO_ID.owner), "repo": repo},
+        "_links": {"self": {"href": url}, "html": {"href": f"https://github.com/{REPO_ID.to_string()}/pull/{number}"}},
+        "author_association": "MEMBER", "auto_merge": None, "active_lock_reason": None
+    }
+
+
+def build_pages(pr_count: int, in_range: float) -> Tuple[List[str], DateRange]:
+    """Build JSON pages sorted by update time and a window holding a share of their PRs.
+
+    PRs are updated one hour apart. A PR updated within the window also closed
+    there, while PRs updated after the window were closed long before it, as
+    PRs commented on after being closed are.
+    """
+    in_range_count = max(1, int(pr_count * in_range))
+    window_end = NEWEST_UPDATE - timedelta(hours=pr_count - in_range_count)
+    window = DateRange(start_date=window_end - timedelta(hours=in_range_count), end_date=window_end)
+
+    payloads = []
+    for index in range(pr_count):
+        updated_at = NEWEST_UPDATE - timedelta(hours=index)
+        closed_at = updated_at if updated_at <= window_end else window.start_date - timedelta(days=30)
+        payloads.append(_pr_payload(pr_count - index, updated_at, closed_at))
+    pages = [json.dumps(payloads[start:start + PER_PAGE]) for start in range(0, pr_count, PER_PAGE)]
+    return pages, window
+
+
+class _InMemoryRequester:
+    """Answers paginated list requests with prepared JSON pages."""
+
+    def __init__(self, pages: List[str]):
+        self._pages = pages
+
+    def requestJsonAndCheck(self, verb: str, url: str, parameters: Dict[str, Any] = None) -> Tuple[Dict[str, str], Any]:
+        page = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+        headers = {}
+        if page < len(self._pages):
+            headers["link"] = f'<https://api.github.com/repos/{REPO_ID.to_string()}/pulls?page={page + 1}>; rel="next"'
+        return headers, json.loads(self._pages[page - 1])
+
+
+class _InMemoryClient:
+    def __init__(self, pages: List[str]):
+        self.requester = _InMemoryRequester(pages)
+
+
+def list_with_pygithub_objects(pages: List[str], window: DateRange, timezone_converter: TimezoneConverter) -> List[PullRequestBasicInfo]:
+    """List the window as the PyGithub listing did, building a PullRequest for every scanned PR."""
+    requester = Github().requester
+    basic_infos = []
+    for page in pages:
+        for pr_payload in json.loads(page):
+            pr = PullRequest(requester, {}, pr_payload, completed=False)
+            if pr.closed_at is None:
+                continue
+            closed_at = timezone_converter.convert_to_target_timezone(pr.closed_at)
+            if window.contains(closed_at):
+                basic_infos.append(PullRequestBasicInfo(
+                    number=pr.number,
+                    title=pr.title,
+                    closed_at=closed_at,
+                    # "merged" is missing from list payloads and would be completed with a request
+                    is_merged=pr.merged_at is not None,
+                    repository_id=REPO_ID
+                ))
+            elif pr.updated_at < window.start_date:
+                return basic_infos
+    return basic_infos
+
+
+def list_with_raw_payloads(pages: List[str], window: DateRange, timezone_converter: TimezoneConverter) -> List[PullRequestBasicInfo]:
+    """List the window with the raw JSON scan of GitHubRepository."""
+    repository = GitHubRepository(_InMemoryClient(pages), timezone_converter, listing_strategy="scan")
+    return list(repository.find_closed_prs_basic_info(REPO_ID, window))
+
+
+def measure(listing: Callable[[], List[PullRequestBasicInfo]], repeat: int) -> Tuple[float, int, int]:
+    """Measure the best run time, the PRs listed and the peak traced memory of a listing."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        listed = len(listing())
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    deque(listing(), maxlen=0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), listed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the per-PR cost of PyGithub objects and raw JSON listing")
+    parser.add_argument("--prs", type=int, default=10000, help="Number of closed PRs scanned (default: 10000)")
+    parser.add_argument("--in-range", type=float, default=0.2, help="Share of scanned PRs closed in the window (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per listing; the fastest is reported (default: 5)")
+    parser.add_argument("--timezone", default="Asia/Tokyo", help="Target timezone of the listed PRs (default: Asia/Tokyo)")
+    args = parser.parse_args()
+
+    pages, window = build_pages(args.prs, args.in_range)
+    timezone_converter = TimezoneConverter(args.timezone)
+    listings = {
+        "pygithub objects": lambda: list_with_pygithub_objects(pages, window, timezone_converter),
+        "raw json": lambda: list_with_raw_payloads(pages, window, timezone_converter),
+    }
+
+    print(f"Scanning {args.prs} PRs in {len(pages)} pages, {args.in_range:.0%} closed in the window")
+    print(f"{'listing':<18}{'listed':>8}{'total ms':>11}{'us/PR':>9}{'peak KiB':>10}")
+    results = {}
+    for name, listing in listings.items():
+        seconds, listed, peak = measure(listing, args.repeat)
+        results[name] = seconds
+        print(f"{name:<18}{listed:>8}{seconds * 1000:>11.1f}{seconds / args.prs * 1e6:>9.2f}{peak / 1024:>10.0f}")
+    print(f"raw json is {results['pygithub objects'] / results['raw json']:.1f}x faster per scanned PR")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 Application services package.
 """
 
+from .multi_repository_collection_service import MultiRepositoryCollectionService
 from .pr_review_collection_service import PRReviewCollectionService
 
 __all__ = [
+    "MultiRepositoryCollectionService",
     "PRReviewCollectionService"
 ]
\ No newline at end of file
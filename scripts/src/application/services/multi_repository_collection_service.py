@@ -0,0 +1,182 @@
+"""
+Application service for collecting PR review comments of many repositories.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ...domain.comment_filter_rules import CommentFilterRules
+from ...domain.date_range import DateRange
+from ...domain.repository_identifier import RepositoryIdentifier
+from ...domain.workspace_config import WorkspaceConfig
+from ...domain.workspace_config_generator import WorkspaceConfigGenerator
+from ...domain.workspace_path_calculator import WorkspacePathCalculator
+from ...domain.interfaces.github_repository_interface import GitHubRepositoryInterface
+from ..exceptions.pr_review_collection_error import PRReviewCollectionError
+from .pr_review_collection_service import PRReviewCollectionService
+
+
+class MultiRepositoryCollectionService:
+    """Application service collecting several repositories concurrently.
+
+    Each repository is collected straight into its own workspace directory,
+    workspaces/<owner>/<repo>, so no workspace has to be switched. The
+    repository currently in workspace/ is collected there instead, so the next
+    workspace switch does not overwrite it with a stale copy. Each repository
+    is filtered by the comment filter rules of its own workspace.yml. All
+    collection services share the GitHub clients and therefore one rate-limit
+    budget.
+    """
+
+    def __init__(
+        self,
+        collection_service_factory: Callable[[CommentFilterRules], PRReviewCollectionService],
+        github_repository: GitHubRepositoryInterface,
+        repository_concurrency: int = 4,
+        config_generator: Optional[WorkspaceConfigGenerator] = None
+    ):
+        """Initialize multi-repository collection service.
+
+        Args:
+            collection_service_factory: Factory creating the collection service
+                of one repository with the repository's comment filter rules; a
+                run keeps per-run state, so every repository gets its own service
+            github_repository: GitHub repository used to list organization repositories
+            repository_concurrency: Number of repositories collected in parallel
+            config_generator: Generator of workspace.yml for new workspace directories
+
+        Raises:
+            ValueError: If repository_concurrency is less than 1
+        """
+        if repository_concurrency < 1:
+            raise ValueError(f"Repository concurrency must be at least 1, got {repository_concurrency}")
+
+        self._collection_service_factory = collection_service_factory
+        self._github_repository = github_repository
+        self._repository_concurrency = repository_concurrency
+        self._config_generator = config_generator or WorkspaceConfigGenerator()
+        self._logger = logging.getLogger("fetch")
+
+    def list_organization_repositories(self, owner: str) -> List[RepositoryIdentifier]:
+        """List the repositories of an organization or user.
+
+        Args:
+            owner: Organization or user login
+
+        Returns:
+            Repository identifiers
+
+        Raises:
+            PRReviewCollectionError: If the repositories cannot be listed
+        """
+        try:
+            repository_ids = self._github_repository.list_repositories(owner)
+        except Exception as e:
+            raise PRReviewCollectionError(f"Failed to list repositories of {owner}: {e}") from e
+        self._logger.info(f"Found {len(repository_ids)} repositories of {owner}")
+        return repository_ids
+
+    def collect_review_comments(
+        self,
+        repository_ids: List[RepositoryIdentifier],
+        date_range: Optional[DateRange],
+        sync: bool = False,
+        resume: bool = False,
+        retry_failed: bool = False
+    ) -> None:
+        """Collect review comments of several repositories in parallel.
+
+        A failing repository does not stop the others; the failures are
+        reported together once every repository finished.
+
+        Args:
+            repository_ids: Repositories to collect
+            date_range: Date range for filtering PRs; not used with retry_failed
+            sync: Also refresh saved PRs with comments changed since the last sync
+            resume: Resume interrupted runs of the same date range
+            retry_failed: Only fetch the PRs on the dead-letter list of each repository again
+
+        Raises:
+            PRReviewCollectionError: If collecting any repository fails
+        """
+        current_repository_id = self._current_repository_id()
+        failures: Dict[str, Exception] = {}
+
+        with ThreadPoolExecutor(max_workers=self._repository_concurrency, thread_name_prefix="repo") as executor:
+            futures = {
+                repository_id.to_string(): executor.submit(
+                    self._collect_repository,
+                    repository_id,
+                    date_range,
+                    self._config_path(repository_id, current_repository_id),
+                    sync,
+                    resume,
+                    retry_failed
+                )
+                for repository_id in dict.fromkeys(repository_ids)
+            }
+            for repository_spec, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    self._logger.error(f"Failed to collect {repository_spec}: {e}")
+                    failures[repository_spec] = e
+
+        self._logger.info(f"Collected {len(futures) - len(failures)} of {len(futures)} repositories.")
+        if failures:
+            raise PRReviewCollectionError(f"Failed to collect {len(failures)} repositories: {', '.join(failures)}")
+
+    def _collect_repository(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: Optional[DateRange],
+        config_path: Path,
+        sync: bool,
+        resume: bool,
+        retry_failed: bool = False
+    ) -> None:
+        """Collect one repository with its own collection service.
+
+        The repository is collected into the directory of its workspace.yml,
+        applying the comment filter rules configured there.
+        """
+        output_directory = config_path.parent
+        comment_filter_rules = WorkspaceConfig(config_path).get_comment_filter_rules()
+        collection_service = self._collection_service_factory(comment_filter_rules)
+        if retry_failed:
+            collection_service.retry_failed_prs(repository_id, output_directory)
+        elif sync:
+            collection_service.sync_review_comments(repository_id, date_range, output_directory, resume=resume)
+        else:
+            collection_service.collect_review_comments(repository_id, date_range, output_directory, resume=resume)
+
+    def _config_path(
+        self,
+        repository_id: RepositoryIdentifier,
+        current_repository_id: Optional[RepositoryIdentifier]
+    ) -> Path:
+        """Get the workspace.yml of the workspace directory a repository is collected into.
+
+        A workspace.yml is created in new workspace directories, so they can be
+        switched to later.
+        """
+        if repository_id == current_repository_id:
+            return WorkspacePathCalculator.get_workspace_config_path()
+
+        config_path = WorkspacePathCalculator.get_repository_backup_config_path(repository_id)
+        if not config_path.exists():
+            self._config_generator.create_workspace_config_file(repository_id, config_path)
+        return config_path
+
+    def _current_repository_id(self) -> Optional[RepositoryIdentifier]:
+        """Get the repository of the current workspace, or None if there is none."""
+        config_path = WorkspacePathCalculator.get_workspace_config_path()
+        if not config_path.exists():
+            return None
+        try:
+            return WorkspaceConfig(config_path).get_repository_identifier()
+        except (KeyError, ValueError) as e:
+            self._logger.warning(f"Ignoring unreadable workspace configuration: {e}")
+            return None
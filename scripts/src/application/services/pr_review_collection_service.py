@@ -3,25 +3,63 @@ Application service for PR review collection.
 """
 
 import logging
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import ContextManager, Deque, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
+from ...domain.date_partitioning import DatePartitioning
 from ...domain.date_range import DateRange
+from ...domain.failed_pull_request import FailedPullRequest
+from ...domain.fetch_checkpoint import FetchCheckpoint
+from ...domain.fetch_plan import FetchPlan
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.pull_request_catalog import PullRequestCatalog
+from ...domain.pull_request_catalog_entry import PullRequestCatalogEntry
 from ...domain.pull_request_metadata import PullRequestMetadata
+from ...domain.pull_request_selection import PullRequestSelection
 from ...domain.repository_identifier import RepositoryIdentifier
+from ...domain.sync_state import SyncState
 from ...domain.interfaces.github_repository_interface import GitHubRepositoryInterface
 from ...domain.interfaces.pull_request_metadata_repository_interface import PullRequestMetadataRepositoryInterface
 from ...domain.interfaces.comment_filter_interface import CommentFilterInterface
+from ...domain.interfaces.pull_request_detail_fetcher_interface import PullRequestDetailFetcherInterface
+from ...domain.interfaces.pull_request_catalog_repository_interface import PullRequestCatalogRepositoryInterface
+from ...domain.interfaces.sync_state_repository_interface import SyncStateRepositoryInterface
+from ...domain.interfaces.fetch_journal_interface import FetchJournalInterface
+from ...domain.interfaces.dead_letter_repository_interface import DeadLetterRepositoryInterface
+from ...domain.interfaces.fetch_budget_interface import FetchBudgetInterface
+from ...domain.interfaces.fetch_metrics_interface import FetchMetricsInterface
 from ..exceptions.pr_review_collection_error import PRReviewCollectionError
 
 
 class PRReviewCollectionService:
     """Application service for collecting PR review comments."""
     
+    # Number of detail fetches queued per worker so workers stay busy while results are saved
+    _PENDING_FETCHES_PER_WORKER = 2
+    
+    # PRs returned per page when the uncovered ranges are listed
+    _LISTING_PAGE_SIZE = 100
+    
     def __init__(
         self,
         github_repository: GitHubRepositoryInterface,
         pr_metadata_repository: PullRequestMetadataRepositoryInterface,
-        comment_filter: CommentFilterInterface
+        comment_filter: CommentFilterInterface,
+        concurrency: int = 1,
+        detail_fetcher: Optional[PullRequestDetailFetcherInterface] = None,
+        pr_catalog_repository: Optional[PullRequestCatalogRepositoryInterface] = None,
+        sync_state_repository: Optional[SyncStateRepositoryInterface] = None,
+        fetch_journal: Optional[FetchJournalInterface] = None,
+        selection: Optional[PullRequestSelection] = None,
+        dead_letter_repository: Optional[DeadLetterRepositoryInterface] = None,
+        partitioning: Optional[DatePartitioning] = None,
+        fetch_budget: Optional[FetchBudgetInterface] = None,
+        fetch_metrics: Optional[FetchMetricsInterface] = None
     ):
         """Initialize PR review collection service.
         
@@ -29,17 +67,57 @@ class PRReviewCollectionService:
             github_repository: GitHub repository interface
             pr_metadata_repository: PR metadata repository
             comment_filter: Comment filtering strategy
+            concurrency: Number of PR detail fetches run in parallel
+            detail_fetcher: Optional batch fetcher for PR details; when omitted,
+                each PR is fetched through github_repository
+            pr_catalog_repository: Optional repository of the local PR catalog;
+                when given, closed-date ranges listed before are answered from
+                the catalog and only the remaining gaps are listed from GitHub
+            sync_state_repository: Optional repository of the sync high-water
+                mark; required by sync_review_comments
+            fetch_journal: Optional journal recording the progress of each run
+                so an interrupted run can be resumed
+            selection: Optional predicates evaluated on the listing data of each
+                PR; PRs they reject are not fetched in detail
+            dead_letter_repository: Optional repository of the dead-letter list;
+                when given, PRs whose details cannot be fetched are recorded
+                there and the run continues, otherwise the run fails
+            partitioning: Optional splitting of the date range into windows
+                listed concurrently, each recorded in the fetch journal once
+                listed; without it the range is listed as one stream
+            fetch_budget: Optional budget of requests and time; once it is used
+                up, collection stops between PRs and can be resumed
+            fetch_metrics: Optional metrics the time spent listing, fetching
+                details and filtering comments is recorded in, together with
+                the saved PRs and comments
+        
+        Raises:
+            ValueError: If concurrency is less than 1
         """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        
         self._github_repository = github_repository
         self._pr_metadata_repository = pr_metadata_repository
         self._comment_filter = comment_filter
+        self._concurrency = concurrency
+        self._detail_fetcher = detail_fetcher
+        self._pr_catalog_repository = pr_catalog_repository
+        self._sync_state_repository = sync_state_repository
+        self._fetch_journal = fetch_journal
+        self._selection = selection
+        self._dead_letter_repository = dead_letter_repository
+        self._partitioning = partitioning
+        self._fetch_budget = fetch_budget
+        self._fetch_metrics = fetch_metrics
         self._logger = logging.getLogger("fetch")
     
     def collect_review_comments(
         self,
         repository_id: RepositoryIdentifier,
         date_range: DateRange,
-        output_directory: Path
+        output_directory: Path,
+        resume: bool = False
     ) -> None:
         """Collect review comments from PRs in the specified date range.
         
@@ -47,42 +125,708 @@ class PRReviewCollectionService:
             repository_id: Target repository identifier
             date_range: Date range for filtering PRs
             output_directory: Output directory for results
+            resume: Continue the interrupted run recorded in the fetch journal;
+                PRs it listed are not listed again, and PRs it did not finish
+                saving are fetched again even if their files exist
+        
+        When the fetch budget is used up, no further PR is listed or fetched.
+        Detail fetches already running are saved, queued ones are cancelled,
+        and the journal is left open so the run can be resumed.
         
         Raises:
-            PRReviewCollectionError: If collection fails
+            PRReviewCollectionError: If collection fails; with a dead-letter
+                repository, failed detail fetches do not fail the run
         """
+        exhausted_reason = self._exhausted_budget_reason()
+        if exhausted_reason is not None:
+            self._logger.warning(f"Skipping collection for {repository_id.to_string()}: {exhausted_reason}")
+            return
+        
         self._logger.info(f"Starting collection for {repository_id.to_string()}")
         self._logger.info(f"Period: {date_range.start_date.date()} to {date_range.end_date.date()}")
         self._logger.info(f"Searching for PRs closed between {date_range.start_date.strftime('%Y-%m-%d %H:%M:%S%z')} and {date_range.end_date.strftime('%Y-%m-%d %H:%M:%S%z')}")
         
+        catalog = self._load_catalog(repository_id, output_directory)
+        checkpoint = self._load_checkpoint(repository_id, date_range, output_directory, resume)
+        dead_letters = self._load_dead_letters(repository_id, output_directory)
         try:
-            # Find and process PRs in streaming fashion
+            self._start_journal(repository_id, date_range, output_directory, checkpoint)
+            
+            # Find PRs in streaming fashion while their details are fetched in parallel
             processed_count = 0
             total_found = 0
             skipped_count = 0
+            deselected_count = 0
+            seen_numbers = set()
+            unfetched: List[PullRequestBasicInfo] = []
+            pending_batch: List[PullRequestBasicInfo] = []
+            pending_fetches: Deque[Tuple[List[PullRequestBasicInfo], Future]] = deque()
+            max_pending_fetches = self._concurrency * self._PENDING_FETCHES_PER_WORKER
             
-            for basic_info in self._github_repository.find_closed_prs_basic_info(
-                repository_id, 
-                date_range
-            ):
-                total_found += 1
-                
-                # Check if files already exist
-                if self._pr_metadata_repository.exists(basic_info, output_directory):
-                    skipped_count += 1
-                    self._logger.info(f"Skipping PR #{basic_info.number} - files already exist")
-                    continue
+            # PRs an interrupted run listed but did not finish may have half-written files
+            unfinished_numbers = {basic_info.number for basic_info in checkpoint.pending} if checkpoint else set()
+            
+            executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="pr-detail")
+            try:
+                listing = self._list_prs_resumably(repository_id, date_range, catalog, output_directory, checkpoint)
+                for basic_info in self._measure_listing(listing):
+                    # Stop at a PR boundary so every saved PR is complete
+                    exhausted_reason = self._exhausted_budget_reason()
+                    if exhausted_reason is not None:
+                        unfetched = [*pending_batch, basic_info, *self._cancel_queued_fetches(pending_fetches)]
+                        break
+                    
+                    # Listing may return the same PR twice when it is updated during pagination
+                    if basic_info.number in seen_numbers:
+                        self._logger.debug(f"Ignoring duplicate listing of PR #{basic_info.number}")
+                        continue
+                    seen_numbers.add(basic_info.number)
+                    total_found += 1
+                    
+                    # Skip PRs the selection rejects before any detail request
+                    rejection_reason = self._selection.rejection_reason(basic_info) if self._selection else None
+                    if rejection_reason is not None:
+                        deselected_count += 1
+                        self._logger.debug(f"Skipping PR #{basic_info.number} - {rejection_reason}")
+                        continue
+                    
+                    # Check if files already exist
+                    if checkpoint is not None and basic_info.number in checkpoint.saved_numbers:
+                        skipped_count += 1
+                        self._logger.info(f"Skipping PR #{basic_info.number} - saved before the interruption")
+                        continue
+                    if basic_info.number not in unfinished_numbers and self._pr_metadata_repository.exists(basic_info, output_directory):
+                        skipped_count += 1
+                        self._logger.info(f"Skipping PR #{basic_info.number} - files already exist")
+                        self._record_saved(basic_info.number)
+                        continue
+                    
+                    # Get full PR metadata only if files don't exist
+                    pending_batch.append(basic_info)
+                    batch_size = self._batch_size()
+                    if batch_size is None or len(pending_batch) < batch_size:
+                        continue
+                    
+                    pending_fetches.append((pending_batch, executor.submit(self._fetch_details, pending_batch)))
+                    pending_batch = []
+                    
+                    if len(pending_fetches) >= max_pending_fetches:
+                        processed_count += self._save_oldest_pending_fetch(
+                            pending_fetches, output_directory, catalog, dead_letters
+                        )
                 
-                # Get full PR metadata only if files don't exist
-                pr_metadata = self._github_repository.get_full_pr_metadata(basic_info.number, repository_id)
+                if exhausted_reason is None:
+                    if self._fetch_journal is not None:
+                        self._fetch_journal.record_listing_completed()
+                    if pending_batch:
+                        pending_fetches.append((pending_batch, executor.submit(self._fetch_details, pending_batch)))
                 
-                if self._process_single_pr(pr_metadata, output_directory):
-                    processed_count += 1
+                while pending_fetches:
+                    processed_count += self._save_oldest_pending_fetch(
+                        pending_fetches, output_directory, catalog, dead_letters
+                    )
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                self._save_catalog(catalog, output_directory)
+                self._save_dead_letters(repository_id, dead_letters, output_directory)
             
-            self._logger.info(f"Collection completed. Found {total_found} PRs, processed {processed_count} PRs, skipped {skipped_count} PRs.")
+            summary = (
+                f"Found {total_found} PRs, processed {processed_count} PRs, "
+                f"skipped {skipped_count} PRs, deselected {deselected_count} PRs."
+            )
+            if exhausted_reason is None:
+                if self._fetch_journal is not None:
+                    self._fetch_journal.finish()
+                self._logger.info(f"Collection completed. {summary}")
+            else:
+                self._logger.warning(f"Collection stopped early: {exhausted_reason}. {summary}")
+                self._log_unfetched(unfetched)
+            self._log_dead_letters(dead_letters)
             
         except Exception as e:
             raise PRReviewCollectionError(f"Failed to collect review comments: {e}") from e
+        finally:
+            if self._fetch_journal is not None:
+                self._fetch_journal.close()
+    
+    def sync_review_comments(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path,
+        resume: bool = False
+    ) -> None:
+        """Refresh saved PRs with comments changed since the last sync, then collect new PRs.
+        
+        Review comments created or edited since the stored high-water mark are
+        fetched repository-wide and patched into the saved PR files. PRs of
+        the date range without a file are collected as usual. The high-water
+        mark is advanced to the start of this run once everything succeeded,
+        so a failed run is repeated in full by the next sync.
+        
+        Args:
+            repository_id: Target repository identifier
+            date_range: Date range for collecting new PRs
+            output_directory: Output directory for results
+            resume: Resume the interrupted collection of new PRs
+        
+        Raises:
+            PRReviewCollectionError: If sync fails
+            ValueError: If the service has no sync state repository
+        """
+        if self._sync_state_repository is None:
+            raise ValueError("Sync requires a sync state repository")
+        
+        sync_started_at = datetime.now(tz=timezone.utc)
+        sync_state = self._sync_state_repository.load(repository_id, output_directory)
+        if sync_state is None:
+            self._logger.info("No previous sync found; collecting PRs without refreshing saved files")
+        else:
+            self._logger.info(f"Refreshing comments changed since {sync_state.last_synced_at.isoformat()}")
+            try:
+                patched_count = self._patch_saved_prs(repository_id, sync_state.last_synced_at, output_directory)
+            except Exception as e:
+                raise PRReviewCollectionError(f"Failed to sync review comments: {e}") from e
+            self._logger.info(f"Refreshed {patched_count} saved PRs.")
+        
+        self.collect_review_comments(repository_id, date_range, output_directory, resume=resume)
+        
+        self._sync_state_repository.save(SyncState(repository_id, sync_started_at), output_directory)
+    
+    def retry_failed_prs(self, repository_id: RepositoryIdentifier, output_directory: Path) -> None:
+        """Fetch the PRs of the dead-letter list again without listing anything.
+        
+        PRs that are saved now leave the list; PRs failing again stay on it
+        with one more attempt counted.
+        
+        Args:
+            repository_id: Target repository identifier
+            output_directory: Output directory of the saved PRs
+        
+        Raises:
+            PRReviewCollectionError: If retrying fails for another reason than a failed fetch
+            ValueError: If the service has no dead-letter repository
+        """
+        if self._dead_letter_repository is None:
+            raise ValueError("Retrying failed PRs requires a dead-letter repository")
+        
+        dead_letters = self._load_dead_letters(repository_id, output_directory)
+        if not dead_letters:
+            self._logger.info(f"No failed PRs of {repository_id.to_string()} to retry")
+            return
+        
+        self._logger.info(f"Retrying {len(dead_letters)} failed PRs of {repository_id.to_string()}")
+        try:
+            processed_count = 0
+            pending_fetches: Deque[Tuple[List[PullRequestBasicInfo], Future]] = deque()
+            executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="pr-detail")
+            try:
+                for batch in self._batches([failed_pr.basic_info for failed_pr in dead_letters.values()]):
+                    pending_fetches.append((batch, executor.submit(self._fetch_details, batch)))
+                while pending_fetches:
+                    processed_count += self._save_oldest_pending_fetch(
+                        pending_fetches, output_directory, dead_letters=dead_letters
+                    )
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                self._save_dead_letters(repository_id, dead_letters, output_directory)
+        except Exception as e:
+            raise PRReviewCollectionError(f"Failed to retry failed PRs: {e}") from e
+        
+        self._logger.info(f"Retry completed. Processed {processed_count} PRs.")
+        self._log_dead_letters(dead_letters)
+    
+    def plan_collection(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path
+    ) -> FetchPlan:
+        """Determine the work collect_review_comments would do without fetching any PR details.
+        
+        PRs the catalog answers are checked against the selection and the saved
+        files one by one. Each uncovered range is counted with one search
+        request instead of being listed. Neither the catalog, the journal nor
+        any PR file is written.
+        
+        Args:
+            repository_id: Target repository identifier
+            date_range: Date range for filtering PRs
+            output_directory: Output directory of the saved PRs
+            
+        Returns:
+            Planned work of the run
+        
+        Raises:
+            PRReviewCollectionError: If the plan cannot be made
+        """
+        try:
+            catalog = self._load_catalog(repository_id, output_directory)
+            if catalog is None:
+                ranges = [date_range]
+                catalogued_entries = []
+            else:
+                ranges = catalog.uncovered_ranges(date_range)
+                catalogued_entries = [
+                    entry for entry in catalog.entries_within(date_range)
+                    if not any(gap.contains(entry.closed_at) for gap in ranges)
+                ]
+            
+            range_counts = [self._github_repository.count_closed_prs(repository_id, gap) for gap in ranges]
+            deselected_count = 0
+            existing_count = 0
+            to_fetch: List[PullRequestBasicInfo] = []
+            for entry in catalogued_entries:
+                basic_info = entry.to_basic_info(repository_id)
+                if self._selection is not None and not self._selection.matches(basic_info):
+                    deselected_count += 1
+                elif self._pr_metadata_repository.exists(basic_info, output_directory):
+                    existing_count += 1
+                else:
+                    to_fetch.append(basic_info)
+            
+            # The repository comments strategy lists every comment since the oldest PR to fetch was
+            # created; PRs that are only counted are taken as created when their range starts
+            counted_starts = [gap.start_date for gap, count in zip(ranges, range_counts) if count]
+            oldest_starts = [basic_info.created_at or basic_info.closed_at for basic_info in to_fetch] + counted_starts
+            repository_comment_count = None
+            if oldest_starts:
+                repository_comment_count = self._github_repository.count_review_comments(
+                    repository_id, min(oldest_starts)
+                )
+        except Exception as e:
+            raise PRReviewCollectionError(f"Failed to plan collection: {e}") from e
+        
+        return FetchPlan(
+            repository_id=repository_id,
+            date_range=date_range,
+            catalogued_count=len(catalogued_entries),
+            counted_count=sum(range_counts),
+            listing_requests=sum(max(1, math.ceil(count / self._LISTING_PAGE_SIZE)) for count in range_counts),
+            deselected_count=deselected_count,
+            existing_count=existing_count,
+            comment_counts=tuple(basic_info.review_comment_count for basic_info in to_fetch),
+            repository_comment_count=repository_comment_count
+        )
+    
+    def _patch_saved_prs(self, repository_id: RepositoryIdentifier, since: datetime, output_directory: Path) -> int:
+        """Patch the saved PR files with review comments changed since a time.
+        
+        Comments of PRs without a saved file are ignored; those PRs are fetched
+        in full when they are collected.
+        
+        Args:
+            repository_id: Target repository identifier
+            since: Only comments created or updated at or after this time are fetched
+            output_directory: Output directory of the saved PRs
+            
+        Returns:
+            Number of PR files patched
+        """
+        comments_by_pr = self._github_repository.get_review_comments_by_pr(repository_id, since)
+        if not comments_by_pr:
+            return 0
+        
+        saved_prs = {
+            pr_metadata.number: pr_metadata
+            for pr_metadata in self._pr_metadata_repository.find_all_by_repository(output_directory, repository_id)
+        }
+        patched_count = 0
+        for pr_number, comments in comments_by_pr.items():
+            saved_pr = saved_prs.get(pr_number)
+            if saved_pr is None:
+                continue
+            if self._process_single_pr(saved_pr.with_updated_comments(comments), output_directory):
+                patched_count += 1
+        return patched_count
+    
+    def _load_checkpoint(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path,
+        resume: bool
+    ) -> Optional[FetchCheckpoint]:
+        """Load the checkpoint of the interrupted run to resume, if any.
+        
+        Raises:
+            ValueError: If resuming is requested without a fetch journal
+        """
+        if not resume:
+            return None
+        if self._fetch_journal is None:
+            raise ValueError("Resuming requires a fetch journal")
+        
+        checkpoint = self._fetch_journal.load_checkpoint(repository_id, date_range, output_directory)
+        if checkpoint is None:
+            self._logger.info("No interrupted run to resume; starting a new run")
+        else:
+            self._logger.info(
+                f"Resuming interrupted run: {len(checkpoint.listed)} PRs listed, "
+                f"{len(checkpoint.pending)} not yet saved, listing {'completed' if checkpoint.listing_completed else 'incomplete'}"
+            )
+        return checkpoint
+    
+    def _start_journal(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path,
+        checkpoint: Optional[FetchCheckpoint]
+    ) -> None:
+        """Start recording the run in the fetch journal, if one is used."""
+        if self._fetch_journal is not None:
+            self._fetch_journal.start(repository_id, date_range, output_directory, resume=checkpoint is not None)
+    
+    def _record_saved(self, pr_number: int) -> None:
+        """Record in the fetch journal that the file of a PR is complete."""
+        if self._fetch_journal is not None:
+            self._fetch_journal.record_saved(pr_number)
+    
+    def _record_window_listed(self, window: DateRange) -> None:
+        """Record in the fetch journal that every PR of a window was listed."""
+        if self._fetch_journal is not None:
+            self._fetch_journal.record_window_listed(window)
+    
+    def _list_prs_resumably(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        catalog: Optional[PullRequestCatalog],
+        output_directory: Path,
+        checkpoint: Optional[FetchCheckpoint]
+    ) -> Generator[PullRequestBasicInfo, None, None]:
+        """List the PRs of a run, continuing from the checkpoint of an interrupted run.
+        
+        PRs recorded by the interrupted run are yielded first. When its listing
+        had completed, nothing is listed again; otherwise listing restarts
+        with the windows it did not finish, and only PRs not recorded yet are
+        journaled. Every listed PR is journaled before it is yielded.
+        
+        Args:
+            repository_id: Target repository identifier
+            date_range: Date range for filtering PRs
+            catalog: PR catalog, or None to list everything from GitHub
+            output_directory: Output directory the catalog is saved in
+            checkpoint: Checkpoint of the run being resumed, or None
+            
+        Yields:
+            Basic info of the PRs closed within the range
+        """
+        journaled_numbers = set()
+        listed_windows = frozenset()
+        if checkpoint is not None:
+            journaled_numbers = {basic_info.number for basic_info in checkpoint.listed}
+            listed_windows = checkpoint.listed_windows
+            yield from checkpoint.listed
+            if checkpoint.listing_completed:
+                return
+        
+        for basic_info in self._list_prs(repository_id, date_range, catalog, output_directory, listed_windows):
+            if self._fetch_journal is not None and basic_info.number not in journaled_numbers:
+                journaled_numbers.add(basic_info.number)
+                self._fetch_journal.record_listed(basic_info)
+            yield basic_info
+    
+    def _load_catalog(self, repository_id: RepositoryIdentifier, output_directory: Path) -> Optional[PullRequestCatalog]:
+        """Load the PR catalog, or return None when no catalog is used."""
+        if self._pr_catalog_repository is None:
+            return None
+        return self._pr_catalog_repository.load(repository_id, output_directory)
+    
+    def _save_catalog(self, catalog: Optional[PullRequestCatalog], output_directory: Path) -> None:
+        """Save the PR catalog if one is used."""
+        if catalog is not None:
+            self._pr_catalog_repository.save(catalog, output_directory)
+    
+    def _list_prs(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        catalog: Optional[PullRequestCatalog],
+        output_directory: Path,
+        listed_windows: frozenset = frozenset()
+    ) -> Generator[PullRequestBasicInfo, None, None]:
+        """List the PRs closed within a date range.
+        
+        With a catalog, catalogued PRs of covered ranges are yielded first and
+        only the uncovered gaps are listed from GitHub. Each listed window is
+        marked as covered once its listing completes, up to the time the
+        listing started, since PRs may still be closed later in the range.
+        
+        Args:
+            repository_id: Target repository identifier
+            date_range: Date range for filtering PRs
+            catalog: PR catalog, or None to list everything from GitHub
+            output_directory: Output directory the catalog is saved in
+            listed_windows: Windows an interrupted run finished listing
+            
+        Yields:
+            Basic info of the PRs closed within the range
+        """
+        listing_started_at = datetime.now(tz=date_range.end_date.tzinfo)
+        if catalog is None:
+            ranges = [date_range]
+        else:
+            ranges = catalog.uncovered_ranges(date_range)
+            catalogued_entries = [
+                entry for entry in catalog.entries_within(date_range)
+                if not any(gap.contains(entry.closed_at) for gap in ranges)
+            ]
+            self._logger.info(
+                f"PR catalog answered {len(catalogued_entries)} PRs; listing {len(ranges)} uncovered range(s) from GitHub"
+            )
+            for entry in catalogued_entries:
+                yield entry.to_basic_info(repository_id)
+        
+        for window, basic_infos in self._list_windows(repository_id, ranges, listed_windows):
+            for basic_info in basic_infos:
+                if catalog is not None:
+                    catalog.add(PullRequestCatalogEntry.from_basic_info(basic_info))
+                yield basic_info
+            
+            covered_end = min(window.end_date, listing_started_at)
+            if catalog is not None and covered_end >= window.start_date:
+                catalog.mark_covered(DateRange(start_date=window.start_date, end_date=covered_end))
+                self._save_catalog(catalog, output_directory)
+            self._record_window_listed(window)
+    
+    def _list_windows(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_ranges: List[DateRange],
+        listed_windows: frozenset
+    ) -> Generator[Tuple[DateRange, Iterable[PullRequestBasicInfo]], None, None]:
+        """List the PRs of date ranges window by window.
+        
+        Without partitioning, every range is one window whose PRs are streamed
+        as they are listed. With partitioning, up to concurrency windows are
+        listed in parallel ahead of the window being consumed. Windows are
+        yielded in chronological order either way, so each one can be
+        checkpointed once its PRs were consumed.
+        
+        Args:
+            repository_id: Target repository identifier
+            date_ranges: Ranges to list in chronological order
+            listed_windows: Windows an interrupted run finished listing; skipped
+            
+        Yields:
+            Each window with its listed PRs
+        """
+        windows = [
+            window
+            for date_range in date_ranges
+            for window in self._partition(repository_id, date_range)
+            if window not in listed_windows
+        ]
+        if self._partitioning is None:
+            for window in windows:
+                yield window, self._github_repository.find_closed_prs_basic_info(repository_id, window)
+            return
+        
+        self._logger.info(f"Listing {len(windows)} date windows, {self._concurrency} at a time")
+        pending: Deque[Tuple[DateRange, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="pr-listing")
+        try:
+            for window in windows:
+                pending.append((window, executor.submit(self._list_window, repository_id, window)))
+                if len(pending) >= self._concurrency:
+                    yield self._listed_window(*pending.popleft())
+            while pending:
+                yield self._listed_window(*pending.popleft())
+        finally:
+            for _, listing in pending:
+                listing.cancel()
+            executor.shutdown(wait=True)
+    
+    def _partition(self, repository_id: RepositoryIdentifier, date_range: DateRange) -> List[DateRange]:
+        """Split a date range into the windows listed separately."""
+        if self._partitioning is None:
+            return [date_range]
+        return self._partitioning.split(
+            date_range,
+            lambda window: self._github_repository.count_closed_prs(repository_id, window)
+        )
+    
+    def _list_window(self, repository_id: RepositoryIdentifier, window: DateRange) -> List[PullRequestBasicInfo]:
+        """List every PR of a window on a listing thread."""
+        return list(self._github_repository.find_closed_prs_basic_info(repository_id, window))
+    
+    def _listed_window(
+        self,
+        window: DateRange,
+        listing: "Future[List[PullRequestBasicInfo]]"
+    ) -> Tuple[DateRange, List[PullRequestBasicInfo]]:
+        """Wait for the listing of a window and report its progress."""
+        basic_infos = listing.result()
+        self._logger.info(
+            f"Listed {len(basic_infos)} PRs closed from {window.start_date.date()} to {window.end_date.date()}"
+        )
+        return window, basic_infos
+    
+    def _load_dead_letters(
+        self,
+        repository_id: RepositoryIdentifier,
+        output_directory: Path
+    ) -> Optional[Dict[int, FailedPullRequest]]:
+        """Load the dead-letter list keyed by PR number, or return None when failures are not recorded."""
+        if self._dead_letter_repository is None:
+            return None
+        return {
+            failed_pr.number: failed_pr
+            for failed_pr in self._dead_letter_repository.load(repository_id, output_directory)
+        }
+    
+    def _save_dead_letters(
+        self,
+        repository_id: RepositoryIdentifier,
+        dead_letters: Optional[Dict[int, FailedPullRequest]],
+        output_directory: Path
+    ) -> None:
+        """Save the dead-letter list if failures are recorded."""
+        if dead_letters is not None:
+            self._dead_letter_repository.save(repository_id, list(dead_letters.values()), output_directory)
+    
+    def _log_dead_letters(self, dead_letters: Optional[Dict[int, FailedPullRequest]]) -> None:
+        """Point out the PRs left on the dead-letter list."""
+        if dead_letters:
+            self._logger.warning(
+                f"{len(dead_letters)} PRs could not be fetched: "
+                f"{', '.join(f'#{number}' for number in dead_letters)}. "
+                f"Fetch them again with --retry-failed."
+            )
+    
+    def _exhausted_budget_reason(self) -> Optional[str]:
+        """Describe why the fetch budget is used up, or None while collection may go on."""
+        if self._fetch_budget is None:
+            return None
+        return self._fetch_budget.exhausted_reason()
+    
+    def _cancel_queued_fetches(
+        self,
+        pending_fetches: Deque[Tuple[List[PullRequestBasicInfo], Future]]
+    ) -> List[PullRequestBasicInfo]:
+        """Cancel the detail fetches no worker has started and return their PRs."""
+        cancelled = [(batch, pending_fetch) for batch, pending_fetch in pending_fetches if pending_fetch.cancel()]
+        for entry in cancelled:
+            pending_fetches.remove(entry)
+        return [basic_info for batch, _ in cancelled for basic_info in batch]
+    
+    def _log_unfetched(self, unfetched: List[PullRequestBasicInfo]) -> None:
+        """Report what a run stopped by its fetch budget left of the date range."""
+        if unfetched:
+            closed_dates = sorted(basic_info.closed_at for basic_info in unfetched)
+            self._logger.warning(
+                f"{len(unfetched)} listed PRs closed between {closed_dates[0].date()} and "
+                f"{closed_dates[-1].date()} were not fetched"
+            )
+        self._logger.warning(
+            "PRs of the period not listed yet were left as well; run again with --resume to continue"
+        )
+    
+    def _measure(self, phase: str) -> ContextManager[None]:
+        """Time a block as a phase of the run, if metrics are recorded."""
+        if self._fetch_metrics is None:
+            return nullcontext()
+        return self._fetch_metrics.measure(phase)
+    
+    def _measure_listing(self, basic_infos: Iterable[PullRequestBasicInfo]) -> Iterator[PullRequestBasicInfo]:
+        """Yield listed PRs, timing the wait for each of them as the listing phase."""
+        iterator = iter(basic_infos)
+        while True:
+            with self._measure("listing"):
+                basic_info = next(iterator, None)
+            if basic_info is None:
+                return
+            yield basic_info
+    
+    def _batches(self, basic_infos: List[PullRequestBasicInfo]) -> List[List[PullRequestBasicInfo]]:
+        """Split PRs into the batches submitted as one detail fetch each."""
+        batch_size = self._batch_size() or len(basic_infos)
+        return [basic_infos[start:start + batch_size] for start in range(0, len(basic_infos), batch_size)]
+    
+    def _batch_size(self) -> Optional[int]:
+        """Number of PRs submitted together as one detail fetch, or None for all."""
+        if self._detail_fetcher is None:
+            return 1
+        return self._detail_fetcher.batch_size
+    
+    def _fetch_details(self, basic_infos: List[PullRequestBasicInfo]) -> List[PullRequestMetadata]:
+        """Fetch full PR metadata for a batch of PRs.
+        
+        Args:
+            basic_infos: Basic info of the PRs to fetch
+            
+        Returns:
+            PR metadata in the same order as basic_infos
+        """
+        with self._measure("detail"):
+            if self._detail_fetcher is not None:
+                return self._detail_fetcher.fetch_details(basic_infos)
+            return [
+                self._github_repository.get_full_pr_metadata(basic_info.number, basic_info.repository_id)
+                for basic_info in basic_infos
+            ]
+    
+    def _save_oldest_pending_fetch(
+        self,
+        pending_fetches: Deque[Tuple[List[PullRequestBasicInfo], Future]],
+        output_directory: Path,
+        catalog: Optional[PullRequestCatalog] = None,
+        dead_letters: Optional[Dict[int, FailedPullRequest]] = None
+    ) -> int:
+        """Wait for the oldest pending detail fetch and save its PRs.
+        
+        Saving in submission order keeps the output order identical to the listing order.
+        
+        Args:
+            pending_fetches: Fetched PRs and their detail fetches in submission order
+            output_directory: Output directory
+            catalog: PR catalog recording the comment counts, if used
+            dead_letters: Dead-letter list by PR number; when given, the PRs of
+                a failed fetch are added to it, and saved PRs are removed
+            
+        Returns:
+            Number of PRs processed
+        
+        Raises:
+            Exception: Re-raises the error of a failed detail fetch without a dead-letter list
+        """
+        basic_infos, pending_fetch = pending_fetches.popleft()
+        try:
+            pr_metadata_list = pending_fetch.result()
+        except Exception as e:
+            if dead_letters is None:
+                raise
+            self._add_dead_letters(basic_infos, e, dead_letters)
+            return 0
+        
+        processed_count = 0
+        for pr_metadata in pr_metadata_list:
+            if catalog is not None:
+                catalog.record_comment_count(pr_metadata.number, len(pr_metadata.review_comments))
+            if self._process_single_pr(pr_metadata, output_directory):
+                self._record_saved(pr_metadata.number)
+                processed_count += 1
+                if dead_letters is not None:
+                    dead_letters.pop(pr_metadata.number, None)
+        return processed_count
+    
+    def _add_dead_letters(
+        self,
+        basic_infos: List[PullRequestBasicInfo],
+        error: Exception,
+        dead_letters: Dict[int, FailedPullRequest]
+    ) -> None:
+        """Put the PRs of a failed detail fetch on the dead-letter list."""
+        failed_at = datetime.now(tz=timezone.utc)
+        for basic_info in basic_infos:
+            self._logger.error(f"Failed to fetch PR #{basic_info.number}: {error}")
+            previous = dead_letters.get(basic_info.number)
+            if previous is None:
+                dead_letters[basic_info.number] = FailedPullRequest(basic_info, str(error), failed_at)
+            else:
+                dead_letters[basic_info.number] = previous.failed_again(str(error), failed_at)
     
     def _process_single_pr(self, pr_metadata: PullRequestMetadata, output_directory: Path) -> bool:
         """Process a single PR.
@@ -96,7 +840,8 @@ class PRReviewCollectionService:
         """
         try:
             # Filter comments before saving
-            filtered_comments = self._comment_filter.filter_comments(pr_metadata.review_comments)
+            with self._measure("filtering"):
+                filtered_comments = self._comment_filter.filter_comments(pr_metadata.review_comments)
             filtered_pr_metadata = PullRequestMetadata(
                 number=pr_metadata.number,
                 title=pr_metadata.title,
@@ -108,6 +853,8 @@ class PRReviewCollectionService:
             
             # Save PR metadata
             self._pr_metadata_repository.save(filtered_pr_metadata, output_directory)
+            if self._fetch_metrics is not None:
+                self._fetch_metrics.record_saved_pr(len(filtered_comments))
             
             self._logger.info(
                 f"Saved PR #{filtered_pr_metadata.number}: {filtered_pr_metadata.title} data ({len(filtered_pr_metadata.review_comments)} comments)"
@@ -0,0 +1,101 @@
+"""
+Comment filter rules value object.
+"""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Mapping, Tuple
+
+
+@dataclass(frozen=True)
+class CommentFilterRules:
+    """Rules deciding which review comments are dropped while fetching.
+
+    A comment is dropped when any rule matches it. Without configuration,
+    only comments of Copilot are dropped.
+
+    Attributes:
+        excluded_authors: Author logins to drop, compared case-insensitively
+        exclude_bot_suffix: Drop authors whose login ends with "[bot]"
+        exclude_bot_users: Drop authors GitHub reports as bot accounts
+        body_presets: Names of built-in body rules, see BODY_PRESETS
+        body_patterns: Regular expressions searched in comment bodies, case-insensitively
+    """
+
+    DEFAULT_EXCLUDED_AUTHORS = ("Copilot",)
+
+    # Built-in body rules; each pattern must match the whole body
+    BODY_PRESETS: ClassVar[Mapping[str, str]] = {
+        # Approvals without content, e.g. "LGTM!" or "Looks good to me."
+        "lgtm": r"\s*(?:lgtm|looks good to me)[\s.!]*",
+        # Bodies made only of emoji or emoji shortcodes, e.g. "👍" or ":+1:"
+        "emoji-only": r"\s*(?:(?::[a-z0-9_+\-]+:|[\u2600-\u27bf\U0001f000-\U0001faff\ufe0f\u200d])\s*)+",
+        # Suggestion blocks without any suggested line
+        "empty-suggestion": r"\s*```suggestion[^\n]*\n\s*```\s*",
+    }
+
+    excluded_authors: Tuple[str, ...] = DEFAULT_EXCLUDED_AUTHORS
+    exclude_bot_suffix: bool = False
+    exclude_bot_users: bool = False
+    body_presets: Tuple[str, ...] = ()
+    body_patterns: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        """Validate rules."""
+        unknown_presets = [preset for preset in self.body_presets if preset not in self.BODY_PRESETS]
+        if unknown_presets:
+            raise ValueError(
+                f"Unknown body filter preset: {', '.join(unknown_presets)}. "
+                f"Use one of {', '.join(self.BODY_PRESETS)}"
+            )
+
+    @classmethod
+    def from_config(cls, section: Dict[str, Any]) -> "CommentFilterRules":
+        """Create rules from the comment_filters section of workspace.yml.
+
+        Example:
+            comment_filters:
+              authors: [Copilot, coderabbitai]
+              bot_suffix: true
+              bot_users: true
+              bodies: [lgtm, emoji-only, empty-suggestion]
+              body_patterns: ['^nit:?\\s*$']
+
+        Args:
+            section: Parsed comment_filters section
+
+        Returns:
+            Comment filter rules; authors default to Copilot when not given
+
+        Raises:
+            ValueError: If the section has unknown keys or values of the wrong type
+        """
+        known_keys = {"authors", "bot_suffix", "bot_users", "bodies", "body_patterns"}
+        unknown_keys = sorted(set(section) - known_keys)
+        if unknown_keys:
+            raise ValueError(f"Unknown comment filter setting: {', '.join(unknown_keys)}")
+
+        return cls(
+            excluded_authors=cls._string_list(section, "authors", cls.DEFAULT_EXCLUDED_AUTHORS),
+            exclude_bot_suffix=cls._flag(section, "bot_suffix"),
+            exclude_bot_users=cls._flag(section, "bot_users"),
+            body_presets=cls._string_list(section, "bodies", ()),
+            body_patterns=cls._string_list(section, "body_patterns", ())
+        )
+
+    @staticmethod
+    def _string_list(section: Dict[str, Any], key: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Read a list of strings from a configuration section."""
+        values = section.get(key)
+        if values is None:
+            return default
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise ValueError(f"Comment filter setting {key} must be a list of strings")
+        return tuple(values)
+
+    @staticmethod
+    def _flag(section: Dict[str, Any], key: str) -> bool:
+        """Read a boolean from a configuration section."""
+        value = section.get(key, False)
+        if not isinstance(value, bool):
+            raise ValueError(f"Comment filter setting {key} must be true or false")
+        return value
@@ -0,0 +1,54 @@
+"""
+Date partitioning value object.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List
+
+from .date_range import DateRange
+
+
+@dataclass(frozen=True)
+class DatePartitioning:
+    """How a long date range is split into windows listed and fetched concurrently.
+
+    Attributes:
+        mode: "month" for one window per calendar month, or "adaptive" to halve
+            windows until each holds at most target_pr_count closed PRs
+        target_pr_count: Largest number of closed PRs in an adaptive window
+    """
+
+    MODES = ("month", "adaptive")
+
+    DEFAULT_TARGET_PR_COUNT = 500
+
+    mode: str = "month"
+    target_pr_count: int = DEFAULT_TARGET_PR_COUNT
+
+    def __post_init__(self):
+        """Validate partitioning."""
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown partitioning mode: {self.mode}. Use one of {', '.join(self.MODES)}")
+        if self.target_pr_count < 1:
+            raise ValueError(f"Target PR count must be at least 1, got {self.target_pr_count}")
+
+    def split(self, date_range: DateRange, count_prs: Callable[[DateRange], int]) -> List[DateRange]:
+        """Split a date range into windows.
+
+        Args:
+            date_range: Range to split
+            count_prs: Function counting the closed PRs of a window; only
+                called in adaptive mode
+
+        Returns:
+            Contiguous windows in chronological order covering the range
+        """
+        if self.mode == "month":
+            return date_range.split_by_month()
+
+        if count_prs(date_range) <= self.target_pr_count:
+            return [date_range]
+        halves = date_range.split_in_half()
+        if halves is None:
+            return [date_range]
+        return [window for half in halves for window in self.split(half, count_prs)]
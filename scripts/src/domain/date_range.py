@@ -3,13 +3,17 @@ Date range value object for filtering PRs.
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 
 
 @dataclass(frozen=True)
 class DateRange:
     """Represents a date range for filtering PRs."""
     
+    # Gap between the end of a window and the start of the next one; ranges end at .999999
+    _RESOLUTION = timedelta(microseconds=1)
+    
     start_date: datetime
     end_date: datetime
     
@@ -20,4 +24,45 @@ class DateRange:
     
     def contains(self, target_date: datetime) -> bool:
         """Check if a date falls within this range."""
-        return self.start_date <= target_date <= self.end_date
\ No newline at end of file
+        return self.start_date <= target_date <= self.end_date
+    
+    def split_by_month(self) -> List["DateRange"]:
+        """Split this range at the start of every month it spans.
+        
+        Month starts are taken in the timezone of start_date. The windows are
+        contiguous and together cover exactly this range.
+        
+        Returns:
+            Windows in chronological order
+        """
+        windows = []
+        window_start = self.start_date
+        while True:
+            month_start = window_start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            if window_start.month == 12:
+                next_start = month_start.replace(year=window_start.year + 1, month=1)
+            else:
+                next_start = month_start.replace(month=window_start.month + 1)
+            
+            if next_start > self.end_date:
+                windows.append(DateRange(window_start, self.end_date))
+                return windows
+            windows.append(DateRange(window_start, next_start - self._RESOLUTION))
+            window_start = next_start
+    
+    def split_in_half(self) -> Optional[Tuple["DateRange", "DateRange"]]:
+        """Split this range at the whole second nearest to its middle.
+        
+        Splitting on a whole second keeps the halves apart in GitHub queries,
+        which compare timestamps in seconds.
+        
+        Returns:
+            Earlier and later half, or None if the range does not span a second boundary
+        """
+        middle = self.start_date + (self.end_date - self.start_date) / 2
+        split_at = middle.replace(microsecond=0)
+        if split_at <= self.start_date:
+            split_at += timedelta(seconds=1)
+        if split_at > self.end_date:
+            return None
+        return DateRange(self.start_date, split_at - self._RESOLUTION), DateRange(split_at, self.end_date)
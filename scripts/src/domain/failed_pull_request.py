@@ -0,0 +1,42 @@
+"""
+Failed pull request value object.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from .pull_request_basic_info import PullRequestBasicInfo
+
+
+@dataclass(frozen=True)
+class FailedPullRequest:
+    """A PR whose details could not be fetched, kept on the dead-letter list for a later retry.
+
+    Attributes:
+        basic_info: Listing data of the PR, enough to fetch it again
+        error: Message of the last failure
+        failed_at: Time of the last failure
+        attempts: Number of runs that failed to fetch the PR
+    """
+
+    basic_info: PullRequestBasicInfo
+    error: str
+    failed_at: datetime
+    attempts: int = 1
+
+    @property
+    def number(self) -> int:
+        """Number of the PR."""
+        return self.basic_info.number
+
+    def failed_again(self, error: str, failed_at: datetime) -> "FailedPullRequest":
+        """Record another failed attempt.
+
+        Args:
+            error: Message of the new failure
+            failed_at: Time of the new failure
+
+        Returns:
+            Failed PR with the new failure and one more attempt
+        """
+        return FailedPullRequest(self.basic_info, error, failed_at, self.attempts + 1)
@@ -0,0 +1,36 @@
+"""
+Fetch checkpoint value object.
+"""
+
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Tuple
+
+from .date_range import DateRange
+from .pull_request_basic_info import PullRequestBasicInfo
+from .repository_identifier import RepositoryIdentifier
+
+
+@dataclass(frozen=True)
+class FetchCheckpoint:
+    """Represents how far an interrupted collection run got.
+    
+    Attributes:
+        repository_id: Repository of the run
+        date_range: Date range of the run
+        listed: PRs listed by the run, in listing order
+        listing_completed: Whether listing finished
+        saved_numbers: PRs whose files were confirmed as saved
+        listed_windows: Date windows whose listing finished
+    """
+
+    repository_id: RepositoryIdentifier
+    date_range: DateRange
+    listed: Tuple[PullRequestBasicInfo, ...] = ()
+    listing_completed: bool = False
+    saved_numbers: FrozenSet[int] = field(default_factory=frozenset)
+    listed_windows: FrozenSet[DateRange] = field(default_factory=frozenset)
+
+    @property
+    def pending(self) -> List[PullRequestBasicInfo]:
+        """Listed PRs whose files were not confirmed as saved, in listing order."""
+        return [basic_info for basic_info in self.listed if basic_info.number not in self.saved_numbers]
@@ -0,0 +1,48 @@
+"""
+Fetch plan value object.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .date_range import DateRange
+from .repository_identifier import RepositoryIdentifier
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """Work a collection run would do for one repository, determined without fetching PR details.
+
+    PRs answered by the PR catalog are known one by one, so the selection and
+    the saved files are checked for each of them. PRs of the uncovered ranges
+    are only counted; they are assumed to be fetched.
+
+    Attributes:
+        repository_id: Target repository identifier
+        date_range: Date range of the run
+        catalogued_count: PRs of covered ranges answered by the PR catalog
+        counted_count: PRs closed in the uncovered ranges, counted with one
+            search request per range
+        listing_requests: Requests listing the uncovered ranges
+        deselected_count: Catalogued PRs the selection rejects
+        existing_count: Catalogued PRs skipped because their files already exist
+        comment_counts: Review comment counts of the catalogued PRs to fetch,
+            None where the catalog does not know it
+        repository_comment_count: Review comments of the repository updated
+            since the oldest PR to fetch was created, or None if not counted
+    """
+
+    repository_id: RepositoryIdentifier
+    date_range: DateRange
+    catalogued_count: int = 0
+    counted_count: int = 0
+    listing_requests: int = 0
+    deselected_count: int = 0
+    existing_count: int = 0
+    comment_counts: Tuple[Optional[int], ...] = ()
+    repository_comment_count: Optional[int] = None
+
+    @property
+    def fetch_count(self) -> int:
+        """Number of PRs whose details would be fetched."""
+        return len(self.comment_counts) + self.counted_count
@@ -2,14 +2,28 @@
 Domain interfaces package.
 """
 
+from .dead_letter_repository_interface import DeadLetterRepositoryInterface
+from .fetch_budget_interface import FetchBudgetInterface
+from .fetch_journal_interface import FetchJournalInterface
+from .fetch_metrics_interface import FetchMetricsInterface
 from .github_repository_interface import GitHubRepositoryInterface
+from .pull_request_catalog_repository_interface import PullRequestCatalogRepositoryInterface
+from .pull_request_detail_fetcher_interface import PullRequestDetailFetcherInterface
 from .pull_request_metadata_repository_interface import PullRequestMetadataRepositoryInterface
 from .summary_repository_interface import SummaryRepositoryInterface
+from .sync_state_repository_interface import SyncStateRepositoryInterface
 from .timezone_converter_interface import TimezoneConverterInterface
 
 __all__ = [
+    "DeadLetterRepositoryInterface",
+    "FetchBudgetInterface",
+    "FetchJournalInterface",
+    "FetchMetricsInterface",
     "GitHubRepositoryInterface",
+    "PullRequestCatalogRepositoryInterface",
+    "PullRequestDetailFetcherInterface",
     "PullRequestMetadataRepositoryInterface",
     "SummaryRepositoryInterface",
+    "SyncStateRepositoryInterface",
     "TimezoneConverterInterface"
 ]
\ No newline at end of file
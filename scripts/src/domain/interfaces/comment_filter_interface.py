@@ -3,7 +3,7 @@ Comment filter interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from ..review_comment import ReviewComment
 
@@ -21,4 +21,22 @@ class CommentFilterInterface(ABC):
         Returns:
             Filtered list of review comments
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def rejects(self, author: str, author_type: Optional[str], body: str) -> bool:
+        """Check a raw comment before a review comment is built from it.
+        
+        Fetchers call this on the fields of each API payload, so rejected
+        comments are never built. Filters that only work on review comments
+        reject nothing here.
+        
+        Args:
+            author: Login of the comment author
+            author_type: Account type GitHub reports for the author, e.g.
+                "User" or "Bot", or None if unknown
+            body: Comment body
+            
+        Returns:
+            True if the comment is dropped
+        """
+        return False
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Interface for the dead-letter list of failed PRs.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List
+
+from ..failed_pull_request import FailedPullRequest
+from ..repository_identifier import RepositoryIdentifier
+
+
+class DeadLetterRepositoryInterface(ABC):
+    """Interface for persisting the PRs whose details could not be fetched."""
+
+    @abstractmethod
+    def load(self, repository_id: RepositoryIdentifier, output_directory: Path) -> List[FailedPullRequest]:
+        """Load the failed PRs of a repository.
+
+        Args:
+            repository_id: Repository identifier
+            output_directory: Base output directory
+
+        Returns:
+            Failed PRs in the order they first failed, or an empty list
+        """
+        pass
+
+    @abstractmethod
+    def save(
+        self,
+        repository_id: RepositoryIdentifier,
+        failed_prs: List[FailedPullRequest],
+        output_directory: Path
+    ) -> None:
+        """Replace the failed PRs of a repository.
+
+        Args:
+            repository_id: Repository identifier
+            failed_prs: Failed PRs; an empty list clears the dead-letter list
+            output_directory: Base output directory
+        """
+        pass
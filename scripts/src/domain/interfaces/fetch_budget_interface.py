@@ -0,0 +1,20 @@
+"""
+Interface for the budget of a fetch run.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class FetchBudgetInterface(ABC):
+    """Interface for the requests and time a fetch run may spend."""
+
+    @abstractmethod
+    def exhausted_reason(self) -> Optional[str]:
+        """Describe why the budget is used up.
+
+        Returns:
+            Reason such as "request budget of 500 used up", or None while
+            budget is left
+        """
+        pass
@@ -0,0 +1,94 @@
+"""
+Interface for the fetch checkpoint journal.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from ..date_range import DateRange
+from ..fetch_checkpoint import FetchCheckpoint
+from ..pull_request_basic_info import PullRequestBasicInfo
+from ..repository_identifier import RepositoryIdentifier
+
+
+class FetchJournalInterface(ABC):
+    """Interface for recording the progress of a collection run.
+
+    The journal is append-only, so the progress recorded before a crash
+    survives and an interrupted run can be resumed from its checkpoint.
+    """
+
+    @abstractmethod
+    def load_checkpoint(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path
+    ) -> Optional[FetchCheckpoint]:
+        """Load the checkpoint of an unfinished run.
+
+        Args:
+            repository_id: Repository identifier of the run
+            date_range: Date range of the run
+            output_directory: Base output directory
+
+        Returns:
+            Checkpoint of an unfinished run for the same repository and date
+            range, or None if there is nothing to resume
+        """
+        pass
+
+    @abstractmethod
+    def start(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path,
+        resume: bool = False
+    ) -> None:
+        """Start recording a run.
+
+        Args:
+            repository_id: Repository identifier of the run
+            date_range: Date range of the run
+            output_directory: Base output directory
+            resume: Continue the existing journal instead of starting a new one
+        """
+        pass
+
+    @abstractmethod
+    def record_listed(self, basic_info: PullRequestBasicInfo) -> None:
+        """Record that a PR was listed."""
+        pass
+
+    @abstractmethod
+    def record_window_listed(self, window: DateRange) -> None:
+        """Record that every PR of a date window was listed.
+        
+        A resumed run does not list recorded windows again.
+        
+        Args:
+            window: Date window whose listing finished
+        """
+        pass
+
+    @abstractmethod
+    def record_listing_completed(self) -> None:
+        """Record that listing finished."""
+        pass
+
+    @abstractmethod
+    def record_saved(self, pr_number: int) -> None:
+        """Record that the file of a PR is complete."""
+        pass
+
+    @abstractmethod
+    def finish(self) -> None:
+        """Record that the run completed and stop recording."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop recording, leaving the run resumable."""
+        pass
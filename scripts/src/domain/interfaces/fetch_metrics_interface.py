@@ -0,0 +1,43 @@
+"""
+Interface for the metrics of a fetch run.
+"""
+
+from abc import ABC, abstractmethod
+from typing import ContextManager
+
+
+class FetchMetricsInterface(ABC):
+    """Interface for recording where a fetch run spends its time."""
+
+    @abstractmethod
+    def measure(self, phase: str) -> ContextManager[None]:
+        """Measure the time spent in a phase of the run.
+
+        Times of the same phase are added up, also across threads.
+
+        Args:
+            phase: Phase name such as "listing", "detail", "comments",
+                "filtering", "serialization" or "disk_write"
+
+        Returns:
+            Context manager timing its block
+        """
+        pass
+
+    @abstractmethod
+    def record_saved_pr(self, comment_count: int) -> None:
+        """Count a saved PR and its review comments.
+
+        Args:
+            comment_count: Number of review comments saved with the PR
+        """
+        pass
+
+    @abstractmethod
+    def record_lazy_completions(self, count: int) -> None:
+        """Count hidden requests PyGithub made to complete listed objects.
+
+        Args:
+            count: Number of listed objects completed by a request of their own
+        """
+        pass
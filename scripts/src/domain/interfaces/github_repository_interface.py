@@ -2,12 +2,14 @@
 Interface for GitHub repository operations.
 """
 
-from typing import Protocol, Generator
+from datetime import datetime
+from typing import Dict, Generator, List, Optional, Protocol
 
 from ..date_range import DateRange
 from ..pull_request_metadata import PullRequestMetadata
 from ..pull_request_basic_info import PullRequestBasicInfo
 from ..repository_identifier import RepositoryIdentifier
+from ..review_comment import ReviewComment
 
 
 class GitHubRepositoryInterface(Protocol):
@@ -24,10 +26,33 @@ class GitHubRepositoryInterface(Protocol):
         """
         ...
     
+    def count_closed_prs(self, repo_id: RepositoryIdentifier, date_range: DateRange) -> int:
+        """Count the PRs closed within the specified date range with a single request."""
+        ...
+    
     def get_full_pr_metadata(
         self, 
         pr_number: int, 
         repo_id: RepositoryIdentifier
     ) -> PullRequestMetadata:
         """Get full PR metadata including review comments for a specific PR."""
+        ...
+    
+    def get_review_comments_by_pr(
+        self,
+        repo_id: RepositoryIdentifier,
+        since: Optional[datetime] = None
+    ) -> Dict[int, List[ReviewComment]]:
+        """Get review comments of all PRs in a repository, grouped by PR number.
+        
+        Only comments updated at or after since are returned when it is given.
+        """
+        ...
+    
+    def count_review_comments(self, repo_id: RepositoryIdentifier, since: Optional[datetime] = None) -> int:
+        """Count the review comments of a repository updated at or after since with a single request."""
+        ...
+    
+    def list_repositories(self, owner: str) -> List[RepositoryIdentifier]:
+        """List the repositories owned by an organization or user."""
         ...
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Interface for PullRequestCatalog repository.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from ..pull_request_catalog import PullRequestCatalog
+from ..repository_identifier import RepositoryIdentifier
+
+
+class PullRequestCatalogRepositoryInterface(ABC):
+    """Interface for persisting the local PR catalog."""
+
+    @abstractmethod
+    def load(self, repository_id: RepositoryIdentifier, output_directory: Path) -> PullRequestCatalog:
+        """Load the catalog of a repository.
+
+        Args:
+            repository_id: Repository identifier
+            output_directory: Base output directory
+
+        Returns:
+            Stored catalog, or an empty catalog if none exists for the repository
+        """
+        pass
+
+    @abstractmethod
+    def save(self, catalog: PullRequestCatalog, output_directory: Path) -> None:
+        """Save the catalog.
+
+        Args:
+            catalog: Catalog to save
+            output_directory: Base output directory
+        """
+        pass
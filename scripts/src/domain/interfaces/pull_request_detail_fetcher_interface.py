@@ -0,0 +1,34 @@
+"""
+Interface for fetching full PR details in batches.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ..pull_request_basic_info import PullRequestBasicInfo
+from ..pull_request_metadata import PullRequestMetadata
+
+
+class PullRequestDetailFetcherInterface(ABC):
+    """Interface for fetching full PR metadata for several PRs at once."""
+
+    @property
+    @abstractmethod
+    def batch_size(self) -> Optional[int]:
+        """Number of PRs fetched together in one call to fetch_details.
+
+        None means all listed PRs are fetched together in a single call.
+        """
+        pass
+
+    @abstractmethod
+    def fetch_details(self, basic_infos: List[PullRequestBasicInfo]) -> List[PullRequestMetadata]:
+        """Fetch full PR metadata including review comments.
+
+        Args:
+            basic_infos: Basic info of the PRs to fetch, at most batch_size items
+
+        Returns:
+            PR metadata in the same order as basic_infos
+        """
+        pass
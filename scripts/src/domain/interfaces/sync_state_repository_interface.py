@@ -0,0 +1,37 @@
+"""
+Interface for SyncState repository.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from ..repository_identifier import RepositoryIdentifier
+from ..sync_state import SyncState
+
+
+class SyncStateRepositoryInterface(ABC):
+    """Interface for persisting the incremental sync high-water mark."""
+
+    @abstractmethod
+    def load(self, repository_id: RepositoryIdentifier, output_directory: Path) -> Optional[SyncState]:
+        """Load the sync state of a repository.
+
+        Args:
+            repository_id: Repository identifier
+            output_directory: Base output directory
+
+        Returns:
+            Stored sync state, or None if the repository was never synced
+        """
+        pass
+
+    @abstractmethod
+    def save(self, sync_state: SyncState, output_directory: Path) -> None:
+        """Save the sync state.
+
+        Args:
+            sync_state: Sync state to save
+            output_directory: Base output directory
+        """
+        pass
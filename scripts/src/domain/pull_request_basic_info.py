@@ -4,16 +4,26 @@ Pull request basic info value object.
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional, Tuple
 
 from .repository_identifier import RepositoryIdentifier
 
 
 @dataclass(frozen=True)
 class PullRequestBasicInfo:
-    """Represents basic PR information."""
+    """Represents basic PR information.
+
+    Fields a listing does not provide are None, meaning unknown.
+    """
 
     number: int
     title: str
     closed_at: datetime
     is_merged: bool
-    repository_id: RepositoryIdentifier
\ No newline at end of file
+    repository_id: RepositoryIdentifier
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    author: Optional[str] = None
+    base_branch: Optional[str] = None
+    labels: Optional[Tuple[str, ...]] = None
+    review_comment_count: Optional[int] = None
\ No newline at end of file
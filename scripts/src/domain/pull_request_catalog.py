@@ -0,0 +1,126 @@
+"""
+Pull request catalog entity.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .date_range import DateRange
+from .pull_request_catalog_entry import PullRequestCatalogEntry
+from .repository_identifier import RepositoryIdentifier
+
+
+class PullRequestCatalog:
+    """Local record of the closed PRs of a repository and the closed-date ranges fully listed.
+
+    A closed-date range is covered once every PR closed within it has been
+    listed, so later listings of the range can be answered from the catalog.
+    """
+
+    # GitHub timestamps have second precision, so only whole seconds can fall between ranges
+    _SECOND = timedelta(seconds=1)
+
+    def __init__(
+        self,
+        repository_id: RepositoryIdentifier,
+        entries: Iterable[PullRequestCatalogEntry] = (),
+        covered_ranges: Iterable[DateRange] = ()
+    ):
+        """Initialize PR catalog.
+
+        Args:
+            repository_id: Repository the catalogued PRs belong to
+            entries: Catalogued PRs
+            covered_ranges: Closed-date ranges whose PRs are all catalogued
+        """
+        self._repository_id = repository_id
+        self._entries: Dict[int, PullRequestCatalogEntry] = {entry.number: entry for entry in entries}
+        self._covered_ranges: List[DateRange] = []
+        for date_range in covered_ranges:
+            self.mark_covered(date_range)
+
+    @property
+    def repository_id(self) -> RepositoryIdentifier:
+        """Repository the catalogued PRs belong to."""
+        return self._repository_id
+
+    @property
+    def entries(self) -> List[PullRequestCatalogEntry]:
+        """Catalogued PRs ordered by number."""
+        return [self._entries[number] for number in sorted(self._entries)]
+
+    @property
+    def covered_ranges(self) -> List[DateRange]:
+        """Disjoint covered closed-date ranges in ascending order."""
+        return list(self._covered_ranges)
+
+    def get(self, number: int) -> Optional[PullRequestCatalogEntry]:
+        """Get the entry of a PR, or None if it is not catalogued."""
+        return self._entries.get(number)
+
+    def add(self, entry: PullRequestCatalogEntry) -> None:
+        """Add or replace the entry of a PR, keeping a known comment count."""
+        existing = self._entries.get(entry.number)
+        if existing is not None and entry.comment_count is None and existing.comment_count is not None:
+            entry = entry.with_comment_count(existing.comment_count)
+        self._entries[entry.number] = entry
+
+    def record_comment_count(self, number: int, comment_count: int) -> None:
+        """Record the number of review comments of a catalogued PR."""
+        entry = self._entries.get(number)
+        if entry is not None:
+            self._entries[number] = entry.with_comment_count(comment_count)
+
+    def entries_within(self, date_range: DateRange) -> List[PullRequestCatalogEntry]:
+        """Get the entries closed within a range, most recently closed first."""
+        matching = [entry for entry in self._entries.values() if date_range.contains(entry.closed_at)]
+        return sorted(matching, key=lambda entry: entry.closed_at, reverse=True)
+
+    def mark_covered(self, date_range: DateRange) -> None:
+        """Record that every PR closed within a range has been catalogued."""
+        merged_start = date_range.start_date
+        merged_end = date_range.end_date
+        remaining = []
+        for covered in self._covered_ranges:
+            if self._next_second(covered.end_date) < merged_start or self._next_second(merged_end) < covered.start_date:
+                remaining.append(covered)
+            else:
+                merged_start = min(merged_start, covered.start_date)
+                merged_end = max(merged_end, covered.end_date)
+        remaining.append(DateRange(start_date=merged_start, end_date=merged_end))
+        self._covered_ranges = sorted(remaining, key=lambda covered: covered.start_date)
+
+    def uncovered_ranges(self, date_range: DateRange) -> List[DateRange]:
+        """Get the parts of a range that still have to be listed from GitHub.
+
+        Args:
+            date_range: Requested closed-date range
+
+        Returns:
+            Disjoint uncovered sub-ranges in ascending order
+        """
+        gaps = []
+        cursor = date_range.start_date
+        for covered in self._covered_ranges:
+            if covered.end_date < cursor:
+                continue
+            if covered.start_date > date_range.end_date:
+                break
+            gap_end = self._previous_second(covered.start_date)
+            if gap_end >= cursor:
+                gaps.append(DateRange(start_date=cursor, end_date=gap_end))
+            cursor = self._next_second(covered.end_date)
+            if cursor > date_range.end_date:
+                return gaps
+        gaps.append(DateRange(start_date=cursor, end_date=date_range.end_date))
+        return gaps
+
+    @classmethod
+    def _next_second(cls, moment: datetime) -> datetime:
+        """Get the first whole second after a moment."""
+        return moment.replace(microsecond=0) + cls._SECOND
+
+    @classmethod
+    def _previous_second(cls, moment: datetime) -> datetime:
+        """Get the last whole second before a moment."""
+        return (moment - DateRange._RESOLUTION).replace(microsecond=0)
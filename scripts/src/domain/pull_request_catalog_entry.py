@@ -0,0 +1,61 @@
+"""
+Pull request catalog entry value object.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional, Tuple
+
+from .pull_request_basic_info import PullRequestBasicInfo
+from .repository_identifier import RepositoryIdentifier
+
+
+@dataclass(frozen=True)
+class PullRequestCatalogEntry:
+    """Represents the locally catalogued listing data of one closed PR."""
+
+    number: int
+    title: str
+    closed_at: datetime
+    is_merged: bool
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    comment_count: Optional[int] = None
+    author: Optional[str] = None
+    base_branch: Optional[str] = None
+    labels: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_basic_info(cls, basic_info: PullRequestBasicInfo) -> "PullRequestCatalogEntry":
+        """Create a catalog entry from listed PR info."""
+        return cls(
+            number=basic_info.number,
+            title=basic_info.title,
+            closed_at=basic_info.closed_at,
+            is_merged=basic_info.is_merged,
+            created_at=basic_info.created_at,
+            updated_at=basic_info.updated_at,
+            author=basic_info.author,
+            base_branch=basic_info.base_branch,
+            labels=basic_info.labels
+        )
+
+    def to_basic_info(self, repository_id: RepositoryIdentifier) -> PullRequestBasicInfo:
+        """Convert the entry back to listed PR info, including the review comment count recorded for it."""
+        return PullRequestBasicInfo(
+            number=self.number,
+            title=self.title,
+            closed_at=self.closed_at,
+            is_merged=self.is_merged,
+            repository_id=repository_id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            author=self.author,
+            base_branch=self.base_branch,
+            labels=self.labels,
+            review_comment_count=self.comment_count
+        )
+
+    def with_comment_count(self, comment_count: int) -> "PullRequestCatalogEntry":
+        """Create a copy of the entry with the number of review comments."""
+        return replace(self, comment_count=comment_count)
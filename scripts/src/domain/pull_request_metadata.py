@@ -2,9 +2,9 @@
 Pull request metadata value object.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import List
+from typing import Iterable, List
 
 from .review_comment import ReviewComment
 from .repository_identifier import RepositoryIdentifier
@@ -19,4 +19,21 @@ class PullRequestMetadata:
     closed_at: datetime
     is_merged: bool
     review_comments: List[ReviewComment]
-    repository_id: RepositoryIdentifier
\ No newline at end of file
+    repository_id: RepositoryIdentifier
+    
+    def with_updated_comments(self, updated_comments: Iterable[ReviewComment]) -> "PullRequestMetadata":
+        """Create a copy with new review comments added and edited ones replaced.
+        
+        Comments are matched by ID and kept in creation order.
+        
+        Args:
+            updated_comments: Review comments created or edited since the PR was saved
+            
+        Returns:
+            PR metadata with the merged review comments
+        """
+        comments_by_id = {comment.comment_id: comment for comment in self.review_comments}
+        for comment in updated_comments:
+            comments_by_id[comment.comment_id] = comment
+        merged_comments = sorted(comments_by_id.values(), key=lambda comment: (comment.created_at, comment.comment_id))
+        return replace(self, review_comments=merged_comments)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Pull request selection value object.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .pull_request_basic_info import PullRequestBasicInfo
+
+
+@dataclass(frozen=True)
+class PullRequestSelection:
+    """Predicates deciding from listing data which PRs are worth fetching in detail.
+
+    A predicate only rejects a PR when the listing provided the data it needs;
+    PRs with unknown values are kept and fetched.
+
+    Attributes:
+        merged_only: Reject PRs closed without being merged
+        excluded_authors: Author login patterns to reject; "*" matches any
+            characters, e.g. "dependabot*" or "*[bot]"
+        base_branches: Base branches to keep, or empty for any branch
+        labels: Labels of which a PR must carry at least one, or empty for any
+        min_review_comments: Minimum number of review comments to keep a PR
+    """
+
+    merged_only: bool = False
+    excluded_authors: Tuple[str, ...] = ()
+    base_branches: Tuple[str, ...] = ()
+    labels: Tuple[str, ...] = ()
+    min_review_comments: int = 0
+
+    def __post_init__(self):
+        """Validate selection."""
+        if self.min_review_comments < 0:
+            raise ValueError(f"Minimum review comments must not be negative, got {self.min_review_comments}")
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the selection keeps every PR."""
+        return self == PullRequestSelection()
+
+    def rejection_reason(self, basic_info: PullRequestBasicInfo) -> Optional[str]:
+        """Check a listed PR against the predicates.
+
+        Args:
+            basic_info: Listed PR
+
+        Returns:
+            Why the PR is not selected, or None if it is selected
+        """
+        if self.merged_only and not basic_info.is_merged:
+            return "not merged"
+
+        if basic_info.author is not None:
+            for pattern in self.excluded_authors:
+                if self._matches_pattern(basic_info.author, pattern):
+                    return f"author {basic_info.author} is excluded"
+
+        if self.base_branches and basic_info.base_branch is not None:
+            if basic_info.base_branch not in self.base_branches:
+                return f"base branch {basic_info.base_branch} is not selected"
+
+        if self.labels and basic_info.labels is not None:
+            if not set(self.labels) & set(basic_info.labels):
+                return "no selected label"
+
+        if basic_info.review_comment_count is not None:
+            if basic_info.review_comment_count < self.min_review_comments:
+                return f"only {basic_info.review_comment_count} review comments"
+
+        return None
+
+    def matches(self, basic_info: PullRequestBasicInfo) -> bool:
+        """Check whether a listed PR is selected.
+
+        Args:
+            basic_info: Listed PR
+
+        Returns:
+            True if the PR should be fetched
+        """
+        return self.rejection_reason(basic_info) is None
+
+    @staticmethod
+    def _matches_pattern(value: str, pattern: str) -> bool:
+        """Match a value against a pattern where "*" matches any characters, ignoring case."""
+        regex = ".*".join(re.escape(part) for part in pattern.split("*"))
+        return re.fullmatch(regex, value, re.IGNORECASE) is not None
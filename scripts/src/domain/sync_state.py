@@ -0,0 +1,20 @@
+"""
+Sync state value object.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from .repository_identifier import RepositoryIdentifier
+
+
+@dataclass(frozen=True)
+class SyncState:
+    """Represents the high-water mark of the last incremental sync of a repository.
+
+    Review comments created or updated at or after last_synced_at have not
+    been applied to the saved PR files yet.
+    """
+
+    repository_id: RepositoryIdentifier
+    last_synced_at: datetime
@@ -6,6 +6,7 @@ from ruamel.yaml import YAML
 from pathlib import Path
 from typing import Optional
 
+from .comment_filter_rules import CommentFilterRules
 from .repository_identifier import RepositoryIdentifier
 
 
@@ -76,4 +77,22 @@ class WorkspaceConfig:
         Returns:
             RepositoryIdentifier instance
         """
-        return RepositoryIdentifier(owner=self.organization, name=self.repository)
\ No newline at end of file
+        return RepositoryIdentifier(owner=self.organization, name=self.repository)
+
+    def get_comment_filter_rules(self) -> CommentFilterRules:
+        """Get the rules of review comments dropped while fetching.
+
+        Returns:
+            Rules of the comment_filters section, or the default rules if the
+            section is missing
+
+        Raises:
+            ValueError: If the comment_filters section is invalid
+        """
+        config = self._load_config()
+        section = config.get('comment_filters')
+        if section is None:
+            return CommentFilterRules()
+        if not isinstance(section, dict):
+            raise ValueError("comment_filters must be a mapping")
+        return CommentFilterRules.from_config(section)
\ No newline at end of file
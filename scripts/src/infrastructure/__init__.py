@@ -2,11 +2,13 @@
 Infrastructure layer - External dependencies and adapters.
 """
 
+from .collection_options import CollectionOptions
 from .service_factory import ServiceFactory
 from .repositories import GitHubRepository, PullRequestMetadataRepository
 from .services import TimezoneConverter
 
 __all__ = [
+    "CollectionOptions",
     "GitHubRepository",
     "PullRequestMetadataRepository",
     "ServiceFactory",
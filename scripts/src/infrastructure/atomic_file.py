@@ -0,0 +1,53 @@
+"""
+Atomic replacement of files.
+"""
+
+import os
+import tempfile
+import stat
+from pathlib import Path
+
+
+def _read_umask() -> int:
+    """Read the file mode creation mask of the process.
+
+    The mask can only be read by setting it, so it is read once at import,
+    before worker threads create files.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def write_text_atomically(path: Path, content: str) -> None:
+    """Replace a file with new content, so readers see either the old or the new file.
+
+    The content is written to a temporary file in the same directory, which
+    then replaces the target. The temporary file is removed if writing fails.
+    The file keeps the permissions of the file it replaces; a new file gets
+    the permissions open() would give it under the umask.
+
+    Args:
+        path: File to write; its directory must exist
+        content: Text written as UTF-8
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        # mkstemp creates the file readable by its owner only
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
@@ -0,0 +1,75 @@
+"""
+Options of a PR review collection run.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ..domain.comment_filter_rules import CommentFilterRules
+from ..domain.date_partitioning import DatePartitioning
+from ..domain.pull_request_selection import PullRequestSelection
+from .fetchers.graphql_pull_request_detail_fetcher import GraphQLPullRequestDetailFetcher
+from .http.fetch_metrics import FetchMetrics
+from .http.hedging_interceptor import HedgingInterceptor
+from .services.github_app_token_provider import GitHubAppCredentials
+
+
+@dataclass(frozen=True)
+class CollectionOptions:
+    """Settings the service factory builds the collection services of a run from.
+
+    Attributes:
+        github_token: GitHub personal access token, or None to authenticate as github_app only
+        timezone: Target timezone for date conversion
+        concurrency: Number of PR details fetched in parallel per repository
+        backend: GitHub API client backend ("pygithub" or "async")
+        strategy: PR detail fetch strategy ("rest", "graphql" or "repo-comments")
+        graphql_batch_size: Number of PRs per GraphQL query
+        http_cache: Revalidate repeated requests against a persistent ETag cache
+        http_cache_directory: Cache directory, or None for the shared default
+        listing_strategy: How closed PRs are selected ("auto", "scan", "search" or "issues")
+        use_catalog: Answer previously listed date ranges from the local PR catalog
+        shared_rate_limit_budget: Draw requests from the rate limit budget shared
+            by all fetch processes of the host
+        additional_tokens: Further tokens requests are spread across together
+            with github_token
+        github_app: GitHub App whose installation tokens are used together
+            with the tokens
+        selection: Predicates on listing data deciding which PRs are fetched
+        comment_filter_rules: Rules of review comments dropped while fetching,
+            or None for the default rules
+        request_timeout: Seconds a GitHub request may take, or None to wait indefinitely
+        hedge_requests: Send a second attempt of GET requests slower than the
+            95th percentile latency
+        partitioning: Split the date range into windows listed concurrently,
+            or None to list it as one stream
+        max_requests: Requests the run may send before collection stops
+            between PRs, or None for no limit
+        deadline: Seconds the run may take before collection stops between
+            PRs, or None for no limit
+        fetch_metrics: Metrics the requests, phase times and saved PRs of
+            the run are recorded in, or None to record none
+    """
+
+    github_token: Optional[str]
+    timezone: str = "UTC"
+    concurrency: int = 1
+    backend: str = "pygithub"
+    strategy: str = "rest"
+    graphql_batch_size: int = GraphQLPullRequestDetailFetcher.DEFAULT_BATCH_SIZE
+    http_cache: bool = True
+    http_cache_directory: Optional[Path] = None
+    listing_strategy: str = "auto"
+    use_catalog: bool = True
+    shared_rate_limit_budget: bool = True
+    additional_tokens: Tuple[str, ...] = ()
+    github_app: Optional[GitHubAppCredentials] = None
+    selection: Optional[PullRequestSelection] = None
+    comment_filter_rules: Optional[CommentFilterRules] = None
+    request_timeout: Optional[float] = HedgingInterceptor.DEFAULT_TIMEOUT_SECONDS
+    hedge_requests: bool = False
+    partitioning: Optional[DatePartitioning] = None
+    max_requests: Optional[int] = None
+    deadline: Optional[float] = None
+    fetch_metrics: Optional[FetchMetrics] = None
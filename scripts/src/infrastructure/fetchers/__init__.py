@@ -0,0 +1,11 @@
+"""
+Infrastructure fetchers package.
+"""
+
+from .graphql_pull_request_detail_fetcher import GraphQLPullRequestDetailFetcher
+from .repository_comments_pull_request_detail_fetcher import RepositoryCommentsPullRequestDetailFetcher
+
+__all__ = [
+    "GraphQLPullRequestDetailFetcher",
+    "RepositoryCommentsPullRequestDetailFetcher"
+]
\ No newline at end of file
@@ -0,0 +1,263 @@
+"""
+GraphQL-backed batch fetcher for PR details.
+"""
+
+import logging
+import math
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from github import Github
+from github.GithubException import GithubException
+
+from ...domain.interfaces.comment_filter_interface import CommentFilterInterface
+from ...domain.interfaces.github_repository_interface import GitHubRepositoryInterface
+from ...domain.interfaces.pull_request_detail_fetcher_interface import PullRequestDetailFetcherInterface
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.pull_request_metadata import PullRequestMetadata
+from ...domain.repository_identifier import RepositoryIdentifier
+from ...domain.review_comment import ReviewComment
+from ..repositories.github_payload_mapper import GitHubPayloadMapper
+from ...application.exceptions.github_api_error import GitHubApiError
+
+
+class GraphQLPullRequestDetailFetcher(PullRequestDetailFetcherInterface):
+    """Fetches many PRs with their review threads in a single GraphQL query.
+
+    PRs whose review threads or thread comments exceed one GraphQL page are
+    fetched again through the REST repository, so no comment is lost.
+    """
+
+    DEFAULT_BATCH_SIZE = 50
+
+    # Page sizes of the nested connections; 50 PRs x 50 threads x 50 comments
+    # stays well below GitHub's limit of 500,000 nodes per query
+    _THREADS_PER_PR = 50
+    _COMMENTS_PER_THREAD = 50
+
+    # GitHub charges one rate-limit point per this many connection requests of a query
+    _CONNECTION_REQUESTS_PER_POINT = 100
+
+    # GraphQL reports bot logins without the "[bot]" suffix REST appends to them
+    _BOT_TYPENAME = "Bot"
+    _BOT_LOGIN_SUFFIX = "[bot]"
+
+    _PULL_REQUEST_FIELDS = f"""
+        number
+        title
+        closedAt
+        merged
+        reviewThreads(first: {_THREADS_PER_PR}) {{
+          pageInfo {{ hasNextPage }}
+          nodes {{
+            comments(first: {_COMMENTS_PER_THREAD}) {{
+              pageInfo {{ hasNextPage }}
+              nodes {{
+                databaseId
+                path
+                originalPosition
+                commit {{ oid }}
+                originalCommit {{ oid }}
+                author {{ login __typename }}
+                createdAt
+                body
+                diffHunk
+              }}
+            }}
+          }}
+        }}
+    """
+
+    def __init__(
+        self,
+        github_client_factory: Callable[[], Github],
+        fallback_repository: GitHubRepositoryInterface,
+        payload_mapper: GitHubPayloadMapper,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        comment_filter: Optional[CommentFilterInterface] = None
+    ):
+        """Initialize GraphQL PR detail fetcher.
+
+        Args:
+            github_client_factory: Factory creating the client each thread sends
+                GraphQL queries with, since PyGithub clients are not thread-safe
+            fallback_repository: Repository fetching PRs that do not fit one query
+            payload_mapper: Mapper for timestamps and author logins
+            batch_size: Number of PRs requested per query
+            comment_filter: Filter whose rejected comments are skipped before
+                review comments are built from them
+
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+
+        self._github_client_factory = github_client_factory
+        self._thread_clients = threading.local()
+        self._fallback_repository = fallback_repository
+        self._payload_mapper = payload_mapper
+        self._batch_size = batch_size
+        self._comment_filter = comment_filter
+        self._logger = logging.getLogger("fetch")
+
+    @property
+    def batch_size(self) -> int:
+        """Number of PRs requested per GraphQL query."""
+        return self._batch_size
+
+    @classmethod
+    def rate_limit_points(cls, pr_count: int) -> int:
+        """Rate-limit points GitHub charges for a query fetching a number of PRs.
+
+        Each PR requests one page of review threads and one page of comments
+        per thread.
+        """
+        connection_requests = pr_count * (1 + cls._THREADS_PER_PR)
+        return max(1, math.ceil(connection_requests / cls._CONNECTION_REQUESTS_PER_POINT))
+
+    def _get_client(self) -> Github:
+        """Get the GitHub client owned by the current thread."""
+        client = getattr(self._thread_clients, "client", None)
+        if client is None:
+            client = self._github_client_factory()
+            self._thread_clients.client = client
+        return client
+
+    def fetch_details(self, basic_infos: List[PullRequestBasicInfo]) -> List[PullRequestMetadata]:
+        """Fetch full PR metadata for a batch of PRs of one repository.
+
+        Raises:
+            GitHubApiError: If the GraphQL query fails
+        """
+        if not basic_infos:
+            return []
+
+        repo_id = basic_infos[0].repository_id
+        pull_request_nodes = self._query_pull_requests(repo_id, [info.number for info in basic_infos])
+
+        results = []
+        for basic_info in basic_infos:
+            node = pull_request_nodes.get(basic_info.number)
+            if node is None or self._has_truncated_comments(node):
+                self._logger.debug(f"Fetching PR #{basic_info.number} through REST")
+                results.append(self._fallback_repository.get_full_pr_metadata(basic_info.number, repo_id))
+            else:
+                results.append(self._to_pr_metadata(node, repo_id))
+        return results
+
+    def build_query(self, pr_numbers: List[int]) -> str:
+        """Build a query selecting each PR under an alias named after its number.
+
+        Args:
+            pr_numbers: PR numbers to select
+
+        Returns:
+            GraphQL query text taking $owner and $name variables
+        """
+        selections = "\n".join(
+            f"pr{number}: pullRequest(number: {int(number)}) {{ ...PullRequestDetail }}"
+            for number in pr_numbers
+        )
+        return (
+            "query($owner: String!, $name: String!) {\n"
+            "  repository(owner: $owner, name: $name) {\n"
+            f"{selections}\n"
+            "  }\n"
+            "}\n"
+            f"fragment PullRequestDetail on PullRequest {{{self._PULL_REQUEST_FIELDS}}}\n"
+        )
+
+    def _query_pull_requests(self, repo_id: RepositoryIdentifier, pr_numbers: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Send one GraphQL query and return the PR nodes keyed by number."""
+        requester = self._get_client().requester
+        query_input = {
+            "query": self.build_query(pr_numbers),
+            "variables": {"owner": repo_id.owner, "name": repo_id.name}
+        }
+        try:
+            _, response = requester.requestJsonAndCheck("POST", requester.graphql_url, input=query_input)
+        except GithubException as e:
+            raise GitHubApiError(f"GraphQL query for {repo_id.to_string()} failed: {e}")
+
+        repository = (response.get("data") or {}).get("repository")
+        if repository is None:
+            raise GitHubApiError(f"GraphQL query for {repo_id.to_string()} failed: {response.get('errors')}")
+        for error in response.get("errors", []):
+            self._logger.warning(f"GraphQL error for {repo_id.to_string()}: {error.get('message')}")
+
+        return {
+            node["number"]: node
+            for node in repository.values()
+            if node is not None
+        }
+
+    @staticmethod
+    def _has_truncated_comments(node: Dict[str, Any]) -> bool:
+        """Check whether some review threads or comments were left on later pages."""
+        threads = node["reviewThreads"]
+        if threads["pageInfo"]["hasNextPage"]:
+            return True
+        return any(thread["comments"]["pageInfo"]["hasNextPage"] for thread in threads["nodes"])
+
+    def _to_pr_metadata(self, node: Dict[str, Any], repo_id: RepositoryIdentifier) -> PullRequestMetadata:
+        """Map a GraphQL pull request node to PR metadata."""
+        comment_nodes = [
+            comment
+            for thread in node["reviewThreads"]["nodes"]
+            for comment in thread["comments"]["nodes"]
+            if not self._rejects_comment(comment)
+        ]
+        # REST returns review comments in creation order; keep the same order
+        comment_nodes.sort(key=lambda comment: comment["databaseId"])
+
+        return PullRequestMetadata(
+            number=node["number"],
+            title=node["title"],
+            closed_at=self._payload_mapper.parse_timestamp(node["closedAt"]),
+            is_merged=node["merged"],
+            review_comments=[self._to_review_comment(comment) for comment in comment_nodes],
+            repository_id=repo_id
+        )
+
+    def _rejects_comment(self, comment: Dict[str, Any]) -> bool:
+        """Check a GraphQL review comment node against the comment filter."""
+        if self._comment_filter is None:
+            return False
+        author = comment.get("author") or {}
+        return self._comment_filter.rejects(
+            self._author_login(comment),
+            author.get("__typename"),
+            comment.get("body") or ""
+        )
+
+    def _to_review_comment(self, comment: Dict[str, Any]) -> ReviewComment:
+        """Map a GraphQL review comment node to a review comment."""
+        commit = comment.get("commit") or comment.get("originalCommit") or {}
+        return ReviewComment(
+            comment_id=comment["databaseId"],
+            file_path=comment["path"],
+            position=comment.get("originalPosition"),
+            commit_id=commit.get("oid", ""),
+            author=self._author_login(comment),
+            created_at=self._payload_mapper.parse_timestamp(comment["createdAt"]),
+            body=comment["body"],
+            diff_context=self._diff_context(comment)
+        )
+
+    @classmethod
+    def _author_login(cls, comment: Dict[str, Any]) -> str:
+        """Extract the author login of a GraphQL review comment node as REST reports it."""
+        author = comment.get("author") or {}
+        login = author.get("login", GitHubPayloadMapper.GHOST_LOGIN)
+        if author.get("__typename") == cls._BOT_TYPENAME:
+            return f"{login}{cls._BOT_LOGIN_SUFFIX}"
+        return login
+
+    @staticmethod
+    def _diff_context(comment: Dict[str, Any]) -> str:
+        """Extract diff context from a GraphQL review comment node."""
+        diff_hunk: Optional[str] = comment.get("diffHunk")
+        if diff_hunk:
+            return diff_hunk
+        return f"@@ Position: {comment.get('originalPosition')} in {comment['path']} @@"
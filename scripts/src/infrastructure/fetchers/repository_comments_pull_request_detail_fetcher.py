@@ -0,0 +1,73 @@
+"""
+Batch fetcher for PR details built on the repository-wide review comments endpoint.
+"""
+
+import logging
+from typing import List, Optional
+
+from ...domain.interfaces.github_repository_interface import GitHubRepositoryInterface
+from ...domain.interfaces.pull_request_detail_fetcher_interface import PullRequestDetailFetcherInterface
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.pull_request_metadata import PullRequestMetadata
+
+
+class RepositoryCommentsPullRequestDetailFetcher(PullRequestDetailFetcherInterface):
+    """Fetches the review comments of many PRs by paging through the repository once.
+
+    A PR cannot receive comments before it is created, so the comments of a
+    batch are requested since the creation time of its oldest PR. By default
+    all listed PRs form a single batch, turning one comments listing per PR
+    into one listing for the whole date range.
+    """
+
+    def __init__(self, github_repository: GitHubRepositoryInterface, batch_size: Optional[int] = None):
+        """Initialize repository comments PR detail fetcher.
+
+        Args:
+            github_repository: Repository providing review comments grouped by PR
+            batch_size: Number of PRs per repository comments listing, or None
+                to list the comments once for all PRs
+
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+
+        self._github_repository = github_repository
+        self._batch_size = batch_size
+        self._logger = logging.getLogger("fetch")
+
+    @property
+    def batch_size(self) -> Optional[int]:
+        """Number of PRs per repository comments listing, or None for all."""
+        return self._batch_size
+
+    def fetch_details(self, basic_infos: List[PullRequestBasicInfo]) -> List[PullRequestMetadata]:
+        """Fetch full PR metadata for a batch of PRs of one repository.
+
+        Raises:
+            GitHubApiError: If the review comments cannot be fetched
+        """
+        if not basic_infos:
+            return []
+
+        repo_id = basic_infos[0].repository_id
+        created_ats = [basic_info.created_at for basic_info in basic_infos]
+        # Without a known creation time every comment of the repository has to be listed
+        since = None if None in created_ats else min(created_ats)
+
+        self._logger.info(f"Fetching review comments of {len(basic_infos)} PRs from {repo_id.to_string()}")
+        comments_by_pr = self._github_repository.get_review_comments_by_pr(repo_id, since)
+
+        return [
+            PullRequestMetadata(
+                number=basic_info.number,
+                title=basic_info.title,
+                closed_at=basic_info.closed_at,
+                is_merged=basic_info.is_merged,
+                review_comments=comments_by_pr.get(basic_info.number, []),
+                repository_id=repo_id
+            )
+            for basic_info in basic_infos
+        ]
@@ -2,25 +2,16 @@
 AI comment filter implementation.
 """
 
-from typing import List
+from ...domain.comment_filter_rules import CommentFilterRules
+from .configurable_comment_filter import ConfigurableCommentFilter
 
-from ...domain.interfaces.comment_filter_interface import CommentFilterInterface
-from ...domain.review_comment import ReviewComment
 
-
-class AICommentFilter(CommentFilterInterface):
+class AICommentFilter(ConfigurableCommentFilter):
     """Filter to remove comments authored by AI systems."""
     
     # List of AI author names to filter out
-    AI_AUTHORS = {"Copilot"}
+    AI_AUTHORS = set(CommentFilterRules.DEFAULT_EXCLUDED_AUTHORS)
     
-    def filter_comments(self, comments: List[ReviewComment]) -> List[ReviewComment]:
-        """Filter out comments authored by AI systems.
-        
-        Args:
-            comments: List of review comments to filter
-            
-        Returns:
-            Filtered list of review comments excluding AI-generated comments
-        """
-        return [comment for comment in comments if comment.author not in self.AI_AUTHORS]
\ No newline at end of file
+    def __init__(self):
+        """Initialize AI comment filter with the default rules."""
+        super().__init__(CommentFilterRules())
@@ -0,0 +1,89 @@
+"""
+Configurable comment filter implementation.
+"""
+
+import re
+from typing import List, Optional
+
+from ...domain.comment_filter_rules import CommentFilterRules
+from ...domain.interfaces.comment_filter_interface import CommentFilterInterface
+from ...domain.review_comment import ReviewComment
+
+
+class ConfigurableCommentFilter(CommentFilterInterface):
+    """Filter dropping review comments by author and body rules.
+    
+    The rules are compiled once: the excluded authors into one set and all
+    body rules into one regular expression, so each comment is checked with
+    a set lookup and a single regex search.
+    """
+    
+    BOT_SUFFIX = "[bot]"
+    BOT_USER_TYPE = "Bot"
+    
+    def __init__(self, rules: Optional[CommentFilterRules] = None):
+        """Initialize configurable comment filter.
+        
+        Args:
+            rules: Rules to apply, or None for the default rules
+            
+        Raises:
+            ValueError: If a body pattern is not a valid regular expression
+        """
+        self._rules = rules or CommentFilterRules()
+        self._excluded_authors = frozenset(author.lower() for author in self._rules.excluded_authors)
+        self._body_regex = self._compile_body_regex(self._rules)
+    
+    @property
+    def rules(self) -> CommentFilterRules:
+        """Rules the filter was compiled from."""
+        return self._rules
+    
+    def filter_comments(self, comments: List[ReviewComment]) -> List[ReviewComment]:
+        """Filter out comments matching any rule.
+        
+        Review comments carry no account type, so the bot user rule only
+        applies while fetching.
+        
+        Args:
+            comments: List of review comments to filter
+            
+        Returns:
+            Filtered list of review comments
+        """
+        return [comment for comment in comments if not self.rejects(comment.author, None, comment.body)]
+    
+    def rejects(self, author: str, author_type: Optional[str], body: str) -> bool:
+        """Check a raw comment against the compiled rules.
+        
+        Args:
+            author: Login of the comment author
+            author_type: Account type GitHub reports for the author, or None if unknown
+            body: Comment body
+            
+        Returns:
+            True if the comment is dropped
+        """
+        login = author.lower()
+        if login in self._excluded_authors:
+            return True
+        if self._rules.exclude_bot_suffix and login.endswith(self.BOT_SUFFIX):
+            return True
+        if self._rules.exclude_bot_users and author_type == self.BOT_USER_TYPE:
+            return True
+        return self._body_regex is not None and self._body_regex.search(body or "") is not None
+    
+    @staticmethod
+    def _compile_body_regex(rules: CommentFilterRules) -> Optional[re.Pattern]:
+        """Combine the body presets and patterns into one case-insensitive regex."""
+        alternatives = [rf"\A(?:{CommentFilterRules.BODY_PRESETS[preset]})\Z" for preset in rules.body_presets]
+        for pattern in rules.body_patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid comment body pattern {pattern!r}: {e}")
+            alternatives.append(f"(?:{pattern})")
+        
+        if not alternatives:
+            return None
+        return re.compile("|".join(alternatives), re.IGNORECASE)
@@ -0,0 +1,45 @@
+"""
+Infrastructure HTTP package.
+"""
+
+from .adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker
+from .disk_http_response_cache import CachedHttpResponse, DiskHttpResponseCache
+from .etag_cache_interceptor import ETagCacheInterceptor
+from .fetch_budget import FetchBudget
+from .fetch_metrics import FetchMetrics
+from .github_http_transport import GitHubHttpTransport
+from .github_token_pool import GitHubTokenPool
+from .hedging_interceptor import HedgingInterceptor
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+from .rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+from .request_budget_interceptor import RequestBudgetInterceptor
+from .request_metrics_interceptor import RequestMetricsInterceptor
+from .retry_interceptor import RetryInterceptor
+from .shared_rate_limit_budget import SharedRateLimitBudget
+from .shared_rate_limit_budget_interceptor import SharedRateLimitBudgetInterceptor
+from .token_pool_interceptor import TokenPoolInterceptor
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "CachedHttpResponse",
+    "CircuitBreaker",
+    "DiskHttpResponseCache",
+    "ETagCacheInterceptor",
+    "FetchBudget",
+    "FetchMetrics",
+    "GitHubHttpTransport",
+    "GitHubTokenPool",
+    "HedgingInterceptor",
+    "HttpHandler",
+    "HttpInterceptor",
+    "HttpRequest",
+    "RateLimitSchedulerInterceptor",
+    "RequestBudgetInterceptor",
+    "RequestMetricsInterceptor",
+    "RetryInterceptor",
+    "SharedRateLimitBudget",
+    "SharedRateLimitBudgetInterceptor",
+    "TokenPoolInterceptor"
+]
\ No newline at end of file
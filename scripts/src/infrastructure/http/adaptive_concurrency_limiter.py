@@ -0,0 +1,112 @@
+"""
+Adaptive limit on the number of in-flight GitHub requests.
+"""
+
+import logging
+import threading
+from typing import Dict
+
+
+class AdaptiveConcurrencyLimiter:
+    """Gates in-flight requests with a limit adjusted by additive increase / multiplicative decrease.
+
+    Each healthy response raises the limit by 1/limit, so it grows by about
+    one per round trip. A throttled response, or latency well above the
+    fastest smoothed latency seen so far, halves the limit. At most one
+    decrease happens per round trip so a burst of slow responses counts once.
+
+    Latencies are only compared within a class of requests, such as a rate
+    limit resource, so slow GraphQL batches mixed with fast REST calls do not
+    look like congestion.
+    """
+
+    # Weight of the newest sample in the smoothed latency
+    _LATENCY_SMOOTHING = 0.2
+
+    # Smoothed latency above this multiple of the baseline counts as congestion
+    _LATENCY_TOLERANCE = 2.0
+
+    _DECREASE_FACTOR = 0.5
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        """Initialize adaptive concurrency limiter.
+
+        Args:
+            max_limit: Upper bound and initial value of the limit
+            min_limit: Lower bound of the limit
+
+        Raises:
+            ValueError: If the bounds are not 1 <= min_limit <= max_limit
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"Limits must satisfy 1 <= min_limit <= max_limit, got {min_limit} and {max_limit}")
+
+        self._max_limit = max_limit
+        self._min_limit = min_limit
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._completions_until_next_decrease = 0
+        self._smoothed_latencies: Dict[str, float] = {}
+        self._baseline_latencies: Dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._logger = logging.getLogger("fetch")
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        with self._condition:
+            return int(self._limit)
+
+    def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, throttled: bool, latency_class: str = "default") -> None:
+        """Record the outcome of a request and free its slot.
+
+        Args:
+            latency: Seconds the request took
+            throttled: Whether GitHub rejected the request for rate limiting
+            latency_class: Class of requests with comparable latencies the
+                request belongs to, e.g. its rate limit resource
+        """
+        with self._condition:
+            self._in_flight -= 1
+            congested = throttled or self._observe_latency(latency, latency_class)
+
+            if self._completions_until_next_decrease > 0:
+                self._completions_until_next_decrease -= 1
+
+            if congested:
+                if self._completions_until_next_decrease == 0:
+                    self._decrease()
+            elif self._limit < self._max_limit:
+                self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+
+            self._condition.notify_all()
+
+    def _observe_latency(self, latency: float, latency_class: str) -> bool:
+        """Update the smoothed latency of a class and check it against the class's baseline."""
+        smoothed = self._smoothed_latencies.get(latency_class)
+        if smoothed is None:
+            smoothed = latency
+        else:
+            smoothed += self._LATENCY_SMOOTHING * (latency - smoothed)
+        self._smoothed_latencies[latency_class] = smoothed
+
+        baseline = self._baseline_latencies.get(latency_class)
+        if baseline is None or smoothed < baseline:
+            self._baseline_latencies[latency_class] = smoothed
+            return False
+        return smoothed > baseline * self._LATENCY_TOLERANCE
+
+    def _decrease(self) -> None:
+        """Cut the limit multiplicatively."""
+        previous = int(self._limit)
+        self._limit = max(float(self._min_limit), self._limit * self._DECREASE_FACTOR)
+        self._completions_until_next_decrease = max(int(self._limit), 1)
+        if int(self._limit) != previous:
+            self._logger.info(f"Lowering GitHub request concurrency from {previous} to {int(self._limit)}")
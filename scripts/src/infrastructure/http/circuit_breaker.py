@@ -0,0 +1,125 @@
+"""
+Circuit breaker pausing GitHub requests while GitHub is degraded.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    """Stops sending requests after consecutive failures until GitHub recovers.
+
+    While closed, requests pass. Once failure_threshold attempts failed in a
+    row, the circuit opens and every request waits out the cooldown instead
+    of adding load to a struggling service. Afterwards a single probe request
+    is let through while the others keep waiting: if it succeeds the circuit
+    closes, otherwise it opens again with a doubled cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_COOLDOWN_SECONDS = 15.0
+    DEFAULT_MAX_COOLDOWN_SECONDS = 300.0
+
+    # How often requests waiting for a probe check whether it answered
+    _PROBE_POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN_SECONDS,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open the first time
+            max_cooldown: Upper bound of the doubled cooldown
+            clock: Monotonic source of the current time in seconds
+            sleep: Function waiting for a number of seconds
+
+        Raises:
+            ValueError: If failure_threshold is less than 1 or the cooldowns are not positive
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"Failure threshold must be at least 1, got {failure_threshold}")
+        if not 0 < cooldown <= max_cooldown:
+            raise ValueError(f"Cooldowns must satisfy 0 < cooldown <= max_cooldown, got {cooldown} and {max_cooldown}")
+
+        self._failure_threshold = failure_threshold
+        self._initial_cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._cooldown = cooldown
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("fetch")
+
+    @property
+    def state(self) -> str:
+        """Current state: CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                if self._state == self.CLOSED:
+                    return
+                if self._state == self.OPEN and now >= self._open_until:
+                    self._state = self.HALF_OPEN
+                    self._probe_in_flight = False
+                if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                    self._probe_in_flight = True
+                    return
+                delay = self._open_until - now if self._state == self.OPEN else self._PROBE_POLL_SECONDS
+            self._sleep(delay)
+
+    def record_success(self) -> None:
+        """Record that GitHub answered a request, closing the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                self._logger.info("GitHub is answering again, resuming requests")
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._cooldown = self._initial_cooldown
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed attempt, opening the circuit after too many in a row."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN:
+                self._cooldown = min(self._cooldown * 2, self._max_cooldown)
+            elif self._state == self.OPEN or self._consecutive_failures < self._failure_threshold:
+                return
+
+            self._state = self.OPEN
+            self._open_until = self._clock() + self._cooldown
+            self._probe_in_flight = False
+            self._logger.warning(
+                f"GitHub failed {self._consecutive_failures} requests in a row, "
+                f"pausing requests for {self._cooldown:.0f}s"
+            )
+
+    def abandon(self) -> None:
+        """Record that a request ended without telling whether GitHub is healthy.
+
+        A probe ending this way is not counted, so the next request probes again.
+        """
+        with self._lock:
+            self._probe_in_flight = False
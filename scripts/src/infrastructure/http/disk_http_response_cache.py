@@ -0,0 +1,103 @@
+"""
+Disk-backed store of GitHub API responses for conditional requests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..atomic_file import write_text_atomically
+
+
+@dataclass(frozen=True)
+class CachedHttpResponse:
+    """Represents a stored response together with its validators."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    body: str
+
+
+class DiskHttpResponseCache:
+    """Stores responses as JSON files, one per URL and credential scope.
+
+    Entries are keyed by a hash of the credential instead of the credential
+    itself, so different tokens never share responses and no token is written
+    to disk.
+    """
+
+    def __init__(self, cache_directory: Path):
+        """Initialize disk HTTP response cache.
+
+        Args:
+            cache_directory: Directory holding the cache entries
+        """
+        self._cache_directory = cache_directory
+        self._logger = logging.getLogger("fetch")
+
+    @staticmethod
+    def default_directory() -> Path:
+        """Get the default cache directory shared by all workspaces.
+
+        Returns:
+            $XDG_CACHE_HOME/agent-md-from-github/http, or ~/.cache/agent-md-from-github/http
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        return Path(cache_home) / "agent-md-from-github" / "http"
+
+    @staticmethod
+    def make_key(url: str, scope: str) -> str:
+        """Build the cache key of a request.
+
+        Args:
+            url: Full request URL including the query string
+            scope: Credential and representation scope, e.g. auth and Accept headers
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        return hashlib.sha256(f"{scope}\n{url}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedHttpResponse]:
+        """Load a cache entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None if missing or unreadable
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return CachedHttpResponse(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            self._logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, response: CachedHttpResponse) -> None:
+        """Store a cache entry atomically.
+
+        Args:
+            key: Cache key
+            response: Response to store
+        """
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomically(path, json.dumps(asdict(response), ensure_ascii=False))
+        except OSError as e:
+            # A cache that cannot be written must not fail the fetch
+            self._logger.warning(f"Could not write HTTP cache entry {path}: {e}")
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path of a cache entry, sharded by key prefix."""
+        return self._cache_directory / key[:2] / f"{key}.json"
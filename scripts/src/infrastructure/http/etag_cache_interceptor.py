@@ -0,0 +1,97 @@
+"""
+Interceptor turning repeated GitHub GET requests into conditional requests.
+"""
+
+import logging
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .disk_http_response_cache import CachedHttpResponse, DiskHttpResponseCache
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+
+
+class ETagCacheInterceptor(HttpInterceptor):
+    """Revalidates cached GET responses with If-None-Match / If-Modified-Since.
+
+    GitHub answers unchanged resources with 304 Not Modified, which does not
+    count against the rate limit. The cached body is then returned as a 200
+    response, so callers cannot tell the difference.
+    """
+
+    # Response headers describing the current request rather than the resource
+    _FRESH_HEADER_PREFIXES = ("x-ratelimit-", "date", "retry-after")
+
+    # Response headers that no longer apply once the body has been decoded
+    _TRANSFER_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection")
+
+    def __init__(self, cache: DiskHttpResponseCache):
+        """Initialize ETag cache interceptor.
+
+        Args:
+            cache: Store for responses and their validators
+        """
+        self._cache = cache
+        self._logger = logging.getLogger("fetch")
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Send a GET request conditionally and serve unchanged responses from the cache."""
+        if request.method.upper() != "GET":
+            return call_next(request)
+
+        key = self._cache.make_key(request.url, self._scope(request))
+        cached = self._cache.get(key)
+
+        conditional_request = request
+        if cached is not None:
+            if cached.etag:
+                conditional_request = conditional_request.with_headers(If_None_Match=cached.etag)
+            elif cached.last_modified:
+                conditional_request = conditional_request.with_headers(If_Modified_Since=cached.last_modified)
+
+        response = call_next(conditional_request)
+
+        if response.status_code == 304 and cached is not None:
+            self._logger.debug(f"Not modified, served from HTTP cache: {request.url}")
+            return self._to_response(cached, response)
+
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._cache.put(key, CachedHttpResponse(
+                    url=request.url,
+                    etag=etag,
+                    last_modified=last_modified,
+                    headers={
+                        name: value
+                        for name, value in response.headers.items()
+                        if name.lower() not in self._TRANSFER_HEADERS
+                    },
+                    body=response.text
+                ))
+
+        return response
+
+    @staticmethod
+    def _scope(request: HttpRequest) -> str:
+        """Describe the credential and representation a response was produced for."""
+        return f"{request.credential_key()} {request.header('Accept') or ''}"
+
+    def _to_response(self, cached: CachedHttpResponse, not_modified: requests.Response) -> requests.Response:
+        """Build a 200 response from a cache entry and the fresh 304 headers."""
+        headers = CaseInsensitiveDict(cached.headers)
+        for name, value in not_modified.headers.items():
+            if name.lower().startswith(self._FRESH_HEADER_PREFIXES):
+                headers[name] = value
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = cached.url
+        response.headers = headers
+        response.encoding = "utf-8"
+        response._content = cached.body.encode("utf-8")
+        response.request = not_modified.request
+        return response
@@ -0,0 +1,65 @@
+"""
+Request and time budget of a fetch run.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from ...domain.interfaces.fetch_budget_interface import FetchBudgetInterface
+
+
+class FetchBudget(FetchBudgetInterface):
+    """Counts the requests a fetch run sent and the time it has taken.
+
+    The budget does not block requests itself. The collection service checks
+    it between PRs and stops once it is used up, so detail fetches already
+    running still finish and no PR is saved half-fetched.
+    """
+
+    def __init__(
+        self,
+        max_requests: Optional[int] = None,
+        deadline: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize fetch budget; the deadline counts from now.
+
+        Args:
+            max_requests: Requests the run may send to GitHub, or None for no limit
+            deadline: Seconds the run may take, or None for no limit
+            clock: Monotonic source of the current time in seconds
+
+        Raises:
+            ValueError: If max_requests is less than 1 or deadline is not positive
+        """
+        if max_requests is not None and max_requests < 1:
+            raise ValueError(f"Max requests must be at least 1, got {max_requests}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"Deadline must be positive, got {deadline}")
+
+        self._max_requests = max_requests
+        self._deadline = deadline
+        self._clock = clock
+        self._started_at = clock()
+        self._requests_sent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def requests_sent(self) -> int:
+        """Number of requests sent so far."""
+        with self._lock:
+            return self._requests_sent
+
+    def record_request(self) -> None:
+        """Count one request sent to GitHub."""
+        with self._lock:
+            self._requests_sent += 1
+
+    def exhausted_reason(self) -> Optional[str]:
+        """Describe why the budget is used up, or None while budget is left."""
+        if self._max_requests is not None and self.requests_sent >= self._max_requests:
+            return f"request budget of {self._max_requests} used up"
+        if self._deadline is not None and self._clock() - self._started_at >= self._deadline:
+            return f"deadline of {self._deadline:g}s reached"
+        return None
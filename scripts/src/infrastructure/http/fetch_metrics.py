@@ -0,0 +1,148 @@
+"""
+Metrics of a fetch run.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ...domain.interfaces.fetch_metrics_interface import FetchMetricsInterface
+
+
+class FetchMetrics(FetchMetricsInterface):
+    """Collects the phase timings, HTTP traffic and throughput of a fetch run.
+
+    Phase times are added up across threads, so with concurrency a phase can
+    take longer than the run. The detail phase includes the comments phase
+    wherever review comments are fetched as part of a PR's details.
+
+    Rate-limit units are derived from the X-RateLimit-Used header: for each
+    credential, resource and rate-limit window, the rise of the reported
+    usage while the run observed it. Requests of other processes sharing a
+    token in the same window are included.
+    """
+
+    PHASES = ("listing", "detail", "comments", "filtering", "serialization", "disk_write")
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """Initialize fetch metrics; the wall time counts from now.
+
+        Args:
+            clock: Monotonic source of the current time in seconds
+        """
+        self._clock = clock
+        self._started_at = clock()
+        self._lock = threading.Lock()
+        self._phase_seconds: Dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self._requests_by_endpoint: Dict[str, int] = {}
+        self._latencies: List[float] = []
+        self._bytes_received = 0
+        # Lowest usage before and highest usage after a request, by credential, resource and reset time
+        self._rate_limit_usage: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+        self._saved_pr_count = 0
+        self._saved_comment_count = 0
+        self._lazy_completion_count = 0
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Measure the time spent in a phase of the run."""
+        started_at = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - started_at
+            with self._lock:
+                self._phase_seconds[phase] = self._phase_seconds.get(phase, 0.0) + elapsed
+
+    def record_saved_pr(self, comment_count: int) -> None:
+        """Count a saved PR and its review comments."""
+        with self._lock:
+            self._saved_pr_count += 1
+            self._saved_comment_count += comment_count
+
+    def record_lazy_completions(self, count: int) -> None:
+        """Count hidden requests PyGithub made to complete listed objects."""
+        with self._lock:
+            self._lazy_completion_count += count
+
+    def record_response(
+        self,
+        endpoint: str,
+        latency: float,
+        bytes_received: int,
+        rate_limit_window: Optional[Tuple[str, str, str]] = None,
+        rate_limit_used: Optional[int] = None,
+        cost: int = 1
+    ) -> None:
+        """Record a response received from GitHub.
+
+        Args:
+            endpoint: Method and path template of the request
+            latency: Seconds from sending the request to receiving the response
+            bytes_received: Size of the response body
+            rate_limit_window: Credential, resource and reset time the
+                response reported its rate-limit usage for, if any
+            rate_limit_used: Units of the window used after the request
+            cost: Units the request itself is assumed to have used
+        """
+        with self._lock:
+            self._requests_by_endpoint[endpoint] = self._requests_by_endpoint.get(endpoint, 0) + 1
+            self._latencies.append(latency)
+            self._bytes_received += bytes_received
+            if rate_limit_window is not None and rate_limit_used is not None:
+                lowest, highest = self._rate_limit_usage.get(rate_limit_window, (rate_limit_used - cost, rate_limit_used))
+                self._rate_limit_usage[rate_limit_window] = (
+                    min(lowest, rate_limit_used - cost),
+                    max(highest, rate_limit_used)
+                )
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the run so far.
+
+        Returns:
+            JSON-serializable summary of wall time, phase times, requests by
+            endpoint, bytes received, latency percentiles, rate-limit units by
+            resource, lazy completions and throughput
+        """
+        wall_seconds = self._clock() - self._started_at
+        with self._lock:
+            latencies = sorted(self._latencies)
+            rate_limit_units: Dict[str, int] = {}
+            for (_, resource, _), (lowest, highest) in self._rate_limit_usage.items():
+                rate_limit_units[resource] = rate_limit_units.get(resource, 0) + max(highest - lowest, 0)
+            return {
+                "wall_seconds": round(wall_seconds, 3),
+                "phase_seconds": {phase: round(seconds, 3) for phase, seconds in self._phase_seconds.items()},
+                "requests": {
+                    "total": len(latencies),
+                    "by_endpoint": dict(sorted(
+                        self._requests_by_endpoint.items(), key=lambda item: (-item[1], item[0])
+                    ))
+                },
+                "bytes_received": self._bytes_received,
+                "latency_seconds": {
+                    f"p{percentile}": self._percentile(latencies, percentile) for percentile in self.PERCENTILES
+                },
+                "rate_limit_units": dict(sorted(rate_limit_units.items())),
+                "lazy_completions": self._lazy_completion_count,
+                "throughput": {
+                    "prs": self._saved_pr_count,
+                    "comments": self._saved_comment_count,
+                    "prs_per_second": round(self._saved_pr_count / wall_seconds, 3) if wall_seconds > 0 else 0.0,
+                    "comments_per_second": (
+                        round(self._saved_comment_count / wall_seconds, 3) if wall_seconds > 0 else 0.0
+                    )
+                }
+            }
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percentile: int) -> Optional[float]:
+        """Nearest-rank percentile of sorted values, or None without values."""
+        if not sorted_values:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+        return round(sorted_values[rank - 1], 3)
@@ -0,0 +1,153 @@
+"""
+HTTP transport for GitHub API traffic with an interceptor chain.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import requests
+from github.Requester import Requester, RequestsResponse
+
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+
+
+class GitHubHttpTransport:
+    """Sends GitHub API requests through an ordered chain of interceptors.
+
+    One transport and its connection pool are shared by every GitHub client of
+    a run, so cross-cutting concerns such as caching see all requests.
+    """
+
+    def __init__(self, interceptors: Sequence[HttpInterceptor] = (), pool_size: int = 10):
+        """Initialize GitHub HTTP transport.
+
+        Args:
+            interceptors: Interceptors applied in order, the first one outermost
+            pool_size: Maximum number of keep-alive connections per host
+        """
+        self._interceptors: List[HttpInterceptor] = list(interceptors)
+        self._session = requests.Session()
+        # Disable the .netrc fallback; credentials always come from the request headers
+        self._session.auth = Requester.noopAuth
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def add_interceptor(self, interceptor: HttpInterceptor) -> None:
+        """Append an interceptor as the innermost step of the chain.
+
+        Args:
+            interceptor: Interceptor to append
+        """
+        self._interceptors.append(interceptor)
+
+    def send(self, request: HttpRequest) -> requests.Response:
+        """Send a request through the interceptor chain.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            Response returned by the chain
+        """
+        return self._handler(0)(request)
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self._session.close()
+
+    def connection_classes(self) -> Tuple[type, type]:
+        """Create PyGithub connection classes that send through this transport.
+
+        Returns:
+            HTTP and HTTPS connection classes for Requester.injectConnectionClasses
+        """
+        transport = self
+
+        class _HttpConnection(_TransportConnection):
+            _transport = transport
+            protocol = "http"
+            default_port = 80
+
+        class _HttpsConnection(_TransportConnection):
+            _transport = transport
+            protocol = "https"
+            default_port = 443
+
+        return _HttpConnection, _HttpsConnection
+
+    def _handler(self, index: int) -> HttpHandler:
+        """Build the handler continuing the chain at the given interceptor."""
+        if index == len(self._interceptors):
+            return self._send_over_network
+
+        interceptor = self._interceptors[index]
+        call_next = self._handler(index + 1)
+        return lambda request: interceptor.intercept(request, call_next)
+
+    def _send_over_network(self, request: HttpRequest) -> requests.Response:
+        """Send a request over the shared connection pool."""
+        return self._session.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            data=request.body,
+            timeout=request.timeout,
+            allow_redirects=False
+        )
+
+
+class _TransportConnection:
+    """PyGithub connection object routing requests to a GitHubHttpTransport.
+
+    PyGithub calls request() and then getresponse() on the same connection, so
+    the pending request is kept per thread.
+    """
+
+    _transport: GitHubHttpTransport
+    protocol: str
+    default_port: int
+
+    # Signature mimics the PyGithub connection classes
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        strict: bool = False,
+        timeout: Optional[float] = None,
+        retry: Any = None,
+        pool_size: Optional[int] = None,
+        **kwargs: Any
+    ):
+        self.host = host
+        self.port = port if port else self.default_port
+        self.timeout = timeout
+        self._pending = threading.local()
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        input: Optional[Union[str, bytes]],
+        headers: Dict[str, str],
+        stream: bool = False
+    ) -> None:
+        """Record a request to be sent by getresponse()."""
+        self._pending.request = HttpRequest(
+            method=verb,
+            url=f"{self.protocol}://{self.host}:{self.port}{url}",
+            headers=dict(headers),
+            body=input,
+            timeout=self.timeout
+        )
+
+    def getresponse(self) -> RequestsResponse:
+        """Send the recorded request through the transport."""
+        request = self._pending.request
+        self._pending.request = None
+        return RequestsResponse(self._transport.send(request))
+
+    def close(self) -> None:
+        """Keep the shared pool open; the transport owns it."""
+        pass
@@ -0,0 +1,218 @@
+"""
+Pool of GitHub credentials with per-token rate limit tracking.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple, Union
+
+
+class RotatingTokenSource(ABC):
+    """Credential whose token is replaced over time, such as a GitHub App installation."""
+
+    @abstractmethod
+    def get_token(self) -> str:
+        """Get the current token of the credential."""
+
+    @abstractmethod
+    def credential_id(self) -> str:
+        """Get an identity of the credential that stays the same across its tokens."""
+
+
+# A fixed token, or a source or function returning the current token of a credential whose token rotates
+TokenSource = Union[str, RotatingTokenSource, Callable[[], str]]
+
+
+@dataclass
+class _TokenBudget:
+    """Last observed rate limit state of one token for one resource."""
+
+    limit: int
+    remaining: int
+    reset_at: float
+
+
+class GitHubTokenPool:
+    """Hands out GitHub tokens round-robin, skipping tokens whose budget ran out.
+
+    Every credential has its own rate limit per resource (core, graphql,
+    search...), so the budget each one reports is tracked separately. A
+    credential whose remaining budget reached zero is skipped until its reset
+    time. Credentials with rotating tokens, such as GitHub App installations,
+    keep their budget across token refreshes.
+    """
+
+    def __init__(self, tokens: Sequence[TokenSource], clock: Callable[[], float] = time.time):
+        """Initialize GitHub token pool.
+
+        Args:
+            tokens: Fixed tokens, or sources or functions returning the current
+                token of a credential; duplicate fixed tokens are ignored
+            clock: Source of the current Unix time
+
+        Raises:
+            ValueError: If no token is given
+        """
+        sources = list(dict.fromkeys(token for token in tokens if token))
+        if not sources:
+            raise ValueError("A token pool needs at least one token")
+
+        self._sources: List[Callable[[], str]] = [
+            source.get_token if isinstance(source, RotatingTokenSource)
+            else source if callable(source) else (lambda token=source: token)
+            for source in sources
+        ]
+        self._credential_id_sources: Dict[int, Callable[[], str]] = {
+            index: source.credential_id
+            for index, source in enumerate(sources)
+            if isinstance(source, RotatingTokenSource)
+        }
+        self._credential_ids: Dict[int, str] = {}
+        self._clock = clock
+        self._budgets: Dict[Tuple[int, str], _TokenBudget] = {}
+        self._index_of_token: Dict[str, int] = {
+            source: index for index, source in enumerate(sources) if isinstance(source, str)
+        }
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of credentials in the pool."""
+        return len(self._sources)
+
+    def label(self, token: str) -> str:
+        """Describe a token for log messages without revealing it.
+
+        Args:
+            token: Token of the pool
+
+        Returns:
+            Label such as "token 2 of 3"
+        """
+        with self._lock:
+            return f"token {self._index_of_token[token] + 1} of {len(self._sources)}"
+
+    def credential_id(self, token: str) -> Optional[str]:
+        """Get the stable identity of the rotating credential a token belongs to.
+
+        Args:
+            token: Token of the pool
+
+        Returns:
+            Identity reported by the token's source, or None for fixed tokens and
+            sources without one, which are identified by the token itself
+        """
+        with self._lock:
+            index = self._index_of_token.get(token)
+            if index is None or index not in self._credential_id_sources:
+                return None
+            credential_id = self._credential_ids.get(index)
+        if credential_id is None:
+            credential_id = self._credential_id_sources[index]()
+            with self._lock:
+                self._credential_ids[index] = credential_id
+        return credential_id
+
+    def next_token(self, resource: str, exclude: Collection[str] = ()) -> Optional[str]:
+        """Pick the next token with budget left for a resource.
+
+        When every token ran out, the one resetting first is returned so the
+        caller runs into the rate limit and waits for it; unless tokens were
+        excluded, in which case the caller already failed over through them.
+
+        Args:
+            resource: Rate limit resource of the request
+            exclude: Tokens already tried for the request
+
+        Returns:
+            Token to send the request with, or None if no token is left to try
+        """
+        with self._lock:
+            index = self._pick(resource, {self._index_of_token[token] for token in exclude})
+        if index is None:
+            return None
+
+        # Resolved outside the lock; a rotating credential may have to request a new token
+        token = self._sources[index]()
+        with self._lock:
+            self._index_of_token[token] = index
+        return token
+
+    def record(self, token: str, resource: str, limit: int, remaining: int, reset_at: float) -> None:
+        """Record the rate limit state GitHub reported for a token.
+
+        Args:
+            token: Token the request was sent with
+            resource: Rate limit resource named by the response
+            limit: Requests allowed per window
+            remaining: Requests left in the current window
+            reset_at: Unix time the window resets
+        """
+        with self._lock:
+            index = self._index_of_token.get(token)
+            if index is None:
+                return
+            budget = self._budgets.get((index, resource))
+            if budget is not None and budget.reset_at == reset_at:
+                # Responses arrive out of order; the lowest count is the latest
+                remaining = min(remaining, budget.remaining)
+            elif budget is not None and budget.reset_at > reset_at:
+                # A response of an older window arrived late
+                return
+            self._budgets[(index, resource)] = _TokenBudget(limit=limit, remaining=remaining, reset_at=reset_at)
+
+    def combined_budget(self, resource: str) -> Optional[Tuple[int, int, float]]:
+        """Sum up the budget of all tokens for a resource.
+
+        Tokens not observed in their current window count with the limit of
+        the observed ones. The reset time is the earliest one of an exhausted
+        pool, and otherwise the latest one, so pacing never overspends.
+
+        Args:
+            resource: Rate limit resource
+
+        Returns:
+            Combined limit, remaining requests and reset time, or None if no
+            token of the resource was observed yet
+        """
+        with self._lock:
+            now = self._clock()
+            budgets = [
+                budget
+                for budget in (self._budgets.get((index, resource)) for index in range(len(self._sources)))
+                if budget is not None and budget.reset_at > now
+            ]
+            if not budgets:
+                return None
+
+            assumed_limit = max(budget.limit for budget in budgets)
+            unobserved = len(self._sources) - len(budgets)
+            limit = sum(budget.limit for budget in budgets) + unobserved * assumed_limit
+            remaining = sum(max(budget.remaining, 0) for budget in budgets) + unobserved * assumed_limit
+            if remaining > 0:
+                reset_at = max(budget.reset_at for budget in budgets)
+            else:
+                reset_at = min(budget.reset_at for budget in budgets)
+            return limit, remaining, reset_at
+
+    def _pick(self, resource: str, excluded: Collection[int]) -> Optional[int]:
+        """Pick the index of the next credential to use, see next_token."""
+        now = self._clock()
+        count = len(self._sources)
+        for offset in range(count):
+            index = (self._next_index + offset) % count
+            if index not in excluded and not self._is_exhausted(index, resource, now):
+                self._next_index = (index + 1) % count
+                return index
+
+        if excluded:
+            return None
+        return min(range(count), key=lambda index: self._budgets[(index, resource)].reset_at)
+
+    def _is_exhausted(self, index: int, resource: str, now: float) -> bool:
+        """Check whether a credential has no budget left for a resource until its reset."""
+        budget = self._budgets.get((index, resource))
+        return budget is not None and budget.remaining <= 0 and budget.reset_at > now
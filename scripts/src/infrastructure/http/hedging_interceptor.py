@@ -0,0 +1,196 @@
+"""
+Interceptor bounding request latency with timeouts and hedged requests.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Callable, Deque, Dict, List, Optional
+
+import requests
+
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+from .rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+
+
+class HedgingInterceptor(HttpInterceptor):
+    """Gives up on requests exceeding a timeout and hedges slow GET requests.
+
+    Each request is sent on a worker thread and must answer within the
+    timeout, counted from the first attempt; otherwise requests.Timeout is
+    raised. The timeout also limits each socket operation of an attempt.
+
+    With hedging enabled, a GET request that has not answered within the
+    recent 95th percentile latency of its rate limit resource is sent a
+    second time. The first answer wins and the other one is discarded.
+    Hedges pass through the inner interceptors like any request, so they are
+    counted against the request budget of the run. Interceptors waiting for
+    a token or a rate limit budget belong outside, so that the timeout only
+    counts the time of the network attempt; a hedge is then sent with the
+    token of its request.
+    Latencies are only tracked once enough requests completed, so no hedge
+    is sent before the percentile is known.
+    """
+
+    DEFAULT_TIMEOUT_SECONDS = 30.0
+
+    # Latency percentile after which a GET request is hedged
+    HEDGE_QUANTILE = 0.95
+
+    # Completed requests of a resource needed before hedging it
+    _MIN_SAMPLES = 20
+
+    # Completed requests of a resource the percentile is computed over
+    _WINDOW_SIZE = 200
+
+    # Hedges are never sent sooner than this, so fast answers are not doubled
+    _MIN_HEDGE_DELAY_SECONDS = 0.05
+
+    def __init__(
+        self,
+        timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        hedging: bool = False,
+        max_workers: int = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize hedging interceptor.
+
+        Args:
+            timeout: Seconds a request may take until it fails, or None to wait indefinitely
+            hedging: Send a second attempt of GET requests slower than the 95th percentile
+            max_workers: Number of attempts sent at the same time
+            clock: Monotonic source of the current time in seconds
+
+        Raises:
+            ValueError: If timeout is not positive or max_workers is less than 1
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"Timeout must be positive, got {timeout}")
+        if max_workers < 1:
+            raise ValueError(f"Max workers must be at least 1, got {max_workers}")
+
+        self._timeout = timeout
+        self._hedging = hedging
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http-attempt")
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._hedges_sent = 0
+        self._hedges_won = 0
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("fetch")
+
+    @property
+    def hedges_sent(self) -> int:
+        """Number of hedged attempts sent."""
+        with self._lock:
+            return self._hedges_sent
+
+    @property
+    def hedges_won(self) -> int:
+        """Number of hedged attempts that answered before the original request."""
+        with self._lock:
+            return self._hedges_won
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Send a request within the timeout, hedging it when it is slow."""
+        if self._timeout is None and not self._hedging:
+            return call_next(request)
+
+        if self._timeout is not None:
+            request = replace(request, timeout=self._timeout)
+
+        resource = RateLimitSchedulerInterceptor.resource_of(request)
+        deadline = None if self._timeout is None else self._clock() + self._timeout
+        attempts = [self._submit(request, call_next, resource)]
+
+        hedge_delay = self._hedge_delay(request, resource)
+        if hedge_delay is not None:
+            done, _ = wait(attempts, timeout=self._remaining(deadline, hedge_delay))
+            if not done and not self._expired(deadline):
+                self._logger.debug(f"No answer within {hedge_delay:.2f}s, hedging {request.method} {request.url}")
+                with self._lock:
+                    self._hedges_sent += 1
+                attempts.append(self._submit(request, call_next, resource))
+
+        return self._first_answer(request, attempts, deadline)
+
+    def _submit(self, request: HttpRequest, call_next: HttpHandler, resource: str) -> "Future[requests.Response]":
+        """Send an attempt on a worker thread."""
+        return self._executor.submit(self._send_attempt, request, call_next, resource)
+
+    def _send_attempt(self, request: HttpRequest, call_next: HttpHandler, resource: str) -> requests.Response:
+        """Send an attempt and record its latency."""
+        started_at = self._clock()
+        response = call_next(request)
+        self._record_latency(resource, self._clock() - started_at)
+        return response
+
+    def _first_answer(
+        self,
+        request: HttpRequest,
+        attempts: List["Future[requests.Response]"],
+        deadline: Optional[float]
+    ) -> requests.Response:
+        """Wait for the first attempt that answers, failing once every attempt failed or the deadline passed."""
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            if self._expired(deadline):
+                break
+            done, pending = wait(pending, timeout=self._remaining(deadline), return_when=FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is not None:
+                    error = attempt.exception()
+                    continue
+                if attempt is not attempts[0]:
+                    with self._lock:
+                        self._hedges_won += 1
+                for loser in pending:
+                    loser.add_done_callback(self._discard)
+                return attempt.result()
+
+        if pending:
+            for loser in pending:
+                loser.add_done_callback(self._discard)
+            raise requests.Timeout(f"GitHub request {request.method} {request.url} timed out after {self._timeout:g}s")
+        raise error
+
+    @staticmethod
+    def _discard(attempt: "Future[requests.Response]") -> None:
+        """Release the connection of an attempt whose answer is not used."""
+        if not attempt.cancelled() and attempt.exception() is None:
+            attempt.result().close()
+
+    def _hedge_delay(self, request: HttpRequest, resource: str) -> Optional[float]:
+        """Get how long to wait before hedging a request, or None if it is not hedged."""
+        if not self._hedging or request.method != "GET":
+            return None
+        with self._lock:
+            latencies = sorted(self._latencies.get(resource, ()))
+        if len(latencies) < self._MIN_SAMPLES:
+            return None
+        index = min(int(len(latencies) * self.HEDGE_QUANTILE), len(latencies) - 1)
+        return max(latencies[index], self._MIN_HEDGE_DELAY_SECONDS)
+
+    def _record_latency(self, resource: str, latency: float) -> None:
+        """Add the latency of a completed attempt to the window of its resource."""
+        with self._lock:
+            window = self._latencies.get(resource)
+            if window is None:
+                window = self._latencies[resource] = deque(maxlen=self._WINDOW_SIZE)
+            window.append(latency)
+
+    def _remaining(self, deadline: Optional[float], limit: Optional[float] = None) -> Optional[float]:
+        """Get the seconds left until the deadline, capped at a limit."""
+        if deadline is None:
+            return limit
+        remaining = max(deadline - self._clock(), 0.0)
+        return remaining if limit is None else min(remaining, limit)
+
+    def _expired(self, deadline: Optional[float]) -> bool:
+        """Check whether the deadline passed."""
+        return deadline is not None and self._clock() >= deadline
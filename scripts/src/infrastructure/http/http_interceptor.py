@@ -0,0 +1,34 @@
+"""
+Interface for interceptors wrapping GitHub HTTP requests.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable
+
+import requests
+
+from .http_request import HttpRequest
+
+# Sends a request through the rest of the chain and returns its response
+HttpHandler = Callable[[HttpRequest], requests.Response]
+
+
+class HttpInterceptor(ABC):
+    """Interface for a step of the GitHub HTTP interceptor chain.
+
+    Interceptors may modify the request, short-circuit it, or inspect and
+    replace the response returned by the rest of the chain.
+    """
+
+    @abstractmethod
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Handle a request.
+
+        Args:
+            request: Outgoing request
+            call_next: Handler sending the request through the rest of the chain
+
+        Returns:
+            Response for the request
+        """
+        pass
@@ -0,0 +1,62 @@
+"""
+HTTP request value object passed through the interceptor chain.
+"""
+
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Union
+
+
+@dataclass(frozen=True)
+class HttpRequest:
+    """Represents an outgoing HTTP request to the GitHub API.
+
+    Attributes:
+        credential_id: Stable identity of a credential whose token rotates, set
+            by the token pool so state kept per credential survives token refreshes
+    """
+
+    method: str
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[Union[str, bytes]] = None
+    timeout: Optional[float] = None
+    credential_id: Optional[str] = None
+
+    def header(self, name: str) -> Optional[str]:
+        """Get a request header value by case-insensitive name.
+
+        Args:
+            name: Header name
+
+        Returns:
+            Header value, or None if the header is not set
+        """
+        lowered = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == lowered:
+                return value
+        return None
+
+    def with_headers(self, **headers: str) -> "HttpRequest":
+        """Create a copy of this request with additional headers.
+
+        Keyword names use underscores in place of dashes, e.g. If_None_Match.
+
+        Returns:
+            New request with the headers added or replaced
+        """
+        merged = dict(self.headers)
+        for name, value in headers.items():
+            merged[name.replace("_", "-")] = value
+        return replace(self, headers=merged)
+
+    def credential_key(self) -> str:
+        """Identify the credential the request is sent with, without revealing it.
+
+        Returns:
+            Hash of the credential identity set by the token pool, or of the
+            Authorization header
+        """
+        credential = self.credential_id or self.header("Authorization") or ""
+        return hashlib.sha256(credential.encode("utf-8")).hexdigest()
@@ -0,0 +1,197 @@
+"""
+Interceptor pacing GitHub requests against the rate limit.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import requests
+
+from .adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+
+
+@dataclass
+class _RateLimitBudget:
+    """Last observed rate limit state of one GitHub resource (core, graphql, search...)."""
+
+    limit: int
+    remaining: int
+    reset_at: float
+
+
+class RateLimitSchedulerInterceptor(HttpInterceptor):
+    """Paces requests from rate limit headers and waits out throttling.
+
+    Requests run at full speed until the remaining budget of their resource
+    drops below a fraction of the limit. From then on they are spaced so the
+    rest of the budget lasts until the reset time. When the budget runs out,
+    or GitHub answers with a primary or secondary rate limit error, requests
+    wait until the reset time or the Retry-After delay and are sent again
+    instead of failing the run.
+    """
+
+    DEFAULT_MAX_RETRIES = 5
+
+    # Remaining budget, as a fraction of the limit, below which requests are paced
+    DEFAULT_PACING_THRESHOLD = 0.2
+
+    # Wait GitHub recommends for a secondary rate limit without Retry-After
+    _SECONDARY_LIMIT_WAIT_SECONDS = 60.0
+
+    # Margin added after the reset time for clock skew
+    _RESET_MARGIN_SECONDS = 1.0
+
+    def __init__(
+        self,
+        concurrency_limiter: AdaptiveConcurrencyLimiter,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        pacing_threshold: float = DEFAULT_PACING_THRESHOLD,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize rate limit scheduler interceptor.
+
+        Args:
+            concurrency_limiter: Limiter gating the number of in-flight requests
+            max_retries: Number of times a throttled request is sent again
+            pacing_threshold: Fraction of the limit below which requests are paced
+            clock: Source of the current Unix time
+            sleep: Function waiting for a number of seconds
+        """
+        self._concurrency_limiter = concurrency_limiter
+        self._max_retries = max_retries
+        self._pacing_threshold = pacing_threshold
+        self._clock = clock
+        self._sleep = sleep
+        self._budgets: Dict[str, _RateLimitBudget] = {}
+        self._next_send_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("fetch")
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Send a request when the rate limit allows it, retrying throttled attempts."""
+        resource = self.resource_of(request)
+        attempt = 0
+        while True:
+            self._wait_for_budget(resource)
+
+            self._concurrency_limiter.acquire()
+            started_at = time.monotonic()
+            throttled = False
+            try:
+                response = call_next(request)
+                resource = self._record_budget(response, resource)
+                throttled = self._is_throttled(response)
+            finally:
+                # GraphQL batches and search queries are far slower than REST reads, so each
+                # resource is compared against its own latency baseline
+                self._concurrency_limiter.release(time.monotonic() - started_at, throttled, resource)
+
+            if not throttled or attempt >= self._max_retries:
+                return response
+
+            attempt += 1
+            delay = self._throttle_delay(response)
+            self._logger.warning(
+                f"GitHub rate limit hit (status {response.status_code}), "
+                f"retrying in {delay:.0f}s ({attempt}/{self._max_retries})"
+            )
+            self._sleep(delay)
+
+    @staticmethod
+    def resource_of(request: HttpRequest) -> str:
+        """Guess the rate limit resource of a request before its response names it.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Resource name such as "core", "graphql" or "search"
+        """
+        if request.url.rstrip("/").endswith("/graphql"):
+            return "graphql"
+        if "/search/" in request.url:
+            return "search"
+        return "core"
+
+    def _wait_for_budget(self, resource: str) -> None:
+        """Sleep until the next request of the resource may be sent."""
+        with self._lock:
+            now = self._clock()
+            budget = self._budgets.get(resource)
+            send_at = now
+
+            if budget is not None and budget.reset_at > now:
+                if budget.remaining <= 0:
+                    send_at = budget.reset_at + self._RESET_MARGIN_SECONDS
+                elif budget.remaining < budget.limit * self._pacing_threshold:
+                    interval = (budget.reset_at - now) / budget.remaining
+                    send_at = max(now, self._next_send_at.get(resource, now))
+                    self._next_send_at[resource] = send_at + interval
+                    # Count the request now so concurrent callers are spaced too
+                    budget.remaining -= 1
+
+        delay = send_at - now
+        if delay > 0:
+            if delay >= self._SECONDARY_LIMIT_WAIT_SECONDS:
+                self._logger.warning(f"GitHub {resource} rate limit exhausted, waiting {delay:.0f}s for reset")
+            self._sleep(delay)
+
+    def _record_budget(self, response: requests.Response, resource: str) -> str:
+        """Update the budget from the rate limit headers of a response.
+
+        Returns:
+            Resource named by the response, or the guessed resource
+        """
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource", resource)
+        try:
+            budget = _RateLimitBudget(
+                limit=int(headers["X-RateLimit-Limit"]),
+                remaining=int(headers["X-RateLimit-Remaining"]),
+                reset_at=float(headers["X-RateLimit-Reset"])
+            )
+        except (KeyError, ValueError):
+            return resource
+
+        with self._lock:
+            self._budgets[resource] = budget
+        return resource
+
+    @staticmethod
+    def _is_throttled(response: requests.Response) -> bool:
+        """Check whether GitHub rejected a request for rate limiting."""
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        if "Retry-After" in response.headers or response.headers.get("X-RateLimit-Remaining") == "0":
+            return True
+        return "rate limit" in response.text.lower()
+
+    def _throttle_delay(self, response: requests.Response) -> float:
+        """Get how long to wait before retrying a throttled request."""
+        retry_after = self._parse_float(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+
+        reset_at = self._parse_float(response.headers.get("X-RateLimit-Reset"))
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset_at is not None:
+            return max(reset_at - self._clock(), 0.0) + self._RESET_MARGIN_SECONDS
+
+        return self._SECONDARY_LIMIT_WAIT_SECONDS
+
+    @staticmethod
+    def _parse_float(value: Optional[str]) -> Optional[float]:
+        """Parse a numeric header value."""
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
@@ -0,0 +1,26 @@
+"""
+Interceptor counting GitHub requests against the budget of a fetch run.
+"""
+
+import requests
+
+from .fetch_budget import FetchBudget
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+
+
+class RequestBudgetInterceptor(HttpInterceptor):
+    """Counts every request sent to GitHub, including retries and hedges."""
+
+    def __init__(self, fetch_budget: FetchBudget):
+        """Initialize request budget interceptor.
+
+        Args:
+            fetch_budget: Budget the requests are counted against
+        """
+        self._fetch_budget = fetch_budget
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Count a request and send it."""
+        self._fetch_budget.record_request()
+        return call_next(request)
@@ -0,0 +1,81 @@
+"""
+Interceptor recording the traffic of GitHub requests in the fetch metrics.
+"""
+
+import time
+from typing import Callable
+from urllib.parse import urlparse
+
+import requests
+
+from .fetch_metrics import FetchMetrics
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+from .rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+
+
+class RequestMetricsInterceptor(HttpInterceptor):
+    """Records the endpoint, latency, body size and rate-limit usage of every response."""
+
+    # Path segments following these segments are names, not endpoint parts
+    _NAME_PARENTS = ("users", "orgs")
+
+    def __init__(self, fetch_metrics: FetchMetrics, clock: Callable[[], float] = time.perf_counter):
+        """Initialize request metrics interceptor.
+
+        Args:
+            fetch_metrics: Metrics the responses are recorded in
+            clock: Monotonic source of the current time in seconds
+        """
+        self._fetch_metrics = fetch_metrics
+        self._clock = clock
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Send a request and record its response."""
+        started_at = self._clock()
+        response = call_next(request)
+        latency = self._clock() - started_at
+
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource", RateLimitSchedulerInterceptor.resource_of(request))
+        rate_limit_window = None
+        rate_limit_used = None
+        try:
+            rate_limit_used = int(headers["X-RateLimit-Used"])
+            rate_limit_window = (request.credential_key(), resource, headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            pass
+        self._fetch_metrics.record_response(
+            self.endpoint_of(request),
+            latency,
+            len(response.content or b""),
+            rate_limit_window,
+            rate_limit_used,
+            # Conditional requests answered with 304 Not Modified do not count against the rate limit
+            cost=0 if response.status_code == 304 else 1
+        )
+        return response
+
+    @classmethod
+    def endpoint_of(cls, request: HttpRequest) -> str:
+        """Name the endpoint of a request with owners, repositories and numbers replaced by placeholders.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Method and path template, e.g. "GET /repos/{owner}/{repo}/pulls/{number}/comments"
+        """
+        segments = urlparse(request.url).path.strip("/").split("/")
+        template = []
+        for index, segment in enumerate(segments):
+            previous = segments[index - 1] if index >= 1 else None
+            if segment.isdigit():
+                template.append("{number}")
+            elif previous == "repos" or previous in cls._NAME_PARENTS:
+                template.append("{owner}")
+            elif index >= 2 and segments[index - 2] == "repos":
+                template.append("{repo}")
+            else:
+                template.append(segment)
+        return f"{request.method} /{'/'.join(template)}"
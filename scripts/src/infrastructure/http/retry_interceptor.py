@@ -0,0 +1,115 @@
+"""
+Interceptor retrying GitHub requests that failed transiently.
+"""
+
+import logging
+import random
+import time
+from typing import Callable, FrozenSet, Optional
+
+import requests
+
+from .circuit_breaker import CircuitBreaker
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+
+
+class RetryInterceptor(HttpInterceptor):
+    """Sends requests again after server errors and connection failures.
+
+    Responses with a 5xx status, connection errors and timeouts are retried
+    with exponential backoff and full jitter: the n-th retry waits a random
+    time between zero and base_delay * 2^(n-1), capped at max_delay, so
+    clients failing together do not retry in lockstep. Every attempt is
+    reported to the circuit breaker, which pauses all requests while GitHub
+    keeps failing. Requests are retried regardless of their method; this
+    tool only reads from GitHub, including its GraphQL queries sent as POST.
+    """
+
+    DEFAULT_MAX_RETRIES = 4
+
+    RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({500, 502, 503, 504})
+
+    def __init__(
+        self,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random
+    ):
+        """Initialize retry interceptor.
+
+        Args:
+            circuit_breaker: Breaker pausing requests while GitHub is degraded, or None
+            max_retries: Number of times a failed request is sent again
+            base_delay: Upper bound in seconds of the wait before the first retry
+            max_delay: Upper bound in seconds of the wait before any retry
+            sleep: Function waiting for a number of seconds
+            jitter: Source of random numbers in [0, 1)
+
+        Raises:
+            ValueError: If max_retries is negative or the delays are not positive
+        """
+        if max_retries < 0:
+            raise ValueError(f"Max retries must not be negative, got {max_retries}")
+        if not 0 < base_delay <= max_delay:
+            raise ValueError(f"Delays must satisfy 0 < base_delay <= max_delay, got {base_delay} and {max_delay}")
+
+        self._circuit_breaker = circuit_breaker
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._sleep = sleep
+        self._jitter = jitter
+        self._logger = logging.getLogger("fetch")
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Send a request, retrying transient failures with backoff."""
+        attempt = 0
+        while True:
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_request()
+
+            response = None
+            try:
+                response = call_next(request)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(failed=True)
+                if attempt >= self._max_retries:
+                    raise
+                failure = f"{type(e).__name__}: {e}"
+            except BaseException:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.abandon()
+                raise
+            else:
+                failed = response.status_code in self.RETRYABLE_STATUS_CODES
+                self._record(failed)
+                if not failed or attempt >= self._max_retries:
+                    return response
+                failure = f"status {response.status_code}"
+
+            attempt += 1
+            delay = self._backoff_delay(attempt)
+            self._logger.warning(
+                f"GitHub request {request.method} {request.url} failed ({failure}), "
+                f"retrying in {delay:.1f}s ({attempt}/{self._max_retries})"
+            )
+            if response is not None:
+                response.close()
+            self._sleep(delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Get a random wait before the given retry, see the class docstring."""
+        return self._jitter() * min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+
+    def _record(self, failed: bool) -> None:
+        """Report the outcome of an attempt to the circuit breaker."""
+        if self._circuit_breaker is None:
+            return
+        if failed:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
@@ -0,0 +1,288 @@
+"""
+Token-bucket rate limit budget shared by all processes of a host.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+from ..atomic_file import write_text_atomically
+
+
+class SharedRateLimitBudget:
+    """Token buckets of GitHub rate limit resources shared through a state file.
+
+    Every process using the same credential keeps its buckets in one JSON
+    file guarded by a lock file, so all of them draw from the same budget.
+    Each request reserves a token; when the bucket is empty the reservation
+    goes into debt and the caller waits until the bucket has refilled up to
+    it. Reservations are therefore served in arrival order across processes,
+    which shares the budget fairly between them.
+
+    Rate limit headers observed by any process are recorded too. Once the
+    remaining budget GitHub reported is used up, every process waits for the
+    reset time instead of running into rate limit errors together.
+
+    To keep worker threads from queueing on the state file, a process leases
+    several tokens at once while the bucket is well filled and hands them out
+    from memory. Observed headers are kept in memory as well and written
+    with the next lease.
+    """
+
+    # Tokens a process reserves per visit of the state file while the budget allows it
+    DEFAULT_LEASE_SIZE = 10
+
+    # GitHub's primary rate limit of a personal access token, used until headers are seen
+    DEFAULT_CAPACITY = 5000
+    DEFAULT_WINDOW_SECONDS = 3600.0
+
+    # Length of the rate limit window of each resource
+    _WINDOW_SECONDS = {"search": 60.0, "code_search": 60.0}
+
+    # Processes not seen for this long no longer count as sharing the budget
+    _PROCESS_TIMEOUT_SECONDS = 60.0
+
+    # Margin added after the reset time for clock skew
+    _RESET_MARGIN_SECONDS = 1.0
+
+    def __init__(
+        self,
+        state_directory: Path,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        lease_size: int = DEFAULT_LEASE_SIZE
+    ):
+        """Initialize shared rate limit budget.
+
+        Args:
+            state_directory: Directory holding the state and lock files
+            clock: Source of the current Unix time
+            sleep: Function waiting for a number of seconds
+            lease_size: Tokens reserved per visit of the state file while the
+                bucket and the remaining budget GitHub reported both hold that many
+
+        Raises:
+            ValueError: If lease_size is less than 1
+        """
+        if lease_size < 1:
+            raise ValueError(f"Lease size must be at least 1, got {lease_size}")
+
+        self._state_directory = state_directory
+        self._clock = clock
+        self._sleep = sleep
+        self._lease_size = lease_size
+        # Tokens reserved by this process and not handed out yet, by credential and resource
+        self._leases: Dict[Tuple[str, str], int] = {}
+        # Latest rate limit state observed per credential and resource, not written yet
+        self._observations: Dict[str, Dict[str, Tuple[int, int, float]]] = {}
+        self._lease_lock = threading.Lock()
+        self._logger = logging.getLogger("fetch")
+
+    @staticmethod
+    def default_directory() -> Path:
+        """Get the default state directory shared by all processes of the user.
+
+        Returns:
+            $XDG_CACHE_HOME/agent-md-from-github/rate-limit, or ~/.cache/agent-md-from-github/rate-limit
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        return Path(cache_home) / "agent-md-from-github" / "rate-limit"
+
+    def acquire(self, credential_key: str, resource: str) -> float:
+        """Reserve one request of a resource, waiting until the budget allows it.
+
+        Args:
+            credential_key: Hash identifying the credential the budget belongs to
+            resource: Rate limit resource, e.g. "core", "graphql" or "search"
+
+        Returns:
+            Seconds waited for the budget
+        """
+        lease_key = (credential_key, resource)
+        with self._lease_lock:
+            if self._leases.get(lease_key, 0) > 0:
+                self._leases[lease_key] -= 1
+                return 0.0
+
+            with self._locked_state(credential_key) as state:
+                now = self._clock()
+                self._write_observations(state, credential_key, now)
+                bucket = self._bucket(state, resource, now)
+
+                server_remaining = bucket.get("server_remaining")
+                size = 1
+                if bucket["tokens"] >= self._lease_size and (
+                    server_remaining is None or server_remaining >= self._lease_size
+                ):
+                    size = self._lease_size
+
+                bucket["tokens"] -= size
+                delay = max(-bucket["tokens"] / bucket["refill_per_second"], 0.0)
+
+                if bucket.get("reset_at") is not None:
+                    bucket["server_remaining"] -= size
+                    if bucket["server_remaining"] < 0:
+                        delay = max(delay, bucket["reset_at"] - now + self._RESET_MARGIN_SECONDS)
+
+                process_count = self._register_process(state, now)
+            self._leases[lease_key] = size - 1
+
+        if delay > 0:
+            self._logger.info(
+                f"Waiting {delay:.1f}s for the shared {resource} rate limit budget "
+                f"({process_count} process(es) sharing it)"
+            )
+            self._sleep(delay)
+        return delay
+
+    def refund(self, credential_key: str, resource: str) -> None:
+        """Return the reservation of a request that did not count against the limit.
+
+        The reservation goes back to the lease of this process.
+
+        Args:
+            credential_key: Hash identifying the credential the budget belongs to
+            resource: Rate limit resource of the request
+        """
+        lease_key = (credential_key, resource)
+        with self._lease_lock:
+            self._leases[lease_key] = self._leases.get(lease_key, 0) + 1
+
+    def observe(self, credential_key: str, resource: str, limit: int, remaining: int, reset_at: float) -> None:
+        """Record the rate limit state GitHub reported for a resource.
+
+        The state is written to the state file with the next lease.
+
+        Args:
+            credential_key: Hash identifying the credential the budget belongs to
+            resource: Rate limit resource named by the response
+            limit: Requests allowed per window
+            remaining: Requests left in the current window
+            reset_at: Unix time the window resets
+        """
+        with self._lease_lock:
+            observations = self._observations.setdefault(credential_key, {})
+            previous = observations.get(resource)
+            if previous is not None and previous[2] > reset_at:
+                # A response of an older window arrived late
+                return
+            if previous is not None and previous[2] == reset_at:
+                # Responses arrive out of order; the lowest count is the latest
+                remaining = min(remaining, previous[1])
+            observations[resource] = (limit, remaining, reset_at)
+
+    def _write_observations(self, state: Dict[str, Any], credential_key: str, now: float) -> None:
+        """Apply the rate limit states observed since the last lease to the shared state."""
+        for resource, (limit, remaining, reset_at) in self._observations.pop(credential_key, {}).items():
+            bucket = self._bucket(state, resource, now)
+
+            window = self._WINDOW_SECONDS.get(resource, self.DEFAULT_WINDOW_SECONDS)
+            bucket["capacity"] = limit
+            bucket["refill_per_second"] = limit / window
+            bucket["tokens"] = min(bucket["tokens"], limit)
+
+            if bucket.get("reset_at") is None or reset_at > bucket["reset_at"]:
+                # A new window started; responses of the old one are stale
+                bucket["reset_at"] = reset_at
+                bucket["server_remaining"] = remaining
+            elif reset_at == bucket["reset_at"]:
+                # Responses arrive out of order; the lowest count is the latest
+                bucket["server_remaining"] = min(bucket["server_remaining"], remaining)
+
+    def _bucket(self, state: Dict[str, Any], resource: str, now: float) -> Dict[str, Any]:
+        """Get the bucket of a resource, refilled up to the current time."""
+        buckets = state.setdefault("buckets", {})
+        bucket = buckets.get(resource)
+        if bucket is None:
+            bucket = {
+                "tokens": float(self.DEFAULT_CAPACITY),
+                "capacity": self.DEFAULT_CAPACITY,
+                "refill_per_second": self.DEFAULT_CAPACITY / self.DEFAULT_WINDOW_SECONDS,
+                "updated_at": now,
+                "reset_at": None,
+                "server_remaining": None
+            }
+            buckets[resource] = bucket
+
+        elapsed = max(now - bucket["updated_at"], 0.0)
+        bucket["tokens"] = min(bucket["tokens"] + elapsed * bucket["refill_per_second"], bucket["capacity"])
+        bucket["updated_at"] = now
+
+        if bucket.get("reset_at") is not None and now >= bucket["reset_at"]:
+            # The server window ended, so its remaining count no longer applies
+            bucket["reset_at"] = None
+            bucket["server_remaining"] = None
+        return bucket
+
+    def _register_process(self, state: Dict[str, Any], now: float) -> int:
+        """Mark this process as active and count the processes sharing the budget."""
+        processes = {
+            pid: last_seen
+            for pid, last_seen in state.get("processes", {}).items()
+            if now - last_seen < self._PROCESS_TIMEOUT_SECONDS
+        }
+        processes[str(os.getpid())] = now
+        state["processes"] = processes
+        return len(processes)
+
+    @contextmanager
+    def _locked_state(self, credential_key: str) -> Generator[Dict[str, Any], None, None]:
+        """Hold the lock of a credential's state file while reading and updating it."""
+        self._state_directory.mkdir(parents=True, exist_ok=True)
+        state_path = self._state_directory / f"{credential_key[:32]}.json"
+        lock_path = self._state_directory / f"{credential_key[:32]}.lock"
+
+        with open(lock_path, "a+b") as lock_file:
+            self._lock(lock_file)
+            try:
+                state = self._read_state(state_path)
+                yield state
+                self._write_state(state_path, state)
+            finally:
+                self._unlock(lock_file)
+
+    def _read_state(self, state_path: Path) -> Dict[str, Any]:
+        """Read the shared state, starting over if it is missing or unreadable."""
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self._logger.debug(f"Ignoring unreadable rate limit state {state_path}: {e}")
+            return {}
+
+    @staticmethod
+    def _write_state(state_path: Path, state: Dict[str, Any]) -> None:
+        """Write the shared state atomically."""
+        write_text_atomically(state_path, json.dumps(state))
+
+    @staticmethod
+    def _lock(lock_file) -> None:
+        """Block until this process holds the exclusive lock."""
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _unlock(lock_file) -> None:
+        """Release the exclusive lock."""
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,51 @@
+"""
+Interceptor drawing every GitHub request from the host-wide rate limit budget.
+"""
+
+import requests
+
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+from .rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+from .shared_rate_limit_budget import SharedRateLimitBudget
+
+
+class SharedRateLimitBudgetInterceptor(HttpInterceptor):
+    """Reserves each request from a budget shared with other processes.
+
+    The rate limit headers of every response are fed back into the shared
+    budget. Conditional requests answered with 304 Not Modified do not count
+    against GitHub's rate limit, so their reservation is returned.
+    """
+
+    def __init__(self, budget: SharedRateLimitBudget):
+        """Initialize shared rate limit budget interceptor.
+
+        Args:
+            budget: Budget shared by all processes of the host
+        """
+        self._budget = budget
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Wait for the shared budget, send the request and record the reported budget."""
+        credential_key = request.credential_key()
+        resource = RateLimitSchedulerInterceptor.resource_of(request)
+        self._budget.acquire(credential_key, resource)
+
+        response = call_next(request)
+
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource", resource)
+        if response.status_code == 304:
+            self._budget.refund(credential_key, resource)
+        try:
+            self._budget.observe(
+                credential_key,
+                resource,
+                limit=int(headers["X-RateLimit-Limit"]),
+                remaining=int(headers["X-RateLimit-Remaining"]),
+                reset_at=float(headers["X-RateLimit-Reset"])
+            )
+        except (KeyError, ValueError):
+            pass
+        return response
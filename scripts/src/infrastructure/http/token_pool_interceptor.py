@@ -0,0 +1,104 @@
+"""
+Interceptor spreading GitHub requests across a pool of tokens.
+"""
+
+import logging
+from dataclasses import replace
+from typing import List
+
+import requests
+
+from .github_token_pool import GitHubTokenPool
+from .http_interceptor import HttpHandler, HttpInterceptor
+from .http_request import HttpRequest
+from .rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+
+
+class TokenPoolInterceptor(HttpInterceptor):
+    """Sends each request with the next token of a pool, failing over on exhaustion.
+
+    The rate limit headers of each response are recorded for the token the
+    request was sent with. When GitHub rejects a request because the token's
+    budget is used up, the request is sent again with another token. Only
+    when every token ran out is the rejection passed on, so the outer
+    rate limit scheduler waits for the earliest reset.
+
+    The rate limit headers passed on describe the combined budget of the
+    pool, so outer interceptors pace requests against all tokens together.
+    """
+
+    _RATE_LIMIT_HEADERS = ("X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset")
+
+    def __init__(self, token_pool: GitHubTokenPool):
+        """Initialize token pool interceptor.
+
+        Args:
+            token_pool: Tokens requests are spread across
+        """
+        self._token_pool = token_pool
+        self._logger = logging.getLogger("fetch")
+
+    def intercept(self, request: HttpRequest, call_next: HttpHandler) -> requests.Response:
+        """Send a request with a pooled token, trying the other tokens once it runs out."""
+        resource = RateLimitSchedulerInterceptor.resource_of(request)
+        tried: List[str] = []
+        response = None
+
+        while True:
+            token = self._token_pool.next_token(resource, exclude=tried)
+            if token is None:
+                break
+            tried.append(token)
+
+            response = call_next(self._with_token(request, token))
+            resource = self._record_budget(token, response, resource)
+            if not self._is_exhausted(response):
+                break
+            self._logger.info(f"GitHub {resource} rate limit of {self._token_pool.label(token)} exhausted, failing over")
+
+        self._report_combined_budget(response, resource)
+        return response
+
+    def _with_token(self, request: HttpRequest, token: str) -> HttpRequest:
+        """Create a copy of a request authenticated with a token."""
+        headers = {name: value for name, value in request.headers.items() if name.lower() != "authorization"}
+        headers["Authorization"] = f"token {token}"
+        return replace(request, headers=headers, credential_id=self._token_pool.credential_id(token))
+
+    def _record_budget(self, token: str, response: requests.Response, resource: str) -> str:
+        """Record the budget a response reported for its token.
+
+        Returns:
+            Resource named by the response, or the guessed resource
+        """
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource", resource)
+        try:
+            self._token_pool.record(
+                token,
+                resource,
+                limit=int(headers["X-RateLimit-Limit"]),
+                remaining=int(headers["X-RateLimit-Remaining"]),
+                reset_at=float(headers["X-RateLimit-Reset"])
+            )
+        except (KeyError, ValueError):
+            pass
+        return resource
+
+    @staticmethod
+    def _is_exhausted(response: requests.Response) -> bool:
+        """Check whether GitHub rejected a request because the token's budget is used up."""
+        return (
+            response.status_code in (403, 429)
+            and response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    def _report_combined_budget(self, response: requests.Response, resource: str) -> None:
+        """Replace the rate limit headers of a response with the budget of the whole pool."""
+        if "X-RateLimit-Remaining" not in response.headers:
+            return
+        combined = self._token_pool.combined_budget(resource)
+        if combined is None:
+            return
+        for name, value in zip(self._RATE_LIMIT_HEADERS, combined):
+            response.headers[name] = str(int(value))
@@ -3,11 +3,21 @@ Infrastructure repositories package.
 """
 
 from .github_repository import GitHubRepository
+from .async_github_repository import AsyncGitHubRepository
+from .dead_letter_repository import DeadLetterRepository
+from .fetch_journal import FetchJournal
+from .pull_request_catalog_repository import PullRequestCatalogRepository
 from .pull_request_metadata_repository import PullRequestMetadataRepository
 from .summary_repository import SummaryRepository
+from .sync_state_repository import SyncStateRepository
 
 __all__ = [
+    "AsyncGitHubRepository",
+    "DeadLetterRepository",
+    "FetchJournal",
     "GitHubRepository",
+    "PullRequestCatalogRepository",
     "PullRequestMetadataRepository",
-    "SummaryRepository"
+    "SummaryRepository",
+    "SyncStateRepository"
 ]
\ No newline at end of file
@@ -0,0 +1,348 @@
+"""
+GitHub API repository implementation built on an asyncio HTTP client.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Dict, Generator, List, Optional, Tuple, TypeVar
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+
+from ...domain.date_range import DateRange
+from ...domain.interfaces.comment_filter_interface import CommentFilterInterface
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.pull_request_metadata import PullRequestMetadata
+from ...domain.repository_identifier import RepositoryIdentifier
+from ...domain.review_comment import ReviewComment
+from ..services.timezone_converter import TimezoneConverter
+from .github_payload_mapper import GitHubPayloadMapper
+from ...application.exceptions.github_api_error import GitHubApiError
+
+T = TypeVar("T")
+
+# Parsed JSON body together with the pagination links of the response
+JsonPage = Tuple[Any, Dict[str, str]]
+
+
+def _shutdown_event_loop(
+    loop: asyncio.AbstractEventLoop,
+    session: aiohttp.ClientSession,
+    loop_thread: threading.Thread
+) -> None:
+    """Close the HTTP session and stop the event loop thread."""
+    if loop.is_closed():
+        return
+    asyncio.run_coroutine_threadsafe(session.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join()
+    loop.close()
+
+
+class AsyncGitHubRepository:
+    """GitHub API repository implementation driven by a single asyncio event loop.
+
+    All HTTP traffic runs on one event loop thread over a shared keep-alive
+    connection pool. The synchronous interface methods submit coroutines to that
+    loop, so any number of caller threads only wait for results while the loop
+    multiplexes their requests.
+    """
+
+    DEFAULT_BASE_URL = "https://api.github.com"
+
+    # Maximum page size accepted by the REST API
+    _PER_PAGE = 100
+
+    def __init__(
+        self,
+        github_token: str,
+        timezone_converter: TimezoneConverter,
+        max_connections: int = 100,
+        base_url: str = DEFAULT_BASE_URL,
+        comment_filter: Optional[CommentFilterInterface] = None,
+        request_timeout: Optional[float] = None
+    ):
+        """Initialize async GitHub repository.
+
+        Args:
+            github_token: GitHub personal access token
+            timezone_converter: Timezone conversion service
+            max_connections: Size of the shared keep-alive connection pool
+            base_url: GitHub REST API base URL
+            comment_filter: Filter whose rejected comments are skipped before
+                review comments are built from them
+            request_timeout: Seconds a request may take, or None to wait indefinitely
+        """
+        self._github_token = github_token
+        self._max_connections = max_connections
+        self._base_url = base_url.rstrip("/")
+        self._comment_filter = comment_filter
+        self._request_timeout = request_timeout
+        self._payload_mapper = GitHubPayloadMapper(timezone_converter)
+        self._logger = logging.getLogger("fetch")
+
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="github-async-io",
+            daemon=True
+        )
+        self._loop_thread.start()
+        self._session = self._run(self._create_session())
+        self._finalizer = weakref.finalize(
+            self, _shutdown_event_loop, self._loop, self._session, self._loop_thread
+        )
+
+    def close(self) -> None:
+        """Close the connection pool and stop the event loop thread."""
+        self._finalizer()
+
+    def find_closed_prs_basic_info(
+        self,
+        repo_id: RepositoryIdentifier,
+        date_range: DateRange
+    ) -> Generator[PullRequestBasicInfo, None, None]:
+        """Find closed PRs basic info within the specified date range.
+
+        The next page is requested while the current page is being consumed.
+        """
+        url = f"{self._repository_url(repo_id)}/pulls"
+        params = {"state": "closed", "sort": "updated", "direction": "desc", "per_page": self._PER_PAGE}
+
+        self._logger.info("Starting basic PR search...")
+        pr_count = 0
+
+        parse_utc_timestamp = self._payload_mapper.parse_utc_timestamp
+        with closing(self._iterate_paginated_payloads(url, params)) as pr_payloads:
+            for pr_payload in pr_payloads:
+                closed_at = parse_utc_timestamp(pr_payload.get("closed_at"))
+                if closed_at is None:
+                    continue
+
+                # A PR cannot be closed after its last update, and PRs are sorted by
+                # updated date in descending order, so no later PR can be in range
+                if parse_utc_timestamp(pr_payload["updated_at"]) < date_range.start_date:
+                    self._logger.debug(f"Reached PR #{pr_payload['number']} updated before range, stopping search")
+                    break
+
+                # Rejected on the raw timestamp before any basic info is built
+                if date_range.contains(closed_at):
+                    basic_info = self._payload_mapper.to_basic_info(pr_payload, repo_id)
+                    pr_count += 1
+                    self._logger.debug(f"Found matching PR #{basic_info.number} (closed: {basic_info.closed_at.date()})")
+                    yield basic_info
+
+        self._logger.info(f"Basic PR search completed. Found {pr_count} matching PRs.")
+
+    def count_closed_prs(self, repo_id: RepositoryIdentifier, date_range: DateRange) -> int:
+        """Count the PRs closed within the specified date range with one search request.
+
+        Raises:
+            GitHubApiError: If the search fails
+        """
+        closed = "..".join(
+            value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            for value in (date_range.start_date, date_range.end_date)
+        )
+        params = {"q": f"repo:{repo_id.to_string()} is:pr is:closed closed:{closed}", "per_page": 1}
+        payload, _ = self._run(self._get_json(f"{self._base_url}/search/issues", params))
+        return payload.get("total_count", 0)
+
+    def get_full_pr_metadata(
+        self,
+        pr_number: int,
+        repo_id: RepositoryIdentifier
+    ) -> PullRequestMetadata:
+        """Get full PR metadata including review comments for a specific PR.
+
+        Raises:
+            GitHubApiError: If the PR or its review comments cannot be fetched
+        """
+        return self._run(self._fetch_full_pr_metadata(pr_number, repo_id))
+
+    def get_review_comments_by_pr(
+        self,
+        repo_id: RepositoryIdentifier,
+        since: Optional[datetime] = None
+    ) -> Dict[int, List[ReviewComment]]:
+        """Get review comments of all PRs in a repository, grouped by PR number.
+
+        Raises:
+            GitHubApiError: If the comments cannot be fetched
+        """
+        url = f"{self._repository_url(repo_id)}/pulls/comments"
+        params = {"sort": "created", "direction": "asc", "per_page": self._PER_PAGE}
+        if since is not None:
+            params["since"] = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        comments_by_pr: Dict[int, List[ReviewComment]] = {}
+        with closing(self._iterate_paginated_payloads(url, params)) as comment_payloads:
+            for comment_payload in comment_payloads:
+                if self._rejects_comment(comment_payload):
+                    continue
+                pr_number = self._payload_mapper.pull_request_number(comment_payload)
+                comments_by_pr.setdefault(pr_number, []).append(
+                    self._payload_mapper.to_review_comment(comment_payload)
+                )
+        return comments_by_pr
+
+    def count_review_comments(self, repo_id: RepositoryIdentifier, since: Optional[datetime] = None) -> int:
+        """Count the review comments of a repository updated at or after since with one one-item request.
+
+        Raises:
+            GitHubApiError: If the comments cannot be counted
+        """
+        params = {"per_page": 1}
+        if since is not None:
+            params["since"] = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        payload, links = self._run(self._get_json(f"{self._repository_url(repo_id)}/pulls/comments", params))
+        last_page = self._page_number(links.get("last"))
+        return last_page if last_page is not None else len(payload)
+
+    def list_repositories(self, owner: str) -> List[RepositoryIdentifier]:
+        """List the repositories owned by an organization or user.
+        
+        Raises:
+            GitHubApiError: If the owner or its repositories cannot be fetched
+        """
+        account, _ = self._run(self._get_json(f"{self._base_url}/users/{owner}"))
+        if account.get("type") == "Organization":
+            url, params = f"{self._base_url}/orgs/{owner}/repos", {"type": "all", "per_page": self._PER_PAGE}
+        else:
+            url, params = f"{self._base_url}/users/{owner}/repos", {"type": "owner", "per_page": self._PER_PAGE}
+        
+        with closing(self._iterate_paginated_payloads(url, params)) as repo_payloads:
+            return [
+                RepositoryIdentifier(owner=repo_payload["owner"]["login"], name=repo_payload["name"])
+                for repo_payload in repo_payloads
+            ]
+    
+    def _iterate_paginated_payloads(
+        self,
+        url: str,
+        params: Dict[str, Any]
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Iterate the items of a paginated endpoint, prefetching the next page.
+
+        The prefetched page is cancelled when iteration stops early.
+        """
+        next_page: Optional[Future] = self._submit(self._get_json(url, params))
+        try:
+            while next_page is not None:
+                payloads, links = next_page.result()
+                next_page = self._submit(self._get_json(links["next"])) if "next" in links else None
+                yield from payloads
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session on the event loop."""
+        connector = aiohttp.TCPConnector(limit=self._max_connections)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self._request_timeout),
+            headers={
+                "Authorization": f"Bearer {self._github_token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "agent-md-from-github"
+            }
+        )
+
+    async def _fetch_full_pr_metadata(self, pr_number: int, repo_id: RepositoryIdentifier) -> PullRequestMetadata:
+        """Fetch a PR and its review comments concurrently."""
+        pr_url = f"{self._repository_url(repo_id)}/pulls/{pr_number}"
+        pr_page, review_comments = await asyncio.gather(
+            self._get_json(pr_url),
+            self._fetch_review_comments(pr_url)
+        )
+        pr_payload, _ = pr_page
+        return self._payload_mapper.to_pr_metadata(pr_payload, review_comments, repo_id)
+
+    async def _fetch_review_comments(self, pr_url: str) -> List[ReviewComment]:
+        """Fetch all review comment pages of a PR.
+
+        Once the first page reveals the last page number, the remaining pages
+        are requested concurrently.
+
+        Raises:
+            GitHubApiError: If a page cannot be fetched; the PR is not
+                returned without its comments, so it is never saved incomplete
+        """
+        comments_url = f"{pr_url}/comments"
+        first_payloads, links = await self._get_json(comments_url, {"per_page": self._PER_PAGE})
+        payloads = list(first_payloads)
+
+        last_page = self._page_number(links.get("last"))
+        if last_page is not None:
+            remaining_pages = await asyncio.gather(*[
+                self._get_json(comments_url, {"per_page": self._PER_PAGE, "page": page})
+                for page in range(2, last_page + 1)
+            ])
+            for page_payloads, _ in remaining_pages:
+                payloads.extend(page_payloads)
+
+        return [
+            self._payload_mapper.to_review_comment(payload)
+            for payload in payloads
+            if not self._rejects_comment(payload)
+        ]
+
+    def _rejects_comment(self, comment_payload: Dict[str, Any]) -> bool:
+        """Check a review comment payload against the comment filter."""
+        if self._comment_filter is None:
+            return False
+        user = comment_payload.get("user") or {}
+        return self._comment_filter.rejects(
+            user.get("login", GitHubPayloadMapper.GHOST_LOGIN),
+            user.get("type"),
+            comment_payload.get("body") or ""
+        )
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> JsonPage:
+        """Send a GET request and return the JSON body with its pagination links.
+
+        Raises:
+            GitHubApiError: If the request fails or GitHub returns an error status
+        """
+        try:
+            async with self._session.get(url, params=params) as response:
+                if response.status >= 400:
+                    message = await response.text()
+                    raise GitHubApiError(f"GitHub API request to {url} failed with status {response.status}: {message}")
+                payload = await response.json()
+                links = {
+                    str(relation): str(link["url"])
+                    for relation, link in response.links.items()
+                }
+                return payload, links
+        except aiohttp.ClientError as e:
+            raise GitHubApiError(f"GitHub API request to {url} failed: {e}")
+        except asyncio.TimeoutError:
+            raise GitHubApiError(f"GitHub API request to {url} timed out after {self._request_timeout:g}s")
+
+    def _repository_url(self, repo_id: RepositoryIdentifier) -> str:
+        """Build the REST API URL of a repository."""
+        return f"{self._base_url}/repos/{repo_id.to_string()}"
+
+    @staticmethod
+    def _page_number(url: Optional[str]) -> Optional[int]:
+        """Extract the page number from a pagination link."""
+        if url is None:
+            return None
+        pages = parse_qs(urlparse(url).query).get("page")
+        return int(pages[0]) if pages else None
+
+    def _submit(self, coroutine: Awaitable[T]) -> "Future[T]":
+        """Schedule a coroutine on the event loop thread."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine on the event loop thread and wait for its result."""
+        return self._submit(coroutine).result()
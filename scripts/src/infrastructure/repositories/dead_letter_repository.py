@@ -0,0 +1,86 @@
+"""
+Dead-letter repository implementation for JSON persistence.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ...domain.failed_pull_request import FailedPullRequest
+from ...domain.interfaces.dead_letter_repository_interface import DeadLetterRepositoryInterface
+from ...domain.repository_identifier import RepositoryIdentifier
+from ..atomic_file import write_text_atomically
+from .pull_request_basic_info_record import from_basic_info_record, to_basic_info_record
+
+
+class DeadLetterRepository(DeadLetterRepositoryInterface):
+    """Repository keeping the PRs that failed to fetch in workspace/dead-letter.json."""
+
+    DEAD_LETTER_FILE_NAME = "dead-letter.json"
+
+    def __init__(self):
+        """Initialize dead-letter repository."""
+        self._logger = logging.getLogger("fetch")
+
+    def load(self, repository_id: RepositoryIdentifier, output_directory: Path) -> List[FailedPullRequest]:
+        """Load the failed PRs of a repository.
+
+        A list recorded for another repository is ignored.
+        """
+        file_path = output_directory / self.DEAD_LETTER_FILE_NAME
+        if not file_path.exists():
+            return []
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("repository") != repository_id.to_string():
+                self._logger.info(f"Ignoring dead-letter list of another repository: {data.get('repository')}")
+                return []
+            return [self._to_failed_pr(record, repository_id) for record in data["pull_requests"]]
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            self._logger.warning(f"Ignoring unreadable dead-letter list {file_path}: {e}")
+            return []
+
+    def save(
+        self,
+        repository_id: RepositoryIdentifier,
+        failed_prs: List[FailedPullRequest],
+        output_directory: Path
+    ) -> None:
+        """Replace the failed PRs atomically, removing the file when none are left."""
+        file_path = output_directory / self.DEAD_LETTER_FILE_NAME
+        if not failed_prs:
+            if file_path.exists():
+                file_path.unlink()
+            return
+
+        data = {
+            "repository": repository_id.to_string(),
+            "pull_requests": [self._to_record(failed_pr) for failed_pr in failed_prs]
+        }
+
+        output_directory.mkdir(parents=True, exist_ok=True)
+        write_text_atomically(file_path, json.dumps(data, indent=2, ensure_ascii=False))
+
+    @staticmethod
+    def _to_record(failed_pr: FailedPullRequest) -> Dict[str, Any]:
+        """Serialize a failed PR."""
+        return {
+            **to_basic_info_record(failed_pr.basic_info),
+            "error": failed_pr.error,
+            "failed_at": failed_pr.failed_at.isoformat(),
+            "attempts": failed_pr.attempts
+        }
+
+    @staticmethod
+    def _to_failed_pr(record: Dict[str, Any], repository_id: RepositoryIdentifier) -> FailedPullRequest:
+        """Deserialize a failed PR."""
+        return FailedPullRequest(
+            basic_info=from_basic_info_record(record, repository_id),
+            error=record["error"],
+            failed_at=datetime.fromisoformat(record["failed_at"]),
+            attempts=record["attempts"]
+        )
@@ -0,0 +1,164 @@
+"""
+Append-only JSON Lines journal of collection run progress.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional
+
+from ...domain.date_range import DateRange
+from ...domain.fetch_checkpoint import FetchCheckpoint
+from ...domain.interfaces.fetch_journal_interface import FetchJournalInterface
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.repository_identifier import RepositoryIdentifier
+from .pull_request_basic_info_record import from_basic_info_record, to_basic_info_record
+
+
+class FetchJournal(FetchJournalInterface):
+    """Journal writing one JSON record per line to workspace/fetch-journal.jsonl.
+
+    Every record is flushed to the operating system as soon as it is written,
+    and checkpoints that end a phase are synced to disk. A record torn by a
+    crash is the last line of the file and is ignored when reading.
+    """
+
+    JOURNAL_FILE_NAME = "fetch-journal.jsonl"
+
+    def __init__(self):
+        """Initialize fetch journal."""
+        self._file: Optional[IO[str]] = None
+        self._logger = logging.getLogger("fetch")
+
+    def load_checkpoint(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path
+    ) -> Optional[FetchCheckpoint]:
+        """Load the checkpoint of an unfinished run."""
+        records = self._read_records(output_directory / self.JOURNAL_FILE_NAME)
+        if not records or records[0].get("event") != "run_started":
+            return None
+
+        header = records[0]
+        if header.get("repository") != repository_id.to_string() or header.get("date_range") != self._date_range_record(date_range):
+            self._logger.info("The journal belongs to a run of another repository or date range; nothing to resume")
+            return None
+
+        listed: Dict[int, PullRequestBasicInfo] = {}
+        saved_numbers = set()
+        listed_windows = set()
+        listing_completed = False
+        for record in records[1:]:
+            event = record.get("event")
+            if event == "listed":
+                basic_info = from_basic_info_record(record["pull_request"], repository_id)
+                listed.setdefault(basic_info.number, basic_info)
+            elif event == "window_listed":
+                listed_windows.add(self._to_date_range(record["window"]))
+            elif event == "listing_completed":
+                listing_completed = True
+            elif event == "saved":
+                saved_numbers.add(record["number"])
+            elif event == "run_completed":
+                return None
+
+        return FetchCheckpoint(
+            repository_id=repository_id,
+            date_range=date_range,
+            listed=tuple(listed.values()),
+            listing_completed=listing_completed,
+            saved_numbers=frozenset(saved_numbers),
+            listed_windows=frozenset(listed_windows)
+        )
+
+    def start(
+        self,
+        repository_id: RepositoryIdentifier,
+        date_range: DateRange,
+        output_directory: Path,
+        resume: bool = False
+    ) -> None:
+        """Start recording a run, truncating the journal unless resuming."""
+        self.close()
+        output_directory.mkdir(parents=True, exist_ok=True)
+        journal_path = output_directory / self.JOURNAL_FILE_NAME
+        if resume:
+            self._file = open(journal_path, "a", encoding="utf-8")
+            self._append({"event": "run_resumed"}, sync=True)
+            return
+
+        self._file = open(journal_path, "w", encoding="utf-8")
+        self._append({
+            "event": "run_started",
+            "repository": repository_id.to_string(),
+            "date_range": self._date_range_record(date_range)
+        }, sync=True)
+
+    def record_listed(self, basic_info: PullRequestBasicInfo) -> None:
+        """Record that a PR was listed."""
+        self._append({"event": "listed", "pull_request": to_basic_info_record(basic_info)})
+
+    def record_window_listed(self, window: DateRange) -> None:
+        """Record that every PR of a date window was listed."""
+        self._append({"event": "window_listed", "window": self._date_range_record(window)}, sync=True)
+
+    def record_listing_completed(self) -> None:
+        """Record that listing finished."""
+        self._append({"event": "listing_completed"}, sync=True)
+
+    def record_saved(self, pr_number: int) -> None:
+        """Record that the file of a PR is complete."""
+        self._append({"event": "saved", "number": pr_number})
+
+    def finish(self) -> None:
+        """Record that the run completed and stop recording."""
+        self._append({"event": "run_completed"}, sync=True)
+        self.close()
+
+    def close(self) -> None:
+        """Stop recording, leaving the run resumable."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, record: Dict[str, Any], sync: bool = False) -> None:
+        """Append one record to the journal.
+
+        Raises:
+            RuntimeError: If no run is being recorded
+        """
+        if self._file is None:
+            raise RuntimeError("The fetch journal has not been started")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def _read_records(self, journal_path: Path) -> List[Dict[str, Any]]:
+        """Read the journal records, stopping at a torn or corrupt line."""
+        if not journal_path.exists():
+            return []
+
+        records = []
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self._logger.warning(f"Ignoring the torn end of the fetch journal {journal_path}")
+                    break
+        return records
+
+    @staticmethod
+    def _date_range_record(date_range: DateRange) -> List[str]:
+        """Serialize a date range for comparison between runs."""
+        return [date_range.start_date.isoformat(), date_range.end_date.isoformat()]
+
+    @staticmethod
+    def _to_date_range(record: List[str]) -> DateRange:
+        """Deserialize a date range."""
+        return DateRange(start_date=datetime.fromisoformat(record[0]), end_date=datetime.fromisoformat(record[1]))
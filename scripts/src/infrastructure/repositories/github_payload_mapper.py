@@ -0,0 +1,209 @@
+"""
+Mapper from raw GitHub REST API payloads to domain objects.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.pull_request_metadata import PullRequestMetadata
+from ...domain.repository_identifier import RepositoryIdentifier
+from ...domain.review_comment import ReviewComment
+from ..services.timezone_converter import TimezoneConverter
+
+
+class GitHubPayloadMapper:
+    """Maps raw GitHub REST API JSON payloads to domain objects."""
+
+    # Login GitHub shows for comments whose author account was deleted
+    GHOST_LOGIN = "ghost"
+
+    # Recently converted timestamps kept; a listed PR often repeats one
+    # timestamp as its closed, merged and updated time
+    _TIMESTAMP_CACHE_SIZE = 256
+
+    def __init__(self, timezone_converter: TimezoneConverter):
+        """Initialize payload mapper.
+
+        Args:
+            timezone_converter: Timezone conversion service
+        """
+        self._timezone_converter = timezone_converter
+        self._convert_timestamp = lru_cache(maxsize=self._TIMESTAMP_CACHE_SIZE)(self._convert_timestamp_uncached)
+
+    def parse_timestamp(self, value: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO 8601 timestamp from the API into the target timezone.
+
+        Args:
+            value: Timestamp such as "2023-01-01T12:00:00Z", or None
+
+        Returns:
+            Timezone-aware datetime in the target timezone, or None
+        """
+        if not value:
+            return None
+        return self._convert_timestamp(value)
+
+    @staticmethod
+    def parse_utc_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO 8601 timestamp from the API without converting its timezone.
+
+        Aware datetimes compare correctly across timezones, so listings filter
+        on these and only convert the timestamps of the PRs they keep.
+
+        Args:
+            value: Timestamp such as "2023-01-01T12:00:00Z", or None
+
+        Returns:
+            Timezone-aware datetime in UTC, or None
+        """
+        if not value:
+            return None
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    def _convert_timestamp_uncached(self, value: str) -> datetime:
+        """Parse a timestamp and convert it into the target timezone."""
+        return self._timezone_converter.convert_to_target_timezone(self.parse_utc_timestamp(value))
+
+    def is_merged(self, pr_payload: Dict[str, Any]) -> bool:
+        """Determine whether a PR payload describes a merged PR.
+
+        The list endpoint omits "merged", so "merged_at" is used when it is absent.
+
+        Args:
+            pr_payload: Pull request payload from the list or detail endpoint
+
+        Returns:
+            True if the PR was merged
+        """
+        if "merged" in pr_payload:
+            return bool(pr_payload["merged"])
+        return pr_payload.get("merged_at") is not None
+
+    def to_basic_info(self, pr_payload: Dict[str, Any], repo_id: RepositoryIdentifier) -> PullRequestBasicInfo:
+        """Map a pull request payload to basic PR info.
+
+        Args:
+            pr_payload: Pull request payload with a non-null "closed_at"
+            repo_id: Repository the PR belongs to
+
+        Returns:
+            Basic PR information
+        """
+        return PullRequestBasicInfo(
+            number=pr_payload["number"],
+            title=pr_payload["title"],
+            closed_at=self.parse_timestamp(pr_payload["closed_at"]),
+            is_merged=self.is_merged(pr_payload),
+            repository_id=repo_id,
+            created_at=self.parse_timestamp(pr_payload.get("created_at")),
+            updated_at=self.parse_timestamp(pr_payload.get("updated_at")),
+            author=self._author(pr_payload),
+            base_branch=(pr_payload.get("base") or {}).get("ref"),
+            labels=self._labels(pr_payload)
+        )
+
+    def issue_to_basic_info(self, issue_payload: Dict[str, Any], repo_id: RepositoryIdentifier) -> PullRequestBasicInfo:
+        """Map an issue payload describing a PR to basic PR info.
+
+        The issues and search APIs describe PRs as issues whose "pull_request"
+        object carries the merge time. They do not name the base branch.
+
+        Args:
+            issue_payload: Issue payload with a "pull_request" object and a non-null "closed_at"
+            repo_id: Repository the PR belongs to
+
+        Returns:
+            Basic PR information
+        """
+        pull_request = issue_payload.get("pull_request") or {}
+        return PullRequestBasicInfo(
+            number=issue_payload["number"],
+            title=issue_payload["title"],
+            closed_at=self.parse_timestamp(issue_payload["closed_at"]),
+            is_merged=pull_request.get("merged_at") is not None,
+            repository_id=repo_id,
+            created_at=self.parse_timestamp(issue_payload.get("created_at")),
+            updated_at=self.parse_timestamp(issue_payload.get("updated_at")),
+            author=self._author(issue_payload),
+            labels=self._labels(issue_payload)
+        )
+
+    def to_review_comment(self, comment_payload: Dict[str, Any]) -> ReviewComment:
+        """Map a pull request review comment payload to a review comment.
+
+        Args:
+            comment_payload: Review comment payload
+
+        Returns:
+            Review comment
+        """
+        user = comment_payload.get("user") or {}
+        return ReviewComment(
+            comment_id=comment_payload["id"],
+            file_path=comment_payload["path"],
+            position=comment_payload.get("original_position"),
+            commit_id=comment_payload["commit_id"],
+            author=user.get("login", self.GHOST_LOGIN),
+            created_at=self.parse_timestamp(comment_payload["created_at"]),
+            body=comment_payload["body"],
+            diff_context=self._to_diff_context(comment_payload)
+        )
+
+    def to_pr_metadata(
+        self,
+        pr_payload: Dict[str, Any],
+        review_comments: List[ReviewComment],
+        repo_id: RepositoryIdentifier
+    ) -> PullRequestMetadata:
+        """Map a pull request payload and its comments to PR metadata.
+
+        Args:
+            pr_payload: Pull request payload
+            review_comments: Review comments of the PR
+            repo_id: Repository the PR belongs to
+
+        Returns:
+            PR metadata
+        """
+        return PullRequestMetadata(
+            number=pr_payload["number"],
+            title=pr_payload["title"],
+            closed_at=self.parse_timestamp(pr_payload["closed_at"]),
+            is_merged=self.is_merged(pr_payload),
+            review_comments=review_comments,
+            repository_id=repo_id
+        )
+
+    def pull_request_number(self, comment_payload: Dict[str, Any]) -> int:
+        """Extract the number of the PR a review comment belongs to.
+
+        Args:
+            comment_payload: Review comment payload with a "pull_request_url"
+
+        Returns:
+            PR number
+        """
+        return int(comment_payload["pull_request_url"].rstrip("/").rsplit("/", 1)[1])
+
+    def _author(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Extract the author login of a PR or issue payload."""
+        user = payload.get("user")
+        if user is None:
+            return None
+        return user.get("login", self.GHOST_LOGIN)
+
+    @staticmethod
+    def _labels(payload: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+        """Extract the label names of a PR or issue payload, or None if the payload has none listed."""
+        if "labels" not in payload:
+            return None
+        return tuple(label["name"] for label in payload["labels"])
+
+    def _to_diff_context(self, comment_payload: Dict[str, Any]) -> str:
+        """Extract diff context from a review comment payload."""
+        diff_hunk = comment_payload.get("diff_hunk")
+        if diff_hunk:
+            return diff_hunk
+        return f"@@ Position: {comment_payload.get('original_position')} in {comment_payload['path']} @@"
@@ -2,83 +2,468 @@
 GitHub API repository implementation.
 """
 
+import itertools
 import logging
-from datetime import datetime
-from typing import Generator
+import math
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, ContextManager, Deque, Dict, Generator, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
 
+import requests
 from github import Github
 from github.GithubException import GithubException
 
 from ...domain.date_range import DateRange
+from ...domain.interfaces.comment_filter_interface import CommentFilterInterface
+from ...domain.interfaces.fetch_metrics_interface import FetchMetricsInterface
 from ...domain.pull_request_metadata import PullRequestMetadata
 from ...domain.pull_request_basic_info import PullRequestBasicInfo
 from ...domain.repository_identifier import RepositoryIdentifier
 from ...domain.review_comment import ReviewComment
 from ..services.timezone_converter import TimezoneConverter
+from .github_payload_mapper import GitHubPayloadMapper
 from ...application.exceptions.github_api_error import GitHubApiError
 
 
+@dataclass
+class _ListingStats:
+    """Pages read by one PR listing."""
+    
+    pages_read: int = 0
+
+
 class GitHubRepository:
     """GitHub API repository implementation."""
     
-    def __init__(self, github_client: Github, timezone_converter: TimezoneConverter):
+    # Ways of selecting the closed PRs of a date window
+    # - scan: page through all closed PRs sorted by update time
+    # - search: let the search API filter on the closed date
+    # - issues: list issues and PRs updated since the window start
+    # - auto: issues for recent windows, search otherwise
+    LISTING_STRATEGIES = ("auto", "scan", "search", "issues")
+    
+    # Windows starting at most this long ago are listed with the issues API,
+    # which returns everything updated since the window start
+    _ISSUES_LISTING_MAX_AGE = timedelta(days=30)
+    
+    # The search API returns at most this many results per query
+    _SEARCH_RESULT_LIMIT = 1000
+    
+    # Page size used for listings paginated by this repository
+    _PER_PAGE = 100
+    
+    def __init__(
+        self,
+        github_client: Github,
+        timezone_converter: TimezoneConverter,
+        github_client_factory: Optional[Callable[[], Github]] = None,
+        listing_strategy: str = "auto",
+        comment_filter: Optional[CommentFilterInterface] = None,
+        page_concurrency: int = 1,
+        estimate_scan_pages: bool = True,
+        fetch_metrics: Optional[FetchMetricsInterface] = None
+    ):
         """Initialize GitHub repository.
         
         Args:
             github_client: Authenticated GitHub client
             timezone_converter: Timezone conversion service
+            github_client_factory: Optional factory creating a dedicated client for
+                each additional thread, since PyGithub clients are not thread-safe
+            listing_strategy: How closed PRs of a date window are selected
+            comment_filter: Filter whose rejected comments are skipped before
+                review comments are built from them
+            page_concurrency: Number of listing pages requested ahead in
+                parallel once the last page number is known; only used with
+                github_client_factory
+            estimate_scan_pages: Log how many pages a scan would have read after
+                each search or issues listing, at the cost of one search request
+            fetch_metrics: Optional metrics the time spent fetching review
+                comments is recorded in as the comments phase
+        
+        Raises:
+            ValueError: If listing_strategy is unknown or page_concurrency is less than 1
         """
+        if listing_strategy not in self.LISTING_STRATEGIES:
+            raise ValueError(
+                f"Unknown listing strategy: {listing_strategy}. Use one of {', '.join(self.LISTING_STRATEGIES)}"
+            )
+        if page_concurrency < 1:
+            raise ValueError(f"Page concurrency must be at least 1, got {page_concurrency}")
+        
         self._github = github_client
         self._timezone_converter = timezone_converter
+        self._github_client_factory = github_client_factory
+        self._listing_strategy = listing_strategy
+        self._comment_filter = comment_filter
+        self._page_concurrency = page_concurrency if github_client_factory is not None else 1
+        self._estimate_scan_pages = estimate_scan_pages
+        self._fetch_metrics = fetch_metrics
+        self._payload_mapper = GitHubPayloadMapper(timezone_converter)
+        self._thread_clients = threading.local()
+        self._thread_clients.client = github_client
         self._logger = logging.getLogger("fetch")
     
+    def _get_client(self) -> Github:
+        """Get the GitHub client owned by the current thread."""
+        client = getattr(self._thread_clients, "client", None)
+        if client is not None:
+            return client
+        if self._github_client_factory is None:
+            return self._github
+        
+        client = self._github_client_factory()
+        self._thread_clients.client = client
+        return client
+    
     def find_closed_prs_basic_info(
         self, 
         repo_id: RepositoryIdentifier, 
         date_range: DateRange
     ) -> Generator[PullRequestBasicInfo, None, None]:
         """Find closed PRs basic info within the specified date range."""
-        try:
-            repo = self._github.get_repo(repo_id.to_string())
-        except GithubException as e:
-            raise GitHubApiError(f"Failed to access repository {repo_id.to_string()}: {e}")
+        strategy = self._select_listing_strategy(date_range)
+        stats = _ListingStats()
+        
+        self._logger.info(f"Starting basic PR search using {strategy} listing...")
+        pr_count = 0
         
         try:
-            # Get all closed PRs (both merged and closed without merge)
-            prs = repo.get_pulls(state='closed', sort='updated', direction='desc')
-            
-            self._logger.info("Starting basic PR search...")
-            pr_count = 0
+            if strategy == "scan":
+                basic_infos = self._list_by_scan(repo_id, date_range, stats)
+            elif strategy == "search":
+                basic_infos = self._list_by_search(repo_id, date_range, stats)
+            else:
+                basic_infos = self._list_by_issues(repo_id, date_range, stats)
             
-            for pr in prs:
-                if pr.closed_at is None:
-                    continue
-                
-                # Convert to target timezone
-                closed_at_tz = self._timezone_converter.convert_to_target_timezone(pr.closed_at)
-                
-                if date_range.contains(closed_at_tz):
-                    pr_count += 1
-                    self._logger.debug(f"Found matching PR #{pr.number} (closed: {closed_at_tz.date()})")
-                    basic_info = PullRequestBasicInfo(
-                        number=pr.number,
-                        title=pr.title,
-                        closed_at=closed_at_tz,
-                        is_merged=pr.merged,
-                        repository_id=repo_id
-                    )
-                    yield basic_info
-                elif closed_at_tz < date_range.start_date:
-                    # PRs are sorted by updated date in descending order
-                    # If we hit a PR older than our range, we can stop
-                    self._logger.debug(f"Reached PR #{pr.number} older than range, stopping search")
-                    break
+            for basic_info in basic_infos:
+                pr_count += 1
+                self._logger.debug(f"Found matching PR #{basic_info.number} (closed: {basic_info.closed_at.date()})")
+                yield basic_info
             
-            self._logger.info(f"Basic PR search completed. Found {pr_count} matching PRs.")
+            self._logger.info(f"Basic PR search completed. Found {pr_count} matching PRs in {stats.pages_read} pages.")
+            if strategy != "scan" and self._estimate_scan_pages:
+                self._log_pages_saved(repo_id, date_range, stats)
                     
         except GithubException as e:
             raise GitHubApiError(f"Error fetching PRs: {e}")
     
+    def count_closed_prs(self, repo_id: RepositoryIdentifier, date_range: DateRange) -> int:
+        """Count the PRs closed within the specified date range.
+        
+        The search API reports the total of a query with a single one-item request.
+        
+        Raises:
+            GitHubApiError: If the search fails
+        """
+        params = {"q": self._closed_search_query(repo_id, date_range), "per_page": 1}
+        try:
+            _, payload = self._get_client().requester.requestJsonAndCheck("GET", "/search/issues", parameters=params)
+        except GithubException as e:
+            raise GitHubApiError(f"Error counting PRs: {e}")
+        return payload.get("total_count", 0)
+    
+    def _select_listing_strategy(self, date_range: DateRange) -> str:
+        """Choose the listing strategy for a date window."""
+        if self._listing_strategy != "auto":
+            return self._listing_strategy
+        
+        window_age = datetime.now(timezone.utc) - date_range.start_date
+        if window_age <= self._ISSUES_LISTING_MAX_AGE:
+            return "issues"
+        return "search"
+    
+    def _list_by_scan(
+        self,
+        repo_id: RepositoryIdentifier,
+        date_range: DateRange,
+        stats: _ListingStats
+    ) -> Generator[PullRequestBasicInfo, None, None]:
+        """List closed PRs sorted by update time and filter them on the client.
+        
+        Most scanned PRs fall outside the window, so they are rejected on their
+        raw timestamps before any basic info is built.
+        """
+        params = {"state": "closed", "sort": "updated", "direction": "desc", "per_page": self._PER_PAGE}
+        parse_utc_timestamp = self._payload_mapper.parse_utc_timestamp
+        
+        for page in self._iterate_raw_pages(f"/repos/{repo_id.to_string()}/pulls", params, stats):
+            for pr_payload in page:
+                # A PR cannot be closed after its last update, and PRs are sorted by
+                # updated date in descending order, so no later PR can be in range
+                if parse_utc_timestamp(pr_payload["updated_at"]) < date_range.start_date:
+                    self._logger.debug(f"Reached PR #{pr_payload['number']} updated before range, stopping search")
+                    return
+                
+                closed_at = parse_utc_timestamp(pr_payload.get("closed_at"))
+                if closed_at is not None and date_range.contains(closed_at):
+                    yield self._payload_mapper.to_basic_info(pr_payload, repo_id)
+    
+    def _list_by_search(
+        self,
+        repo_id: RepositoryIdentifier,
+        date_range: DateRange,
+        stats: _ListingStats
+    ) -> Generator[PullRequestBasicInfo, None, None]:
+        """List closed PRs with the search API filtering on the closed date.
+        
+        Windows matching more PRs than one search can return are split in half.
+        """
+        params = {
+            "q": self._closed_search_query(repo_id, date_range),
+            "sort": "updated",
+            "order": "desc",
+            "per_page": self._PER_PAGE
+        }
+        
+        pages = self._iterate_raw_pages("/search/issues", params, stats)
+        first_page = next(pages)
+        total_count = first_page.get("total_count", 0)
+        
+        if total_count > self._SEARCH_RESULT_LIMIT and date_range.start_date < date_range.end_date:
+            pages.close()
+            middle = date_range.start_date + (date_range.end_date - date_range.start_date) / 2
+            self._logger.debug(f"Search matched {total_count} PRs, splitting window at {middle}")
+            yield from self._list_by_search(repo_id, DateRange(date_range.start_date, middle), stats)
+            later_start = middle + timedelta(seconds=1)
+            if later_start <= date_range.end_date:
+                yield from self._list_by_search(repo_id, DateRange(later_start, date_range.end_date), stats)
+            return
+        
+        if first_page.get("incomplete_results"):
+            self._logger.warning("Search results are incomplete; some PRs of the window may be missing")
+        
+        for page in itertools.chain([first_page], pages):
+            for item in page["items"]:
+                yield self._payload_mapper.issue_to_basic_info(item, repo_id)
+    
+    def _list_by_issues(
+        self,
+        repo_id: RepositoryIdentifier,
+        date_range: DateRange,
+        stats: _ListingStats
+    ) -> Generator[PullRequestBasicInfo, None, None]:
+        """List closed issues and PRs updated since the window start and keep PRs in range."""
+        params = {
+            "state": "closed",
+            "since": self._format_utc(date_range.start_date),
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": self._PER_PAGE
+        }
+        
+        parse_utc_timestamp = self._payload_mapper.parse_utc_timestamp
+        for page in self._iterate_raw_pages(f"/repos/{repo_id.to_string()}/issues", params, stats):
+            for item in page:
+                if item.get("pull_request") is None:
+                    continue
+                closed_at = parse_utc_timestamp(item.get("closed_at"))
+                if closed_at is not None and date_range.contains(closed_at):
+                    yield self._payload_mapper.issue_to_basic_info(item, repo_id)
+    
+    def _iterate_raw_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        stats: _ListingStats
+    ) -> Generator[Any, None, None]:
+        """Iterate the JSON pages of a paginated endpoint without building PyGithub objects.
+        
+        Listing items as plain payloads avoids lazy completion of fields that are
+        missing from list responses, and lets the pages read be counted exactly.
+        
+        Once the first response names the last page, the remaining pages are
+        requested ahead in parallel and still yielded in order. Only
+        page_concurrency pages are requested ahead, so a listing stopped early
+        requests at most that many pages it does not read.
+        """
+        requester = self._get_client().requester
+        headers, payload = requester.requestJsonAndCheck("GET", url, parameters=params)
+        stats.pages_read += 1
+        yield payload
+        
+        links = self._parse_links(headers)
+        last_url = links.get("last")
+        last_page = self._page_number(last_url)
+        if self._page_concurrency > 1 and last_page is not None:
+            yield from self._fan_out_pages(last_url, last_page, stats)
+            return
+        
+        # The next link already carries every query parameter
+        next_url = links.get("next")
+        while next_url is not None:
+            headers, payload = requester.requestJsonAndCheck("GET", next_url)
+            stats.pages_read += 1
+            yield payload
+            next_url = self._parse_links(headers).get("next")
+    
+    def _fan_out_pages(self, last_url: str, last_page: int, stats: _ListingStats) -> Generator[Any, None, None]:
+        """Request pages 2 to last_page in parallel and yield them in order."""
+        pending: Deque["Future[Any]"] = deque()
+        executor = ThreadPoolExecutor(max_workers=self._page_concurrency, thread_name_prefix="page")
+        try:
+            for page in range(2, last_page + 1):
+                pending.append(executor.submit(self._request_page, self._page_url(last_url, page)))
+                if len(pending) >= self._page_concurrency:
+                    payload = pending.popleft().result()
+                    stats.pages_read += 1
+                    yield payload
+            while pending:
+                payload = pending.popleft().result()
+                stats.pages_read += 1
+                yield payload
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _request_page(self, page_url: str) -> Any:
+        """Request one page with the client of the current thread."""
+        _, payload = self._get_client().requester.requestJsonAndCheck("GET", page_url)
+        return payload
+    
+    @staticmethod
+    def _parse_links(headers: Dict[str, Any]) -> Dict[str, str]:
+        """Parse the pagination links of a response by relation."""
+        return {
+            link.get("rel"): link.get("url")
+            for link in requests.utils.parse_header_links(headers.get("link", ""))
+        }
+    
+    @staticmethod
+    def _page_number(url: Optional[str]) -> Optional[int]:
+        """Extract the page number from a pagination link."""
+        if url is None:
+            return None
+        pages = parse_qs(urlparse(url).query).get("page")
+        return int(pages[0]) if pages else None
+    
+    @staticmethod
+    def _page_url(last_url: str, page: int) -> str:
+        """Build the link of a page from the link of the last page."""
+        parsed = urlparse(last_url)
+        query = parse_qs(parsed.query)
+        query["page"] = [str(page)]
+        return parsed._replace(query=urlencode(query, doseq=True)).geturl()
+    
+    def _log_pages_saved(self, repo_id: RepositoryIdentifier, date_range: DateRange, stats: _ListingStats) -> None:
+        """Log how many pages a closed PR scan would have read for the same window.
+        
+        A scan reads every closed PR updated since the window start; the search
+        API counts them with a single one-item request.
+        """
+        params = {
+            "q": f"repo:{repo_id.to_string()} is:pr is:closed updated:>={self._format_utc(date_range.start_date)}",
+            "per_page": 1
+        }
+        try:
+            _, payload = self._get_client().requester.requestJsonAndCheck("GET", "/search/issues", parameters=params)
+        except GithubException as e:
+            self._logger.debug(f"Could not estimate scan pages: {e}")
+            return
+        
+        scan_pages = max(1, math.ceil(payload.get("total_count", 0) / self._PER_PAGE))
+        self._logger.info(
+            f"A closed PR scan would have read about {scan_pages} pages "
+            f"({max(scan_pages - stats.pages_read, 0)} pages saved)."
+        )
+    
+    @classmethod
+    def _closed_search_query(cls, repo_id: RepositoryIdentifier, date_range: DateRange) -> str:
+        """Build the search query of the PRs closed within a date range."""
+        return (
+            f"repo:{repo_id.to_string()} is:pr is:closed "
+            f"closed:{cls._format_utc(date_range.start_date)}..{cls._format_utc(date_range.end_date)}"
+        )
+    
+    @staticmethod
+    def _format_utc(value: datetime) -> str:
+        """Format a timestamp as the UTC ISO 8601 form accepted by GitHub queries."""
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    def _measure_comments(self) -> ContextManager[None]:
+        """Time a block fetching review comments as the comments phase, if metrics are recorded."""
+        if self._fetch_metrics is None:
+            return nullcontext()
+        return self._fetch_metrics.measure("comments")
+    
+    def _report_lazy_completions(self, lazy_completions: int, source: str) -> None:
+        """Warn about hidden requests PyGithub made to complete listed review comments.
+        
+        Reading an attribute missing from a list payload makes PyGithub fetch the
+        whole object again. Review comments are built only from list payload
+        fields, so there should be none.
+        
+        Args:
+            lazy_completions: Number of listed review comments completed by a request of their own
+            source: What the review comments were listed for, as shown in the warning
+        """
+        if not lazy_completions:
+            return
+        self._logger.warning(f"Fetching review comments of {source} made {lazy_completions} lazy completion requests")
+        if self._fetch_metrics is not None:
+            self._fetch_metrics.record_lazy_completions(lazy_completions)
+    
+    def count_review_comments(self, repo_id: RepositoryIdentifier, since: Optional[datetime] = None) -> int:
+        """Count the review comments of a repository updated at or after a time.
+        
+        A one-item page of the repository-wide review comments endpoint links
+        to its last page, whose number is the total.
+        
+        Args:
+            repo_id: Repository identifier
+            since: Only comments updated at or after this time, or None for all
+        
+        Raises:
+            GitHubApiError: If the comments cannot be counted
+        """
+        params = {"per_page": 1}
+        if since is not None:
+            params["since"] = self._format_utc(since)
+        try:
+            headers, payload = self._get_client().requester.requestJsonAndCheck(
+                "GET", f"/repos/{repo_id.to_string()}/pulls/comments", parameters=params
+            )
+        except GithubException as e:
+            raise GitHubApiError(f"Error counting review comments of {repo_id.to_string()}: {e}")
+        last_page = self._page_number(self._parse_links(headers).get("last"))
+        return last_page if last_page is not None else len(payload)
+    
+    def list_repositories(self, owner: str) -> List[RepositoryIdentifier]:
+        """List the repositories owned by an organization or user.
+        
+        Organization repositories are listed with type "all", so private
+        repositories visible to the token are included.
+        
+        Args:
+            owner: Organization or user login
+            
+        Returns:
+            Repository identifiers in the order GitHub lists them
+        
+        Raises:
+            GitHubApiError: If the owner or its repositories cannot be fetched
+        """
+        try:
+            _, account = self._get_client().requester.requestJsonAndCheck("GET", f"/users/{owner}")
+            if account.get("type") == "Organization":
+                url, params = f"/orgs/{owner}/repos", {"type": "all", "per_page": self._PER_PAGE}
+            else:
+                url, params = f"/users/{owner}/repos", {"type": "owner", "per_page": self._PER_PAGE}
+            
+            return [
+                RepositoryIdentifier(owner=repo_payload["owner"]["login"], name=repo_payload["name"])
+                for page in self._iterate_raw_pages(url, params, _ListingStats())
+                for repo_payload in page
+            ]
+        except GithubException as e:
+            raise GitHubApiError(f"Error listing repositories of {owner}: {e}")
+    
     def get_full_pr_metadata(
         self, 
         pr_number: int, 
@@ -86,7 +471,7 @@ class GitHubRepository:
     ) -> PullRequestMetadata:
         """Get full PR metadata including review comments for a specific PR."""
         try:
-            repo = self._github.get_repo(repo_id.to_string())
+            repo = self._get_client().get_repo(repo_id.to_string())
             pr = repo.get_pull(pr_number)
             
             # Convert closed_at to target timezone
@@ -97,9 +482,58 @@ class GitHubRepository:
         except GithubException as e:
             raise GitHubApiError(f"Error fetching PR #{pr_number}: {e}")
     
+    def get_review_comments_by_pr(
+        self,
+        repo_id: RepositoryIdentifier,
+        since: Optional[datetime] = None
+    ) -> Dict[int, List[ReviewComment]]:
+        """Get review comments of all PRs in a repository, grouped by PR number.
+        
+        Pages through the repository-wide review comments endpoint once instead
+        of requesting the comments of every PR separately.
+        
+        Args:
+            repo_id: Repository identifier
+            since: Only comments updated at or after this time, or None for all
+            
+        Returns:
+            Review comments in creation order keyed by PR number
+        
+        Raises:
+            GitHubApiError: If the comments cannot be fetched
+        """
+        comments_by_pr: Dict[int, List[ReviewComment]] = {}
+        try:
+            with self._measure_comments():
+                repo = self._get_client().get_repo(repo_id.to_string())
+                if since is None:
+                    comments = repo.get_pulls_review_comments(sort="created", direction="asc")
+                else:
+                    comments = repo.get_pulls_review_comments(
+                        sort="created",
+                        direction="asc",
+                        since=since.astimezone(timezone.utc)
+                    )
+                
+                lazy_completions = 0
+                for comment in comments:
+                    if not self._rejects_comment(comment):
+                        pr_number = int(comment.pull_request_url.rstrip("/").rsplit("/", 1)[1])
+                        comments_by_pr.setdefault(pr_number, []).append(self._convert_review_comment(comment))
+                    # Checked once every field was read, so completions triggered by any read are counted
+                    if comment.completed:
+                        lazy_completions += 1
+                self._report_lazy_completions(lazy_completions, repo_id.to_string())
+                
+        except GithubException as e:
+            raise GitHubApiError(f"Error fetching review comments of {repo_id.to_string()}: {e}")
+        
+        return comments_by_pr
+    
     def _convert_to_pr_metadata(self, pr, closed_at_tz: datetime, repo_id: RepositoryIdentifier) -> PullRequestMetadata:
         """Convert GitHub PR object to domain model."""
-        review_comments = self._extract_review_comments(pr)
+        with self._measure_comments():
+            review_comments = self._extract_review_comments(pr)
         
         return PullRequestMetadata(
             number=pr.number,
@@ -111,34 +545,57 @@ class GitHubRepository:
         )
     
     def _extract_review_comments(self, pr) -> list[ReviewComment]:
-        """Extract review comments from PR."""
+        """Extract review comments from PR.
+        
+        Raises:
+            GitHubApiError: If the comments cannot be fetched; the PR is not
+                returned without them, so it is never saved incomplete
+        """
         comments = []
         
         try:
             # Get review comments (inline comments on code)
             review_comments = pr.get_review_comments()
             
+            lazy_completions = 0
             for comment in review_comments:
-                created_at_tz = self._timezone_converter.convert_to_target_timezone(comment.created_at)
-                diff_context = self._extract_diff_context(comment)
-                
-                review_comment = ReviewComment(
-                    comment_id=comment.id,
-                    file_path=comment.path,
-                    position=comment.original_position,
-                    commit_id=comment.commit_id,
-                    author=comment.user.login,
-                    created_at=created_at_tz,
-                    body=comment.body,
-                    diff_context=diff_context
-                )
-                comments.append(review_comment)
+                if not self._rejects_comment(comment):
+                    comments.append(self._convert_review_comment(comment))
+                # Checked once every field was read, so completions triggered by any read are counted
+                if comment.completed:
+                    lazy_completions += 1
+            self._report_lazy_completions(lazy_completions, f"PR #{pr.number}")
                 
         except GithubException as e:
-            self._logger.warning(f"Error fetching review comments: {e}")
+            raise GitHubApiError(f"Error fetching review comments of PR #{pr.number}: {e}")
         
         return comments
     
+    def _rejects_comment(self, comment) -> bool:
+        """Check a GitHub review comment object against the comment filter."""
+        if self._comment_filter is None:
+            return False
+        user = comment.user
+        if user is None:
+            return self._comment_filter.rejects(GitHubPayloadMapper.GHOST_LOGIN, None, comment.body)
+        return self._comment_filter.rejects(user.login, user.type, comment.body)
+    
+    def _convert_review_comment(self, comment) -> ReviewComment:
+        """Convert GitHub review comment object to domain model."""
+        created_at_tz = self._timezone_converter.convert_to_target_timezone(comment.created_at)
+        diff_context = self._extract_diff_context(comment)
+        
+        return ReviewComment(
+            comment_id=comment.id,
+            file_path=comment.path,
+            position=comment.original_position,
+            commit_id=comment.commit_id,
+            author=comment.user.login,
+            created_at=created_at_tz,
+            body=comment.body,
+            diff_context=diff_context
+        )
+    
     def _extract_diff_context(self, comment) -> str:
         """Extract diff context from comment."""
         try:
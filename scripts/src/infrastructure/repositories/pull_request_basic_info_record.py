@@ -0,0 +1,66 @@
+"""
+JSON record format of listed PR info shared by the fetch journal, PR catalog and dead-letter list.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ...domain.pull_request_basic_info import PullRequestBasicInfo
+from ...domain.repository_identifier import RepositoryIdentifier
+
+
+def to_basic_info_record(basic_info: PullRequestBasicInfo) -> Dict[str, Any]:
+    """Serialize listed PR info.
+
+    Args:
+        basic_info: Listed PR info
+
+    Returns:
+        JSON-compatible record with every field except the repository
+    """
+    return {
+        "number": basic_info.number,
+        "title": basic_info.title,
+        "closed_at": basic_info.closed_at.isoformat(),
+        "merged": basic_info.is_merged,
+        "created_at": basic_info.created_at.isoformat() if basic_info.created_at else None,
+        "updated_at": basic_info.updated_at.isoformat() if basic_info.updated_at else None,
+        "author": basic_info.author,
+        "base_branch": basic_info.base_branch,
+        "labels": list(basic_info.labels) if basic_info.labels is not None else None,
+        "review_comment_count": basic_info.review_comment_count
+    }
+
+
+def from_basic_info_record(record: Dict[str, Any], repository_id: RepositoryIdentifier) -> PullRequestBasicInfo:
+    """Deserialize listed PR info.
+
+    Optional fields missing from records written by older versions are read as None.
+
+    Args:
+        record: Record created by to_basic_info_record
+        repository_id: Repository the PR belongs to
+
+    Returns:
+        Listed PR info
+
+    Raises:
+        KeyError: If a required field is missing
+        ValueError: If a timestamp is malformed
+    """
+    def parse(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
+
+    return PullRequestBasicInfo(
+        number=record["number"],
+        title=record["title"],
+        closed_at=datetime.fromisoformat(record["closed_at"]),
+        is_merged=record["merged"],
+        repository_id=repository_id,
+        created_at=parse(record.get("created_at")),
+        updated_at=parse(record.get("updated_at")),
+        author=record.get("author"),
+        base_branch=record.get("base_branch"),
+        labels=tuple(record["labels"]) if record.get("labels") is not None else None,
+        review_comment_count=record.get("review_comment_count")
+    )
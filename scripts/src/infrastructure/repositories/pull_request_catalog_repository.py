@@ -0,0 +1,96 @@
+"""
+PullRequestCatalog repository implementation for JSON persistence.
+"""
+
+import json
+import logging
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+from ...domain.date_range import DateRange
+from ...domain.interfaces.pull_request_catalog_repository_interface import PullRequestCatalogRepositoryInterface
+from ...domain.pull_request_catalog import PullRequestCatalog
+from ...domain.pull_request_catalog_entry import PullRequestCatalogEntry
+from ...domain.repository_identifier import RepositoryIdentifier
+from ..atomic_file import write_text_atomically
+from .pull_request_basic_info_record import from_basic_info_record, to_basic_info_record
+
+
+class PullRequestCatalogRepository(PullRequestCatalogRepositoryInterface):
+    """Repository persisting the PR catalog as one JSON file in the workspace."""
+
+    CATALOG_FILE_NAME = "pr-catalog.json"
+
+    def __init__(self):
+        """Initialize PR catalog repository."""
+        self._logger = logging.getLogger("fetch")
+
+    def load(self, repository_id: RepositoryIdentifier, output_directory: Path) -> PullRequestCatalog:
+        """Load the catalog of a repository.
+
+        A missing or unreadable file, or a catalog of another repository, yields
+        an empty catalog so the next listing rebuilds it.
+        """
+        file_path = output_directory / self.CATALOG_FILE_NAME
+        if not file_path.exists():
+            return PullRequestCatalog(repository_id)
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("repository") != repository_id.to_string():
+                self._logger.info(f"Ignoring PR catalog of another repository: {data.get('repository')}")
+                return PullRequestCatalog(repository_id)
+
+            return PullRequestCatalog(
+                repository_id,
+                entries=[self._to_entry(number, record, repository_id) for number, record in data["pull_requests"].items()],
+                covered_ranges=[
+                    DateRange(start_date=datetime.fromisoformat(start), end_date=datetime.fromisoformat(end))
+                    for start, end in data["covered_ranges"]
+                ]
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            self._logger.warning(f"Ignoring unreadable PR catalog {file_path}: {e}")
+            return PullRequestCatalog(repository_id)
+
+    def save(self, catalog: PullRequestCatalog, output_directory: Path) -> None:
+        """Save the catalog atomically."""
+        data = {
+            "repository": catalog.repository_id.to_string(),
+            "covered_ranges": [
+                [covered.start_date.isoformat(), covered.end_date.isoformat()]
+                for covered in catalog.covered_ranges
+            ],
+            "pull_requests": {
+                str(entry.number): self._to_record(entry, catalog.repository_id)
+                for entry in catalog.entries
+            }
+        }
+
+        output_directory.mkdir(parents=True, exist_ok=True)
+        write_text_atomically(
+            output_directory / self.CATALOG_FILE_NAME,
+            json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        )
+
+    @staticmethod
+    def _to_record(entry: PullRequestCatalogEntry, repository_id: RepositoryIdentifier) -> Dict[str, Any]:
+        """Serialize a catalog entry without its number, which is the record key."""
+        record = to_basic_info_record(entry.to_basic_info(repository_id))
+        del record["number"]
+        return record
+
+    @staticmethod
+    def _to_entry(number: str, record: Dict[str, Any], repository_id: RepositoryIdentifier) -> PullRequestCatalogEntry:
+        """Deserialize a catalog entry.
+
+        Catalogs written by older versions store the review comment count as comment_count.
+        """
+        basic_info = from_basic_info_record({**record, "number": int(number)}, repository_id)
+        return replace(
+            PullRequestCatalogEntry.from_basic_info(basic_info),
+            comment_count=record.get("review_comment_count", record.get("comment_count"))
+        )
@@ -3,22 +3,37 @@ PullRequestMetadata repository implementation for JSON persistence.
 """
 
 import json
+from contextlib import nullcontext
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional
+from typing import ContextManager, List, Optional
 
+from ...domain.interfaces.fetch_metrics_interface import FetchMetricsInterface
 from ...domain.interfaces.pull_request_metadata_repository_interface import PullRequestMetadataRepositoryInterface
 from ...domain.pull_request_basic_info import PullRequestBasicInfo
 from ...domain.pull_request_metadata import PullRequestMetadata
 from ...domain.repository_identifier import RepositoryIdentifier
+from ..atomic_file import write_text_atomically
 
 
 class PullRequestMetadataRepository(PullRequestMetadataRepositoryInterface):
     """Repository for persisting PullRequestMetadata to JSON files."""
 
+    def __init__(self, fetch_metrics: Optional[FetchMetricsInterface] = None):
+        """Initialize PR metadata repository.
+
+        Args:
+            fetch_metrics: Optional metrics the time spent serializing and
+                writing PR files is recorded in
+        """
+        self._fetch_metrics = fetch_metrics
+
     def save(self, pr_metadata: PullRequestMetadata, output_directory: Path) -> None:
         """Save PullRequestMetadata to JSON file.
 
+        The file is written under a temporary name and renamed into place, so
+        an interrupted save never leaves a half-written PR file behind.
+
         Args:
             pr_metadata: The PR metadata to save
             output_directory: Base output directory
@@ -30,24 +45,34 @@ class PullRequestMetadataRepository(PullRequestMetadataRepositoryInterface):
 
         file_path = repo_path / f"PR-{pr_metadata.number}.json"
 
-        # Convert to dict and handle datetime serialization
-        data = asdict(pr_metadata)
-        data["closed_at"] = pr_metadata.closed_at.isoformat()
-
-        # Serialize review_comments with datetime handling
-        data["review_comments"] = [
-            {
-                **asdict(comment),
-                "created_at": comment.created_at.isoformat()
-            }
-            for comment in pr_metadata.review_comments
-        ]
-
-        # Serialize repository_id
-        data["repository_id"] = asdict(pr_metadata.repository_id)
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with self._measure("serialization"):
+            # Convert to dict and handle datetime serialization
+            data = asdict(pr_metadata)
+            data["closed_at"] = pr_metadata.closed_at.isoformat()
+
+            # Serialize review_comments with datetime handling
+            data["review_comments"] = [
+                {
+                    **asdict(comment),
+                    "created_at": comment.created_at.isoformat()
+                }
+                for comment in pr_metadata.review_comments
+            ]
+
+            # Serialize repository_id
+            data["repository_id"] = asdict(pr_metadata.repository_id)
+
+            # Encode before the file is opened, so serialization and disk write are timed apart
+            content = json.dumps(data, indent=2, ensure_ascii=False)
+
+        with self._measure("disk_write"):
+            write_text_atomically(file_path, content)
+
+    def _measure(self, phase: str) -> ContextManager[None]:
+        """Time a block as a phase of the run, if metrics are recorded."""
+        if self._fetch_metrics is None:
+            return nullcontext()
+        return self._fetch_metrics.measure(phase)
 
     def exists(self, basic_info: PullRequestBasicInfo, output_directory: Path) -> bool:
         """Check if PR metadata file already exists.
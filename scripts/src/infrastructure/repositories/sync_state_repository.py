@@ -0,0 +1,61 @@
+"""
+SyncState repository implementation for JSON persistence.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ...domain.interfaces.sync_state_repository_interface import SyncStateRepositoryInterface
+from ...domain.repository_identifier import RepositoryIdentifier
+from ...domain.sync_state import SyncState
+from ..atomic_file import write_text_atomically
+
+
+class SyncStateRepository(SyncStateRepositoryInterface):
+    """Repository persisting the sync high-water mark in a sidecar JSON file."""
+
+    SYNC_STATE_FILE_NAME = "sync-state.json"
+
+    def __init__(self):
+        """Initialize sync state repository."""
+        self._logger = logging.getLogger("fetch")
+
+    def load(self, repository_id: RepositoryIdentifier, output_directory: Path) -> Optional[SyncState]:
+        """Load the sync state of a repository.
+
+        A state recorded for another repository is ignored, so switching the
+        workspace to a new repository starts with a full collection.
+        """
+        file_path = output_directory / self.SYNC_STATE_FILE_NAME
+        if not file_path.exists():
+            return None
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("repository") != repository_id.to_string():
+                self._logger.info(f"Ignoring sync state of another repository: {data.get('repository')}")
+                return None
+            return SyncState(
+                repository_id=repository_id,
+                last_synced_at=datetime.fromisoformat(data["last_synced_at"])
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            self._logger.warning(f"Ignoring unreadable sync state {file_path}: {e}")
+            return None
+
+    def save(self, sync_state: SyncState, output_directory: Path) -> None:
+        """Save the sync state atomically."""
+        data = {
+            "repository": sync_state.repository_id.to_string(),
+            "last_synced_at": sync_state.last_synced_at.isoformat()
+        }
+
+        output_directory.mkdir(parents=True, exist_ok=True)
+        write_text_atomically(
+            output_directory / self.SYNC_STATE_FILE_NAME,
+            json.dumps(data, indent=2, ensure_ascii=False)
+        )
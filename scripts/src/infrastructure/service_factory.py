@@ -3,66 +3,398 @@ Factory for creating application services and dependencies.
 """
 
 import logging
-from typing import Optional
-
-from github import Github
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
 
 from ..application.services.pr_review_collection_service import PRReviewCollectionService
+from ..application.services.multi_repository_collection_service import MultiRepositoryCollectionService
 from ..application.services.missing_summaries_service import MissingSummariesService
 from ..application.services.comments_service import CommentsService
 from ..application.services.review_summary_service import ReviewSummaryService
 from ..application.services.pop_comments_service import PopCommentsService
 from ..application.services.list_summary_files_service import ListSummaryFilesService
 from ..application.services.workspace_switch_service import WorkspaceSwitchService
+from ..domain.comment_filter_rules import CommentFilterRules
+from ..domain.interfaces.github_repository_interface import GitHubRepositoryInterface
+from ..domain.interfaces.pull_request_detail_fetcher_interface import PullRequestDetailFetcherInterface
+from .collection_options import CollectionOptions
+from .repositories.dead_letter_repository import DeadLetterRepository
+from .repositories.fetch_journal import FetchJournal
 from .repositories.github_repository import GitHubRepository
+from .repositories.async_github_repository import AsyncGitHubRepository
+from .repositories.github_payload_mapper import GitHubPayloadMapper
+from .repositories.pull_request_catalog_repository import PullRequestCatalogRepository
 from .repositories.pull_request_metadata_repository import PullRequestMetadataRepository
 from .repositories.summary_repository import SummaryRepository
+from .repositories.sync_state_repository import SyncStateRepository
 from .repositories.filesystem_workspace_repository import FileSystemWorkspaceRepository
 from .services.timezone_converter import TimezoneConverter
-from .filters.ai_comment_filter import AICommentFilter
+from .services.github_app_token_provider import GitHubAppTokenProvider
+from .services.github_client_factory import GitHubClientFactory
+from .http.adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from .http.circuit_breaker import CircuitBreaker
+from .http.disk_http_response_cache import DiskHttpResponseCache
+from .http.etag_cache_interceptor import ETagCacheInterceptor
+from .http.fetch_budget import FetchBudget
+from .http.fetch_metrics import FetchMetrics
+from .http.github_http_transport import GitHubHttpTransport
+from .http.github_token_pool import GitHubTokenPool
+from .http.hedging_interceptor import HedgingInterceptor
+from .http.rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+from .http.request_budget_interceptor import RequestBudgetInterceptor
+from .http.request_metrics_interceptor import RequestMetricsInterceptor
+from .http.retry_interceptor import RetryInterceptor
+from .http.shared_rate_limit_budget import SharedRateLimitBudget
+from .http.shared_rate_limit_budget_interceptor import SharedRateLimitBudgetInterceptor
+from .http.token_pool_interceptor import TokenPoolInterceptor
+from .fetchers.graphql_pull_request_detail_fetcher import GraphQLPullRequestDetailFetcher
+from .fetchers.repository_comments_pull_request_detail_fetcher import RepositoryCommentsPullRequestDetailFetcher
+from .filters.configurable_comment_filter import ConfigurableCommentFilter
 from ..presentation.markdown_formatter import MarkdownFormatter
 
 
 class ServiceFactory:
     """Factory for creating application services with proper dependencies."""
     
+    # Available GitHub API client backends
+    GITHUB_BACKENDS = ("pygithub", "async")
+    
+    # Available PR detail fetch strategies
+    FETCH_STRATEGIES = ("rest", "graphql", "repo-comments")
+    
     @staticmethod
-    def create_pr_collection_service(
-        github_token: str,
-        timezone: str = "UTC",
-        logger: Optional[logging.Logger] = None
-    ) -> PRReviewCollectionService:
+    def create_pr_collection_service(options: CollectionOptions) -> PRReviewCollectionService:
         """Create a PR review collection service with all dependencies.
         
         Args:
-            github_token: GitHub personal access token
-            timezone: Target timezone for date conversion
-            logger: Optional logger instance
+            options: Settings of the collection run
             
         Returns:
             Configured PR review collection service
         """
-        # Create GitHub client
-        github_client = Github(github_token)
+        _, create_collection_service = ServiceFactory._create_collection_components(
+            options,
+            http_concurrency=options.concurrency
+        )
+        return create_collection_service()
+    
+    @staticmethod
+    def create_multi_repository_collection_service(
+        options: CollectionOptions,
+        repository_concurrency: int = 4
+    ) -> MultiRepositoryCollectionService:
+        """Create a service collecting several repositories with one shared rate-limit budget.
         
-        # Create timezone converter
-        timezone_converter = TimezoneConverter(timezone)
+        Args:
+            options: Settings of the collection run, with concurrency applying per repository
+            repository_concurrency: Number of repositories collected in parallel
+            
+        Returns:
+            Configured multi-repository collection service
+        """
+        github_repository, create_collection_service = ServiceFactory._create_collection_components(
+            options,
+            http_concurrency=options.concurrency * repository_concurrency
+        )
+        return MultiRepositoryCollectionService(
+            collection_service_factory=create_collection_service,
+            github_repository=github_repository,
+            repository_concurrency=repository_concurrency
+        )
+    
+    @staticmethod
+    def _create_collection_components(
+        options: CollectionOptions,
+        http_concurrency: int
+    ) -> Tuple[
+        GitHubRepositoryInterface,
+        Callable[[Optional[CommentFilterRules]], PRReviewCollectionService]
+    ]:
+        """Create the GitHub components and a factory of collection services sharing them.
         
-        # Create GitHub repository
-        github_repository = GitHubRepository(github_client, timezone_converter)
+        Every service created by the factory sends its requests through the same
+        transport, so all of them share one rate-limit budget. The factory takes
+        the comment filter rules of a repository's workspace.yml, defaulting to
+        the rules of the options; services with equal rules share their GitHub
+        repository and detail fetcher.
         
-        # Create PR metadata repository
-        pr_metadata_repository = PullRequestMetadataRepository()
+        Args:
+            options: Settings of the collection run
+            http_concurrency: Number of requests allowed in flight across all services
+            
+        Returns:
+            GitHub repository applying the rules of the options, and the factory
+            of collection services
+            
+        Raises:
+            ValueError: If the async backend is combined with multiple tokens, a GitHub
+                App, hedging, a request budget or fetch metrics, or partitioning with
+                scan listing
+        """
+        backend = options.backend
         
-        # Create comment filter
-        comment_filter = AICommentFilter()
+        # Create timezone converter
+        timezone_converter = TimezoneConverter(options.timezone)
         
-        # Create and return application service
-        return PRReviewCollectionService(
-            github_repository=github_repository,
-            pr_metadata_repository=pr_metadata_repository,
-            comment_filter=comment_filter
+        # Installation tokens rotate, so they are set on each request by the token pool
+        token_sources = [token for token in (options.github_token, *options.additional_tokens) if token]
+        if options.github_app is not None:
+            if backend == "async":
+                raise ValueError("The async backend does not support GitHub App authentication")
+            token_sources.append(GitHubAppTokenProvider(options.github_app))
+        if len(token_sources) > 1 and backend == "async":
+            # The async backend sends requests with its own session, bypassing the token pool
+            raise ValueError("The async backend does not support multiple tokens")
+        if options.hedge_requests and backend == "async":
+            raise ValueError("The async backend does not support hedged requests")
+        if options.partitioning is not None and (backend == "async" or options.listing_strategy == "scan"):
+            # A scan walks every PR updated since the window started, so each window would rescan its successors
+            raise ValueError("Date partitioning requires the search or issues listing of the pygithub backend")
+        if options.max_requests is not None and backend == "async":
+            raise ValueError("The async backend does not support request budgets")
+        if options.fetch_metrics is not None and backend == "async":
+            raise ValueError("The async backend does not support fetch metrics")
+        
+        # One budget for every service, so that repositories collected in parallel share it
+        fetch_budget = (
+            FetchBudget(options.max_requests, options.deadline)
+            if options.max_requests is not None or options.deadline is not None else None
+        )
+        
+        # Create GitHub client factory sending all requests through one transport
+        github_client_factory = GitHubClientFactory(
+            options.github_token,
+            ServiceFactory._create_http_transport(
+                http_concurrency,
+                options.http_cache,
+                options.http_cache_directory,
+                options.shared_rate_limit_budget,
+                token_pool=(
+                    GitHubTokenPool(token_sources)
+                    if len(token_sources) > 1 or options.github_app is not None else None
+                ),
+                request_timeout=options.request_timeout,
+                hedge_requests=options.hedge_requests,
+                fetch_budget=fetch_budget,
+                fetch_metrics=options.fetch_metrics
+            )
         )
+        
+        # Repositories collected in parallel may configure different comment filter rules,
+        # so the components applying them are created once per set of rules
+        components_by_rules: Dict[
+            CommentFilterRules,
+            Tuple[ConfigurableCommentFilter, GitHubRepositoryInterface, Optional[PullRequestDetailFetcherInterface]]
+        ] = {}
+        components_lock = threading.Lock()
+        
+        def get_filtering_components(comment_filter_rules: Optional[CommentFilterRules]):
+            rules = comment_filter_rules or CommentFilterRules()
+            with components_lock:
+                components = components_by_rules.get(rules)
+                if components is None:
+                    # Compiled once and applied to raw comments before review comments are built
+                    comment_filter = ConfigurableCommentFilter(rules)
+                    github_repository = ServiceFactory._create_github_repository(
+                        backend, options.github_token, timezone_converter, http_concurrency, github_client_factory,
+                        options.listing_strategy, comment_filter, options.request_timeout,
+                        estimate_scan_pages=options.partitioning is None, fetch_metrics=options.fetch_metrics
+                    )
+                    detail_fetcher = ServiceFactory._create_detail_fetcher(
+                        options.strategy, github_client_factory, timezone_converter, github_repository,
+                        options.graphql_batch_size, comment_filter
+                    )
+                    components = components_by_rules[rules] = (comment_filter, github_repository, detail_fetcher)
+                return components
+        
+        def create_collection_service(
+            comment_filter_rules: Optional[CommentFilterRules] = options.comment_filter_rules
+        ) -> PRReviewCollectionService:
+            comment_filter, github_repository, detail_fetcher = get_filtering_components(comment_filter_rules)
+            # The fetch journal records one run at a time, so every service gets its own
+            return PRReviewCollectionService(
+                github_repository=github_repository,
+                pr_metadata_repository=PullRequestMetadataRepository(options.fetch_metrics),
+                comment_filter=comment_filter,
+                concurrency=options.concurrency,
+                detail_fetcher=detail_fetcher,
+                pr_catalog_repository=PullRequestCatalogRepository() if options.use_catalog else None,
+                sync_state_repository=SyncStateRepository(),
+                fetch_journal=FetchJournal(),
+                selection=options.selection,
+                dead_letter_repository=DeadLetterRepository(),
+                partitioning=options.partitioning,
+                fetch_budget=fetch_budget,
+                fetch_metrics=options.fetch_metrics
+            )
+        
+        _, github_repository, _ = get_filtering_components(options.comment_filter_rules)
+        return github_repository, create_collection_service
+    
+    @staticmethod
+    def _create_http_transport(
+        concurrency: int,
+        http_cache: bool,
+        http_cache_directory: Optional[Path],
+        shared_rate_limit_budget: bool = True,
+        token_pool: Optional[GitHubTokenPool] = None,
+        request_timeout: Optional[float] = HedgingInterceptor.DEFAULT_TIMEOUT_SECONDS,
+        hedge_requests: bool = False,
+        fetch_budget: Optional[FetchBudget] = None,
+        fetch_metrics: Optional[FetchMetrics] = None
+    ) -> GitHubHttpTransport:
+        """Create the HTTP transport shared by all PyGithub clients.
+        
+        Args:
+            concurrency: Number of PR details fetched in parallel
+            http_cache: Revalidate repeated requests against a persistent ETag cache
+            http_cache_directory: Cache directory, or None for the shared default
+            shared_rate_limit_budget: Draw requests from the host-wide rate limit budget
+            token_pool: Tokens requests are spread across, or None to send every
+                request with the client's token
+            request_timeout: Seconds a request may take, or None to wait indefinitely
+            hedge_requests: Send a second attempt of GET requests slower than the
+                95th percentile latency
+            fetch_budget: Budget every request sent is counted against, or None
+            fetch_metrics: Metrics every response is recorded in, or None
+            
+        Returns:
+            HTTP transport with its interceptor chain
+        """
+        transport = GitHubHttpTransport(pool_size=max(concurrency, 10))
+        # Outside the scheduler so that a retry waiting out its backoff holds no concurrency slot
+        # and is paced against the rate limit like any request
+        transport.add_interceptor(RetryInterceptor(CircuitBreaker()))
+        transport.add_interceptor(RateLimitSchedulerInterceptor(AdaptiveConcurrencyLimiter(concurrency)))
+        if token_pool is not None:
+            # Inside the scheduler so that it only waits once every token ran out
+            transport.add_interceptor(TokenPoolInterceptor(token_pool))
+        if http_cache:
+            # Inside the token pool so that responses are cached for the credential that fetched them
+            cache_directory = http_cache_directory or DiskHttpResponseCache.default_directory()
+            transport.add_interceptor(ETagCacheInterceptor(DiskHttpResponseCache(cache_directory)))
+        if shared_rate_limit_budget:
+            # Inside the retry so that every attempt, including retries, draws from the shared budget
+            transport.add_interceptor(SharedRateLimitBudgetInterceptor(
+                SharedRateLimitBudget(SharedRateLimitBudget.default_directory())
+            ))
+        if request_timeout is not None or hedge_requests:
+            # Inside the token pool and shared budget so that the timeout only counts the network
+            # attempt, not the wait for the budget to refill; a hedge reuses the attempt's token
+            transport.add_interceptor(HedgingInterceptor(
+                request_timeout, hedge_requests, max_workers=2 * max(concurrency, 10)
+            ))
+        if fetch_budget is not None:
+            # Innermost so that every request reaching GitHub is counted once
+            transport.add_interceptor(RequestBudgetInterceptor(fetch_budget))
+        if fetch_metrics is not None:
+            # Innermost so that latencies and sizes are those of the requests reaching GitHub
+            transport.add_interceptor(RequestMetricsInterceptor(fetch_metrics))
+        return transport
+    
+    @staticmethod
+    def _create_github_repository(
+        backend: str,
+        github_token: str,
+        timezone_converter: TimezoneConverter,
+        concurrency: int,
+        github_client_factory: GitHubClientFactory,
+        listing_strategy: str = "auto",
+        comment_filter: Optional[ConfigurableCommentFilter] = None,
+        request_timeout: Optional[float] = HedgingInterceptor.DEFAULT_TIMEOUT_SECONDS,
+        estimate_scan_pages: bool = True,
+        fetch_metrics: Optional[FetchMetrics] = None
+    ) -> GitHubRepositoryInterface:
+        """Create the GitHub repository for the selected client backend.
+        
+        Args:
+            backend: GitHub API client backend ("pygithub" or "async")
+            github_token: GitHub personal access token
+            timezone_converter: Timezone conversion service
+            concurrency: Number of PR details and listing pages fetched in parallel
+            github_client_factory: Factory for PyGithub clients
+            listing_strategy: How closed PRs are selected ("auto", "scan", "search" or "issues")
+            comment_filter: Filter applied to comments before they are built
+            request_timeout: Seconds a request of the async backend may take, or None
+                to wait indefinitely; the pygithub backend enforces it in the transport
+            estimate_scan_pages: Log the pages a scan would have read after each
+                listing of the pygithub backend, at the cost of one search request
+            fetch_metrics: Metrics the time of fetching review comments is
+                recorded in by the pygithub backend, or None
+            
+        Returns:
+            GitHub repository implementation
+            
+        Raises:
+            ValueError: If backend is unknown or does not support the listing strategy
+        """
+        if backend == "async":
+            if listing_strategy not in ("auto", "scan"):
+                raise ValueError(f"The async backend only supports scan listing, got {listing_strategy}")
+            return AsyncGitHubRepository(
+                github_token,
+                timezone_converter,
+                max_connections=concurrency,
+                comment_filter=comment_filter,
+                request_timeout=request_timeout
+            )
+        
+        if backend == "pygithub":
+            return GitHubRepository(
+                github_client_factory.create(),
+                timezone_converter,
+                github_client_factory=github_client_factory.create,
+                listing_strategy=listing_strategy,
+                comment_filter=comment_filter,
+                page_concurrency=concurrency,
+                estimate_scan_pages=estimate_scan_pages,
+                fetch_metrics=fetch_metrics
+            )
+        
+        raise ValueError(f"Unknown GitHub backend: {backend}. Use one of {', '.join(ServiceFactory.GITHUB_BACKENDS)}")
+    
+    @staticmethod
+    def _create_detail_fetcher(
+        strategy: str,
+        github_client_factory: GitHubClientFactory,
+        timezone_converter: TimezoneConverter,
+        github_repository: GitHubRepositoryInterface,
+        graphql_batch_size: int,
+        comment_filter: Optional[ConfigurableCommentFilter] = None
+    ) -> Optional[PullRequestDetailFetcherInterface]:
+        """Create the PR detail fetcher for the selected fetch strategy.
+        
+        Args:
+            strategy: PR detail fetch strategy ("rest", "graphql" or "repo-comments")
+            github_client_factory: Factory for PyGithub clients
+            timezone_converter: Timezone conversion service
+            github_repository: GitHub repository used for per-PR REST fetches
+            graphql_batch_size: Number of PRs per GraphQL query
+            comment_filter: Filter applied to comments before they are built
+            
+        Returns:
+            Batch detail fetcher, or None to fetch each PR through the repository
+            
+        Raises:
+            ValueError: If strategy is unknown
+        """
+        if strategy == "rest":
+            return None
+        
+        if strategy == "graphql":
+            return GraphQLPullRequestDetailFetcher(
+                github_client_factory.create,
+                github_repository,
+                GitHubPayloadMapper(timezone_converter),
+                batch_size=graphql_batch_size,
+                comment_filter=comment_filter
+            )
+        
+        if strategy == "repo-comments":
+            return RepositoryCommentsPullRequestDetailFetcher(github_repository)
+        
+        raise ValueError(f"Unknown fetch strategy: {strategy}. Use one of {', '.join(ServiceFactory.FETCH_STRATEGIES)}")
     
     @staticmethod
     def setup_logging(verbose: bool = False) -> logging.Logger:
@@ -0,0 +1,167 @@
+"""
+Cost estimator of the PR detail fetch strategies.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ...domain.fetch_plan import FetchPlan
+from ..fetchers.graphql_pull_request_detail_fetcher import GraphQLPullRequestDetailFetcher
+
+
+@dataclass(frozen=True)
+class FetchCostEstimate:
+    """Estimated cost of carrying out a fetch plan with one detail fetch strategy.
+
+    Attributes:
+        strategy: Detail fetch strategy
+        requests: HTTP requests sent, including the listing of uncovered ranges
+        rest_cost: Requests counted against the hourly REST rate limit
+        graphql_cost: Points counted against the hourly GraphQL rate limit
+        wall_seconds: Estimated wall time, including waits for the rate limit to reset
+    """
+
+    strategy: str
+    requests: int
+    rest_cost: int
+    graphql_cost: int
+    wall_seconds: float
+
+
+class FetchCostEstimator:
+    """Estimates the requests, rate-limit cost and wall time of each detail fetch strategy.
+
+    Request counts follow the requests each strategy sends for a PR. PRs
+    whose review comment count is unknown are assumed to fit on one comment
+    page, and request latencies are assumed averages, so the wall times are
+    rough.
+    """
+
+    STRATEGIES = ("rest", "graphql", "repo-comments")
+
+    # Hourly rate limits of a personal access token
+    REST_RATE_LIMIT = 5000
+    GRAPHQL_RATE_LIMIT = 5000
+
+    # Assumed average latency of a REST request, and the share of a GraphQL query per PR
+    _REST_REQUEST_SECONDS = 0.3
+    _GRAPHQL_SECONDS_PER_PR = 0.05
+
+    # Review comments per page: PyGithub's default page size, and the one of the async backend
+    _COMMENT_PAGE_SIZES = {"pygithub": 30, "async": 100}
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        graphql_batch_size: int = GraphQLPullRequestDetailFetcher.DEFAULT_BATCH_SIZE,
+        backend: str = "pygithub"
+    ):
+        """Initialize the estimator.
+
+        Args:
+            concurrency: Number of detail fetches run in parallel
+            graphql_batch_size: Number of PRs fetched per GraphQL query
+            backend: GitHub API client backend
+
+        Raises:
+            ValueError: If concurrency or graphql_batch_size is less than 1, or backend is unknown
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        if graphql_batch_size < 1:
+            raise ValueError(f"GraphQL batch size must be at least 1, got {graphql_batch_size}")
+        if backend not in self._COMMENT_PAGE_SIZES:
+            raise ValueError(f"Unknown GitHub backend: {backend}")
+
+        self._concurrency = concurrency
+        self._graphql_batch_size = graphql_batch_size
+        self._comment_page_size = self._COMMENT_PAGE_SIZES[backend]
+        # PyGithub fetches the repository before each PR
+        self._requests_before_pr = 2 if backend == "pygithub" else 1
+        self._requests_before_repository_comments = 1 if backend == "pygithub" else 0
+
+    def estimate(self, plan: FetchPlan) -> List[FetchCostEstimate]:
+        """Estimate the cost of a fetch plan for every detail fetch strategy.
+
+        Args:
+            plan: Planned work of a run
+
+        Returns:
+            One estimate per strategy, in the order of STRATEGIES
+        """
+        return [
+            self._estimate_rest(plan),
+            self._estimate_graphql(plan),
+            self._estimate_repository_comments(plan)
+        ]
+
+    def _estimate_rest(self, plan: FetchPlan) -> FetchCostEstimate:
+        """Estimate fetching every PR and its comment pages with separate REST requests."""
+        comment_counts = list(plan.comment_counts) + [None] * plan.counted_count
+        detail_requests = sum(
+            self._requests_before_pr + self._comment_pages(comment_count) for comment_count in comment_counts
+        )
+        requests = plan.listing_requests + detail_requests
+        return FetchCostEstimate(
+            strategy="rest",
+            requests=requests,
+            rest_cost=requests,
+            graphql_cost=0,
+            wall_seconds=self._wall_seconds(requests * self._REST_REQUEST_SECONDS / self._concurrency, requests, 0)
+        )
+
+    def _estimate_graphql(self, plan: FetchPlan) -> FetchCostEstimate:
+        """Estimate fetching the PRs in batches of one GraphQL query each."""
+        full_batches, remainder = divmod(plan.fetch_count, self._graphql_batch_size)
+        batch_sizes = [self._graphql_batch_size] * full_batches + ([remainder] if remainder else [])
+        graphql_cost = sum(GraphQLPullRequestDetailFetcher.rate_limit_points(batch_size) for batch_size in batch_sizes)
+        query_seconds = sum(
+            self._REST_REQUEST_SECONDS + batch_size * self._GRAPHQL_SECONDS_PER_PR for batch_size in batch_sizes
+        )
+        sending_seconds = (
+            plan.listing_requests * self._REST_REQUEST_SECONDS + query_seconds
+        ) / self._concurrency
+        return FetchCostEstimate(
+            strategy="graphql",
+            requests=plan.listing_requests + len(batch_sizes),
+            rest_cost=plan.listing_requests,
+            graphql_cost=graphql_cost,
+            wall_seconds=self._wall_seconds(sending_seconds, plan.listing_requests, graphql_cost)
+        )
+
+    def _estimate_repository_comments(self, plan: FetchPlan) -> FetchCostEstimate:
+        """Estimate listing the review comments of the whole repository page by page."""
+        comment_requests = 0
+        if plan.fetch_count:
+            comment_requests = self._requests_before_repository_comments + self._comment_pages(
+                plan.repository_comment_count
+            )
+        requests = plan.listing_requests + comment_requests
+        # Comment pages are read one after another
+        sending_seconds = (
+            plan.listing_requests / self._concurrency + comment_requests
+        ) * self._REST_REQUEST_SECONDS
+        return FetchCostEstimate(
+            strategy="repo-comments",
+            requests=requests,
+            rest_cost=requests,
+            graphql_cost=0,
+            wall_seconds=self._wall_seconds(sending_seconds, requests, 0)
+        )
+
+    def _comment_pages(self, comment_count: Optional[int]) -> int:
+        """Number of pages listing a number of review comments; an unknown count is taken as one page."""
+        if comment_count is None:
+            return 1
+        return max(1, math.ceil(comment_count / self._comment_page_size))
+
+    @classmethod
+    def _wall_seconds(cls, sending_seconds: float, rest_cost: int, graphql_cost: int) -> float:
+        """Add the hours spent waiting for used-up rate limits to reset to the time of sending requests."""
+        waited_hours = max(
+            math.ceil(rest_cost / cls.REST_RATE_LIMIT) - 1,
+            math.ceil(graphql_cost / cls.GRAPHQL_RATE_LIMIT) - 1,
+            0
+        )
+        return sending_seconds + waited_hours * 3600
@@ -0,0 +1,142 @@
+"""
+Installation access tokens of a GitHub App.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+from github import Auth
+
+from ...application.exceptions.github_api_error import GitHubApiError
+from ..http.github_token_pool import RotatingTokenSource
+
+
+@dataclass(frozen=True)
+class GitHubAppCredentials:
+    """Credentials of a GitHub App installed on the repositories to fetch.
+
+    Attributes:
+        app_id: App ID shown on the App's settings page
+        private_key: PEM encoded private key generated for the App
+        installation_id: Installation to mint tokens for, or None if the App
+            has exactly one installation
+    """
+
+    app_id: str
+    private_key: str
+    installation_id: Optional[int] = None
+
+
+class GitHubAppTokenProvider(RotatingTokenSource):
+    """Mints installation access tokens of a GitHub App and caches them until shortly before they expire.
+
+    The App authenticates with a short-lived JWT signed by its private key and
+    exchanges it for an installation token, which is valid for an hour and
+    carries the installation's rate limit.
+    """
+
+    DEFAULT_BASE_URL = "https://api.github.com"
+
+    # Tokens are replaced this long before they expire, so requests in flight stay valid
+    _REFRESH_MARGIN = timedelta(minutes=5)
+
+    _TIMEOUT_SECONDS = 30
+
+    def __init__(
+        self,
+        credentials: GitHubAppCredentials,
+        base_url: str = DEFAULT_BASE_URL,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
+    ):
+        """Initialize GitHub App token provider.
+
+        Args:
+            credentials: App ID, private key and optional installation ID
+            base_url: GitHub REST API base URL
+            clock: Source of the current timezone-aware time
+        """
+        self._credentials = credentials
+        self._base_url = base_url.rstrip("/")
+        self._clock = clock
+        self._installation_id = credentials.installation_id
+        self._token: Optional[str] = None
+        self._expires_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("fetch")
+
+    def get_token(self) -> str:
+        """Get a valid installation token, minting a new one when the cached one is about to expire.
+
+        Returns:
+            Installation access token
+
+        Raises:
+            GitHubApiError: If the installation cannot be found or no token can be minted
+        """
+        with self._lock:
+            if self._token is None or self._clock() >= self._expires_at - self._REFRESH_MARGIN:
+                self._token, self._expires_at = self._mint_token()
+            return self._token
+
+    def credential_id(self) -> str:
+        """Identify the installation, whose rate limit every token minted for it shares.
+
+        Returns:
+            Identity such as "github-app-installation 42"
+
+        Raises:
+            GitHubApiError: If the installation cannot be found
+        """
+        with self._lock:
+            return f"github-app-installation {self._get_installation_id()}"
+
+    def _mint_token(self) -> Tuple[str, datetime]:
+        """Exchange an App JWT for a new installation token."""
+        installation_id = self._get_installation_id()
+        payload = self._request("POST", f"/app/installations/{installation_id}/access_tokens")
+        expires_at = datetime.fromisoformat(payload["expires_at"].replace("Z", "+00:00"))
+        self._logger.info(f"Minted GitHub App installation token valid until {expires_at.isoformat()}")
+        return payload["token"], expires_at
+
+    def _get_installation_id(self) -> int:
+        """Get the configured installation, or the only installation of the App."""
+        if self._installation_id is None:
+            installations = self._request("GET", "/app/installations")
+            if len(installations) != 1:
+                accounts = ", ".join(
+                    f"{installation['account']['login']} ({installation['id']})"
+                    for installation in installations
+                )
+                raise GitHubApiError(
+                    f"GitHub App {self._credentials.app_id} has {len(installations)} installations; "
+                    f"store the installation ID to use: {accounts or 'none'}"
+                )
+            self._installation_id = installations[0]["id"]
+        return self._installation_id
+
+    def _request(self, method: str, path: str) -> Any:
+        """Send a request authenticated as the App and return its JSON body."""
+        jwt = Auth.AppAuth(self._credentials.app_id, self._credentials.private_key).create_jwt()
+        try:
+            response = requests.request(
+                method,
+                f"{self._base_url}{path}",
+                headers={
+                    "Authorization": f"Bearer {jwt}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28"
+                },
+                timeout=self._TIMEOUT_SECONDS
+            )
+        except requests.RequestException as e:
+            raise GitHubApiError(f"GitHub App request to {path} failed: {e}")
+
+        if response.status_code >= 400:
+            raise GitHubApiError(
+                f"GitHub App request to {path} failed with status {response.status_code}: {response.text}"
+            )
+        return response.json()
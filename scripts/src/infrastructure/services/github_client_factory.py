@@ -0,0 +1,46 @@
+"""
+Factory for authenticated PyGithub clients.
+"""
+
+import threading
+from typing import Optional
+
+from github import Github
+from github.Requester import Requester
+
+from ..http.github_http_transport import GitHubHttpTransport
+
+
+class GitHubClientFactory:
+    """Creates authenticated PyGithub clients sharing the same credentials."""
+
+    # PyGithub reads injected connection classes from class-level state while a
+    # client is constructed, so injection and construction must not interleave
+    _connection_injection_lock = threading.Lock()
+
+    def __init__(self, github_token: Optional[str], http_transport: Optional[GitHubHttpTransport] = None):
+        """Initialize GitHub client factory.
+
+        Args:
+            github_token: GitHub personal access token, or None when the transport
+                authenticates each request
+            http_transport: Optional transport all client requests are sent through
+        """
+        self._github_token = github_token
+        self._http_transport = http_transport
+
+    def create(self) -> Github:
+        """Create a new authenticated GitHub client.
+
+        Returns:
+            Authenticated GitHub client with its own HTTP connection
+        """
+        if self._http_transport is None:
+            return Github(self._github_token)
+
+        with self._connection_injection_lock:
+            Requester.injectConnectionClasses(*self._http_transport.connection_classes())
+            try:
+                return Github(self._github_token)
+            finally:
+                Requester.resetConnectionClasses()
@@ -23,10 +23,8 @@ class TimezoneConverter:
         if utc_datetime.tzinfo is None:
             # Assume UTC if no timezone info
             utc_datetime = utc_datetime.replace(tzinfo=pytz.UTC)
-        elif utc_datetime.tzinfo != pytz.UTC:
-            # Convert to UTC first if different timezone
-            utc_datetime = utc_datetime.astimezone(pytz.UTC)
         
+        # An aware datetime converts directly, whichever timezone it carries
         return utc_datetime.astimezone(self._target_timezone)
     
     def localize_date_range(self, start_date: datetime, end_date: datetime) -> tuple[datetime, datetime]:
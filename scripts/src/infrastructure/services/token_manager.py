@@ -2,8 +2,11 @@
 Secure token management using system keyring.
 """
 
+import json
 import keyring
-from typing import Optional
+from typing import List, Optional
+
+from .github_app_token_provider import GitHubAppCredentials
 
 
 class TokenManager:
@@ -11,6 +14,8 @@ class TokenManager:
 
     SERVICE_NAME = "agent-md-from-github"
     USERNAME = "github-token"
+    POOL_USERNAME = "github-token-pool"
+    APP_USERNAME = "github-app"
 
     @classmethod
     def store_token(cls, token: str) -> None:
@@ -36,6 +41,42 @@ class TokenManager:
         except Exception:
             return None
 
+    @classmethod
+    def add_token(cls, token: str) -> int:
+        """Add a GitHub token to the pool of tokens fetch spreads requests across.
+
+        The first token added becomes the stored token when none is stored yet.
+
+        Args:
+            token: GitHub personal access token to add
+
+        Returns:
+            Number of tokens stored after adding
+        """
+        if not cls.has_token():
+            cls.store_token(token)
+            return len(cls.get_tokens())
+
+        pool = cls._get_pool()
+        if token != cls.get_token() and token not in pool:
+            pool.append(token)
+        try:
+            keyring.set_password(cls.SERVICE_NAME, cls.POOL_USERNAME, json.dumps(pool))
+        except Exception as e:
+            raise RuntimeError(f"Failed to store token in keyring: {e}")
+        return len(cls.get_tokens())
+
+    @classmethod
+    def get_tokens(cls) -> List[str]:
+        """Retrieve all stored GitHub tokens, the stored token first.
+
+        Returns:
+            Stored GitHub tokens, empty if none is stored
+        """
+        token = cls.get_token()
+        tokens = [token] if token else []
+        return list(dict.fromkeys(tokens + cls._get_pool()))
+
     @classmethod
     def clear_token(cls) -> bool:
         """Remove GitHub token from system keyring.
@@ -53,6 +94,69 @@ class TokenManager:
             else:
                 raise RuntimeError(f"Failed to clear token from keyring: {e}")
 
+    @classmethod
+    def clear_token_pool(cls) -> bool:
+        """Remove the tokens added besides the stored token from system keyring.
+
+        Returns:
+            True if the pool was removed, False if no pool was stored
+        """
+        try:
+            keyring.delete_password(cls.SERVICE_NAME, cls.POOL_USERNAME)
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def store_app_credentials(cls, credentials: GitHubAppCredentials) -> None:
+        """Store GitHub App credentials in system keyring.
+
+        Args:
+            credentials: App ID, private key and optional installation ID
+        """
+        stored = json.dumps({
+            "app_id": credentials.app_id,
+            "private_key": credentials.private_key,
+            "installation_id": credentials.installation_id
+        })
+        try:
+            keyring.set_password(cls.SERVICE_NAME, cls.APP_USERNAME, stored)
+        except Exception as e:
+            raise RuntimeError(f"Failed to store GitHub App credentials in keyring: {e}")
+
+    @classmethod
+    def get_app_credentials(cls) -> Optional[GitHubAppCredentials]:
+        """Retrieve GitHub App credentials from system keyring.
+
+        Returns:
+            Stored GitHub App credentials, or None if not found
+        """
+        try:
+            stored = keyring.get_password(cls.SERVICE_NAME, cls.APP_USERNAME)
+            if not stored:
+                return None
+            data = json.loads(stored)
+            return GitHubAppCredentials(
+                app_id=str(data["app_id"]),
+                private_key=data["private_key"],
+                installation_id=data.get("installation_id")
+            )
+        except Exception:
+            return None
+
+    @classmethod
+    def clear_app_credentials(cls) -> bool:
+        """Remove GitHub App credentials from system keyring.
+
+        Returns:
+            True if the credentials were removed, False if none were stored
+        """
+        try:
+            keyring.delete_password(cls.SERVICE_NAME, cls.APP_USERNAME)
+            return True
+        except Exception:
+            return False
+
     @classmethod
     def has_token(cls) -> bool:
         """Check if a GitHub token is stored in keyring.
@@ -60,4 +164,14 @@ class TokenManager:
         Returns:
             True if token exists, False otherwise
         """
-        return cls.get_token() is not None
\ No newline at end of file
+        return cls.get_token() is not None
+
+    @classmethod
+    def _get_pool(cls) -> List[str]:
+        """Retrieve the tokens added besides the stored token."""
+        try:
+            stored = keyring.get_password(cls.SERVICE_NAME, cls.POOL_USERNAME)
+            pool = json.loads(stored) if stored else []
+        except Exception:
+            return []
+        return [token for token in pool if isinstance(token, str) and token]
\ No newline at end of file
@@ -4,7 +4,9 @@ Auth controller for GitHub authentication token management.
 
 import argparse
 import sys
+from pathlib import Path
 
+from ..infrastructure.services.github_app_token_provider import GitHubAppCredentials
 from ..infrastructure.services.token_manager import TokenManager
 
 
@@ -31,10 +33,32 @@ class AuthController:
             help="Store GitHub token securely in system keyring"
         )
 
+        parser.add_argument(
+            "--add-token",
+            help="Add another GitHub token to the pool fetch spreads requests across"
+        )
+
+        parser.add_argument(
+            "--store-app-id",
+            help="Store GitHub App credentials with this App ID; fetch mints installation tokens from them"
+        )
+
+        parser.add_argument(
+            "--app-private-key",
+            type=Path,
+            help="PEM private key file of the GitHub App given by --store-app-id"
+        )
+
+        parser.add_argument(
+            "--app-installation-id",
+            type=int,
+            help="Installation of the GitHub App to use (default: the App's only installation)"
+        )
+
         parser.add_argument(
             "--clear-token",
             action="store_true",
-            help="Remove stored GitHub token from system keyring"
+            help="Remove stored GitHub tokens and GitHub App credentials from system keyring"
         )
 
     def run(self, args: list[str] = None) -> None:
@@ -52,6 +76,12 @@ class AuthController:
             self._handle_store_token(parsed_args.store_token)
         elif parsed_args.clear_token:
             self._handle_clear_token()
+        elif parsed_args.add_token:
+            self._handle_add_token(parsed_args.add_token)
+        elif parsed_args.store_app_id:
+            self._handle_store_app_credentials(
+                parsed_args.store_app_id, parsed_args.app_private_key, parsed_args.app_installation_id
+            )
         else:
             self._parser.parse_args(["--help"])
 
@@ -68,9 +98,47 @@ class AuthController:
             print(f"Failed to store token: {e}")
             sys.exit(1)
 
+    def _handle_add_token(self, token: str) -> None:
+        """Handle token pool addition command.
+
+        Args:
+            token: Token to add
+        """
+        try:
+            token_count = TokenManager.add_token(token)
+            print(f"GitHub token has been added to the token pool ({token_count} token(s) stored).")
+        except Exception as e:
+            print(f"Failed to add token: {e}")
+            sys.exit(1)
+
+    def _handle_store_app_credentials(self, app_id: str, private_key_path: Path, installation_id: int) -> None:
+        """Handle GitHub App credentials storage command.
+
+        Args:
+            app_id: GitHub App ID
+            private_key_path: PEM private key file of the App
+            installation_id: Installation to use, or None for the App's only installation
+        """
+        if private_key_path is None:
+            self._parser.error("--store-app-id requires --app-private-key")
+
+        try:
+            credentials = GitHubAppCredentials(
+                app_id=app_id,
+                private_key=private_key_path.read_text(encoding="utf-8"),
+                installation_id=installation_id
+            )
+            TokenManager.store_app_credentials(credentials)
+            print("GitHub App credentials have been securely stored in system keyring.")
+        except Exception as e:
+            print(f"Failed to store GitHub App credentials: {e}")
+            sys.exit(1)
+
     def _handle_clear_token(self) -> None:
         """Handle token clearing command."""
         try:
+            TokenManager.clear_token_pool()
+            TokenManager.clear_app_credentials()
             if TokenManager.clear_token():
                 print("GitHub token has been removed from system keyring.")
             else:
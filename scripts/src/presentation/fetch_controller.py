@@ -3,16 +3,28 @@ Fetch controller for GitHub PR review comments collection.
 """
 
 import argparse
+import json
 import os
 import sys
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 from ..application.exceptions.pr_review_collection_error import PRReviewCollectionError
+from ..domain.date_partitioning import DatePartitioning
 from ..domain.date_range import DateRange
+from ..domain.fetch_plan import FetchPlan
+from ..domain.pull_request_selection import PullRequestSelection
 from ..domain.repository_identifier import RepositoryIdentifier
+from ..domain.repository_identifier_validator import RepositoryIdentifierValidator
 from ..domain.workspace_config import WorkspaceConfig
+from ..infrastructure.collection_options import CollectionOptions
+from ..infrastructure.http.fetch_metrics import FetchMetrics
+from ..infrastructure.http.hedging_interceptor import HedgingInterceptor
+from ..infrastructure.repositories.github_repository import GitHubRepository
 from ..infrastructure.service_factory import ServiceFactory
+from ..infrastructure.services.fetch_cost_estimator import FetchCostEstimator
 from ..infrastructure.services.timezone_converter import TimezoneConverter
 from ..infrastructure.services.token_manager import TokenManager
 
@@ -35,6 +47,139 @@ def parse_date(date_str: str) -> datetime:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
+def parse_positive_int(value_str: str) -> int:
+    """Parse a positive integer.
+
+    Args:
+        value_str: Integer string
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer
+    """
+    try:
+        value = int(value_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer: {value_str}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"Value must be at least 1: {value_str}")
+    return value
+
+
+def parse_non_negative_int(value_str: str) -> int:
+    """Parse a non-negative integer.
+
+    Args:
+        value_str: Integer string
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a non-negative integer
+    """
+    try:
+        value = int(value_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer: {value_str}")
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"Value must not be negative: {value_str}")
+    return value
+
+
+def parse_positive_float(value_str: str) -> float:
+    """Parse a positive number.
+
+    Args:
+        value_str: Number string
+
+    Returns:
+        Parsed number
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive number
+    """
+    try:
+        value = float(value_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid number: {value_str}")
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"Value must be positive: {value_str}")
+    return value
+
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value_str: str) -> float:
+    """Parse a positive duration such as 90s, 30m or 2h; a plain number is seconds.
+
+    Args:
+        value_str: Duration string
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive duration
+    """
+    unit = value_str[-1:].lower()
+    number = value_str[:-1] if unit in _DURATION_UNITS else value_str
+    try:
+        value = float(number) * _DURATION_UNITS.get(unit, 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid duration: {value_str}. Use e.g. 90s, 30m or 2h")
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"Duration must be positive: {value_str}")
+    return value
+
+
+# Where --metrics-json writes the metrics of a run
+METRICS_FILE_PATH = Path("workspace") / "temp" / "fetch-metrics.json"
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration as hours, minutes and seconds, e.g. 1h05m or 3m20s.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Duration with its two largest units
+    """
+    total_seconds = round(seconds)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+def parse_repository_list(value_str: str) -> List[RepositoryIdentifier]:
+    """Parse a comma-separated list of repositories in owner/repo format.
+
+    Args:
+        value_str: Repository list such as "owner/a,owner/b"
+
+    Returns:
+        Parsed repository identifiers
+
+    Raises:
+        argparse.ArgumentTypeError: If the list is empty or a repository is invalid
+    """
+    specs = [spec.strip() for spec in value_str.split(",") if spec.strip()]
+    if not specs:
+        raise argparse.ArgumentTypeError("At least one repository is required")
+    try:
+        return [RepositoryIdentifierValidator.parse_repository_spec(spec) for spec in specs]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 class FetchController:
     """Controller for fetching GitHub PR review comments."""
 
@@ -56,15 +201,13 @@ class FetchController:
         parser.add_argument(
             "--from-date",
             type=parse_date,
-            required=True,
-            help="Start date (inclusive) in YYYY-MM-DD format"
+            help="Start date (inclusive) in YYYY-MM-DD format; required unless --retry-failed is given"
         )
 
         parser.add_argument(
             "--to-date",
             type=parse_date,
-            required=True,
-            help="End date (inclusive) in YYYY-MM-DD format"
+            help="End date (inclusive) in YYYY-MM-DD format; required unless --retry-failed is given"
         )
 
         parser.add_argument(
@@ -75,7 +218,230 @@ class FetchController:
 
         parser.add_argument(
             "--token",
-            help="GitHub personal access token (or set GITHUB_TOKEN environment variable)"
+            action="append",
+            help="GitHub personal access token (or set GITHUB_TOKEN environment variable); "
+                 "repeat to spread requests across several tokens"
+        )
+
+        parser.add_argument(
+            "--concurrency",
+            type=parse_positive_int,
+            default=1,
+            help="Number of PR details fetched in parallel (default: 1)"
+        )
+
+        parser.add_argument(
+            "--backend",
+            choices=ServiceFactory.GITHUB_BACKENDS,
+            default="pygithub",
+            help="GitHub API client backend (default: pygithub)"
+        )
+
+        parser.add_argument(
+            "--strategy",
+            choices=ServiceFactory.FETCH_STRATEGIES,
+            default="rest",
+            help=(
+                "PR detail fetch strategy; graphql fetches many PRs per query, "
+                "repo-comments lists review comments once for the whole repository (default: rest)"
+            )
+        )
+
+        parser.add_argument(
+            "--graphql-batch-size",
+            type=parse_positive_int,
+            default=50,
+            help="Number of PRs fetched per GraphQL query (default: 50)"
+        )
+
+        parser.add_argument(
+            "--listing",
+            choices=GitHubRepository.LISTING_STRATEGIES,
+            default="auto",
+            help=(
+                "How closed PRs of the date range are selected; auto uses the issues API "
+                "for recent ranges and the search API otherwise (default: auto)"
+            )
+        )
+
+        parser.add_argument(
+            "--partition",
+            choices=DatePartitioning.MODES,
+            help=(
+                "Split the date range into windows listed concurrently, one per month or "
+                "adaptively sized by --partition-size; not supported with scan listing"
+            )
+        )
+
+        parser.add_argument(
+            "--partition-size",
+            type=parse_positive_int,
+            default=DatePartitioning.DEFAULT_TARGET_PR_COUNT,
+            help=(
+                "Largest number of closed PRs in an adaptive window "
+                f"(default: {DatePartitioning.DEFAULT_TARGET_PR_COUNT})"
+            )
+        )
+
+        parser.add_argument(
+            "--http-cache-dir",
+            type=Path,
+            help="Directory of the persistent ETag cache shared by all workspaces (default: ~/.cache/agent-md-from-github/http)"
+        )
+
+        parser.add_argument(
+            "--no-http-cache",
+            action="store_true",
+            help="Disable the persistent ETag cache"
+        )
+
+        parser.add_argument(
+            "--no-shared-budget",
+            action="store_true",
+            help="Do not share the rate limit budget with other fetch processes on this host"
+        )
+
+        parser.add_argument(
+            "--request-timeout",
+            type=parse_positive_float,
+            default=HedgingInterceptor.DEFAULT_TIMEOUT_SECONDS,
+            help=(
+                "Seconds a GitHub request may take before it fails "
+                f"(default: {HedgingInterceptor.DEFAULT_TIMEOUT_SECONDS:g})"
+            )
+        )
+
+        parser.add_argument(
+            "--hedge",
+            action="store_true",
+            help=(
+                "Send a second attempt of GET requests that have not answered within the "
+                "95th percentile latency and use whichever answers first (pygithub backend only)"
+            )
+        )
+
+        parser.add_argument(
+            "--max-requests",
+            type=parse_positive_int,
+            help=(
+                "Stop between PRs once this many requests were sent to GitHub; detail fetches "
+                "already running still finish, so continue with --resume (pygithub backend only)"
+            )
+        )
+
+        parser.add_argument(
+            "--deadline",
+            type=parse_duration,
+            help="Stop between PRs once the run took this long, e.g. 90s, 30m or 2h; continue with --resume"
+        )
+
+        parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help=(
+                "Print the phase times, requests per endpoint, bytes received, latency percentiles, "
+                "rate-limit units and throughput of the run when it ends (pygithub backend only)"
+            )
+        )
+
+        parser.add_argument(
+            "--metrics-json",
+            action="store_true",
+            help=f"Also write the metrics of --metrics to {METRICS_FILE_PATH}"
+        )
+
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help=(
+                "Also patch saved PR files with review comments created or edited since the "
+                "last sync, recorded in workspace/sync-state.json"
+            )
+        )
+
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the interrupted run of the same date range recorded in workspace/fetch-journal.jsonl"
+        )
+
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help=(
+                "Only fetch the PRs that failed in earlier runs again, recorded in "
+                "workspace/dead-letter.json; the date range is ignored"
+            )
+        )
+
+        parser.add_argument(
+            "--plan",
+            action="store_true",
+            help=(
+                "Only report the PRs of the date range, how many would be skipped, and the requests, "
+                "rate-limit cost and wall time of each fetch strategy, without fetching PR details"
+            )
+        )
+
+        parser.add_argument(
+            "--no-catalog",
+            action="store_true",
+            help="List every PR from GitHub instead of answering previously listed dates from workspace/pr-catalog.json"
+        )
+
+        parser.add_argument(
+            "--merged-only",
+            action="store_true",
+            help="Fetch only merged PRs"
+        )
+
+        parser.add_argument(
+            "--exclude-author",
+            action="append",
+            default=[],
+            help="Skip PRs of authors matching this pattern, where * matches any characters, e.g. '*[bot]'; repeatable"
+        )
+
+        parser.add_argument(
+            "--base-branch",
+            action="append",
+            default=[],
+            help="Fetch only PRs into this base branch; repeatable"
+        )
+
+        parser.add_argument(
+            "--label",
+            action="append",
+            default=[],
+            help="Fetch only PRs carrying at least one of these labels; repeatable"
+        )
+
+        parser.add_argument(
+            "--min-review-comments",
+            type=parse_non_negative_int,
+            default=0,
+            help="Skip PRs known from the PR catalog to have fewer review comments"
+        )
+
+        repository_group = parser.add_mutually_exclusive_group()
+        repository_group.add_argument(
+            "--repos",
+            type=parse_repository_list,
+            help=(
+                "Comma-separated repositories (owner/repo) collected in parallel into "
+                "workspaces/<owner>/<repo> instead of the repository of workspace.yml"
+            )
+        )
+        repository_group.add_argument(
+            "--org",
+            help="Collect every repository of an organization or user into workspaces/<owner>/<repo>"
+        )
+
+        parser.add_argument(
+            "--repo-concurrency",
+            type=parse_positive_int,
+            default=4,
+            help="Number of repositories collected in parallel with --repos or --org (default: 4)"
         )
 
         parser.add_argument(
@@ -91,34 +457,90 @@ class FetchController:
             args: Command-line arguments (defaults to sys.argv)
         """
         parsed_args = self._parser.parse_args(args)
+        if not parsed_args.retry_failed and (parsed_args.from_date is None or parsed_args.to_date is None):
+            self._parser.error("the following arguments are required: --from-date, --to-date")
         self._handle_collector_command(parsed_args)
 
     def _handle_collector_command(self, parsed_args) -> None:
         """Handle PR collection command."""
         try:
             # Setup logging
-            logger = ServiceFactory.setup_logging(parsed_args.verbose)
+            ServiceFactory.setup_logging(parsed_args.verbose)
 
             # Validate and extract arguments
-            github_token = self._get_github_token(parsed_args.token)
+            # Tokens given on the command line replace all stored credentials
+            github_app = None if parsed_args.token else TokenManager.get_app_credentials()
+            if parsed_args.retry_failed and (parsed_args.sync or parsed_args.resume):
+                raise ValueError("--retry-failed cannot be combined with --sync or --resume")
+            if parsed_args.plan and (parsed_args.sync or parsed_args.resume or parsed_args.retry_failed):
+                raise ValueError("--plan cannot be combined with --sync, --resume or --retry-failed")
+            if parsed_args.plan and (parsed_args.repos or parsed_args.org):
+                raise ValueError("--plan only plans the repository of workspace.yml")
+            github_tokens = self._get_github_tokens(parsed_args.token, github_app is not None)
+            # Retrying failed PRs lists nothing, so it needs no date range
+            date_range = None if parsed_args.retry_failed else self._create_date_range(parsed_args, parsed_args.timezone)
+            collection_options = CollectionOptions(
+                github_token=github_tokens[0] if github_tokens else None,
+                additional_tokens=tuple(github_tokens[1:]),
+                github_app=github_app,
+                timezone=parsed_args.timezone,
+                concurrency=parsed_args.concurrency,
+                backend=parsed_args.backend,
+                strategy=parsed_args.strategy,
+                graphql_batch_size=parsed_args.graphql_batch_size,
+                http_cache=not parsed_args.no_http_cache,
+                http_cache_directory=parsed_args.http_cache_dir,
+                listing_strategy=parsed_args.listing,
+                use_catalog=not parsed_args.no_catalog,
+                shared_rate_limit_budget=not parsed_args.no_shared_budget,
+                request_timeout=parsed_args.request_timeout,
+                hedge_requests=parsed_args.hedge,
+                selection=self._create_selection(parsed_args),
+                partitioning=self._create_partitioning(parsed_args),
+                max_requests=parsed_args.max_requests,
+                deadline=parsed_args.deadline,
+                fetch_metrics=FetchMetrics() if parsed_args.metrics or parsed_args.metrics_json else None
+            )
+
+            if parsed_args.repos or parsed_args.org:
+                self._collect_repositories(parsed_args, date_range, collection_options)
+                self._report_metrics(collection_options.fetch_metrics, parsed_args.metrics_json)
+                return
+
             workspace_config = WorkspaceConfig()
             repository_id = workspace_config.get_repository_identifier()
-            date_range = self._create_date_range(parsed_args, parsed_args.timezone)
             output_directory = Path("workspace")
 
             # Create application service
             collection_service = ServiceFactory.create_pr_collection_service(
-                github_token=github_token,
-                timezone=parsed_args.timezone,
-                logger=logger
+                replace(collection_options, comment_filter_rules=workspace_config.get_comment_filter_rules())
             )
 
             # Execute collection
-            collection_service.collect_review_comments(
-                repository_id=repository_id,
-                date_range=date_range,
-                output_directory=output_directory
-            )
+            if parsed_args.plan:
+                fetch_plan = collection_service.plan_collection(
+                    repository_id=repository_id,
+                    date_range=date_range,
+                    output_directory=output_directory
+                )
+                self._print_plan(fetch_plan, parsed_args)
+            elif parsed_args.retry_failed:
+                collection_service.retry_failed_prs(repository_id=repository_id, output_directory=output_directory)
+            elif parsed_args.sync:
+                collection_service.sync_review_comments(
+                    repository_id=repository_id,
+                    date_range=date_range,
+                    output_directory=output_directory,
+                    resume=parsed_args.resume
+                )
+            else:
+                collection_service.collect_review_comments(
+                    repository_id=repository_id,
+                    date_range=date_range,
+                    output_directory=output_directory,
+                    resume=parsed_args.resume
+                )
+            self._report_metrics(collection_options.fetch_metrics, parsed_args.metrics_json)
 
         except (ValueError, PRReviewCollectionError, FileNotFoundError) as e:
             print(f"Error: {e}")
@@ -130,6 +552,142 @@ class FetchController:
             print(f"Unexpected error: {e}")
             sys.exit(1)
 
+    def _collect_repositories(
+        self,
+        parsed_args,
+        date_range: Optional[DateRange],
+        collection_options: CollectionOptions
+    ) -> None:
+        """Collect the repositories given by --repos or --org in parallel."""
+        collection_service = ServiceFactory.create_multi_repository_collection_service(
+            collection_options,
+            repository_concurrency=parsed_args.repo_concurrency
+        )
+        repository_ids = parsed_args.repos or collection_service.list_organization_repositories(parsed_args.org)
+        collection_service.collect_review_comments(
+            repository_ids=repository_ids,
+            date_range=date_range,
+            sync=parsed_args.sync,
+            resume=parsed_args.resume,
+            retry_failed=parsed_args.retry_failed
+        )
+
+    def _report_metrics(self, fetch_metrics: Optional[FetchMetrics], write_json: bool) -> None:
+        """Print the metrics of the run and write them as JSON if requested."""
+        if fetch_metrics is None:
+            return
+        summary = fetch_metrics.summary()
+        phases = ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in summary["phase_seconds"].items())
+        latency = ", ".join(
+            f"{name} {seconds:.3f}s" if seconds is not None else f"{name} -"
+            for name, seconds in summary["latency_seconds"].items()
+        )
+        rate_limit_units = ", ".join(
+            f"{resource} {units}" for resource, units in summary["rate_limit_units"].items()
+        ) or "-"
+        throughput = summary["throughput"]
+        print(f"Fetch metrics (wall time {format_duration(summary['wall_seconds'])})")
+        print(f"  Phases: {phases}")
+        print(f"  Requests: {summary['requests']['total']}")
+        for endpoint, count in summary["requests"]["by_endpoint"].items():
+            print(f"    {count:>6}  {endpoint}")
+        print(f"  Received: {summary['bytes_received'] / 1024:.1f} KiB")
+        print(f"  Latency: {latency}")
+        print(f"  Rate limit used: {rate_limit_units}")
+        if summary["lazy_completions"]:
+            print(f"  Lazy completion requests: {summary['lazy_completions']}")
+        print(
+            f"  Throughput: {throughput['prs']} PRs ({throughput['prs_per_second']:.2f}/s), "
+            f"{throughput['comments']} comments ({throughput['comments_per_second']:.2f}/s)"
+        )
+
+        if write_json:
+            METRICS_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            METRICS_FILE_PATH.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+            print(f"Metrics written to {METRICS_FILE_PATH}")
+
+    def _print_plan(self, fetch_plan: FetchPlan, parsed_args) -> None:
+        """Print the planned work of a run and the estimated cost of each fetch strategy."""
+        estimator = FetchCostEstimator(
+            concurrency=parsed_args.concurrency,
+            graphql_batch_size=parsed_args.graphql_batch_size,
+            backend=parsed_args.backend
+        )
+        print(
+            f"Fetch plan for {fetch_plan.repository_id.to_string()}, PRs closed from "
+            f"{fetch_plan.date_range.start_date.date()} to {fetch_plan.date_range.end_date.date()}"
+        )
+        print(
+            f"  From the PR catalog: {fetch_plan.catalogued_count} PRs, {fetch_plan.deselected_count} deselected, "
+            f"{fetch_plan.existing_count} skipped because their files already exist"
+        )
+        print(
+            f"  Counted on GitHub: {fetch_plan.counted_count} PRs, "
+            f"listed with about {fetch_plan.listing_requests} requests"
+        )
+        print(f"  PRs to fetch: {fetch_plan.fetch_count}")
+        if fetch_plan.repository_comment_count is not None:
+            print(f"  Review comments since the oldest PR to fetch: {fetch_plan.repository_comment_count}")
+        print()
+        print(f"{'strategy':<16}{'requests':>10}{'REST cost':>11}{'GraphQL cost':>14}{'wall time':>11}")
+        for estimate in estimator.estimate(fetch_plan):
+            name = f"{estimate.strategy}*" if estimate.strategy == parsed_args.strategy else estimate.strategy
+            print(
+                f"{name:<16}{estimate.requests:>10}{estimate.rest_cost:>11}"
+                f"{estimate.graphql_cost:>14}{format_duration(estimate.wall_seconds):>11}"
+            )
+        print(
+            f"* configured strategy; wall times assume average latencies at concurrency "
+            f"{parsed_args.concurrency} and rate limits of "
+            f"{FetchCostEstimator.REST_RATE_LIMIT} requests and {FetchCostEstimator.GRAPHQL_RATE_LIMIT} points per hour"
+        )
+
+    def _create_selection(self, parsed_args) -> Optional[PullRequestSelection]:
+        """Create the PR selection from parsed arguments, or None if every PR is fetched."""
+        selection = PullRequestSelection(
+            merged_only=parsed_args.merged_only,
+            excluded_authors=tuple(parsed_args.exclude_author),
+            base_branches=tuple(parsed_args.base_branch),
+            labels=tuple(parsed_args.label),
+            min_review_comments=parsed_args.min_review_comments
+        )
+        return None if selection.is_empty else selection
+
+    def _create_partitioning(self, parsed_args) -> Optional[DatePartitioning]:
+        """Create the date partitioning from parsed arguments, or None if the range is listed as one."""
+        if parsed_args.partition is None:
+            return None
+        return DatePartitioning(mode=parsed_args.partition, target_pr_count=parsed_args.partition_size)
+
+    def _get_github_tokens(self, token_args: Optional[List[str]], has_app_credentials: bool = False) -> List[str]:
+        """Get the GitHub tokens requests are spread across.
+
+        Tokens given on the command line take precedence over the tokens
+        stored in the keyring, which take precedence over GITHUB_TOKEN.
+
+        Args:
+            token_args: Tokens from repeated command-line arguments
+            has_app_credentials: GitHub App credentials are stored, so no token is required
+
+        Returns:
+            GitHub tokens without duplicates; at least one unless has_app_credentials
+
+        Raises:
+            ValueError: If no token is provided
+        """
+        if token_args:
+            return list(dict.fromkeys(token_args))
+
+        stored_tokens = TokenManager.get_tokens()
+        if stored_tokens:
+            return stored_tokens
+
+        if has_app_credentials:
+            env_token = os.getenv("GITHUB_TOKEN")
+            return [env_token] if env_token else []
+
+        return [self._get_github_token(None)]
+
     def _get_github_token(self, token_arg: str) -> str:
         """Get GitHub token from argument, keyring, or environment variable.
 
@@ -0,0 +1,131 @@
+"""
+Tests for MultiRepositoryCollectionService.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.src.application.exceptions.pr_review_collection_error import PRReviewCollectionError
+from scripts.src.application.services.multi_repository_collection_service import MultiRepositoryCollectionService
+from scripts.src.domain.comment_filter_rules import CommentFilterRules
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.domain.workspace_config import WorkspaceConfig
+from scripts.src.domain.workspace_config_generator import WorkspaceConfigGenerator
+
+
+DATE_RANGE = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31))
+
+
+class TestMultiRepositoryCollectionService:
+    """Test cases for MultiRepositoryCollectionService."""
+
+    def test___init___並列数が0_ValueErrorが発生する(self):
+        """Test __init__ rejects a repository concurrency below 1."""
+        with pytest.raises(ValueError):
+            MultiRepositoryCollectionService(MagicMock(), MagicMock(), repository_concurrency=0)
+
+    def test_collect_review_comments_複数リポジトリ_各ワークスペースに収集される(self, tmp_path, monkeypatch):
+        """Test collect_review_comments collects every repository into its own workspace directory."""
+        monkeypatch.chdir(tmp_path)
+        current = RepositoryIdentifier(owner="owner", name="current")
+        other = RepositoryIdentifier(owner="owner", name="other")
+        WorkspaceConfigGenerator().create_workspace_config_file(current, Path("workspace/workspace.yml"))
+        collection_services = []
+
+        def create_collection_service(comment_filter_rules):
+            collection_services.append(MagicMock())
+            return collection_services[-1]
+
+        service = MultiRepositoryCollectionService(create_collection_service, MagicMock(), repository_concurrency=2)
+
+        service.collect_review_comments([current, other, other], DATE_RANGE)
+
+        assert len(collection_services) == 2
+        output_directories = {
+            call.args[0]: call.args[2]
+            for collection_service in collection_services
+            for call in collection_service.collect_review_comments.call_args_list
+        }
+        assert output_directories == {
+            current: Path("workspace"),
+            other: Path("workspaces/owner/other")
+        }
+        assert WorkspaceConfig(Path("workspaces/owner/other/workspace.yml")).get_repository_identifier() == other
+
+    def test_collect_review_comments_一部リポジトリが失敗_残りを収集してからエラーが発生する(self, tmp_path, monkeypatch):
+        """Test collect_review_comments finishes the other repositories before reporting failures."""
+        monkeypatch.chdir(tmp_path)
+        failing = RepositoryIdentifier(owner="owner", name="failing")
+        working = RepositoryIdentifier(owner="owner", name="working")
+        synced = []
+
+        def sync_review_comments(repository_id, date_range, output_directory, resume=False):
+            if repository_id == failing:
+                raise RuntimeError("boom")
+            synced.append(repository_id)
+
+        def create_collection_service(comment_filter_rules):
+            collection_service = MagicMock()
+            collection_service.sync_review_comments.side_effect = sync_review_comments
+            return collection_service
+
+        service = MultiRepositoryCollectionService(create_collection_service, MagicMock())
+
+        with pytest.raises(PRReviewCollectionError, match="owner/failing"):
+            service.collect_review_comments([failing, working], DATE_RANGE, sync=True)
+
+        assert synced == [working]
+
+    def test_collect_review_comments_失敗PRの再取得指定_各リポジトリのデッドレターが再取得される(self, tmp_path, monkeypatch):
+        """Test collect_review_comments replays the dead-letter list of every repository with retry_failed."""
+        monkeypatch.chdir(tmp_path)
+        repository_id = RepositoryIdentifier(owner="owner", name="repo")
+        collection_service = MagicMock()
+        service = MultiRepositoryCollectionService(lambda comment_filter_rules: collection_service, MagicMock())
+
+        service.collect_review_comments([repository_id], None, retry_failed=True)
+
+        collection_service.retry_failed_prs.assert_called_once_with(repository_id, Path("workspaces/owner/repo"))
+        collection_service.collect_review_comments.assert_not_called()
+
+    def test_collect_review_comments_除外設定あり_各ワークスペースの規則でサービスが作成される(self, tmp_path, monkeypatch):
+        """Test collect_review_comments filters every repository by the comment_filters of its own workspace.yml."""
+        monkeypatch.chdir(tmp_path)
+        current = RepositoryIdentifier(owner="owner", name="current")
+        other = RepositoryIdentifier(owner="owner", name="other")
+        Path("workspace").mkdir()
+        Path("workspace/workspace.yml").write_text(
+            "workspace:\n  organization: owner\n  repository: current\n"
+            "comment_filters:\n  authors: [coderabbitai]\n  bot_suffix: true\n",
+            encoding="utf-8"
+        )
+        rules_by_repository = {}
+
+        def create_collection_service(comment_filter_rules):
+            collection_service = MagicMock()
+            collection_service.collect_review_comments.side_effect = (
+                lambda repository_id, *args, **kwargs: rules_by_repository.update({repository_id: comment_filter_rules})
+            )
+            return collection_service
+
+        service = MultiRepositoryCollectionService(create_collection_service, MagicMock())
+
+        service.collect_review_comments([current, other], DATE_RANGE)
+
+        assert rules_by_repository == {
+            current: CommentFilterRules(excluded_authors=("coderabbitai",), exclude_bot_suffix=True),
+            other: CommentFilterRules()
+        }
+
+    def test_list_organization_repositories_正常実行_リポジトリ一覧が返される(self):
+        """Test list_organization_repositories delegates to the GitHub repository."""
+        github_repository = MagicMock()
+        github_repository.list_repositories.return_value = [RepositoryIdentifier(owner="org", name="repo")]
+        service = MultiRepositoryCollectionService(MagicMock(), github_repository)
+
+        assert service.list_organization_repositories("org") == [RepositoryIdentifier(owner="org", name="repo")]
+        github_repository.list_repositories.assert_called_once_with("org")
@@ -3,15 +3,23 @@ Tests for PRReviewCollectionService.
 """
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from scripts.src.application.services.pr_review_collection_service import PRReviewCollectionService
+from scripts.src.domain.date_partitioning import DatePartitioning
 from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.failed_pull_request import FailedPullRequest
+from scripts.src.domain.fetch_checkpoint import FetchCheckpoint
 from scripts.src.domain.repository_identifier import RepositoryIdentifier
 from scripts.src.domain.pull_request_metadata import PullRequestMetadata
 from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.pull_request_catalog import PullRequestCatalog
+from scripts.src.domain.pull_request_catalog_entry import PullRequestCatalogEntry
+from scripts.src.domain.pull_request_selection import PullRequestSelection
 from scripts.src.domain.review_comment import ReviewComment
+from scripts.src.domain.sync_state import SyncState
+from scripts.src.infrastructure.http.fetch_metrics import FetchMetrics
 
 
 class TestPRReviewCollectionService:
@@ -151,4 +159,849 @@ class TestPRReviewCollectionService:
 
         result = service._process_single_pr(pr_metadata, output_dir)
         assert result is True
-        mock_repository.save.assert_called_once()
\ No newline at end of file
+        mock_repository.save.assert_called_once()
+
+    def test___init___並列数が0_ValueErrorが発生する(self):
+        """Test __init__ raises ValueError when concurrency is less than 1."""
+        with pytest.raises(ValueError):
+            PRReviewCollectionService(
+                github_repository=MagicMock(),
+                pr_metadata_repository=MagicMock(),
+                comment_filter=MagicMock(),
+                concurrency=0
+            )
+
+    def test_collect_review_comments_並列取得_一覧順に保存される(self):
+        """Test collect_review_comments saves PRs in listing order when fetched concurrently."""
+        import time
+
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            concurrency=4
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2)
+        )
+        numbers = [1, 2, 3, 4, 5, 6]
+
+        def get_full_pr_metadata(number, repository_id):
+            # Earlier PRs finish later to exercise ordering
+            time.sleep(0.01 * (len(numbers) - number))
+            return PullRequestMetadata(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                review_comments=[],
+                repository_id=repository_id
+            )
+
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                repository_id=repo_id
+            )
+            for number in numbers
+        ]
+        mock_github.get_full_pr_metadata.side_effect = get_full_pr_metadata
+        mock_repository.exists.return_value = False
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        saved_numbers = [call.args[0].number for call in mock_repository.save.call_args_list]
+        assert saved_numbers == numbers
+
+    def test_collect_review_comments_予算を使い切る_PRの区切りで停止し再開できる状態で終わる(self):
+        """Test collect_review_comments stops between PRs once the fetch budget is used up."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = False
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+        mock_journal = MagicMock()
+        mock_journal.load_checkpoint.return_value = None
+        mock_budget = MagicMock()
+        # The budget runs out once the first detail fetch was sent
+        mock_budget.exhausted_reason.side_effect = lambda: (
+            "request budget of 1 used up" if mock_github.get_full_pr_metadata.called else None
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        numbers = [1, 2, 3, 4, 5, 6]
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, number),
+                is_merged=True,
+                repository_id=repo_id
+            )
+            for number in numbers
+        ]
+        mock_github.get_full_pr_metadata.side_effect = lambda number, repository_id: PullRequestMetadata(
+            number=number,
+            title=f"PR {number}",
+            closed_at=datetime(2023, 1, number),
+            is_merged=True,
+            review_comments=[],
+            repository_id=repository_id
+        )
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            fetch_journal=mock_journal,
+            fetch_budget=mock_budget
+        )
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31))
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        saved_numbers = [call.args[0].number for call in mock_repository.save.call_args_list]
+        assert 1 <= len(saved_numbers) <= 2
+        assert saved_numbers == numbers[:len(saved_numbers)]
+        mock_journal.record_listing_completed.assert_not_called()
+        mock_journal.finish.assert_not_called()
+        mock_journal.close.assert_called_once()
+
+    def test_collect_review_comments_開始時に予算切れ_一覧取得されない(self):
+        """Test collect_review_comments lists nothing when the fetch budget was used up before it started."""
+        mock_github = MagicMock()
+        mock_budget = MagicMock()
+        mock_budget.exhausted_reason.return_value = "deadline of 60s reached"
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=MagicMock(),
+            comment_filter=MagicMock(),
+            fetch_budget=mock_budget
+        )
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31))
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_github.find_closed_prs_basic_info.assert_not_called()
+
+    def test_collect_review_comments_重複したPR_一度だけ取得される(self):
+        """Test collect_review_comments fetches a PR listed twice only once."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_filter = MagicMock()
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            concurrency=2
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2)
+        )
+        basic_info = PullRequestBasicInfo(
+            number=1,
+            title="Test PR",
+            closed_at=datetime(2023, 1, 1),
+            is_merged=True,
+            repository_id=repo_id
+        )
+        mock_github.find_closed_prs_basic_info.return_value = [basic_info, basic_info]
+        mock_github.get_full_pr_metadata.return_value = PullRequestMetadata(
+            number=1,
+            title="Test PR",
+            closed_at=datetime(2023, 1, 1),
+            is_merged=True,
+            review_comments=[],
+            repository_id=repo_id
+        )
+        mock_repository.exists.return_value = False
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_github.get_full_pr_metadata.assert_called_once_with(1, repo_id)
+        mock_repository.save.assert_called_once()
+
+    def test_collect_review_comments_選択条件指定_除外されたPRの詳細は取得されない(self):
+        """Test collect_review_comments skips PRs rejected by the selection before fetching details."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=MagicMock(),
+            selection=PullRequestSelection(merged_only=True, excluded_authors=("*[bot]",))
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2)
+        )
+
+        def listed(number, is_merged, author):
+            return PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=is_merged,
+                repository_id=repo_id,
+                author=author
+            )
+
+        mock_github.find_closed_prs_basic_info.return_value = [
+            listed(1, True, "alice"),
+            listed(2, False, "alice"),
+            listed(3, True, "dependabot[bot]"),
+            listed(4, True, None)
+        ]
+        mock_github.get_full_pr_metadata.side_effect = lambda number, repository_id: PullRequestMetadata(
+            number=number,
+            title=f"PR {number}",
+            closed_at=datetime(2023, 1, 1),
+            is_merged=True,
+            review_comments=[],
+            repository_id=repository_id
+        )
+        mock_repository.exists.return_value = False
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        fetched = [call.args[0] for call in mock_github.get_full_pr_metadata.call_args_list]
+        assert fetched == [1, 4]
+
+    def test_collect_review_comments_詳細取得失敗_PRReviewCollectionErrorが発生する(self):
+        """Test collect_review_comments raises PRReviewCollectionError when a detail fetch fails."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_filter = MagicMock()
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            concurrency=2
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2)
+        )
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(
+                number=1,
+                title="Test PR",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                repository_id=repo_id
+            )
+        ]
+        mock_github.get_full_pr_metadata.side_effect = Exception("API error")
+        mock_repository.exists.return_value = False
+
+        from scripts.src.application.exceptions.pr_review_collection_error import PRReviewCollectionError
+        with pytest.raises(PRReviewCollectionError):
+            service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_repository.save.assert_not_called()
+
+    def test_collect_review_comments_バッチフェッチャー指定_バッチ単位で取得される(self):
+        """Test collect_review_comments groups PRs into batches for the detail fetcher."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+        mock_fetcher = MagicMock()
+        mock_fetcher.batch_size = 2
+        mock_fetcher.fetch_details.side_effect = lambda basic_infos: [
+            PullRequestMetadata(
+                number=basic_info.number,
+                title=basic_info.title,
+                closed_at=basic_info.closed_at,
+                is_merged=basic_info.is_merged,
+                review_comments=[],
+                repository_id=basic_info.repository_id
+            )
+            for basic_info in basic_infos
+        ]
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            concurrency=2,
+            detail_fetcher=mock_fetcher
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2)
+        )
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                repository_id=repo_id
+            )
+            for number in [1, 2, 3, 4, 5]
+        ]
+        mock_repository.exists.side_effect = lambda basic_info, output_directory: basic_info.number == 2
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        batches = [[info.number for info in call.args[0]] for call in mock_fetcher.fetch_details.call_args_list]
+        assert batches == [[1, 3], [4, 5]]
+        saved_numbers = [call.args[0].number for call in mock_repository.save.call_args_list]
+        assert saved_numbers == [1, 3, 4, 5]
+        mock_github.get_full_pr_metadata.assert_not_called()
+
+    def test_collect_review_comments_バッチサイズなし_全PRが一度に取得される(self):
+        """Test collect_review_comments fetches all listed PRs at once when batch_size is None."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = False
+        mock_filter = MagicMock()
+        mock_fetcher = MagicMock()
+        mock_fetcher.batch_size = None
+        mock_fetcher.fetch_details.return_value = []
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            detail_fetcher=mock_fetcher
+        )
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2)
+        )
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                repository_id=repo_id
+            )
+            for number in [1, 2, 3]
+        ]
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_fetcher.fetch_details.assert_called_once()
+        assert [info.number for info in mock_fetcher.fetch_details.call_args.args[0]] == [1, 2, 3]
+
+    def test_collect_review_comments_カタログで一部期間が取得済み_未取得期間のみ一覧取得される(self):
+        """Test collect_review_comments lists only the date ranges the PR catalog does not cover."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = True
+        mock_catalog_repository = MagicMock()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        catalog = PullRequestCatalog(
+            repo_id,
+            entries=[PullRequestCatalogEntry(number=1, title="PR 1", closed_at=datetime(2023, 1, 1, 12), is_merged=True)],
+            covered_ranges=[DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 1, 23, 59, 59))]
+        )
+        mock_catalog_repository.load.return_value = catalog
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(
+                number=2,
+                title="PR 2",
+                closed_at=datetime(2023, 1, 2, 12),
+                is_merged=False,
+                repository_id=repo_id
+            )
+        ]
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=MagicMock(),
+            pr_catalog_repository=mock_catalog_repository
+        )
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2, 23, 59, 59))
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_github.find_closed_prs_basic_info.assert_called_once_with(
+            repo_id, DateRange(start_date=datetime(2023, 1, 2), end_date=datetime(2023, 1, 2, 23, 59, 59))
+        )
+        checked_numbers = [call.args[0].number for call in mock_repository.exists.call_args_list]
+        assert checked_numbers == [1, 2]
+        assert catalog.get(2) is not None
+        assert catalog.uncovered_ranges(date_range) == []
+        mock_catalog_repository.save.assert_called_with(catalog, Path("test_dir"))
+
+    def test_collect_review_comments_月単位で分割_各期間が並列に一覧取得され順番に処理される(self):
+        """Test collect_review_comments lists every month window and journals each once its PRs were consumed."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = True
+        mock_journal = MagicMock()
+        mock_journal.load_checkpoint.return_value = None
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        mock_github.find_closed_prs_basic_info.side_effect = lambda repository_id, window: [
+            PullRequestBasicInfo(
+                number=window.start_date.month,
+                title=f"PR {window.start_date.month}",
+                closed_at=window.start_date,
+                is_merged=True,
+                repository_id=repository_id
+            )
+        ]
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=MagicMock(),
+            concurrency=2,
+            fetch_journal=mock_journal,
+            partitioning=DatePartitioning(mode="month")
+        )
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 3, 31, 23, 59, 59))
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        windows = date_range.split_by_month()
+        listed_windows = sorted(call.args[1].start_date for call in mock_github.find_closed_prs_basic_info.call_args_list)
+        assert listed_windows == [window.start_date for window in windows]
+        checked_numbers = [call.args[0].number for call in mock_repository.exists.call_args_list]
+        assert checked_numbers == [1, 2, 3]
+        assert [call.args[0] for call in mock_journal.record_window_listed.call_args_list] == windows
+        mock_github.count_closed_prs.assert_not_called()
+
+    def test_collect_review_comments_分割した実行を再開_一覧取得済みの期間は再取得されない(self):
+        """Test collect_review_comments resumes a partitioned listing with the windows it did not finish."""
+        mock_github = MagicMock()
+        mock_github.find_closed_prs_basic_info.return_value = []
+        mock_journal = MagicMock()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 3, 31, 23, 59, 59))
+        january, february, march = date_range.split_by_month()
+        mock_journal.load_checkpoint.return_value = FetchCheckpoint(
+            repository_id=repo_id,
+            date_range=date_range,
+            listed=(),
+            listing_completed=False,
+            saved_numbers=frozenset(),
+            listed_windows=frozenset({january})
+        )
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=MagicMock(),
+            comment_filter=MagicMock(),
+            concurrency=2,
+            fetch_journal=mock_journal,
+            partitioning=DatePartitioning(mode="month")
+        )
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"), resume=True)
+
+        listed = sorted(call.args[1].start_date for call in mock_github.find_closed_prs_basic_info.call_args_list)
+        assert listed == [february.start_date, march.start_date]
+
+    def test_sync_review_comments_前回同期あり_変更コメントで保存済みPRが更新される(self):
+        """Test sync_review_comments patches saved PRs with comments changed since the last sync."""
+        mock_github = MagicMock()
+        mock_github.find_closed_prs_basic_info.return_value = []
+        mock_repository = MagicMock()
+        mock_sync_state_repository = MagicMock()
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        last_synced_at = datetime(2023, 1, 5)
+        mock_sync_state_repository.load.return_value = SyncState(repo_id, last_synced_at)
+
+        def comment(comment_id, body, day):
+            return ReviewComment(
+                comment_id=comment_id,
+                file_path="test.py",
+                position=1,
+                commit_id="abc",
+                author="reviewer",
+                created_at=datetime(2023, 1, day),
+                body=body,
+                diff_context="@@ -1 +1 @@"
+            )
+
+        saved_pr = PullRequestMetadata(
+            number=1,
+            title="PR 1",
+            closed_at=datetime(2023, 1, 1),
+            is_merged=True,
+            review_comments=[comment(10, "Original", 1), comment(11, "Kept", 2)],
+            repository_id=repo_id
+        )
+        mock_repository.find_all_by_repository.return_value = [saved_pr]
+        mock_github.get_review_comments_by_pr.return_value = {
+            1: [comment(10, "Edited", 1), comment(12, "Late reply", 6)],
+            99: [comment(20, "PR without file", 6)]
+        }
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            sync_state_repository=mock_sync_state_repository
+        )
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2))
+
+        service.sync_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_github.get_review_comments_by_pr.assert_called_once_with(repo_id, last_synced_at)
+        mock_repository.save.assert_called_once()
+        patched_pr = mock_repository.save.call_args.args[0]
+        assert patched_pr.number == 1
+        assert [c.body for c in patched_pr.review_comments] == ["Edited", "Kept", "Late reply"]
+        saved_state = mock_sync_state_repository.save.call_args.args[0]
+        assert saved_state.repository_id == repo_id
+        assert saved_state.last_synced_at > datetime(2023, 1, 5, tzinfo=timezone.utc)
+
+    def test_sync_review_comments_前回同期なし_保存済みPRを更新せず同期時刻が記録される(self):
+        """Test sync_review_comments only collects and records the high-water mark on the first sync."""
+        mock_github = MagicMock()
+        mock_github.find_closed_prs_basic_info.return_value = []
+        mock_sync_state_repository = MagicMock()
+        mock_sync_state_repository.load.return_value = None
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=MagicMock(),
+            comment_filter=MagicMock(),
+            sync_state_repository=mock_sync_state_repository
+        )
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2))
+
+        service.sync_review_comments(repo_id, date_range, Path("test_dir"))
+
+        mock_github.get_review_comments_by_pr.assert_not_called()
+        mock_github.find_closed_prs_basic_info.assert_called_once()
+        mock_sync_state_repository.save.assert_called_once()
+
+    def test_collect_review_comments_中断した実行を再開_一覧取得せず未保存のPRのみ取得される(self):
+        """Test collect_review_comments resumes from the journal checkpoint without listing again."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = True
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+        mock_journal = MagicMock()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2))
+        listed = tuple(
+            PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                repository_id=repo_id
+            )
+            for number in [1, 2]
+        )
+        mock_journal.load_checkpoint.return_value = FetchCheckpoint(
+            repository_id=repo_id,
+            date_range=date_range,
+            listed=listed,
+            listing_completed=True,
+            saved_numbers=frozenset({1})
+        )
+        mock_github.get_full_pr_metadata.side_effect = lambda number, repository_id: PullRequestMetadata(
+            number=number,
+            title=f"PR {number}",
+            closed_at=datetime(2023, 1, 1),
+            is_merged=True,
+            review_comments=[],
+            repository_id=repository_id
+        )
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            fetch_journal=mock_journal
+        )
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"), resume=True)
+
+        mock_github.find_closed_prs_basic_info.assert_not_called()
+        # PR 2 may be half-written, so its existing file does not prevent the refetch
+        mock_github.get_full_pr_metadata.assert_called_once_with(2, repo_id)
+        mock_journal.start.assert_called_once_with(repo_id, date_range, Path("test_dir"), resume=True)
+        mock_journal.record_saved.assert_called_once_with(2)
+        mock_journal.finish.assert_called_once()
+
+    def test_collect_review_comments_デッドレター指定で詳細取得失敗_失敗PRが記録され残りは保存される(self):
+        """Test collect_review_comments puts PRs failing to fetch on the dead-letter list and continues."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = False
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+        mock_dead_letters = MagicMock()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2))
+        listed = [
+            PullRequestBasicInfo(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                repository_id=repo_id
+            )
+            for number in [1, 2, 3]
+        ]
+        # PR 3 failed in an earlier run and succeeds now
+        mock_dead_letters.load.return_value = [
+            FailedPullRequest(listed[2], "old error", datetime(2022, 12, 31, tzinfo=timezone.utc))
+        ]
+        mock_github.find_closed_prs_basic_info.return_value = listed
+
+        def get_full_pr_metadata(number, repository_id):
+            if number == 2:
+                raise Exception("502 Bad Gateway")
+            return PullRequestMetadata(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                review_comments=[],
+                repository_id=repository_id
+            )
+
+        mock_github.get_full_pr_metadata.side_effect = get_full_pr_metadata
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            concurrency=2,
+            dead_letter_repository=mock_dead_letters
+        )
+
+        service.collect_review_comments(repo_id, date_range, Path("test_dir"))
+
+        saved_numbers = [call.args[0].number for call in mock_repository.save.call_args_list]
+        assert saved_numbers == [1, 3]
+        saved_repo_id, failed_prs, output_directory = mock_dead_letters.save.call_args.args
+        assert saved_repo_id == repo_id
+        assert output_directory == Path("test_dir")
+        assert [(failed_pr.number, failed_pr.error, failed_pr.attempts) for failed_pr in failed_prs] == [
+            (2, "502 Bad Gateway", 1)
+        ]
+
+    def test_retry_failed_prs_デッドレターあり_成功したPRのみ一覧から外れる(self):
+        """Test retry_failed_prs saves recovered PRs and keeps the ones failing again with another attempt."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments
+        mock_dead_letters = MagicMock()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        failed_at = datetime(2022, 12, 31, tzinfo=timezone.utc)
+        mock_dead_letters.load.return_value = [
+            FailedPullRequest(
+                PullRequestBasicInfo(
+                    number=number,
+                    title=f"PR {number}",
+                    closed_at=datetime(2023, 1, 1),
+                    is_merged=True,
+                    repository_id=repo_id
+                ),
+                "old error",
+                failed_at,
+                attempts=2
+            )
+            for number in [1, 2]
+        ]
+
+        def get_full_pr_metadata(number, repository_id):
+            if number == 1:
+                raise Exception("connection reset")
+            return PullRequestMetadata(
+                number=number,
+                title=f"PR {number}",
+                closed_at=datetime(2023, 1, 1),
+                is_merged=True,
+                review_comments=[],
+                repository_id=repository_id
+            )
+
+        mock_github.get_full_pr_metadata.side_effect = get_full_pr_metadata
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            dead_letter_repository=mock_dead_letters
+        )
+
+        service.retry_failed_prs(repo_id, Path("test_dir"))
+
+        mock_github.find_closed_prs_basic_info.assert_not_called()
+        assert [call.args[0].number for call in mock_repository.save.call_args_list] == [2]
+        _, failed_prs, _ = mock_dead_letters.save.call_args.args
+        assert [(failed_pr.number, failed_pr.error, failed_pr.attempts) for failed_pr in failed_prs] == [
+            (1, "connection reset", 3)
+        ]
+        assert failed_prs[0].failed_at > failed_at
+
+    def test_retry_failed_prs_デッドレターリポジトリなし_ValueErrorが発生する(self):
+        """Test retry_failed_prs requires a dead-letter repository."""
+        service = PRReviewCollectionService(
+            github_repository=MagicMock(),
+            pr_metadata_repository=MagicMock(),
+            comment_filter=MagicMock()
+        )
+
+        with pytest.raises(ValueError, match="dead-letter"):
+            service.retry_failed_prs(RepositoryIdentifier(owner="test", name="repo"), Path("test_dir"))
+
+    def test_collect_review_comments_メトリクス指定_フェーズ時間と保存数が記録される(self):
+        """Test collect_review_comments times listing, detail fetches and filtering and counts saved PRs and comments."""
+        mock_github = MagicMock()
+        mock_repository = MagicMock()
+        mock_repository.exists.return_value = False
+        mock_filter = MagicMock()
+        mock_filter.filter_comments.side_effect = lambda comments: comments[:1]
+        fetch_metrics = FetchMetrics()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        mock_github.find_closed_prs_basic_info.return_value = [
+            PullRequestBasicInfo(number=number, title=f"PR {number}", closed_at=datetime(2023, 1, 1), is_merged=True,
+                                 repository_id=repo_id)
+            for number in (1, 2)
+        ]
+        comment = ReviewComment(
+            comment_id=1, file_path="a.py", position=1, commit_id="abc", author="user",
+            created_at=datetime(2023, 1, 1), body="comment", diff_context="diff"
+        )
+        mock_github.get_full_pr_metadata.side_effect = lambda number, _: PullRequestMetadata(
+            number=number, title=f"PR {number}", closed_at=datetime(2023, 1, 1), is_merged=True,
+            review_comments=[comment, comment], repository_id=repo_id
+        )
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=mock_filter,
+            fetch_metrics=fetch_metrics
+        )
+
+        with patch.object(fetch_metrics, "measure", wraps=fetch_metrics.measure) as measure:
+            service.collect_review_comments(
+                repo_id, DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2)), Path("test_dir")
+            )
+
+        measured_phases = [call.args[0] for call in measure.call_args_list]
+        assert measured_phases.count("listing") == 3
+        assert measured_phases.count("detail") == 2
+        assert measured_phases.count("filtering") == 2
+        assert fetch_metrics.summary()["throughput"]["prs"] == 2
+        assert fetch_metrics.summary()["throughput"]["comments"] == 2
+
+    def test_plan_collection_カタログと未取得範囲_既存と除外を数え詳細は取得しない(self):
+        """Test plan_collection checks catalogued PRs one by one, counts the gaps, and fetches no details."""
+        mock_github = MagicMock()
+        mock_github.count_closed_prs.return_value = 250
+        mock_github.count_review_comments.return_value = 900
+        mock_repository = MagicMock()
+        mock_repository.exists.side_effect = lambda basic_info, _: basic_info.number == 2
+        mock_catalog_repository = MagicMock()
+
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        catalog = PullRequestCatalog(
+            repo_id,
+            entries=[
+                PullRequestCatalogEntry(number=1, title="PR 1", closed_at=datetime(2023, 1, 1, 10), is_merged=False),
+                PullRequestCatalogEntry(number=2, title="PR 2", closed_at=datetime(2023, 1, 1, 11), is_merged=True),
+                PullRequestCatalogEntry(
+                    number=3, title="PR 3", closed_at=datetime(2023, 1, 1, 12), is_merged=True,
+                    created_at=datetime(2022, 12, 20), comment_count=40
+                )
+            ],
+            covered_ranges=[DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 1, 23, 59, 59))]
+        )
+        mock_catalog_repository.load.return_value = catalog
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=mock_repository,
+            comment_filter=MagicMock(),
+            pr_catalog_repository=mock_catalog_repository,
+            fetch_journal=MagicMock(),
+            selection=PullRequestSelection(merged_only=True)
+        )
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2, 23, 59, 59))
+
+        plan = service.plan_collection(repo_id, date_range, Path("test_dir"))
+
+        assert plan.catalogued_count == 3
+        assert plan.deselected_count == 1
+        assert plan.existing_count == 1
+        assert plan.comment_counts == (40,)
+        assert plan.counted_count == 250
+        assert plan.listing_requests == 3
+        assert plan.fetch_count == 251
+        assert plan.repository_comment_count == 900
+        mock_github.count_closed_prs.assert_called_once_with(
+            repo_id, DateRange(start_date=datetime(2023, 1, 2), end_date=datetime(2023, 1, 2, 23, 59, 59))
+        )
+        mock_github.count_review_comments.assert_called_once_with(repo_id, datetime(2022, 12, 20))
+        mock_github.find_closed_prs_basic_info.assert_not_called()
+        mock_github.get_full_pr_metadata.assert_not_called()
+        mock_catalog_repository.save.assert_not_called()
+        mock_repository.save.assert_not_called()
+        assert service._fetch_journal.method_calls == []
+
+    def test_plan_collection_取得対象なし_コメント数を問い合わせない(self):
+        """Test plan_collection skips the comment count when there is nothing to fetch."""
+        mock_github = MagicMock()
+        mock_github.count_closed_prs.return_value = 0
+
+        service = PRReviewCollectionService(
+            github_repository=mock_github,
+            pr_metadata_repository=MagicMock(),
+            comment_filter=MagicMock()
+        )
+        repo_id = RepositoryIdentifier(owner="test", name="repo")
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31))
+
+        plan = service.plan_collection(repo_id, date_range, Path("test_dir"))
+
+        assert plan.fetch_count == 0
+        assert plan.listing_requests == 1
+        assert plan.repository_comment_count is None
+        mock_github.count_review_comments.assert_not_called()
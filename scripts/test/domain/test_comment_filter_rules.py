@@ -0,0 +1,62 @@
+"""
+Tests for CommentFilterRules.
+"""
+
+import pytest
+
+from scripts.src.domain.comment_filter_rules import CommentFilterRules
+
+
+class TestCommentFilterRules:
+    """Test cases for CommentFilterRules."""
+
+    def test___init___デフォルト_Copilotのみ除外される(self):
+        """Test the default rules only exclude Copilot."""
+        rules = CommentFilterRules()
+
+        assert rules.excluded_authors == ("Copilot",)
+        assert not rules.exclude_bot_suffix
+        assert not rules.exclude_bot_users
+        assert rules.body_presets == ()
+        assert rules.body_patterns == ()
+
+    def test___init___未知のプリセット_ValueErrorが発生する(self):
+        """Test __init__ rejects unknown body presets."""
+        with pytest.raises(ValueError, match="Unknown body filter preset: thanks"):
+            CommentFilterRules(body_presets=("lgtm", "thanks"))
+
+    def test_from_config_全設定_規則が作成される(self):
+        """Test from_config reads every setting of the section."""
+        rules = CommentFilterRules.from_config({
+            "authors": ["coderabbitai"],
+            "bot_suffix": True,
+            "bot_users": True,
+            "bodies": ["lgtm", "emoji-only"],
+            "body_patterns": ["^nit$"]
+        })
+
+        assert rules == CommentFilterRules(
+            excluded_authors=("coderabbitai",),
+            exclude_bot_suffix=True,
+            exclude_bot_users=True,
+            body_presets=("lgtm", "emoji-only"),
+            body_patterns=("^nit$",)
+        )
+
+    def test_from_config_作成者なし_デフォルトの作成者が使用される(self):
+        """Test from_config keeps the default authors when none are configured."""
+        rules = CommentFilterRules.from_config({"bot_suffix": True})
+
+        assert rules.excluded_authors == CommentFilterRules.DEFAULT_EXCLUDED_AUTHORS
+
+    def test_from_config_未知のキー_ValueErrorが発生する(self):
+        """Test from_config rejects unknown settings."""
+        with pytest.raises(ValueError, match="Unknown comment filter setting: author"):
+            CommentFilterRules.from_config({"author": ["Copilot"]})
+
+    def test_from_config_型不正_ValueErrorが発生する(self):
+        """Test from_config rejects values of the wrong type."""
+        with pytest.raises(ValueError, match="authors must be a list of strings"):
+            CommentFilterRules.from_config({"authors": "Copilot"})
+        with pytest.raises(ValueError, match="bot_users must be true or false"):
+            CommentFilterRules.from_config({"bot_users": "yes"})
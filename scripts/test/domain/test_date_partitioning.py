@@ -0,0 +1,59 @@
+"""
+Tests for DatePartitioning.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from scripts.src.domain.date_partitioning import DatePartitioning
+from scripts.src.domain.date_range import DateRange
+
+
+DATE_RANGE = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 4, 30, 23, 59, 59))
+
+
+class TestDatePartitioning:
+    """Test cases for DatePartitioning."""
+
+    def test___post_init___未知の分割方法_ValueErrorが発生する(self):
+        """Test __post_init__ rejects unknown modes."""
+        with pytest.raises(ValueError):
+            DatePartitioning(mode="weekly")
+
+    def test___post_init___目標件数が0_ValueErrorが発生する(self):
+        """Test __post_init__ rejects a target PR count below 1."""
+        with pytest.raises(ValueError):
+            DatePartitioning(mode="adaptive", target_pr_count=0)
+
+    def test_split_月単位_件数を数えずに月ごとに分割される(self):
+        """Test split returns one window per month without counting PRs."""
+        count_prs = pytest.fail
+
+        windows = DatePartitioning(mode="month").split(DATE_RANGE, count_prs)
+
+        assert [w.start_date.month for w in windows] == [1, 2, 3, 4]
+
+    def test_split_適応的_目標件数以下になるまで2分割される(self):
+        """Test split halves windows until each holds at most the target PR count."""
+        counted = []
+
+        def count_prs(window):
+            counted.append(window)
+            # 4 PRs a day in January, none afterwards
+            january_end = min(window.end_date, datetime(2023, 1, 31, 23, 59, 59))
+            return max(0, (january_end - window.start_date).days + 1) * 4
+
+        windows = DatePartitioning(mode="adaptive", target_pr_count=100).split(DATE_RANGE, count_prs)
+
+        assert windows[0].start_date == DATE_RANGE.start_date
+        assert windows[-1].end_date == DATE_RANGE.end_date
+        assert all(count_prs(w) <= 100 for w in windows)
+        assert all(b.start_date > a.end_date for a, b in zip(windows, windows[1:]))
+        assert len(windows) < len(counted)
+
+    def test_split_適応的で目標件数以下_範囲がそのまま返される(self):
+        """Test split keeps a range holding few enough PRs whole."""
+        windows = DatePartitioning(mode="adaptive", target_pr_count=100).split(DATE_RANGE, lambda window: 100)
+
+        assert windows == [DATE_RANGE]
@@ -3,7 +3,7 @@ Tests for DateRange.
 """
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from scripts.src.domain.date_range import DateRange
 
 
@@ -39,4 +39,45 @@ class TestDateRange:
         end = datetime(2023, 1, 3)
         date_range = DateRange(start_date=start, end_date=end)
         target = datetime(2023, 1, 4)
-        assert date_range.contains(target) is False
\ No newline at end of file
+        assert date_range.contains(target) is False
+
+    def test_split_by_month_複数月の範囲_月ごとの連続した範囲が返される(self):
+        """Test split_by_month returns contiguous month windows clipped to the range."""
+        date_range = DateRange(start_date=datetime(2023, 1, 15), end_date=datetime(2023, 3, 10, 23, 59, 59))
+
+        windows = date_range.split_by_month()
+
+        assert [(w.start_date, w.end_date) for w in windows] == [
+            (datetime(2023, 1, 15), datetime(2023, 2, 1) - timedelta(microseconds=1)),
+            (datetime(2023, 2, 1), datetime(2023, 3, 1) - timedelta(microseconds=1)),
+            (datetime(2023, 3, 1), datetime(2023, 3, 10, 23, 59, 59)),
+        ]
+
+    def test_split_by_month_31日開始で翌月が短い_月ごとの範囲が返される(self):
+        """Test split_by_month starts on the 31st before a shorter month without failing."""
+        date_range = DateRange(start_date=datetime(2023, 1, 31), end_date=datetime(2023, 3, 10))
+
+        windows = date_range.split_by_month()
+
+        assert [(w.start_date, w.end_date) for w in windows] == [
+            (datetime(2023, 1, 31), datetime(2023, 2, 1) - timedelta(microseconds=1)),
+            (datetime(2023, 2, 1), datetime(2023, 3, 1) - timedelta(microseconds=1)),
+            (datetime(2023, 3, 1), datetime(2023, 3, 10)),
+        ]
+
+    def test_split_in_half_複数秒の範囲_秒の境界で2分割される(self):
+        """Test split_in_half splits at a whole second with no gap between the halves."""
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 3))
+
+        first, second = date_range.split_in_half()
+
+        assert first.start_date == datetime(2023, 1, 1)
+        assert second.start_date == datetime(2023, 1, 2)
+        assert second.start_date - first.end_date == timedelta(microseconds=1)
+        assert second.end_date == datetime(2023, 1, 3)
+
+    def test_split_in_half_1秒未満の範囲_Noneが返される(self):
+        """Test split_in_half returns None once a range cannot be split at a second."""
+        date_range = DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 1, 0, 0, 0, 999999))
+
+        assert date_range.split_in_half() is None
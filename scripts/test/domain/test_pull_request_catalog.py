@@ -0,0 +1,111 @@
+"""
+Tests for PullRequestCatalog.
+"""
+
+from datetime import datetime
+
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.pull_request_catalog import PullRequestCatalog
+from scripts.src.domain.pull_request_catalog_entry import PullRequestCatalogEntry
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+
+
+def _entry(number, closed_at, comment_count=None):
+    return PullRequestCatalogEntry(
+        number=number,
+        title=f"PR {number}",
+        closed_at=closed_at,
+        is_merged=True,
+        comment_count=comment_count
+    )
+
+
+def _day(day, hour=0, minute=0, second=0):
+    return datetime(2023, 1, day, hour, minute, second)
+
+
+class TestPullRequestCatalog:
+    """Test cases for PullRequestCatalog."""
+
+    def test_mark_covered_隣接する範囲_1つの範囲に統合される(self):
+        """Test mark_covered merges ranges that touch each other."""
+        catalog = PullRequestCatalog(RepositoryIdentifier(owner="owner", name="repo"))
+
+        catalog.mark_covered(DateRange(start_date=_day(3), end_date=_day(3, 23, 59, 59)))
+        catalog.mark_covered(DateRange(start_date=_day(1), end_date=_day(1, 23, 59, 59)))
+        catalog.mark_covered(DateRange(start_date=_day(2), end_date=_day(2, 23, 59, 59)))
+
+        assert catalog.covered_ranges == [DateRange(start_date=_day(1), end_date=_day(3, 23, 59, 59))]
+
+    def test_uncovered_ranges_一部のみ取得済み_未取得部分が返される(self):
+        """Test uncovered_ranges returns the gaps around covered ranges."""
+        catalog = PullRequestCatalog(
+            RepositoryIdentifier(owner="owner", name="repo"),
+            covered_ranges=[DateRange(start_date=_day(2), end_date=_day(3, 23, 59, 59))]
+        )
+
+        gaps = catalog.uncovered_ranges(DateRange(start_date=_day(1), end_date=_day(5, 23, 59, 59)))
+
+        assert gaps == [
+            DateRange(start_date=_day(1), end_date=_day(1, 23, 59, 59)),
+            DateRange(start_date=_day(4), end_date=_day(5, 23, 59, 59))
+        ]
+
+    def test_uncovered_ranges_境界の秒にクローズされたPR_未取得部分に含まれる(self):
+        """Test the gap after a window ending at .999999 contains a PR closed on the next whole second."""
+        catalog = PullRequestCatalog(
+            RepositoryIdentifier(owner="owner", name="repo"),
+            covered_ranges=[DateRange(start_date=_day(1), end_date=datetime(2023, 1, 31, 23, 59, 59, 999999))]
+        )
+        closed_on_boundary = datetime(2023, 2, 1)
+
+        gaps = catalog.uncovered_ranges(DateRange(start_date=_day(1), end_date=datetime(2023, 2, 28, 23, 59, 59)))
+
+        assert gaps == [DateRange(start_date=closed_on_boundary, end_date=datetime(2023, 2, 28, 23, 59, 59))]
+        assert gaps[0].contains(closed_on_boundary)
+
+    def test_mark_covered_間に整数秒を挟む範囲_統合されない(self):
+        """Test mark_covered keeps ranges apart when a whole second lies between them."""
+        catalog = PullRequestCatalog(RepositoryIdentifier(owner="owner", name="repo"))
+        january = DateRange(start_date=_day(1), end_date=datetime(2023, 1, 31, 23, 59, 59, 999999))
+        february = DateRange(start_date=datetime(2023, 2, 1, 0, 0, 0, 500000), end_date=datetime(2023, 2, 28))
+
+        catalog.mark_covered(january)
+        catalog.mark_covered(february)
+
+        assert catalog.covered_ranges == [january, february]
+        assert catalog.uncovered_ranges(DateRange(start_date=_day(1), end_date=datetime(2023, 2, 28))) == [
+            DateRange(start_date=datetime(2023, 2, 1), end_date=datetime(2023, 2, 1))
+        ]
+
+    def test_uncovered_ranges_全期間取得済み_空リストが返される(self):
+        """Test uncovered_ranges returns nothing for a fully covered range."""
+        catalog = PullRequestCatalog(
+            RepositoryIdentifier(owner="owner", name="repo"),
+            covered_ranges=[DateRange(start_date=_day(1), end_date=_day(9))]
+        )
+
+        assert catalog.uncovered_ranges(DateRange(start_date=_day(2), end_date=_day(3))) == []
+
+    def test_entries_within_範囲指定_範囲内のエントリがクローズ日時の降順で返される(self):
+        """Test entries_within returns entries of the range, most recently closed first."""
+        catalog = PullRequestCatalog(
+            RepositoryIdentifier(owner="owner", name="repo"),
+            entries=[_entry(1, _day(1)), _entry(2, _day(3)), _entry(3, _day(2)), _entry(4, _day(9))]
+        )
+
+        entries = catalog.entries_within(DateRange(start_date=_day(1), end_date=_day(3)))
+
+        assert [entry.number for entry in entries] == [2, 3, 1]
+
+    def test_add_コメント数のない再登録_既知のコメント数が保持される(self):
+        """Test add keeps the known comment count when the new entry has none."""
+        catalog = PullRequestCatalog(
+            RepositoryIdentifier(owner="owner", name="repo"),
+            entries=[_entry(1, _day(1), comment_count=4)]
+        )
+
+        catalog.add(_entry(1, _day(2)))
+
+        assert catalog.get(1).closed_at == _day(2)
+        assert catalog.get(1).comment_count == 4
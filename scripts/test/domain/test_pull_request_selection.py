@@ -0,0 +1,70 @@
+"""
+Tests for PullRequestSelection.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.pull_request_selection import PullRequestSelection
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+
+
+def _basic_info(**fields):
+    values = dict(
+        number=1,
+        title="PR",
+        closed_at=datetime(2023, 1, 1),
+        is_merged=True,
+        repository_id=RepositoryIdentifier(owner="owner", name="repo")
+    )
+    values.update(fields)
+    return PullRequestBasicInfo(**values)
+
+
+class TestPullRequestSelection:
+    """Test cases for PullRequestSelection."""
+
+    def test___init___負のコメント数_ValueErrorが発生する(self):
+        """Test __init__ rejects a negative minimum review comment count."""
+        with pytest.raises(ValueError):
+            PullRequestSelection(min_review_comments=-1)
+
+    def test_is_empty_条件なし_Trueが返される(self):
+        """Test is_empty tells whether the selection keeps every PR."""
+        assert PullRequestSelection().is_empty
+        assert not PullRequestSelection(merged_only=True).is_empty
+
+    def test_rejection_reason_未マージ_除外される(self):
+        """Test rejection_reason rejects unmerged PRs when only merged PRs are selected."""
+        selection = PullRequestSelection(merged_only=True)
+
+        assert selection.rejection_reason(_basic_info(is_merged=False)) == "not merged"
+        assert selection.matches(_basic_info(is_merged=True))
+
+    def test_rejection_reason_作成者パターン_ワイルドカードで照合される(self):
+        """Test rejection_reason matches author patterns with * and takes brackets literally."""
+        selection = PullRequestSelection(excluded_authors=("*[bot]", "renovate*"))
+
+        assert not selection.matches(_basic_info(author="dependabot[bot]"))
+        assert not selection.matches(_basic_info(author="Renovate-Bot"))
+        assert selection.matches(_basic_info(author="bot"))
+        assert selection.matches(_basic_info(author=None))
+
+    def test_rejection_reason_ベースブランチとラベル_不明な値は選択される(self):
+        """Test rejection_reason checks base branch and labels only when the listing provided them."""
+        selection = PullRequestSelection(base_branches=("main",), labels=("review", "bug"))
+
+        assert selection.matches(_basic_info(base_branch="main", labels=("bug",)))
+        assert not selection.matches(_basic_info(base_branch="release", labels=("bug",)))
+        assert not selection.matches(_basic_info(base_branch="main", labels=("docs",)))
+        assert selection.matches(_basic_info(base_branch=None, labels=None))
+
+    def test_rejection_reason_レビューコメント数_既知の数のみ判定される(self):
+        """Test rejection_reason rejects PRs with a known review comment count below the minimum."""
+        selection = PullRequestSelection(min_review_comments=1)
+
+        assert selection.rejection_reason(_basic_info(review_comment_count=0)) == "only 0 review comments"
+        assert selection.matches(_basic_info(review_comment_count=3))
+        assert selection.matches(_basic_info(review_comment_count=None))
@@ -0,0 +1,205 @@
+"""
+Tests for GraphQLPullRequestDetailFetcher.
+"""
+
+import re
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import pytz
+
+from scripts.src.application.exceptions.github_api_error import GitHubApiError
+from scripts.src.domain.comment_filter_rules import CommentFilterRules
+from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.fetchers.graphql_pull_request_detail_fetcher import GraphQLPullRequestDetailFetcher
+from scripts.src.infrastructure.filters.configurable_comment_filter import ConfigurableCommentFilter
+from scripts.src.infrastructure.repositories.github_payload_mapper import GitHubPayloadMapper
+from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+
+def _selected_author_fields():
+    query = GraphQLPullRequestDetailFetcher(MagicMock(), MagicMock(), MagicMock()).build_query([1])
+    return re.search(r"author \{ ([^}]*) \}", query).group(1).split()
+
+
+def _comment_node(database_id, body="Comment", author="reviewer", author_type="User"):
+    # The author holds only the fields the real query selects
+    author_node = {"login": author, "__typename": author_type}
+    author_node = {field: author_node[field] for field in _selected_author_fields()}
+    return {
+        "databaseId": database_id,
+        "path": "src/app.py",
+        "originalPosition": 3,
+        "commit": {"oid": "abc123"},
+        "originalCommit": {"oid": "def456"},
+        "author": author_node if author else None,
+        "createdAt": "2023-01-01T00:00:00Z",
+        "body": body,
+        "diffHunk": "@@ -1,3 +1,3 @@"
+    }
+
+
+def _pr_node(number, threads, has_more_threads=False):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "closedAt": "2023-01-02T00:00:00Z",
+        "merged": True,
+        "reviewThreads": {
+            "pageInfo": {"hasNextPage": has_more_threads},
+            "nodes": [
+                {"comments": {"pageInfo": {"hasNextPage": False}, "nodes": comments}}
+                for comments in threads
+            ]
+        }
+    }
+
+
+def _basic_info(number, repo_id):
+    return PullRequestBasicInfo(
+        number=number,
+        title=f"PR {number}",
+        closed_at=datetime(2023, 1, 2, tzinfo=pytz.UTC),
+        is_merged=True,
+        repository_id=repo_id
+    )
+
+
+class TestGraphQLPullRequestDetailFetcher:
+    """Test cases for GraphQLPullRequestDetailFetcher."""
+
+    def _create_fetcher(self, response, fallback_repository=None, batch_size=50, comment_filter=None):
+        client = MagicMock()
+        client.requester.graphql_url = "https://api.github.com/graphql"
+        client.requester.requestJsonAndCheck.return_value = ({}, response)
+        fetcher = GraphQLPullRequestDetailFetcher(
+            lambda: client,
+            fallback_repository or MagicMock(),
+            GitHubPayloadMapper(TimezoneConverter("UTC")),
+            batch_size=batch_size,
+            comment_filter=comment_filter
+        )
+        return fetcher, client
+
+    def test___init___バッチサイズが0_ValueErrorが発生する(self):
+        """Test __init__ rejects batch sizes below 1."""
+        with pytest.raises(ValueError):
+            GraphQLPullRequestDetailFetcher(MagicMock(), MagicMock(), MagicMock(), batch_size=0)
+
+    def test_build_query_複数PR_PR番号ごとのエイリアスが含まれる(self):
+        """Test build_query selects each PR under its own alias."""
+        fetcher, _ = self._create_fetcher({})
+
+        query = fetcher.build_query([12, 34])
+
+        assert "pr12: pullRequest(number: 12)" in query
+        assert "pr34: pullRequest(number: 34)" in query
+        assert "fragment PullRequestDetail on PullRequest" in query
+
+    def test_rate_limit_points_PR数_スレッドとコメントの接続数から点数が決まる(self):
+        """Test rate_limit_points charges one point per 100 connection requests, at least one."""
+        assert GraphQLPullRequestDetailFetcher.rate_limit_points(50) == 26
+        assert GraphQLPullRequestDetailFetcher.rate_limit_points(1) == 1
+
+    def test_fetch_details_複数PR_1クエリで入力順に変換される(self):
+        """Test fetch_details maps all PRs of one query in input order."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        response = {"data": {"repository": {
+            "pr2": _pr_node(2, [[_comment_node(30)]]),
+            "pr1": _pr_node(1, [[_comment_node(20, body="Later")], [_comment_node(10, body="Earlier", author=None)]])
+        }}}
+        fetcher, client = self._create_fetcher(response)
+
+        results = fetcher.fetch_details([_basic_info(1, repo_id), _basic_info(2, repo_id)])
+
+        client.requester.requestJsonAndCheck.assert_called_once()
+        args, kwargs = client.requester.requestJsonAndCheck.call_args
+        assert args == ("POST", "https://api.github.com/graphql")
+        assert kwargs["input"]["variables"] == {"owner": "owner", "name": "repo"}
+        assert [result.number for result in results] == [1, 2]
+        assert [comment.body for comment in results[0].review_comments] == ["Earlier", "Later"]
+        first_comment = results[0].review_comments[0]
+        assert first_comment.comment_id == 10
+        assert first_comment.author == GitHubPayloadMapper.GHOST_LOGIN
+        assert first_comment.commit_id == "abc123"
+        assert first_comment.diff_context == "@@ -1,3 +1,3 @@"
+        assert results[0].closed_at == datetime(2023, 1, 2, tzinfo=pytz.UTC)
+        assert results[0].repository_id == repo_id
+
+    def test_fetch_details_フィルター指定_除外コメントは変換されない(self):
+        """Test fetch_details drops rejected comment nodes before building review comments."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        response = {"data": {"repository": {
+            "pr1": _pr_node(1, [[
+                _comment_node(10, body="Handle the timeout"),
+                _comment_node(11, author="ci-app", author_type="Bot"),
+                _comment_node(12, body="👍")
+            ]])
+        }}}
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(
+            exclude_bot_users=True, body_presets=("emoji-only",)
+        ))
+        fetcher, _ = self._create_fetcher(response, comment_filter=comment_filter)
+
+        results = fetcher.fetch_details([_basic_info(1, repo_id)])
+
+        assert [comment.comment_id for comment in results[0].review_comments] == [10]
+
+    def test_fetch_details_ボットの作成者_REST同様に接尾辞付きのログインになる(self):
+        """Test fetch_details reports bot logins with the "[bot]" suffix and applies the bot suffix rule."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        response = {"data": {"repository": {
+            "pr1": _pr_node(1, [[
+                _comment_node(10, author="ci-app", author_type="Bot"),
+                _comment_node(11, author="reviewer")
+            ]])
+        }}}
+        fetcher, _ = self._create_fetcher(response)
+        filtered_fetcher, _ = self._create_fetcher(
+            response, comment_filter=ConfigurableCommentFilter(CommentFilterRules(exclude_bot_suffix=True))
+        )
+
+        results = fetcher.fetch_details([_basic_info(1, repo_id)])
+        filtered_results = filtered_fetcher.fetch_details([_basic_info(1, repo_id)])
+
+        assert [comment.author for comment in results[0].review_comments] == ["ci-app[bot]", "reviewer"]
+        assert [comment.comment_id for comment in filtered_results[0].review_comments] == [11]
+
+    def test_fetch_details_スレッドが1ページを超える_RESTで再取得される(self):
+        """Test fetch_details falls back to REST for PRs with truncated review threads."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        fallback_repository = MagicMock()
+        response = {"data": {"repository": {
+            "pr1": _pr_node(1, [[_comment_node(10)]], has_more_threads=True)
+        }}}
+        fetcher, _ = self._create_fetcher(response, fallback_repository)
+
+        results = fetcher.fetch_details([_basic_info(1, repo_id)])
+
+        fallback_repository.get_full_pr_metadata.assert_called_once_with(1, repo_id)
+        assert results == [fallback_repository.get_full_pr_metadata.return_value]
+
+    def test_fetch_details_一部PRのみエラー_RESTで再取得される(self):
+        """Test fetch_details falls back to REST for PRs the query could not resolve."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        fallback_repository = MagicMock()
+        response = {
+            "data": {"repository": {"pr1": _pr_node(1, []), "pr2": None}},
+            "errors": [{"message": "Could not resolve to a PullRequest with the number of 2."}]
+        }
+        fetcher, _ = self._create_fetcher(response, fallback_repository)
+
+        results = fetcher.fetch_details([_basic_info(1, repo_id), _basic_info(2, repo_id)])
+
+        assert results[0].number == 1
+        fallback_repository.get_full_pr_metadata.assert_called_once_with(2, repo_id)
+
+    def test_fetch_details_データなし_GitHubApiErrorが発生する(self):
+        """Test fetch_details raises GitHubApiError when the query returns no data."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        fetcher, _ = self._create_fetcher({"data": None, "errors": [{"message": "Bad credentials"}]})
+
+        with pytest.raises(GitHubApiError):
+            fetcher.fetch_details([_basic_info(1, repo_id)])
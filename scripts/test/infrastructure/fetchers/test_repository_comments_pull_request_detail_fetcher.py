@@ -0,0 +1,68 @@
+"""
+Tests for RepositoryCommentsPullRequestDetailFetcher.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.fetchers.repository_comments_pull_request_detail_fetcher import (
+    RepositoryCommentsPullRequestDetailFetcher
+)
+
+
+def _basic_info(number, repo_id, created_at):
+    return PullRequestBasicInfo(
+        number=number,
+        title=f"PR {number}",
+        closed_at=datetime(2023, 2, 1),
+        is_merged=True,
+        repository_id=repo_id,
+        created_at=created_at
+    )
+
+
+class TestRepositoryCommentsPullRequestDetailFetcher:
+    """Test cases for RepositoryCommentsPullRequestDetailFetcher."""
+
+    def test___init___バッチサイズが0_ValueErrorが発生する(self):
+        """Test __init__ rejects batch sizes below 1."""
+        with pytest.raises(ValueError):
+            RepositoryCommentsPullRequestDetailFetcher(MagicMock(), batch_size=0)
+
+    def test_batch_size_未指定_Noneが返される(self):
+        """Test batch_size defaults to fetching all PRs together."""
+        assert RepositoryCommentsPullRequestDetailFetcher(MagicMock()).batch_size is None
+
+    def test_fetch_details_複数PR_最古の作成日時以降のコメントが振り分けられる(self):
+        """Test fetch_details lists comments once since the oldest PR and assigns them per PR."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        github_repository = MagicMock()
+        comment = MagicMock()
+        github_repository.get_review_comments_by_pr.return_value = {1: [comment], 99: [MagicMock()]}
+        fetcher = RepositoryCommentsPullRequestDetailFetcher(github_repository)
+
+        results = fetcher.fetch_details([
+            _basic_info(1, repo_id, datetime(2023, 1, 10)),
+            _basic_info(2, repo_id, datetime(2023, 1, 5))
+        ])
+
+        github_repository.get_review_comments_by_pr.assert_called_once_with(repo_id, datetime(2023, 1, 5))
+        assert [result.number for result in results] == [1, 2]
+        assert results[0].review_comments == [comment]
+        assert results[1].review_comments == []
+        assert results[0].closed_at == datetime(2023, 2, 1)
+
+    def test_fetch_details_作成日時不明のPRあり_全期間のコメントが取得される(self):
+        """Test fetch_details lists all comments when a PR creation time is unknown."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        github_repository = MagicMock()
+        github_repository.get_review_comments_by_pr.return_value = {}
+        fetcher = RepositoryCommentsPullRequestDetailFetcher(github_repository)
+
+        fetcher.fetch_details([_basic_info(1, repo_id, None), _basic_info(2, repo_id, datetime(2023, 1, 5))])
+
+        github_repository.get_review_comments_by_pr.assert_called_once_with(repo_id, None)
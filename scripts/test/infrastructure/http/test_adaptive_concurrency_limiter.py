@@ -0,0 +1,69 @@
+"""
+Tests for AdaptiveConcurrencyLimiter.
+"""
+
+import pytest
+
+from scripts.src.infrastructure.http.adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter."""
+
+    def test___init___最小値が最大値を超える_ValueErrorが発生する(self):
+        """Test __init__ rejects inconsistent bounds."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(max_limit=2, min_limit=3)
+
+    def test_release_レート制限_上限が半分になる(self):
+        """Test release halves the limit after a throttled response."""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        limiter.acquire()
+        limiter.release(latency=0.1, throttled=True)
+
+        assert limiter.limit == 4
+
+    def test_release_連続したレート制限_往復ごとに一度だけ減少する(self):
+        """Test release decreases at most once per round trip."""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(latency=0.1, throttled=True)
+
+        assert limiter.limit == 4
+
+    def test_release_正常応答が続く_上限まで回復する(self):
+        """Test release raises the limit additively back to the maximum."""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4)
+        limiter.acquire()
+        limiter.release(latency=0.1, throttled=True)
+
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(latency=0.1, throttled=False)
+
+        assert limiter.limit == 4
+
+    def test_release_レイテンシ悪化_上限が下がる(self):
+        """Test release treats a sustained latency increase as congestion."""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        for latency in [0.1, 0.1, 2.0, 2.0, 2.0]:
+            limiter.acquire()
+            limiter.release(latency=latency, throttled=False)
+
+        assert limiter.limit < 8
+
+    def test_release_遅い種類と速い種類が混在_上限が下がらない(self):
+        """Test release compares latencies only within their class, so slow GraphQL batches are no congestion."""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(latency=0.1, throttled=False, latency_class="core")
+            limiter.acquire()
+            limiter.release(latency=3.0, throttled=False, latency_class="graphql")
+
+        assert limiter.limit == 8
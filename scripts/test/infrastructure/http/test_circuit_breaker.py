@@ -0,0 +1,116 @@
+"""
+Tests for CircuitBreaker.
+"""
+
+import pytest
+
+from scripts.src.infrastructure.http.circuit_breaker import CircuitBreaker
+
+
+class _FakeClock:
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _create_breaker(clock, failure_threshold=3):
+    return CircuitBreaker(
+        failure_threshold=failure_threshold,
+        cooldown=10.0,
+        max_cooldown=25.0,
+        clock=clock,
+        sleep=clock.sleep
+    )
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test___init___しきい値が0_ValueErrorが発生する(self):
+        """Test __init__ rejects a failure threshold below 1."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_record_failure_しきい値未満の連続失敗_閉じたまま待たずに送信される(self):
+        """Test the circuit stays closed until the threshold of consecutive failures is reached."""
+        clock = _FakeClock(100.0)
+        breaker = _create_breaker(clock)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.before_request()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert clock.sleeps == []
+
+    def test_record_success_失敗の間に成功_連続失敗数がリセットされる(self):
+        """Test a success in between resets the count of consecutive failures."""
+        clock = _FakeClock(100.0)
+        breaker = _create_breaker(clock)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_before_request_連続失敗で開いた回路_クールダウン後に試行が許可される(self):
+        """Test an open circuit makes requests wait for the cooldown and then lets a probe through."""
+        clock = _FakeClock(100.0)
+        breaker = _create_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.before_request()
+
+        assert clock.sleeps == [10.0]
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    def test_record_success_試行が成功_回路が閉じる(self):
+        """Test a successful probe closes the circuit."""
+        clock = _FakeClock(100.0)
+        breaker = _create_breaker(clock, failure_threshold=1)
+        breaker.record_failure()
+        breaker.before_request()
+
+        breaker.record_success()
+        breaker.before_request()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert clock.sleeps == [10.0]
+
+    def test_record_failure_試行が失敗_倍のクールダウンで再び開く(self):
+        """Test a failed probe opens the circuit again with a doubled cooldown, capped at the maximum."""
+        clock = _FakeClock(100.0)
+        breaker = _create_breaker(clock, failure_threshold=1)
+        breaker.record_failure()
+
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure()
+        breaker.before_request()
+
+        assert clock.sleeps == [10.0, 20.0, 25.0]
+
+    def test_abandon_試行が結果なく終了_次のリクエストが試行する(self):
+        """Test an abandoned probe lets the next request probe without waiting again."""
+        clock = _FakeClock(100.0)
+        breaker = _create_breaker(clock, failure_threshold=1)
+        breaker.record_failure()
+        breaker.before_request()
+
+        breaker.abandon()
+        breaker.before_request()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert clock.sleeps == [10.0]
@@ -0,0 +1,48 @@
+"""
+Tests for DiskHttpResponseCache.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.src.infrastructure.http.disk_http_response_cache import CachedHttpResponse, DiskHttpResponseCache
+
+
+class TestDiskHttpResponseCache:
+    """Test cases for DiskHttpResponseCache."""
+
+    def test_put_保存後_getで同じ内容が返される(self, tmp_path):
+        """Test put stores entries that get reads back."""
+        cache = DiskHttpResponseCache(tmp_path)
+        entry = CachedHttpResponse(
+            url="https://api.github.com/user",
+            etag='"abc"',
+            last_modified=None,
+            headers={"ETag": '"abc"'},
+            body='{"login": "octocat"}'
+        )
+        key = cache.make_key(entry.url, "scope")
+
+        cache.put(key, entry)
+
+        assert cache.get(key) == entry
+        assert list(tmp_path.rglob("*.tmp")) == []
+
+    def test_get_壊れたエントリ_Noneが返される(self, tmp_path):
+        """Test get ignores unreadable entries."""
+        cache = DiskHttpResponseCache(tmp_path)
+        key = cache.make_key("https://api.github.com/user", "scope")
+        path = tmp_path / key[:2] / f"{key}.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{broken", encoding="utf-8")
+
+        assert cache.get(key) is None
+
+    def test_make_key_スコープが異なる_別のキーが返される(self):
+        """Test make_key separates entries by scope."""
+        assert DiskHttpResponseCache.make_key("https://x", "a") != DiskHttpResponseCache.make_key("https://x", "b")
+
+    def test_default_directory_XDG_CACHE_HOME指定_その配下が返される(self):
+        """Test default_directory honours XDG_CACHE_HOME."""
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": "/tmp/cache-home"}):
+            assert DiskHttpResponseCache.default_directory() == Path("/tmp/cache-home/agent-md-from-github/http")
@@ -0,0 +1,95 @@
+"""
+Tests for ETagCacheInterceptor.
+"""
+
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import requests
+
+from scripts.src.infrastructure.http.disk_http_response_cache import DiskHttpResponseCache
+from scripts.src.infrastructure.http.etag_cache_interceptor import ETagCacheInterceptor
+from scripts.src.infrastructure.http.http_request import HttpRequest
+
+
+def _response(status_code, body="", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+def _request(token="token-a", method="GET"):
+    return HttpRequest(
+        method=method,
+        url="https://api.github.com/repos/owner/repo/pulls?page=1",
+        headers={"Authorization": f"token {token}", "Accept": "application/vnd.github+json"}
+    )
+
+
+class TestETagCacheInterceptor:
+    """Test cases for ETagCacheInterceptor."""
+
+    def test_intercept_初回取得_ETag付きレスポンスが保存される(self, tmp_path):
+        """Test intercept stores responses carrying an ETag."""
+        interceptor = ETagCacheInterceptor(DiskHttpResponseCache(tmp_path))
+        call_next = MagicMock(return_value=_response(200, "[1]", {"ETag": '"abc"', "Content-Encoding": "gzip"}))
+
+        response = interceptor.intercept(_request(), call_next)
+
+        assert response.text == "[1]"
+        sent_request = call_next.call_args.args[0]
+        assert sent_request.header("If-None-Match") is None
+        assert len(list(tmp_path.rglob("*.json"))) == 1
+
+    def test_intercept_未変更_キャッシュの本文が200で返される(self, tmp_path):
+        """Test intercept revalidates with If-None-Match and serves 304 responses from the cache."""
+        interceptor = ETagCacheInterceptor(DiskHttpResponseCache(tmp_path))
+        interceptor.intercept(_request(), MagicMock(return_value=_response(200, "[1]", {"ETag": '"abc"'})))
+        call_next = MagicMock(return_value=_response(304, headers={"X-RateLimit-Remaining": "4999"}))
+
+        response = interceptor.intercept(_request(), call_next)
+
+        assert call_next.call_args.args[0].header("If-None-Match") == '"abc"'
+        assert response.status_code == 200
+        assert response.json() == [1]
+        assert response.headers["ETag"] == '"abc"'
+        assert response.headers["X-RateLimit-Remaining"] == "4999"
+
+    def test_intercept_別トークン_キャッシュが共有されない(self, tmp_path):
+        """Test intercept keeps separate entries per credential."""
+        interceptor = ETagCacheInterceptor(DiskHttpResponseCache(tmp_path))
+        interceptor.intercept(_request("token-a"), MagicMock(return_value=_response(200, "[1]", {"ETag": '"abc"'})))
+        call_next = MagicMock(return_value=_response(200, "[2]", {"ETag": '"def"'}))
+
+        interceptor.intercept(_request("token-b"), call_next)
+
+        assert call_next.call_args.args[0].header("If-None-Match") is None
+
+    def test_intercept_同じ資格情報の更新されたトークン_キャッシュが共有される(self, tmp_path):
+        """Test intercept keys entries on the credential identity the token pool sets, not the rotating token."""
+        interceptor = ETagCacheInterceptor(DiskHttpResponseCache(tmp_path))
+        installation = "github-app-installation 42"
+        interceptor.intercept(
+            replace(_request("ghs_1"), credential_id=installation),
+            MagicMock(return_value=_response(200, "[1]", {"ETag": '"abc"'}))
+        )
+        call_next = MagicMock(return_value=_response(304))
+
+        response = interceptor.intercept(replace(_request("ghs_2"), credential_id=installation), call_next)
+
+        assert call_next.call_args.args[0].header("If-None-Match") == '"abc"'
+        assert response.json() == [1]
+
+    def test_intercept_GET以外_キャッシュされない(self, tmp_path):
+        """Test intercept passes non-GET requests through untouched."""
+        interceptor = ETagCacheInterceptor(DiskHttpResponseCache(tmp_path))
+        request = _request(method="POST")
+        call_next = MagicMock(return_value=_response(200, "{}", {"ETag": '"abc"'}))
+
+        interceptor.intercept(request, call_next)
+
+        call_next.assert_called_once_with(request)
+        assert list(tmp_path.rglob("*.json")) == []
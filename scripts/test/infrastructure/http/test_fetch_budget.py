@@ -0,0 +1,56 @@
+"""
+Tests for FetchBudget.
+"""
+
+import pytest
+
+from scripts.src.infrastructure.http.fetch_budget import FetchBudget
+
+
+class _FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestFetchBudget:
+    """Test cases for FetchBudget."""
+
+    def test___init___リクエスト上限が0_ValueErrorが発生する(self):
+        """Test __init__ rejects a request budget below 1."""
+        with pytest.raises(ValueError):
+            FetchBudget(max_requests=0)
+
+    def test___init___期限が0_ValueErrorが発生する(self):
+        """Test __init__ rejects a deadline that is not positive."""
+        with pytest.raises(ValueError):
+            FetchBudget(deadline=0)
+
+    def test_exhausted_reason_上限未満_Noneが返される(self):
+        """Test exhausted_reason reports nothing while requests and time are left."""
+        clock = _FakeClock(100.0)
+        budget = FetchBudget(max_requests=2, deadline=60.0, clock=clock)
+        budget.record_request()
+        clock.now = 159.0
+
+        assert budget.exhausted_reason() is None
+
+    def test_exhausted_reason_リクエスト上限に到達_理由が返される(self):
+        """Test exhausted_reason reports the request budget once it is used up."""
+        budget = FetchBudget(max_requests=2)
+        budget.record_request()
+        budget.record_request()
+
+        assert budget.exhausted_reason() == "request budget of 2 used up"
+        assert budget.requests_sent == 2
+
+    def test_exhausted_reason_期限に到達_理由が返される(self):
+        """Test exhausted_reason reports the deadline counted from the creation of the budget."""
+        clock = _FakeClock(100.0)
+        budget = FetchBudget(deadline=1800.0, clock=clock)
+        clock.now = 1900.0
+
+        assert budget.exhausted_reason() == "deadline of 1800s reached"
+
@@ -0,0 +1,102 @@
+"""
+Tests for FetchMetrics.
+"""
+
+from scripts.src.infrastructure.http.fetch_metrics import FetchMetrics
+
+
+class _FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestFetchMetrics:
+    """Test cases for FetchMetrics."""
+
+    def test_measure_同じフェーズを複数回_時間が合算される(self):
+        """Test measure adds up the times of every block of a phase."""
+        clock = _FakeClock()
+        metrics = FetchMetrics(clock)
+
+        for duration in (1.5, 2.0):
+            with metrics.measure("detail"):
+                clock.now += duration
+
+        summary = metrics.summary()
+        assert summary["phase_seconds"]["detail"] == 3.5
+        assert summary["phase_seconds"]["listing"] == 0.0
+
+    def test_measure_例外発生_時間が記録される(self):
+        """Test measure records the time of a block left by an exception."""
+        clock = _FakeClock()
+        metrics = FetchMetrics(clock)
+
+        try:
+            with metrics.measure("disk_write"):
+                clock.now += 0.25
+                raise OSError("disk full")
+        except OSError:
+            pass
+
+        assert metrics.summary()["phase_seconds"]["disk_write"] == 0.25
+
+    def test_record_response_複数の応答_エンドポイント別件数とバイト数と百分位が集計される(self):
+        """Test record_response counts requests per endpoint and summarizes bytes and latency percentiles."""
+        metrics = FetchMetrics(_FakeClock())
+
+        for index in range(100):
+            endpoint = "GET /search/issues" if index < 10 else "GET /repos/{owner}/{repo}/pulls/{number}"
+            metrics.record_response(endpoint, latency=(index + 1) / 100, bytes_received=10)
+
+        summary = metrics.summary()
+        assert summary["requests"] == {
+            "total": 100,
+            "by_endpoint": {"GET /repos/{owner}/{repo}/pulls/{number}": 90, "GET /search/issues": 10}
+        }
+        assert summary["bytes_received"] == 1000
+        assert summary["latency_seconds"] == {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+    def test_record_response_レート制限の使用量_窓ごとの増分がリソース別に合算される(self):
+        """Test rate-limit units are the rise of the reported usage per window, summed by resource."""
+        metrics = FetchMetrics(_FakeClock())
+        core = ("credential", "core", "1700000000")
+        for used in (11, 12, 15):
+            metrics.record_response("GET /a", 0.1, 0, core, used)
+        # A conditional request answered from the cache does not use a unit
+        metrics.record_response("GET /a", 0.1, 0, core, 15, cost=0)
+        metrics.record_response("POST /graphql", 0.1, 0, ("credential", "graphql", "1700000000"), 26, cost=1)
+        metrics.record_response("POST /graphql", 0.1, 0, ("credential", "graphql", "1700000000"), 52, cost=1)
+
+        assert metrics.summary()["rate_limit_units"] == {"core": 5, "graphql": 27}
+
+    def test_record_lazy_completions_複数回_合計が集計される(self):
+        """Test record_lazy_completions adds up the hidden completion requests of the run."""
+        metrics = FetchMetrics(_FakeClock())
+
+        metrics.record_lazy_completions(2)
+        metrics.record_lazy_completions(3)
+
+        assert metrics.summary()["lazy_completions"] == 5
+
+    def test_summary_保存済みPR_スループットが計算される(self):
+        """Test summary divides the saved PRs and comments by the wall time."""
+        clock = _FakeClock()
+        metrics = FetchMetrics(clock)
+        metrics.record_saved_pr(3)
+        metrics.record_saved_pr(5)
+        clock.now = 4.0
+
+        summary = metrics.summary()
+
+        assert summary["wall_seconds"] == 4.0
+        assert summary["throughput"] == {"prs": 2, "comments": 8, "prs_per_second": 0.5, "comments_per_second": 2.0}
+
+    def test_summary_記録なし_百分位はNoneになる(self):
+        """Test summary reports no latency percentiles before any response."""
+        summary = FetchMetrics(_FakeClock()).summary()
+
+        assert summary["latency_seconds"] == {"p50": None, "p95": None, "p99": None}
+        assert summary["requests"]["total"] == 0
@@ -0,0 +1,58 @@
+"""
+Tests for GitHubHttpTransport.
+"""
+
+from unittest.mock import patch
+
+import requests
+
+from scripts.src.infrastructure.http.github_http_transport import GitHubHttpTransport
+from scripts.src.infrastructure.http.http_interceptor import HttpInterceptor
+from scripts.src.infrastructure.http.http_request import HttpRequest
+
+
+class _RecordingInterceptor(HttpInterceptor):
+    def __init__(self, name, calls):
+        self._name = name
+        self._calls = calls
+
+    def intercept(self, request, call_next):
+        self._calls.append(self._name)
+        return call_next(request.with_headers(**{f"X_{self._name}": "1"}))
+
+
+class TestGitHubHttpTransport:
+    """Test cases for GitHubHttpTransport."""
+
+    def test_send_複数インターセプター_登録順に適用される(self):
+        """Test send applies interceptors in order before the network call."""
+        calls = []
+        transport = GitHubHttpTransport([_RecordingInterceptor("A", calls)])
+        transport.add_interceptor(_RecordingInterceptor("B", calls))
+        response = requests.Response()
+
+        with patch.object(transport._session, "request", return_value=response) as mock_request:
+            result = transport.send(HttpRequest(method="GET", url="https://api.github.com/user"))
+
+        assert result is response
+        assert calls == ["A", "B"]
+        _, kwargs = mock_request.call_args
+        assert kwargs["headers"] == {"X-A": "1", "X-B": "1"}
+        assert kwargs["allow_redirects"] is False
+
+    def test_connection_classes_リクエスト記録後_トランスポート経由で送信される(self):
+        """Test connection classes translate PyGithub calls into transport requests."""
+        transport = GitHubHttpTransport()
+        _, https_class = transport.connection_classes()
+        response = requests.Response()
+        response.status_code = 200
+
+        with patch.object(transport, "send", return_value=response) as mock_send:
+            connection = https_class("api.github.com", timeout=15)
+            connection.request("GET", "/user?page=2", None, {"Authorization": "token x"})
+            result = connection.getresponse()
+
+        sent = mock_send.call_args.args[0]
+        assert sent.url == "https://api.github.com:443/user?page=2"
+        assert sent.timeout == 15
+        assert result.status == 200
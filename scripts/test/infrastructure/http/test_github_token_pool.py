@@ -0,0 +1,97 @@
+"""
+Tests for GitHubTokenPool.
+"""
+
+import pytest
+
+from scripts.src.infrastructure.http.github_token_pool import GitHubTokenPool, RotatingTokenSource
+
+
+class TestGitHubTokenPool:
+    """Test cases for GitHubTokenPool."""
+
+    def test___init___トークンなし_ValueErrorが発生する(self):
+        """Test __init__ rejects an empty pool."""
+        with pytest.raises(ValueError):
+            GitHubTokenPool(["", ""])
+
+    def test_next_token_予算あり_順番に返される(self):
+        """Test next_token hands out the tokens round-robin."""
+        pool = GitHubTokenPool(["a", "b", "c"], clock=lambda: 1000.0)
+
+        assert [pool.next_token("core") for _ in range(4)] == ["a", "b", "c", "a"]
+
+    def test_next_token_使い切ったトークン_リセットまで飛ばされる(self):
+        """Test next_token skips a token whose budget ran out until its reset."""
+        now = [1000.0]
+        pool = GitHubTokenPool(["a", "b"], clock=lambda: now[0])
+        pool.record("a", "core", limit=5000, remaining=0, reset_at=2000.0)
+
+        assert [pool.next_token("core") for _ in range(2)] == ["b", "b"]
+        assert pool.next_token("graphql") == "a"
+
+        now[0] = 2000.0
+        assert {pool.next_token("core") for _ in range(2)} == {"a", "b"}
+
+    def test_next_token_全トークン枯渇_最初にリセットされるトークンが返される(self):
+        """Test next_token returns the earliest resetting token once all ran out, unless all were tried."""
+        pool = GitHubTokenPool(["a", "b"], clock=lambda: 1000.0)
+        pool.record("a", "core", limit=5000, remaining=0, reset_at=3000.0)
+        pool.record("b", "core", limit=5000, remaining=0, reset_at=2000.0)
+
+        assert pool.next_token("core") == "b"
+        assert pool.next_token("core", exclude=["a"]) is None
+
+    def test_next_token_更新されるトークン_予算が引き継がれる(self):
+        """Test a credential keeps its budget when its token is replaced by its source."""
+        tokens = iter(["ghs_1", "ghs_2"])
+        pool = GitHubTokenPool([lambda: next(tokens), "fixed"], clock=lambda: 1000.0)
+
+        assert pool.next_token("core") == "ghs_1"
+        pool.record("ghs_1", "core", limit=15000, remaining=0, reset_at=2000.0)
+
+        assert pool.next_token("core") == "fixed"
+        assert pool.next_token("core") == "fixed"
+        pool.record("fixed", "core", limit=5000, remaining=0, reset_at=3000.0)
+        assert pool.next_token("core") == "ghs_2"
+        assert pool.label("ghs_2") == "token 1 of 2"
+
+    def test_credential_id_更新されるトークンの資格情報_トークンによらず同じIDが返される(self):
+        """Test credential_id reports the identity of a rotating source and None for fixed tokens."""
+        class Installation(RotatingTokenSource):
+            def __init__(self):
+                self.tokens = iter(["ghs_1", "ghs_2"])
+
+            def get_token(self):
+                return next(self.tokens)
+
+            def credential_id(self):
+                return "github-app-installation 42"
+
+        pool = GitHubTokenPool([Installation(), "fixed"], clock=lambda: 1000.0)
+        first = pool.next_token("core")
+        pool.next_token("core")
+        second = pool.next_token("core")
+
+        assert (first, second) == ("ghs_1", "ghs_2")
+        assert pool.credential_id(first) == pool.credential_id(second) == "github-app-installation 42"
+        assert pool.credential_id("fixed") is None
+
+    def test_record_古い応答_最新の残量が維持される(self):
+        """Test record keeps the lowest count of a window and ignores older windows."""
+        pool = GitHubTokenPool(["a"], clock=lambda: 1000.0)
+        pool.record("a", "core", limit=5000, remaining=10, reset_at=2000.0)
+        pool.record("a", "core", limit=5000, remaining=12, reset_at=2000.0)
+        pool.record("a", "core", limit=5000, remaining=0, reset_at=1500.0)
+
+        assert pool.combined_budget("core") == (5000, 10, 2000.0)
+
+    def test_combined_budget_一部観測_未観測トークンは上限で数えられる(self):
+        """Test combined_budget sums the tokens and counts unobserved ones at the limit."""
+        pool = GitHubTokenPool(["a", "b", "c"], clock=lambda: 1000.0)
+        assert pool.combined_budget("core") is None
+
+        pool.record("a", "core", limit=5000, remaining=100, reset_at=2000.0)
+        pool.record("b", "core", limit=5000, remaining=0, reset_at=3000.0)
+
+        assert pool.combined_budget("core") == (15000, 5100, 3000.0)
@@ -0,0 +1,145 @@
+"""
+Tests for HedgingInterceptor.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from scripts.src.infrastructure.http.hedging_interceptor import HedgingInterceptor
+from scripts.src.infrastructure.http.http_request import HttpRequest
+
+
+def _response(status_code=200, body=b"[]"):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    return response
+
+
+GET_REQUEST = HttpRequest(method="GET", url="https://api.github.com/repos/owner/repo/pulls/1/comments", timeout=15)
+POST_REQUEST = HttpRequest(method="POST", url="https://api.github.com/graphql", body=b"{}")
+
+
+def _prime_latencies(interceptor, latency=0.01, count=20):
+    """Record enough fast requests of the core resource for hedging to start."""
+    for _ in range(count):
+        interceptor._record_latency("core", latency)
+
+
+class TestHedgingInterceptor:
+    """Test cases for HedgingInterceptor."""
+
+    def test___init___タイムアウトが0_ValueErrorが発生する(self):
+        """Test __init__ rejects timeouts that are not positive."""
+        with pytest.raises(ValueError):
+            HedgingInterceptor(timeout=0)
+
+    def test_intercept_期限内に応答_タイムアウト付きで送信される(self):
+        """Test intercept sends the request with the configured socket timeout."""
+        interceptor = HedgingInterceptor(timeout=5.0)
+        sent = []
+
+        def call_next(request):
+            sent.append(request)
+            return _response()
+
+        response = interceptor.intercept(GET_REQUEST, call_next)
+
+        assert response.status_code == 200
+        assert [request.timeout for request in sent] == [5.0]
+
+    def test_intercept_期限超過_Timeoutが発生する(self):
+        """Test intercept gives up on a request that does not answer within the timeout."""
+        interceptor = HedgingInterceptor(timeout=0.05)
+        release = threading.Event()
+
+        def call_next(request):
+            release.wait(5)
+            return _response()
+
+        try:
+            with pytest.raises(requests.Timeout, match="timed out after 0.05s"):
+                interceptor.intercept(GET_REQUEST, call_next)
+        finally:
+            release.set()
+
+    def test_intercept_送信失敗_例外がそのまま発生する(self):
+        """Test intercept raises the error of a failed attempt."""
+        interceptor = HedgingInterceptor(timeout=5.0)
+
+        def call_next(request):
+            raise requests.ConnectionError("reset")
+
+        with pytest.raises(requests.ConnectionError, match="reset"):
+            interceptor.intercept(GET_REQUEST, call_next)
+
+    def test_intercept_p95超過のGET_ヘッジの応答が使用される(self):
+        """Test intercept hedges a GET slower than the 95th percentile and returns the first answer."""
+        interceptor = HedgingInterceptor(timeout=5.0, hedging=True)
+        _prime_latencies(interceptor)
+        release = threading.Event()
+        calls = []
+        lock = threading.Lock()
+
+        def call_next(request):
+            with lock:
+                calls.append(request)
+                attempt = len(calls)
+            if attempt == 1:
+                release.wait(5)
+                return _response(body=b"original")
+            return _response(body=b"hedge")
+
+        try:
+            response = interceptor.intercept(GET_REQUEST, call_next)
+        finally:
+            release.set()
+
+        assert response.content == b"hedge"
+        assert len(calls) == 2
+        assert interceptor.hedges_sent == 1
+        assert interceptor.hedges_won == 1
+
+    def test_intercept_POSTリクエスト_ヘッジされない(self):
+        """Test intercept never hedges requests that are not idempotent GETs."""
+        interceptor = HedgingInterceptor(timeout=5.0, hedging=True)
+        _prime_latencies(interceptor)
+        calls = []
+
+        def call_next(request):
+            calls.append(request)
+            time.sleep(0.2)
+            return _response()
+
+        interceptor.intercept(POST_REQUEST, call_next)
+
+        assert len(calls) == 1
+        assert interceptor.hedges_sent == 0
+
+    def test_intercept_レイテンシ不足_ヘッジされない(self):
+        """Test intercept does not hedge before enough latencies are known."""
+        interceptor = HedgingInterceptor(timeout=5.0, hedging=True)
+        _prime_latencies(interceptor, count=5)
+        calls = []
+
+        def call_next(request):
+            calls.append(request)
+            time.sleep(0.2)
+            return _response()
+
+        interceptor.intercept(GET_REQUEST, call_next)
+
+        assert len(calls) == 1
+        assert interceptor.hedges_sent == 0
+
+    def test__hedge_delay_記録済みレイテンシ_95パーセンタイルが返される(self):
+        """Test _hedge_delay waits for the 95th percentile latency of the resource."""
+        interceptor = HedgingInterceptor(hedging=True)
+        for latency in range(1, 101):
+            interceptor._record_latency("core", latency / 100)
+
+        assert interceptor._hedge_delay(GET_REQUEST, "core") == pytest.approx(0.96)
+        assert interceptor._hedge_delay(GET_REQUEST, "search") is None
@@ -0,0 +1,125 @@
+"""
+Tests for RateLimitSchedulerInterceptor.
+"""
+
+from unittest.mock import MagicMock
+
+import requests
+
+from scripts.src.infrastructure.http.adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from scripts.src.infrastructure.http.http_request import HttpRequest
+from scripts.src.infrastructure.http.rate_limit_scheduler_interceptor import RateLimitSchedulerInterceptor
+
+
+def _response(status_code, remaining="4000", reset="2000", body="", **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update({
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": remaining,
+        "X-RateLimit-Reset": reset,
+        "X-RateLimit-Resource": "core",
+        **headers
+    })
+    response._content = body.encode("utf-8")
+    return response
+
+
+class _FakeClock:
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _create_interceptor(clock, max_retries=5):
+    return RateLimitSchedulerInterceptor(
+        AdaptiveConcurrencyLimiter(4),
+        max_retries=max_retries,
+        clock=clock,
+        sleep=clock.sleep
+    )
+
+
+REQUEST = HttpRequest(method="GET", url="https://api.github.com/repos/owner/repo/pulls")
+
+
+class TestRateLimitSchedulerInterceptor:
+    """Test cases for RateLimitSchedulerInterceptor."""
+
+    def test_intercept_十分な残量_待たずに送信される(self):
+        """Test intercept sends immediately while plenty of budget remains."""
+        clock = _FakeClock(1000.0)
+        interceptor = _create_interceptor(clock)
+        call_next = MagicMock(return_value=_response(200))
+
+        interceptor.intercept(REQUEST, call_next)
+        interceptor.intercept(REQUEST, call_next)
+
+        assert clock.sleeps == []
+
+    def test_intercept_残量が少ない_リセットまで均等に間隔が空けられる(self):
+        """Test intercept spaces requests over the time left until reset when budget is low."""
+        clock = _FakeClock(1000.0)
+        interceptor = _create_interceptor(clock)
+        call_next = MagicMock(return_value=_response(200, remaining="100", reset="2000"))
+
+        for _ in range(3):
+            interceptor.intercept(REQUEST, call_next)
+
+        assert len(clock.sleeps) == 1
+        assert 9.0 < clock.sleeps[0] <= 10.0
+
+    def test_intercept_残量ゼロ_リセット時刻まで待機する(self):
+        """Test intercept waits for the reset once the budget is exhausted."""
+        clock = _FakeClock(1000.0)
+        interceptor = _create_interceptor(clock)
+        call_next = MagicMock(return_value=_response(200, remaining="0", reset="1300"))
+
+        interceptor.intercept(REQUEST, call_next)
+        interceptor.intercept(REQUEST, call_next)
+
+        assert clock.sleeps == [301.0]
+
+    def test_intercept_セカンダリレート制限_RetryAfter後に再送される(self):
+        """Test intercept retries secondary rate limit errors after Retry-After."""
+        clock = _FakeClock(1000.0)
+        interceptor = _create_interceptor(clock)
+        call_next = MagicMock(side_effect=[
+            _response(403, body="You have exceeded a secondary rate limit", **{"Retry-After": "30"}),
+            _response(200)
+        ])
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 200
+        assert call_next.call_count == 2
+        assert clock.sleeps == [30.0]
+
+    def test_intercept_再試行上限_最後のレスポンスが返される(self):
+        """Test intercept gives up after max_retries and returns the throttled response."""
+        clock = _FakeClock(1000.0)
+        interceptor = _create_interceptor(clock, max_retries=1)
+        call_next = MagicMock(return_value=_response(429, **{"Retry-After": "5"}))
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 429
+        assert call_next.call_count == 2
+
+    def test_intercept_権限エラー_再送されない(self):
+        """Test intercept does not retry 403 responses unrelated to rate limiting."""
+        clock = _FakeClock(1000.0)
+        interceptor = _create_interceptor(clock)
+        call_next = MagicMock(return_value=_response(403, body="Resource not accessible by integration"))
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 403
+        assert call_next.call_count == 1
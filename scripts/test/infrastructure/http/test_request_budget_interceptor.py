@@ -0,0 +1,26 @@
+"""
+Tests for RequestBudgetInterceptor.
+"""
+
+from unittest.mock import MagicMock
+
+from scripts.src.infrastructure.http.fetch_budget import FetchBudget
+from scripts.src.infrastructure.http.http_request import HttpRequest
+from scripts.src.infrastructure.http.request_budget_interceptor import RequestBudgetInterceptor
+
+
+class TestRequestBudgetInterceptor:
+    """Test cases for RequestBudgetInterceptor."""
+
+    def test_intercept_リクエスト送信_予算に数えられる(self):
+        """Test intercept counts every request it passes on."""
+        budget = FetchBudget(max_requests=10)
+        interceptor = RequestBudgetInterceptor(budget)
+        call_next = MagicMock()
+        request = HttpRequest(method="GET", url="https://api.github.com/repos/owner/repo/pulls")
+
+        response = interceptor.intercept(request, call_next)
+        interceptor.intercept(request, call_next)
+
+        assert response is call_next.return_value
+        assert budget.requests_sent == 2
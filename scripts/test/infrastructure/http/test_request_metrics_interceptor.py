@@ -0,0 +1,82 @@
+"""
+Tests for RequestMetricsInterceptor.
+"""
+
+from unittest.mock import MagicMock
+
+import requests
+
+from scripts.src.infrastructure.http.fetch_metrics import FetchMetrics
+from scripts.src.infrastructure.http.http_request import HttpRequest
+from scripts.src.infrastructure.http.request_metrics_interceptor import RequestMetricsInterceptor
+
+
+def _response(status_code=200, content=b"[]", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+class _StepClock:
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestRequestMetricsInterceptor:
+    """Test cases for RequestMetricsInterceptor."""
+
+    def test_intercept_応答受信_エンドポイントと遅延とサイズと使用量が記録される(self):
+        """Test intercept records the endpoint, latency, body size and rate-limit usage of a response."""
+        metrics = MagicMock(spec=FetchMetrics)
+        interceptor = RequestMetricsInterceptor(metrics, clock=_StepClock(0.25))
+        response = _response(content=b"0123456789", headers={
+            "X-RateLimit-Resource": "core", "X-RateLimit-Used": "42", "X-RateLimit-Reset": "1700000000"
+        })
+        request = HttpRequest(
+            method="GET",
+            url="https://api.github.com/repos/owner/repo/pulls/7/comments?per_page=100",
+            headers={"Authorization": "token secret"}
+        )
+
+        returned = interceptor.intercept(request, MagicMock(return_value=response))
+
+        assert returned is response
+        args, kwargs = metrics.record_response.call_args
+        endpoint, latency, bytes_received, window, used = args
+        assert endpoint == "GET /repos/{owner}/{repo}/pulls/{number}/comments"
+        assert latency == 0.25
+        assert bytes_received == 10
+        assert window[1:] == ("core", "1700000000")
+        assert "secret" not in window[0]
+        assert used == 42
+        assert kwargs == {"cost": 1}
+
+    def test_intercept_304応答_使用量に数えない(self):
+        """Test intercept records conditional requests answered with 304 at no rate-limit cost."""
+        metrics = MagicMock(spec=FetchMetrics)
+        interceptor = RequestMetricsInterceptor(metrics, clock=_StepClock(0.1))
+        request = HttpRequest(method="GET", url="https://api.github.com/repos/owner/repo")
+
+        interceptor.intercept(request, MagicMock(return_value=_response(304, b"")))
+
+        args, kwargs = metrics.record_response.call_args
+        assert args[3:] == (None, None)
+        assert kwargs == {"cost": 0}
+
+    def test_endpoint_of_各種URL_名前と番号が置き換えられる(self):
+        """Test endpoint_of replaces owners, repositories and numbers with placeholders."""
+        def endpoint(method, url):
+            return RequestMetricsInterceptor.endpoint_of(HttpRequest(method=method, url=url))
+
+        assert endpoint("POST", "https://api.github.com/graphql") == "POST /graphql"
+        assert endpoint("GET", "https://api.github.com/search/issues?q=repo") == "GET /search/issues"
+        assert endpoint("GET", "https://api.github.com/orgs/octo/repos") == "GET /orgs/{owner}/repos"
+        assert endpoint("GET", "https://api.github.com/repositories/123/pulls/comments?page=2") == \
+            "GET /repositories/{number}/pulls/comments"
@@ -0,0 +1,112 @@
+"""
+Tests for RetryInterceptor.
+"""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from scripts.src.infrastructure.http.circuit_breaker import CircuitBreaker
+from scripts.src.infrastructure.http.http_request import HttpRequest
+from scripts.src.infrastructure.http.retry_interceptor import RetryInterceptor
+
+
+def _response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    response.raw = io.BytesIO()
+    return response
+
+
+REQUEST = HttpRequest(method="GET", url="https://api.github.com/repos/owner/repo/pulls/1")
+
+
+def _create_interceptor(sleeps, circuit_breaker=None, max_retries=3):
+    return RetryInterceptor(
+        circuit_breaker,
+        max_retries=max_retries,
+        base_delay=1.0,
+        max_delay=3.0,
+        sleep=sleeps.append,
+        jitter=lambda: 0.5
+    )
+
+
+class TestRetryInterceptor:
+    """Test cases for RetryInterceptor."""
+
+    def test___init___遅延が0_ValueErrorが発生する(self):
+        """Test __init__ rejects delays that are not positive."""
+        with pytest.raises(ValueError):
+            RetryInterceptor(base_delay=0)
+
+    def test_intercept_5xx応答後に成功_ジッター付き指数バックオフで再送される(self):
+        """Test intercept retries server errors with jittered exponential backoff capped at max_delay."""
+        sleeps = []
+        interceptor = _create_interceptor(sleeps)
+        call_next = MagicMock(side_effect=[_response(502), _response(503), _response(500), _response(200)])
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 200
+        assert call_next.call_count == 4
+        assert sleeps == [0.5, 1.0, 1.5]
+
+    def test_intercept_接続エラー後に成功_再送される(self):
+        """Test intercept retries connection errors and timeouts."""
+        sleeps = []
+        interceptor = _create_interceptor(sleeps)
+        call_next = MagicMock(side_effect=[requests.ConnectionError("reset"), requests.Timeout("slow"), _response(200)])
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 200
+        assert len(sleeps) == 2
+
+    def test_intercept_再送上限まで5xx_最後の応答が返される(self):
+        """Test intercept returns the last server error once the retries are used up."""
+        sleeps = []
+        interceptor = _create_interceptor(sleeps, max_retries=2)
+        call_next = MagicMock(return_value=_response(503))
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 503
+        assert call_next.call_count == 3
+
+    def test_intercept_再送上限まで接続エラー_例外が発生する(self):
+        """Test intercept raises the connection error once the retries are used up."""
+        interceptor = _create_interceptor([], max_retries=1)
+        call_next = MagicMock(side_effect=requests.ConnectionError("reset"))
+
+        with pytest.raises(requests.ConnectionError, match="reset"):
+            interceptor.intercept(REQUEST, call_next)
+
+        assert call_next.call_count == 2
+
+    def test_intercept_4xx応答_再送されない(self):
+        """Test intercept returns client errors without retrying."""
+        sleeps = []
+        interceptor = _create_interceptor(sleeps)
+        call_next = MagicMock(return_value=_response(404))
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 404
+        assert call_next.call_count == 1
+        assert sleeps == []
+
+    def test_intercept_回路遮断器指定_各試行の結果が報告される(self):
+        """Test intercept waits for the circuit breaker and reports every attempt to it."""
+        circuit_breaker = MagicMock(spec=CircuitBreaker)
+        interceptor = _create_interceptor([], circuit_breaker)
+        call_next = MagicMock(side_effect=[_response(502), _response(200)])
+
+        interceptor.intercept(REQUEST, call_next)
+
+        assert circuit_breaker.before_request.call_count == 2
+        circuit_breaker.record_failure.assert_called_once_with()
+        circuit_breaker.record_success.assert_called_once_with()
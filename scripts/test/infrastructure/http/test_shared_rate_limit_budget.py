@@ -0,0 +1,115 @@
+"""
+Tests for SharedRateLimitBudget.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from scripts.src.infrastructure.http.shared_rate_limit_budget import SharedRateLimitBudget
+
+
+class _FakeClock:
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def _create_budget(tmp_path, clock, lease_size=SharedRateLimitBudget.DEFAULT_LEASE_SIZE):
+    return SharedRateLimitBudget(tmp_path, clock=clock, sleep=clock.sleep, lease_size=lease_size)
+
+
+class TestSharedRateLimitBudget:
+    """Test cases for SharedRateLimitBudget."""
+
+    def test_acquire_予算内_待たずに予約される(self, tmp_path):
+        """Test acquire returns immediately while tokens are left."""
+        clock = _FakeClock(1000.0)
+        budget = _create_budget(tmp_path, clock)
+
+        assert budget.acquire("key", "core") == 0.0
+        assert clock.sleeps == []
+
+    def test_acquire_バケットが空_到着順に補充を待つ(self, tmp_path):
+        """Test acquire spaces reservations of all processes at the refill rate once the bucket is empty."""
+        clock = _FakeClock(1000.0)
+        first_process = _create_budget(tmp_path, clock)
+        second_process = _create_budget(tmp_path, clock)
+        first_process.observe("key", "search", limit=2, remaining=30, reset_at=5000.0)
+
+        first_process.acquire("key", "search")
+        second_process.acquire("key", "search")
+        first_process.acquire("key", "search")
+        second_process.acquire("key", "search")
+
+        # The search bucket refills 2 tokens per 60 seconds
+        assert clock.sleeps == [30.0, 60.0]
+
+    def test_acquire_サーバー残量を使い切った_全プロセスがリセットまで待つ(self, tmp_path):
+        """Test acquire waits for the reset once the remaining budget reported by GitHub is used up by any process."""
+        clock = _FakeClock(1000.0)
+        first_process = _create_budget(tmp_path, clock)
+        second_process = _create_budget(tmp_path, clock)
+        first_process.observe("key", "core", limit=5000, remaining=1, reset_at=1500.0)
+
+        first_process.acquire("key", "core")
+        delay = second_process.acquire("key", "core")
+
+        assert delay == 501.0
+
+    def test_observe_古いウィンドウの応答_新しい残量が上書きされない(self, tmp_path):
+        """Test observe ignores responses of an earlier rate limit window."""
+        clock = _FakeClock(1000.0)
+        budget = _create_budget(tmp_path, clock)
+        budget.observe("key", "core", limit=5000, remaining=0, reset_at=2000.0)
+
+        budget.observe("key", "core", limit=5000, remaining=4000, reset_at=1200.0)
+
+        assert budget.acquire("key", "core") == 1001.0
+
+    def test_refund_予約を返却_次の予約で待たない(self, tmp_path):
+        """Test refund returns a reservation that did not count against the limit."""
+        clock = _FakeClock(1000.0)
+        budget = _create_budget(tmp_path, clock)
+        budget.observe("key", "core", limit=5000, remaining=1, reset_at=1500.0)
+
+        budget.acquire("key", "core")
+        budget.refund("key", "core")
+
+        assert budget.acquire("key", "core") == 0.0
+
+    def test_acquire_別の認証情報_予算が共有されない(self, tmp_path):
+        """Test acquire keeps separate budgets for separate credentials."""
+        clock = _FakeClock(1000.0)
+        budget = _create_budget(tmp_path, clock)
+        budget.observe("key-a", "core", limit=5000, remaining=0, reset_at=1500.0)
+
+        assert budget.acquire("key-b", "core") == 0.0
+
+    def test_acquire_予算に余裕あり_まとめて予約し状態ファイルを1回だけ更新する(self, tmp_path):
+        """Test acquire leases several tokens per visit of the state file and hands them out from memory."""
+        clock = _FakeClock(1000.0)
+        budget = _create_budget(tmp_path, clock, lease_size=5)
+        other_process = _create_budget(tmp_path, clock, lease_size=1)
+        other_process.observe("key", "core", limit=5000, remaining=6, reset_at=1500.0)
+        other_process.acquire("key", "core")
+
+        with patch.object(SharedRateLimitBudget, "_write_state", wraps=SharedRateLimitBudget._write_state) as write_state:
+            delays = [budget.acquire("key", "core") for _ in range(4)]
+            budget.observe("key", "core", limit=5000, remaining=5, reset_at=1500.0)
+
+        assert delays == [0.0, 0.0, 0.0, 0.0]
+        assert write_state.call_count == 1
+        # Observations wait for the next lease; the other process already sees the leased tokens
+        assert other_process.acquire("key", "core") == 501.0
+
+    def test___init___リース数が0_ValueErrorが発生する(self, tmp_path):
+        """Test __init__ rejects lease sizes below 1."""
+        with pytest.raises(ValueError):
+            SharedRateLimitBudget(tmp_path, lease_size=0)
@@ -0,0 +1,70 @@
+"""
+Tests for SharedRateLimitBudgetInterceptor.
+"""
+
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import requests
+
+from scripts.src.infrastructure.http.http_request import HttpRequest
+from scripts.src.infrastructure.http.shared_rate_limit_budget_interceptor import SharedRateLimitBudgetInterceptor
+
+
+def _response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update({
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": "2000",
+        "X-RateLimit-Resource": "core"
+    })
+    return response
+
+
+REQUEST = HttpRequest(
+    method="GET",
+    url="https://api.github.com/repos/owner/repo/pulls",
+    headers={"Authorization": "token secret"}
+)
+
+
+class TestSharedRateLimitBudgetInterceptor:
+    """Test cases for SharedRateLimitBudgetInterceptor."""
+
+    def test_intercept_正常応答_予約して残量が記録される(self):
+        """Test intercept reserves the request and feeds the reported budget back."""
+        budget = MagicMock()
+        interceptor = SharedRateLimitBudgetInterceptor(budget)
+
+        response = interceptor.intercept(REQUEST, MagicMock(return_value=_response(200)))
+
+        assert response.status_code == 200
+        credential_key, resource = budget.acquire.call_args.args
+        assert resource == "core"
+        assert "secret" not in credential_key
+        budget.observe.assert_called_once_with(credential_key, "core", limit=5000, remaining=4999, reset_at=2000.0)
+        budget.refund.assert_not_called()
+
+    def test_intercept_304応答_予約が返却される(self):
+        """Test intercept returns the reservation of a request answered with 304 Not Modified."""
+        budget = MagicMock()
+        interceptor = SharedRateLimitBudgetInterceptor(budget)
+
+        interceptor.intercept(REQUEST, MagicMock(return_value=_response(304)))
+
+        budget.refund.assert_called_once_with(budget.acquire.call_args.args[0], "core")
+
+    def test_intercept_同じ資格情報の更新されたトークン_同じ予算が使われる(self):
+        """Test intercept keys the budget on the credential identity, so refreshed installation tokens share one state file."""
+        budget = MagicMock()
+        interceptor = SharedRateLimitBudgetInterceptor(budget)
+        installation = "github-app-installation 42"
+
+        for token in ("ghs_1", "ghs_2"):
+            request = replace(REQUEST, headers={"Authorization": f"token {token}"}, credential_id=installation)
+            interceptor.intercept(request, MagicMock(return_value=_response(200)))
+
+        first_key, second_key = [call.args[0] for call in budget.acquire.call_args_list]
+        assert first_key == second_key
@@ -0,0 +1,73 @@
+"""
+Tests for TokenPoolInterceptor.
+"""
+
+from unittest.mock import MagicMock
+
+import requests
+
+from scripts.src.infrastructure.http.github_token_pool import GitHubTokenPool
+from scripts.src.infrastructure.http.http_request import HttpRequest
+from scripts.src.infrastructure.http.token_pool_interceptor import TokenPoolInterceptor
+
+
+def _response(status_code, remaining):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update({
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": "2000",
+        "X-RateLimit-Resource": "core"
+    })
+    return response
+
+
+REQUEST = HttpRequest(
+    method="GET",
+    url="https://api.github.com/repos/owner/repo/pulls",
+    headers={"Authorization": "token first"}
+)
+
+
+class TestTokenPoolInterceptor:
+    """Test cases for TokenPoolInterceptor."""
+
+    def test_intercept_複数リクエスト_トークンが順番に使用される(self):
+        """Test intercept sends consecutive requests with alternating tokens."""
+        pool = GitHubTokenPool(["first", "second"], clock=lambda: 1000.0)
+        interceptor = TokenPoolInterceptor(pool)
+        call_next = MagicMock(return_value=_response(200, 4000))
+
+        interceptor.intercept(REQUEST, call_next)
+        interceptor.intercept(REQUEST, call_next)
+
+        sent = [call.args[0].header("Authorization") for call in call_next.call_args_list]
+        assert sent == ["token first", "token second"]
+
+    def test_intercept_トークン枯渇_別トークンで再送される(self):
+        """Test intercept fails over to the next token when a token's budget is used up."""
+        pool = GitHubTokenPool(["first", "second"], clock=lambda: 1000.0)
+        interceptor = TokenPoolInterceptor(pool)
+        call_next = MagicMock(side_effect=[_response(403, 0), _response(200, 4999)])
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 200
+        sent = [call.args[0].header("Authorization") for call in call_next.call_args_list]
+        assert sent == ["token first", "token second"]
+        # The combined budget of both tokens is passed on
+        assert response.headers["X-RateLimit-Limit"] == "10000"
+        assert response.headers["X-RateLimit-Remaining"] == "4999"
+
+    def test_intercept_全トークン枯渇_拒否応答が返される(self):
+        """Test intercept passes the rejection on once every token ran out."""
+        pool = GitHubTokenPool(["first", "second"], clock=lambda: 1000.0)
+        interceptor = TokenPoolInterceptor(pool)
+        call_next = MagicMock(return_value=_response(403, 0))
+
+        response = interceptor.intercept(REQUEST, call_next)
+
+        assert response.status_code == 403
+        assert call_next.call_count == 2
+        assert response.headers["X-RateLimit-Remaining"] == "0"
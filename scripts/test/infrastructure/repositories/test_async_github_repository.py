@@ -0,0 +1,161 @@
+"""
+Tests for AsyncGitHubRepository.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+import pytz
+
+from scripts.src.application.exceptions.github_api_error import GitHubApiError
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.repositories.async_github_repository import AsyncGitHubRepository
+from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+
+def _pr_payload(number: int, closed_at: str) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "closed_at": closed_at,
+        "merged_at": closed_at,
+        "updated_at": closed_at
+    }
+
+
+def _comment_payload(comment_id: int) -> dict:
+    return {
+        "id": comment_id,
+        "path": "app.py",
+        "original_position": 1,
+        "commit_id": "abc",
+        "user": {"login": "reviewer"},
+        "created_at": "2023-01-01T00:00:00Z",
+        "body": "comment",
+        "diff_hunk": "@@ -1 +1 @@"
+    }
+
+
+@pytest.fixture
+def repository():
+    repository = AsyncGitHubRepository("token", TimezoneConverter("UTC"), base_url="https://api.test")
+    yield repository
+    repository.close()
+
+
+class TestAsyncGitHubRepository:
+    """Test cases for AsyncGitHubRepository."""
+
+    def test_find_closed_prs_basic_info_複数ページ_範囲内のPRが返される(self, repository):
+        """Test find_closed_prs_basic_info follows next links and filters by date range."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        date_range = DateRange(
+            start_date=pytz.UTC.localize(datetime(2023, 1, 1)),
+            end_date=pytz.UTC.localize(datetime(2023, 1, 31))
+        )
+        pages = {
+            "https://api.test/repos/owner/repo/pulls": (
+                [_pr_payload(3, "2023-02-05T00:00:00Z"), _pr_payload(2, "2023-01-20T00:00:00Z")],
+                {"next": "https://api.test/page2"}
+            ),
+            "https://api.test/page2": (
+                [_pr_payload(1, "2023-01-10T00:00:00Z"), {"number": 9, "title": "Open", "closed_at": None}],
+                {}
+            )
+        }
+
+        async def get_json(url, params=None):
+            return pages[url]
+
+        with patch.object(repository, "_get_json", side_effect=get_json):
+            result = list(repository.find_closed_prs_basic_info(repo_id, date_range))
+
+        assert [info.number for info in result] == [2, 1]
+        assert result[0].is_merged is True
+
+    def test_get_full_pr_metadata_コメント複数ページ_全ページのコメントが含まれる(self, repository):
+        """Test get_full_pr_metadata collects every review comment page."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        pr_url = "https://api.test/repos/owner/repo/pulls/7"
+
+        async def get_json(url, params=None):
+            if url == pr_url:
+                return {**_pr_payload(7, "2023-01-10T00:00:00Z"), "merged": False}, {}
+            page = (params or {}).get("page", 1)
+            links = {"last": f"{url}?page=3"} if page == 1 else {}
+            return [_comment_payload(page)], links
+
+        with patch.object(repository, "_get_json", side_effect=get_json):
+            metadata = repository.get_full_pr_metadata(7, repo_id)
+
+        assert metadata.number == 7
+        assert metadata.is_merged is False
+        assert [comment.comment_id for comment in metadata.review_comments] == [1, 2, 3]
+
+    def test_get_full_pr_metadata_コメント取得失敗_GitHubApiErrorが発生する(self, repository):
+        """Test get_full_pr_metadata raises GitHubApiError instead of returning the PR without comments."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        pr_url = "https://api.test/repos/owner/repo/pulls/7"
+
+        async def get_json(url, params=None):
+            if url == pr_url:
+                return _pr_payload(7, "2023-01-10T00:00:00Z"), {}
+            raise GitHubApiError("comments unavailable")
+
+        with patch.object(repository, "_get_json", side_effect=get_json):
+            with pytest.raises(GitHubApiError):
+                repository.get_full_pr_metadata(7, repo_id)
+
+    def test_get_full_pr_metadata_PR取得失敗_GitHubApiErrorが発生する(self, repository):
+        """Test get_full_pr_metadata raises GitHubApiError when the PR cannot be fetched."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+
+        async def get_json(url, params=None):
+            raise GitHubApiError("not found")
+
+        with patch.object(repository, "_get_json", side_effect=get_json):
+            with pytest.raises(GitHubApiError):
+                repository.get_full_pr_metadata(7, repo_id)
+
+    def test_get_review_comments_by_pr_複数ページ_PR番号ごとにまとめられる(self, repository):
+        """Test get_review_comments_by_pr pages through repository-wide comments and groups them."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        requested_params = []
+
+        def comment(comment_id, pr_number):
+            return {**_comment_payload(comment_id), "pull_request_url": f"https://api.test/repos/owner/repo/pulls/{pr_number}"}
+
+        async def get_json(url, params=None):
+            if url == "https://api.test/repos/owner/repo/pulls/comments":
+                requested_params.append(params)
+                return [comment(1, 5), comment(2, 6)], {"next": "https://api.test/comments2"}
+            return [comment(3, 5)], {}
+
+        since = pytz.UTC.localize(datetime(2023, 1, 1))
+        with patch.object(repository, "_get_json", side_effect=get_json):
+            result = repository.get_review_comments_by_pr(repo_id, since)
+
+        assert {number: [c.comment_id for c in comments] for number, comments in result.items()} == {5: [1, 3], 6: [2]}
+        assert requested_params[0]["since"] == "2023-01-01T00:00:00Z"
+
+    def test_count_review_comments_最終ページのリンク_総件数が返される(self, repository):
+        """Test count_review_comments reads the total from the last page link of a one-item page."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        requests = []
+
+        async def get_json(url, params=None):
+            requests.append((url, params))
+            return [_comment_payload(1)], {"last": "https://api.test/repositories/1/pulls/comments?per_page=1&page=42"}
+
+        with patch.object(repository, "_get_json", side_effect=get_json):
+            count = repository.count_review_comments(repo_id)
+
+        assert count == 42
+        assert requests == [("https://api.test/repos/owner/repo/pulls/comments", {"per_page": 1})]
+
+    def test__page_number_ページ指定あり_ページ番号が返される(self):
+        """Test _page_number extracts the page query parameter."""
+        assert AsyncGitHubRepository._page_number("https://api.test/x?per_page=100&page=4") == 4
+        assert AsyncGitHubRepository._page_number(None) is None
@@ -0,0 +1,94 @@
+"""
+Tests for DeadLetterRepository.
+"""
+
+from datetime import datetime
+
+import pytz
+
+from scripts.src.domain.failed_pull_request import FailedPullRequest
+from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.repositories.dead_letter_repository import DeadLetterRepository
+
+
+def _failed_pr(repo_id, number=1, attempts=1):
+    return FailedPullRequest(
+        basic_info=PullRequestBasicInfo(
+            number=number,
+            title=f"PR {number}",
+            closed_at=datetime(2023, 1, 2, tzinfo=pytz.UTC),
+            is_merged=True,
+            repository_id=repo_id,
+            created_at=datetime(2023, 1, 1, tzinfo=pytz.UTC)
+        ),
+        error="502 Bad Gateway",
+        failed_at=datetime(2023, 1, 3, tzinfo=pytz.UTC),
+        attempts=attempts
+    )
+
+
+class TestDeadLetterRepository:
+    """Test cases for DeadLetterRepository."""
+
+    def test_save_保存後に読み込み_同じ失敗PRが復元される(self, tmp_path):
+        """Test save and load round-trip the failed PRs in order."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        failed_prs = [_failed_pr(repo_id, 2, attempts=3), _failed_pr(repo_id, 1)]
+        repository = DeadLetterRepository()
+
+        repository.save(repo_id, failed_prs, tmp_path)
+
+        assert repository.load(repo_id, tmp_path) == failed_prs
+
+    def test_save_一覧情報の全項目あり_全項目が復元される(self, tmp_path):
+        """Test save and load keep the author, base branch, labels, update time and comment count."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        failed_pr = FailedPullRequest(
+            basic_info=PullRequestBasicInfo(
+                number=5,
+                title="PR 5",
+                closed_at=datetime(2023, 1, 2, tzinfo=pytz.UTC),
+                is_merged=False,
+                repository_id=repo_id,
+                created_at=datetime(2023, 1, 1, tzinfo=pytz.UTC),
+                updated_at=datetime(2023, 1, 2, 12, tzinfo=pytz.UTC),
+                author="octocat",
+                base_branch="main",
+                labels=("bug", "backend"),
+                review_comment_count=4
+            ),
+            error="502 Bad Gateway",
+            failed_at=datetime(2023, 1, 3, tzinfo=pytz.UTC),
+            attempts=2
+        )
+        repository = DeadLetterRepository()
+
+        repository.save(repo_id, [failed_pr], tmp_path)
+
+        assert repository.load(repo_id, tmp_path) == [failed_pr]
+
+    def test_save_失敗PRなし_ファイルが削除される(self, tmp_path):
+        """Test save removes the dead-letter file once no failed PR is left."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        repository = DeadLetterRepository()
+        repository.save(repo_id, [_failed_pr(repo_id)], tmp_path)
+
+        repository.save(repo_id, [], tmp_path)
+
+        assert not (tmp_path / DeadLetterRepository.DEAD_LETTER_FILE_NAME).exists()
+        assert repository.load(repo_id, tmp_path) == []
+
+    def test_load_別リポジトリの一覧_空のリストが返される(self, tmp_path):
+        """Test load ignores the dead-letter list of another repository."""
+        other = RepositoryIdentifier(owner="owner", name="other")
+        repository = DeadLetterRepository()
+        repository.save(other, [_failed_pr(other)], tmp_path)
+
+        assert repository.load(RepositoryIdentifier(owner="owner", name="repo"), tmp_path) == []
+
+    def test_load_壊れたファイル_空のリストが返される(self, tmp_path):
+        """Test load ignores an unreadable dead-letter file."""
+        (tmp_path / DeadLetterRepository.DEAD_LETTER_FILE_NAME).write_text("{broken", encoding="utf-8")
+
+        assert DeadLetterRepository().load(RepositoryIdentifier(owner="owner", name="repo"), tmp_path) == []
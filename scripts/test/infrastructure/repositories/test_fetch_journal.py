@@ -0,0 +1,96 @@
+"""
+Tests for FetchJournal.
+"""
+
+from datetime import datetime
+
+import pytz
+
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.repositories.fetch_journal import FetchJournal
+
+
+REPO_ID = RepositoryIdentifier(owner="owner", name="repo")
+DATE_RANGE = DateRange(
+    start_date=datetime(2023, 1, 1, tzinfo=pytz.UTC),
+    end_date=datetime(2023, 1, 31, tzinfo=pytz.UTC)
+)
+
+
+def _basic_info(number):
+    return PullRequestBasicInfo(
+        number=number,
+        title=f"PR {number}",
+        closed_at=datetime(2023, 1, number, tzinfo=pytz.UTC),
+        is_merged=True,
+        repository_id=REPO_ID,
+        updated_at=datetime(2023, 2, 1, tzinfo=pytz.UTC)
+    )
+
+
+class TestFetchJournal:
+    """Test cases for FetchJournal."""
+
+    def test_load_checkpoint_中断した実行_一覧取得済みと保存済みのPRが復元される(self, tmp_path):
+        """Test load_checkpoint restores the progress of an interrupted run."""
+        journal = FetchJournal()
+        journal.start(REPO_ID, DATE_RANGE, tmp_path)
+        journal.record_listed(_basic_info(1))
+        journal.record_listed(_basic_info(2))
+        journal.record_saved(1)
+        journal.close()
+
+        checkpoint = FetchJournal().load_checkpoint(REPO_ID, DATE_RANGE, tmp_path)
+
+        assert checkpoint.listed == (_basic_info(1), _basic_info(2))
+        assert checkpoint.pending == [_basic_info(2)]
+        assert checkpoint.listing_completed is False
+
+    def test_load_checkpoint_末尾の行が途中で切れている_切れた行が無視される(self, tmp_path):
+        """Test load_checkpoint ignores a record torn by a crash."""
+        journal = FetchJournal()
+        journal.start(REPO_ID, DATE_RANGE, tmp_path)
+        journal.record_listed(_basic_info(1))
+        journal.record_listing_completed()
+        journal.close()
+        with open(tmp_path / FetchJournal.JOURNAL_FILE_NAME, "a", encoding="utf-8") as f:
+            f.write('{"event": "sav')
+
+        checkpoint = FetchJournal().load_checkpoint(REPO_ID, DATE_RANGE, tmp_path)
+
+        assert checkpoint.listing_completed is True
+        assert checkpoint.saved_numbers == frozenset()
+
+    def test_load_checkpoint_完了した実行_Noneが返される(self, tmp_path):
+        """Test load_checkpoint has nothing to resume after a completed run."""
+        journal = FetchJournal()
+        journal.start(REPO_ID, DATE_RANGE, tmp_path)
+        journal.record_listed(_basic_info(1))
+        journal.finish()
+
+        assert FetchJournal().load_checkpoint(REPO_ID, DATE_RANGE, tmp_path) is None
+
+    def test_load_checkpoint_別の期間の実行_Noneが返される(self, tmp_path):
+        """Test load_checkpoint ignores the journal of another date range."""
+        journal = FetchJournal()
+        journal.start(REPO_ID, DATE_RANGE, tmp_path)
+        journal.close()
+        other_range = DateRange(start_date=DATE_RANGE.start_date, end_date=datetime(2023, 2, 28, tzinfo=pytz.UTC))
+
+        assert FetchJournal().load_checkpoint(REPO_ID, other_range, tmp_path) is None
+
+    def test_load_checkpoint_一覧取得済みの期間あり_期間が復元される(self, tmp_path):
+        """Test load_checkpoint restores the windows whose listing completed."""
+        first_half = DateRange(start_date=DATE_RANGE.start_date, end_date=datetime(2023, 1, 15, tzinfo=pytz.UTC))
+        journal = FetchJournal()
+        journal.start(REPO_ID, DATE_RANGE, tmp_path)
+        journal.record_listed(_basic_info(1))
+        journal.record_window_listed(first_half)
+        journal.close()
+
+        checkpoint = FetchJournal().load_checkpoint(REPO_ID, DATE_RANGE, tmp_path)
+
+        assert checkpoint.listed_windows == frozenset({first_half})
+        assert checkpoint.listing_completed is False
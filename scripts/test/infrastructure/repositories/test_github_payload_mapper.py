@@ -0,0 +1,163 @@
+"""
+Tests for GitHubPayloadMapper.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytz
+
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.repositories.github_payload_mapper import GitHubPayloadMapper
+from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+
+class TestGitHubPayloadMapper:
+    """Test cases for GitHubPayloadMapper."""
+
+    def test_parse_timestamp_UTC文字列_対象タイムゾーンに変換される(self):
+        """Test parse_timestamp converts API timestamps to the target timezone."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("Asia/Tokyo"))
+
+        result = mapper.parse_timestamp("2023-01-01T15:30:00Z")
+
+        assert result == pytz.timezone("Asia/Tokyo").localize(datetime(2023, 1, 2, 0, 30, 0))
+
+    def test_parse_timestamp_None_Noneが返される(self):
+        """Test parse_timestamp returns None for missing timestamps."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+
+        assert mapper.parse_timestamp(None) is None
+
+    def test_parse_timestamp_同じ文字列を繰り返し解析_変換は一度だけ行われる(self):
+        """Test parse_timestamp converts a timestamp repeated across fields only once."""
+        converter = MagicMock(wraps=TimezoneConverter("Asia/Tokyo"))
+        mapper = GitHubPayloadMapper(converter)
+
+        first = mapper.parse_timestamp("2023-01-01T15:30:00Z")
+        second = mapper.parse_timestamp("2023-01-01T15:30:00Z")
+
+        assert first == second
+        converter.convert_to_target_timezone.assert_called_once()
+
+    def test_parse_utc_timestamp_UTC文字列_UTCのまま返される(self):
+        """Test parse_utc_timestamp keeps the UTC timezone of API timestamps."""
+        result = GitHubPayloadMapper.parse_utc_timestamp("2023-01-01T15:30:00Z")
+
+        assert result == datetime(2023, 1, 1, 15, 30, 0, tzinfo=timezone.utc)
+        assert result.utcoffset() == timedelta(0)
+        assert GitHubPayloadMapper.parse_utc_timestamp(None) is None
+
+    def test_to_basic_info_一覧ペイロード_merged_atからマージ状態が判定される(self):
+        """Test to_basic_info derives merge state from merged_at in list payloads."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+
+        merged = mapper.to_basic_info(
+            {"number": 1, "title": "Merged", "closed_at": "2023-01-01T00:00:00Z", "merged_at": "2023-01-01T00:00:00Z"},
+            repo_id
+        )
+        closed = mapper.to_basic_info(
+            {"number": 2, "title": "Closed", "closed_at": "2023-01-01T00:00:00Z", "merged_at": None},
+            repo_id
+        )
+
+        assert merged.is_merged is True
+        assert closed.is_merged is False
+        assert merged.repository_id == repo_id
+
+    def test_to_basic_info_一覧ペイロード_選択条件用の項目が設定される(self):
+        """Test to_basic_info reads author, base branch and labels for the PR selection."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+
+        basic_info = mapper.to_basic_info(
+            {
+                "number": 1, "title": "Bump", "closed_at": "2023-01-01T00:00:00Z", "merged_at": None,
+                "user": {"login": "dependabot[bot]"},
+                "base": {"ref": "main"},
+                "labels": [{"name": "dependencies"}, {"name": "python"}]
+            },
+            RepositoryIdentifier(owner="owner", name="repo")
+        )
+
+        assert basic_info.author == "dependabot[bot]"
+        assert basic_info.base_branch == "main"
+        assert basic_info.labels == ("dependencies", "python")
+        assert basic_info.review_comment_count is None
+
+    def test_to_review_comment_diff_hunkなし_デフォルトコンテキストが設定される(self):
+        """Test to_review_comment falls back to a position context without diff_hunk."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+
+        comment = mapper.to_review_comment({
+            "id": 10,
+            "path": "src/app.py",
+            "original_position": 5,
+            "commit_id": "abc123",
+            "user": {"login": "reviewer"},
+            "created_at": "2023-01-01T00:00:00Z",
+            "body": "Looks off",
+            "diff_hunk": None
+        })
+
+        assert comment.comment_id == 10
+        assert comment.author == "reviewer"
+        assert comment.diff_context == "@@ Position: 5 in src/app.py @@"
+
+    def test_to_review_comment_削除済みユーザー_ghostが設定される(self):
+        """Test to_review_comment uses the ghost login for deleted users."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+
+        comment = mapper.to_review_comment({
+            "id": 10,
+            "path": "src/app.py",
+            "original_position": 5,
+            "commit_id": "abc123",
+            "user": None,
+            "created_at": "2023-01-01T00:00:00Z",
+            "body": "Looks off",
+            "diff_hunk": "@@ -1 +1 @@"
+        })
+
+        assert comment.author == "ghost"
+        assert comment.diff_context == "@@ -1 +1 @@"
+
+    def test_to_pr_metadata_詳細ペイロード_mergedが使用される(self):
+        """Test to_pr_metadata uses the merged flag of detail payloads."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+
+        metadata = mapper.to_pr_metadata(
+            {"number": 3, "title": "PR", "closed_at": "2023-01-01T00:00:00Z", "merged": True, "merged_at": None},
+            [],
+            repo_id
+        )
+
+        assert metadata.number == 3
+        assert metadata.is_merged is True
+        assert metadata.review_comments == []
+
+    def test_pull_request_number_コメントペイロード_PR番号が返される(self):
+        """Test pull_request_number extracts the PR number from pull_request_url."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+
+        number = mapper.pull_request_number({"pull_request_url": "https://api.github.com/repos/owner/repo/pulls/42"})
+
+        assert number == 42
+
+    def test_issue_to_basic_info_PRのissueペイロード_pull_requestからマージ状態が判定される(self):
+        """Test issue_to_basic_info derives merge state from pull_request.merged_at."""
+        mapper = GitHubPayloadMapper(TimezoneConverter("UTC"))
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+
+        info = mapper.issue_to_basic_info({
+            "number": 5,
+            "title": "Fix",
+            "closed_at": "2023-01-01T00:00:00Z",
+            "created_at": "2022-12-30T00:00:00Z",
+            "pull_request": {"merged_at": "2023-01-01T00:00:00Z"}
+        }, repo_id)
+
+        assert info.number == 5
+        assert info.is_merged is True
+        assert info.created_at == pytz.UTC.localize(datetime(2022, 12, 30))
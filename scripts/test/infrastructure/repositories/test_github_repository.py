@@ -49,6 +49,422 @@ class TestGitHubRepository:
             assert comments[0].comment_id == 1
             assert comments[0].author == "testuser"
 
+    def test__extract_review_comments_コメント取得失敗_GitHubApiErrorが発生する(self):
+        """Test _extract_review_comments fails instead of returning the PR without its comments."""
+        import pytest
+        from github import GithubException
+        from scripts.src.application.exceptions.github_api_error import GitHubApiError
+
+        repo = GitHubRepository(MagicMock(), MagicMock())
+        mock_pr = MagicMock()
+        mock_pr.number = 7
+        mock_pr.get_review_comments.side_effect = GithubException(502, "Bad Gateway", None)
+
+        with pytest.raises(GitHubApiError, match="PR #7"):
+            repo._extract_review_comments(mock_pr)
+
+    def test__extract_review_comments_フィルター指定_除外コメントは変換されない(self):
+        """Test _extract_review_comments skips rejected comments before converting them."""
+        from scripts.src.domain.comment_filter_rules import CommentFilterRules
+        from scripts.src.infrastructure.filters.configurable_comment_filter import ConfigurableCommentFilter
+
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(exclude_bot_users=True, body_presets=("lgtm",)))
+        repo = GitHubRepository(MagicMock(), MagicMock(), comment_filter=comment_filter)
+
+        def make_comment(comment_id, login, user_type, body):
+            comment = MagicMock()
+            comment.id = comment_id
+            comment.user.login = login
+            comment.user.type = user_type
+            comment.body = body
+            return comment
+
+        mock_pr = MagicMock()
+        mock_pr.get_review_comments.return_value = [
+            make_comment(1, "reviewer", "User", "Please handle the error"),
+            make_comment(2, "Copilot", "Bot", "Consider renaming"),
+            make_comment(3, "ci-app", "Bot", "Coverage dropped"),
+            make_comment(4, "reviewer", "User", "LGTM"),
+        ]
+
+        with patch.object(repo, '_convert_review_comment') as mock_convert:
+            comments = repo._extract_review_comments(mock_pr)
+
+        assert comments == [mock_convert.return_value]
+        mock_convert.assert_called_once_with(mock_pr.get_review_comments.return_value[0])
+
+    def test_find_closed_prs_basic_info_一覧ペイロード_遅延補完なしでマージ状態が判定される(self):
+        """Test find_closed_prs_basic_info reads only list payload fields and builds no PyGithub objects."""
+        import pytz
+        from scripts.src.domain.date_range import DateRange
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        def listed_pr(number, merged_at):
+            return {
+                "url": f"https://api.github.com/repos/owner/repo/pulls/{number}",
+                "number": number,
+                "title": f"PR {number}",
+                "created_at": "2023-01-01T00:00:00Z",
+                "updated_at": "2023-01-10T00:00:00Z",
+                "closed_at": "2023-01-10T00:00:00Z",
+                "merged_at": merged_at,
+                "user": {"login": "dependabot[bot]"},
+                "base": {"ref": "main"},
+                "labels": [{"name": "dependencies"}]
+            }
+
+        mock_github = MagicMock()
+        mock_github.requester.requestJsonAndCheck.return_value = (
+            {}, [listed_pr(1, "2023-01-10T00:00:00Z"), listed_pr(2, None)]
+        )
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"), listing_strategy="scan")
+        date_range = DateRange(
+            start_date=pytz.UTC.localize(datetime(2023, 1, 1)),
+            end_date=pytz.UTC.localize(datetime(2023, 1, 31))
+        )
+
+        result = list(repo.find_closed_prs_basic_info(RepositoryIdentifier(owner="owner", name="repo"), date_range))
+
+        assert [(info.number, info.is_merged) for info in result] == [(1, True), (2, False)]
+        assert (result[0].author, result[0].base_branch, result[0].labels) == ("dependabot[bot]", "main", ("dependencies",))
+        mock_github.requester.requestJsonAndCheck.assert_called_once_with(
+            "GET",
+            "/repos/owner/repo/pulls",
+            parameters={"state": "closed", "sort": "updated", "direction": "desc", "per_page": 100}
+        )
+        mock_github.get_repo.assert_not_called()
+
+    def test___init___未知の一覧取得方式_ValueErrorが発生する(self):
+        """Test __init__ rejects unknown listing strategies."""
+        import pytest
+
+        with pytest.raises(ValueError):
+            GitHubRepository(MagicMock(), MagicMock(), listing_strategy="unknown")
+
+    def test_find_closed_prs_basic_info_scan方式_更新日時で打ち切られる(self):
+        """Test the scan listing keeps old PRs updated in range and stops at PRs updated before it."""
+        import pytz
+        from scripts.src.domain.date_range import DateRange
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        def listed_pr(number, closed_at, updated_at):
+            return {
+                "number": number,
+                "title": f"PR {number}",
+                "created_at": "2022-01-01T00:00:00Z",
+                "closed_at": closed_at,
+                "updated_at": updated_at,
+                "merged_at": None
+            }
+
+        in_range = "2023-01-10T00:00:00Z"
+        mock_github = MagicMock()
+        mock_github.requester.requestJsonAndCheck.return_value = ({}, [
+            # Closed before the range but commented on later
+            listed_pr(1, "2022-06-01T00:00:00Z", "2023-02-01T00:00:00Z"),
+            listed_pr(2, in_range, in_range),
+            listed_pr(3, "2022-12-01T00:00:00Z", "2022-12-01T00:00:00Z"),
+            listed_pr(4, in_range, in_range)
+        ])
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"), listing_strategy="scan")
+        date_range = DateRange(
+            start_date=pytz.UTC.localize(datetime(2023, 1, 1)),
+            end_date=pytz.UTC.localize(datetime(2023, 1, 31))
+        )
+
+        result = list(repo.find_closed_prs_basic_info(RepositoryIdentifier(owner="owner", name="repo"), date_range))
+
+        assert [info.number for info in result] == [2]
+
+    def test__iterate_raw_pages_最終ページリンクあり_残りのページが並列取得され順番に返される(self):
+        """Test _iterate_raw_pages requests the pages after the first in parallel and yields them in order."""
+        import threading
+        import time
+        from scripts.src.infrastructure.repositories.github_repository import _ListingStats
+
+        last_link = '<https://api.github.com/repositories/1/pulls?state=closed&per_page=100&page=5>; rel="last"'
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def request_json(verb, url, parameters=None):
+            if parameters is not None:
+                return {"link": last_link}, ["page 1"]
+            page = int(url.rsplit("page=", 1)[1])
+            with lock:
+                in_flight.append(page)
+                max_in_flight.append(len(in_flight))
+            # Later pages answer first
+            time.sleep(0.01 * (6 - page))
+            with lock:
+                in_flight.remove(page)
+            return {}, [f"page {page}"]
+
+        def create_client():
+            client = MagicMock()
+            client.requester.requestJsonAndCheck.side_effect = request_json
+            return client
+
+        repo = GitHubRepository(create_client(), MagicMock(), github_client_factory=create_client, page_concurrency=3)
+        stats = _ListingStats()
+
+        pages = list(repo._iterate_raw_pages("/repos/owner/repo/pulls", {"per_page": 100}, stats))
+
+        assert pages == [["page 1"], ["page 2"], ["page 3"], ["page 4"], ["page 5"]]
+        assert stats.pages_read == 5
+        assert 1 < max(max_in_flight) <= 3
+
+    def test__iterate_raw_pages_途中で打ち切り_先読み分を超えて取得されない(self):
+        """Test _iterate_raw_pages requests at most page_concurrency pages ahead of a listing stopped early."""
+        from scripts.src.infrastructure.repositories.github_repository import _ListingStats
+
+        last_link = '<https://api.github.com/repositories/1/pulls?page=40>; rel="last"'
+        requested = []
+
+        def request_json(verb, url, parameters=None):
+            requested.append(url)
+            if parameters is not None:
+                return {"link": last_link}, []
+            return {}, []
+
+        def create_client():
+            client = MagicMock()
+            client.requester.requestJsonAndCheck.side_effect = request_json
+            return client
+
+        repo = GitHubRepository(create_client(), MagicMock(), github_client_factory=create_client, page_concurrency=4)
+
+        pages = repo._iterate_raw_pages("/repos/owner/repo/pulls", {"per_page": 100}, _ListingStats())
+        next(pages)
+        next(pages)
+        pages.close()
+
+        # The first page and at most four pages requested ahead
+        assert len(requested) <= 5
+        assert "https://api.github.com/repositories/1/pulls?page=2" in requested
+
+    def test_find_closed_prs_basic_info_search方式_検索上限超過で期間が分割される(self):
+        """Test the search listing splits windows matching more PRs than one search returns."""
+        import pytz
+        from scripts.src.domain.date_range import DateRange
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        def item(number):
+            return {
+                "number": number,
+                "title": f"PR {number}",
+                "closed_at": "2023-01-10T00:00:00Z",
+                "created_at": "2023-01-01T00:00:00Z",
+                "pull_request": {"merged_at": "2023-01-10T00:00:00Z"}
+            }
+
+        queries = []
+
+        def request_json(verb, url, parameters=None):
+            query = parameters["q"]
+            queries.append(query)
+            if "updated:>=" in query:
+                return {}, {"total_count": 500, "items": []}
+            if "2023-01-01T00:00:00Z..2023-01-31T00:00:00Z" in query:
+                return {}, {"total_count": 1500, "items": [item(99)]}
+            number = 1 if "closed:2023-01-01" in query else 2
+            return {}, {"total_count": 1, "items": [item(number)]}
+
+        mock_github = MagicMock()
+        mock_github.per_page = 100
+        mock_github.requester.requestJsonAndCheck.side_effect = request_json
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"), listing_strategy="search")
+        date_range = DateRange(
+            start_date=pytz.UTC.localize(datetime(2023, 1, 1)),
+            end_date=pytz.UTC.localize(datetime(2023, 1, 31))
+        )
+
+        result = list(repo.find_closed_prs_basic_info(RepositoryIdentifier(owner="owner", name="repo"), date_range))
+
+        assert [(info.number, info.is_merged) for info in result] == [(1, True), (2, True)]
+        assert "repo:owner/repo is:pr is:closed" in queries[0]
+        assert len(queries) == 4
+
+    def test_count_closed_prs_検索結果_総件数が1件の取得で返される(self):
+        """Test count_closed_prs reads the total of the closed-PR search from a one-item page."""
+        import pytz
+        from scripts.src.domain.date_range import DateRange
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        mock_github = MagicMock()
+        mock_github.requester.requestJsonAndCheck.return_value = ({}, {"total_count": 1234, "items": []})
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"))
+        date_range = DateRange(
+            start_date=pytz.UTC.localize(datetime(2023, 1, 1)),
+            end_date=pytz.UTC.localize(datetime(2023, 1, 31))
+        )
+
+        count = repo.count_closed_prs(RepositoryIdentifier(owner="owner", name="repo"), date_range)
+
+        assert count == 1234
+        _, kwargs = mock_github.requester.requestJsonAndCheck.call_args
+        assert kwargs["parameters"] == {
+            "q": "repo:owner/repo is:pr is:closed closed:2023-01-01T00:00:00Z..2023-01-31T00:00:00Z",
+            "per_page": 1
+        }
+
+    def test_count_review_comments_最終ページのリンク_総件数が1件の取得で返される(self):
+        """Test count_review_comments reads the total from the last page link of a one-item page."""
+        import pytz
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        mock_github = MagicMock()
+        mock_github.requester.requestJsonAndCheck.return_value = (
+            {"link": '<https://api.github.com/repositories/1/pulls/comments?per_page=1&page=2>; rel="next", '
+                     '<https://api.github.com/repositories/1/pulls/comments?per_page=1&page=873>; rel="last"'},
+            [{"id": 1}]
+        )
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"))
+
+        count = repo.count_review_comments(
+            RepositoryIdentifier(owner="owner", name="repo"), pytz.UTC.localize(datetime(2023, 1, 1))
+        )
+
+        assert count == 873
+        args, kwargs = mock_github.requester.requestJsonAndCheck.call_args
+        assert args == ("GET", "/repos/owner/repo/pulls/comments")
+        assert kwargs["parameters"] == {"per_page": 1, "since": "2023-01-01T00:00:00Z"}
+
+    def test_count_review_comments_リンクなし_取得した件数が返される(self):
+        """Test count_review_comments counts the returned comments when everything fits one page."""
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        mock_github = MagicMock()
+        mock_github.requester.requestJsonAndCheck.return_value = ({}, [])
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"))
+
+        assert repo.count_review_comments(RepositoryIdentifier(owner="owner", name="repo")) == 0
+
+    def test_find_closed_prs_basic_info_issues方式_期間内のPRのみ返される(self):
+        """Test the issues listing follows next links and keeps only closed PRs in range."""
+        import pytz
+        from scripts.src.domain.date_range import DateRange
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+        from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
+
+        issue = {"number": 1, "title": "Issue", "closed_at": "2023-01-10T00:00:00Z"}
+        in_range_pr = {
+            "number": 2, "title": "PR 2", "closed_at": "2023-01-10T00:00:00Z",
+            "pull_request": {"merged_at": None}
+        }
+        out_of_range_pr = {
+            "number": 3, "title": "PR 3", "closed_at": "2022-06-01T00:00:00Z",
+            "pull_request": {"merged_at": "2022-06-01T00:00:00Z"}
+        }
+        responses = {
+            "/repos/owner/repo/issues": (
+                {"link": '<https://api.github.com/repositories/1/issues?page=2>; rel="next"'},
+                [issue, in_range_pr]
+            ),
+            "https://api.github.com/repositories/1/issues?page=2": ({}, [out_of_range_pr])
+        }
+        mock_github = MagicMock()
+        mock_github.per_page = 100
+        mock_github.requester.requestJsonAndCheck.side_effect = (
+            lambda verb, url, parameters=None: responses.get(url, ({}, {"total_count": 0}))
+        )
+        repo = GitHubRepository(mock_github, TimezoneConverter("UTC"), listing_strategy="issues")
+        date_range = DateRange(
+            start_date=pytz.UTC.localize(datetime(2023, 1, 1)),
+            end_date=pytz.UTC.localize(datetime(2023, 1, 31))
+        )
+
+        result = list(repo.find_closed_prs_basic_info(RepositoryIdentifier(owner="owner", name="repo"), date_range))
+
+        assert [(info.number, info.is_merged) for info in result] == [(2, False)]
+        _, kwargs = mock_github.requester.requestJsonAndCheck.call_args_list[0]
+        assert kwargs["parameters"]["since"] == "2023-01-01T00:00:00Z"
+
+    def test__select_listing_strategy_auto_期間の開始日時で選択される(self):
+        """Test auto listing uses the issues API for recent windows and search otherwise."""
+        from datetime import timedelta, timezone
+        from scripts.src.domain.date_range import DateRange
+
+        repo = GitHubRepository(MagicMock(), MagicMock())
+        now = datetime.now(timezone.utc)
+
+        recent = DateRange(start_date=now - timedelta(days=7), end_date=now)
+        old = DateRange(start_date=now - timedelta(days=400), end_date=now - timedelta(days=370))
+
+        assert repo._select_listing_strategy(recent) == "issues"
+        assert repo._select_listing_strategy(old) == "search"
+
+    def test__extract_review_comments_変換中に補完_警告されメトリクスに記録される(self, caplog):
+        """Test _extract_review_comments counts completions triggered while a comment is converted."""
+        class _LazyComment:
+            """Review comment completed by PyGithub once diff_hunk, missing from its payload, is read."""
+            id = 1
+            path = "test.py"
+            original_position = 10
+            commit_id = "abc123"
+            user = MagicMock(login="testuser", type="User")
+            created_at = datetime(2023, 1, 1, 12, 0, 0)
+            body = "Test comment"
+            completed = False
+
+            @property
+            def diff_hunk(self):
+                self.completed = True
+                return "@@ -1 +1 @@"
+
+        fetch_metrics = MagicMock()
+        repo = GitHubRepository(MagicMock(), MagicMock(), fetch_metrics=fetch_metrics)
+        mock_pr = MagicMock()
+        mock_pr.number = 7
+        mock_pr.get_review_comments.return_value = [_LazyComment(), _LazyComment()]
+
+        with caplog.at_level("WARNING", logger="fetch"):
+            comments = repo._extract_review_comments(mock_pr)
+
+        assert [comment.diff_context for comment in comments] == ["@@ -1 +1 @@", "@@ -1 +1 @@"]
+        assert "Fetching review comments of PR #7 made 2 lazy completion requests" in caplog.text
+        fetch_metrics.record_lazy_completions.assert_called_once_with(2)
+
+    def test_get_review_comments_by_pr_複数PRのコメント_PR番号ごとにまとめられる(self):
+        """Test get_review_comments_by_pr groups repository-wide comments by PR number."""
+        import pytz
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+
+        mock_github = MagicMock()
+        mock_converter = MagicMock()
+        mock_converter.convert_to_target_timezone.side_effect = lambda value: value
+        repo = GitHubRepository(mock_github, mock_converter)
+
+        def make_comment(comment_id, pr_number):
+            comment = MagicMock()
+            comment.id = comment_id
+            comment.pull_request_url = f"https://api.github.com/repos/owner/repo/pulls/{pr_number}"
+            comment.diff_hunk = "@@ -1 +1 @@"
+            comment.completed = False
+            return comment
+
+        mock_repo = mock_github.get_repo.return_value
+        mock_repo.get_pulls_review_comments.return_value = [
+            make_comment(1, 10), make_comment(2, 11), make_comment(3, 10)
+        ]
+        since = pytz.timezone("Asia/Tokyo").localize(datetime(2023, 1, 1, 9, 0, 0))
+
+        result = repo.get_review_comments_by_pr(RepositoryIdentifier(owner="owner", name="repo"), since)
+
+        assert {number: [comment.comment_id for comment in comments] for number, comments in result.items()} == {
+            10: [1, 3],
+            11: [2]
+        }
+        _, kwargs = mock_repo.get_pulls_review_comments.call_args
+        assert kwargs["sort"] == "created"
+        assert kwargs["since"] == pytz.UTC.localize(datetime(2023, 1, 1, 0, 0, 0))
+
     def test__extract_diff_context_diff_hunkあり_diff_hunkが返される(self):
         """Test _extract_diff_context returns diff_hunk when available."""
         mock_github = MagicMock()
@@ -79,4 +495,62 @@ class TestGitHubRepository:
 
         result = repo._extract_diff_context(mock_comment)
 
-        assert "@@ Position: 10 in test.py @@" in result
\ No newline at end of file
+        assert "@@ Position: 10 in test.py @@" in result
+
+    def test__get_client_別スレッド_ファクトリで作成したクライアントが返される(self):
+        """Test _get_client creates a dedicated client for other threads."""
+        import threading
+
+        mock_github = MagicMock()
+        mock_converter = MagicMock()
+        thread_client = MagicMock()
+
+        repo = GitHubRepository(mock_github, mock_converter, github_client_factory=lambda: thread_client)
+
+        clients = []
+        thread = threading.Thread(target=lambda: clients.append(repo._get_client()))
+        thread.start()
+        thread.join()
+
+        assert repo._get_client() == mock_github
+        assert clients == [thread_client]
+
+    def test__get_client_ファクトリなし_共有クライアントが返される(self):
+        """Test _get_client falls back to the shared client without a factory."""
+        import threading
+
+        mock_github = MagicMock()
+        mock_converter = MagicMock()
+
+        repo = GitHubRepository(mock_github, mock_converter)
+
+        clients = []
+        thread = threading.Thread(target=lambda: clients.append(repo._get_client()))
+        thread.start()
+        thread.join()
+
+        assert clients == [mock_github]
+
+    def test_list_repositories_組織_組織の全リポジトリが返される(self):
+        """Test list_repositories pages through the repositories of an organization."""
+        from scripts.src.domain.repository_identifier import RepositoryIdentifier
+
+        responses = {
+            "/users/org": ({}, {"login": "org", "type": "Organization"}),
+            "/orgs/org/repos": (
+                {"link": '<https://api.github.com/organizations/1/repos?page=2>; rel="next"'},
+                [{"name": "a", "owner": {"login": "org"}}]
+            ),
+            "https://api.github.com/organizations/1/repos?page=2": ({}, [{"name": "b", "owner": {"login": "org"}}])
+        }
+        mock_github = MagicMock()
+        mock_github.requester.requestJsonAndCheck.side_effect = (
+            lambda verb, url, parameters=None: responses[url]
+        )
+        repo = GitHubRepository(mock_github, MagicMock())
+
+        result = repo.list_repositories("org")
+
+        assert result == [RepositoryIdentifier(owner="org", name="a"), RepositoryIdentifier(owner="org", name="b")]
+        _, kwargs = mock_github.requester.requestJsonAndCheck.call_args_list[1]
+        assert kwargs["parameters"]["type"] == "all"
@@ -0,0 +1,89 @@
+"""
+Tests for PullRequestCatalogRepository.
+"""
+
+from datetime import datetime
+
+import pytz
+
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.pull_request_catalog import PullRequestCatalog
+from scripts.src.domain.pull_request_catalog_entry import PullRequestCatalogEntry
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.repositories.pull_request_catalog_repository import PullRequestCatalogRepository
+
+
+class TestPullRequestCatalogRepository:
+    """Test cases for PullRequestCatalogRepository."""
+
+    def test_save_保存後に読み込み_同じカタログが復元される(self, tmp_path):
+        """Test save and load round-trip the catalog."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        entry = PullRequestCatalogEntry(
+            number=7,
+            title="Fix bug",
+            closed_at=datetime(2023, 1, 2, 3, 4, 5, tzinfo=pytz.UTC),
+            is_merged=True,
+            updated_at=datetime(2023, 1, 3, tzinfo=pytz.UTC),
+            comment_count=2,
+            author="alice",
+            base_branch="main",
+            labels=("bug",)
+        )
+        covered = DateRange(
+            start_date=datetime(2023, 1, 1, tzinfo=pytz.UTC),
+            end_date=datetime(2023, 1, 31, tzinfo=pytz.UTC)
+        )
+        repository = PullRequestCatalogRepository()
+
+        repository.save(PullRequestCatalog(repo_id, entries=[entry], covered_ranges=[covered]), tmp_path)
+        loaded = repository.load(repo_id, tmp_path)
+
+        assert loaded.entries == [entry]
+        assert loaded.covered_ranges == [covered]
+        assert [path.name for path in tmp_path.iterdir()] == ["pr-catalog.json"]
+
+    def test_load_旧形式のコメント数_コメント数が復元される(self, tmp_path):
+        """Test load reads the comment count of catalogs that store it as comment_count."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        (tmp_path / "pr-catalog.json").write_text(
+            '{"repository": "owner/repo", "covered_ranges": [], "pull_requests": {"7": '
+            '{"title": "Fix bug", "closed_at": "2023-01-02T00:00:00+00:00", "merged": true, "comment_count": 2}}}',
+            encoding="utf-8"
+        )
+
+        catalog = PullRequestCatalogRepository().load(repo_id, tmp_path)
+
+        assert catalog.entries == [
+            PullRequestCatalogEntry(
+                number=7,
+                title="Fix bug",
+                closed_at=datetime(2023, 1, 2, tzinfo=pytz.UTC),
+                is_merged=True,
+                comment_count=2
+            )
+        ]
+
+    def test_load_ファイルなし_空のカタログが返される(self, tmp_path):
+        """Test load returns an empty catalog when no file exists."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+
+        catalog = PullRequestCatalogRepository().load(repo_id, tmp_path)
+
+        assert catalog.entries == []
+        assert catalog.covered_ranges == []
+
+    def test_load_別リポジトリのカタログ_空のカタログが返される(self, tmp_path):
+        """Test load ignores the catalog of another repository."""
+        repository = PullRequestCatalogRepository()
+        repository.save(
+            PullRequestCatalog(
+                RepositoryIdentifier(owner="owner", name="other"),
+                entries=[PullRequestCatalogEntry(number=1, title="PR", closed_at=datetime(2023, 1, 1), is_merged=False)]
+            ),
+            tmp_path
+        )
+
+        catalog = repository.load(RepositoryIdentifier(owner="owner", name="repo"), tmp_path)
+
+        assert catalog.entries == []
@@ -0,0 +1,36 @@
+"""
+Tests for SyncStateRepository.
+"""
+
+from datetime import datetime
+
+import pytz
+
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.domain.sync_state import SyncState
+from scripts.src.infrastructure.repositories.sync_state_repository import SyncStateRepository
+
+
+class TestSyncStateRepository:
+    """Test cases for SyncStateRepository."""
+
+    def test_save_保存後に読み込み_同じ同期状態が復元される(self, tmp_path):
+        """Test save and load round-trip the sync state."""
+        repo_id = RepositoryIdentifier(owner="owner", name="repo")
+        sync_state = SyncState(repo_id, datetime(2023, 1, 2, 3, 4, 5, tzinfo=pytz.UTC))
+        repository = SyncStateRepository()
+
+        repository.save(sync_state, tmp_path)
+
+        assert repository.load(repo_id, tmp_path) == sync_state
+
+    def test_load_ファイルなし_Noneが返される(self, tmp_path):
+        """Test load returns None before the first sync."""
+        assert SyncStateRepository().load(RepositoryIdentifier(owner="owner", name="repo"), tmp_path) is None
+
+    def test_load_別リポジトリの同期状態_Noneが返される(self, tmp_path):
+        """Test load ignores the sync state of another repository."""
+        repository = SyncStateRepository()
+        repository.save(SyncState(RepositoryIdentifier(owner="owner", name="other"), datetime(2023, 1, 1)), tmp_path)
+
+        assert repository.load(RepositoryIdentifier(owner="owner", name="repo"), tmp_path) is None
@@ -0,0 +1,89 @@
+"""
+Tests for FetchCostEstimator.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.fetch_plan import FetchPlan
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.infrastructure.services.fetch_cost_estimator import FetchCostEstimator
+
+
+def _plan(**kwargs):
+    return FetchPlan(
+        repository_id=RepositoryIdentifier(owner="owner", name="repo"),
+        date_range=DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)),
+        **kwargs
+    )
+
+
+def _estimates(estimator, plan):
+    return {estimate.strategy: estimate for estimate in estimator.estimate(plan)}
+
+
+class TestFetchCostEstimator:
+    """Test cases for FetchCostEstimator."""
+
+    def test___init___並列数が0_ValueErrorが発生する(self):
+        """Test __init__ rejects a concurrency below 1."""
+        with pytest.raises(ValueError):
+            FetchCostEstimator(concurrency=0)
+
+    def test_estimate_PyGithub_PRごとにリポジトリとPRとコメントページを数える(self):
+        """Test the REST estimate counts the repository, the PR and its comment pages per PR."""
+        plan = _plan(listing_requests=2, counted_count=3, comment_counts=(0, 31, None))
+
+        rest = _estimates(FetchCostEstimator(concurrency=4), plan)["rest"]
+
+        # 6 PRs x (repository + PR) + comment pages 1 + 2 + 1 + 3 x 1 + 2 listing pages
+        assert rest.requests == 2 + 12 + 7
+        assert rest.rest_cost == rest.requests
+        assert rest.graphql_cost == 0
+        assert rest.wall_seconds == pytest.approx(rest.requests * 0.3 / 4)
+
+    def test_estimate_asyncバックエンド_リポジトリ取得とページ数が減る(self):
+        """Test the async backend skips the repository request and reads 100 comments per page."""
+        plan = _plan(comment_counts=(150,))
+
+        estimates = _estimates(FetchCostEstimator(backend="async"), plan)
+
+        assert estimates["rest"].requests == 1 + 2
+        assert estimates["repo-comments"].requests == 0 + 1
+
+    def test_estimate_GraphQL_バッチごとのクエリと点数を数える(self):
+        """Test the GraphQL estimate sends one query per batch and charges points by batch size."""
+        plan = _plan(listing_requests=1, counted_count=120)
+
+        graphql = _estimates(FetchCostEstimator(graphql_batch_size=50), plan)["graphql"]
+
+        assert graphql.requests == 1 + 3
+        assert graphql.rest_cost == 1
+        # 50 PRs x (1 + 50 threads) / 100 = 25.5 -> 26 points; 20 PRs -> 11 points
+        assert graphql.graphql_cost == 26 + 26 + 11
+
+    def test_estimate_リポジトリコメント_コメント総数からページを数える(self):
+        """Test the repository comments estimate pages through every comment since the oldest PR."""
+        plan = _plan(listing_requests=1, counted_count=10, repository_comment_count=3000)
+
+        repository_comments = _estimates(FetchCostEstimator(), plan)["repo-comments"]
+
+        assert repository_comments.requests == 1 + 1 + 100
+        assert repository_comments.wall_seconds == pytest.approx(102 * 0.3)
+
+    def test_estimate_取得対象なし_一覧の取得のみ数える(self):
+        """Test a plan without PRs to fetch only costs the listing."""
+        estimates = _estimates(FetchCostEstimator(), _plan(listing_requests=1))
+
+        assert [estimate.requests for estimate in estimates.values()] == [1, 1, 1]
+
+    def test_estimate_レート制限超過_リセット待ちの時間が加わる(self):
+        """Test requests beyond the hourly rate limit add the hours waited for it to reset."""
+        plan = _plan(counted_count=6000)
+
+        rest = _estimates(FetchCostEstimator(concurrency=100), plan)["rest"]
+
+        assert rest.requests == 18000
+        assert rest.wall_seconds == pytest.approx(18000 * 0.3 / 100 + 3 * 3600)
@@ -0,0 +1,165 @@
+"""
+Tests for GitHubAppTokenProvider against a local stand-in of the GitHub API.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from scripts.src.application.exceptions.github_api_error import GitHubApiError
+from scripts.src.infrastructure.services.github_app_token_provider import (
+    GitHubAppCredentials,
+    GitHubAppTokenProvider
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    """Generate an RSA key pair for signing App JWTs."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def private_key_pem(private_key):
+    """PEM encoding of the App private key."""
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption()
+    ).decode("utf-8")
+
+
+@pytest.fixture
+def github_api(private_key):
+    """Run a stand-in GitHub API that checks App JWTs and mints numbered installation tokens."""
+    state = {"installations": [{"id": 42, "account": {"login": "org"}}], "minted": [], "jwt_claims": []}
+    public_key = private_key.public_key()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _authenticate(self):
+            scheme, _, token = self.headers.get("Authorization", "").partition(" ")
+            try:
+                claims = jwt.decode(token, public_key, algorithms=["RS256"])
+            except jwt.PyJWTError:
+                self._send(401, {"message": "A JSON web token could not be decoded"})
+                return False
+            state["jwt_claims"].append(claims)
+            return scheme == "Bearer"
+
+        def _send(self, status, body):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self._authenticate() and self.path == "/app/installations":
+                self._send(200, state["installations"])
+
+        def do_POST(self):
+            if not self._authenticate():
+                return
+            if self.path != "/app/installations/42/access_tokens":
+                self._send(404, {"message": "Not Found"})
+                return
+            state["minted"].append(self.path)
+            self._send(201, {
+                "token": f"ghs_{len(state['minted'])}",
+                "expires_at": (NOW + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            })
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["base_url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestGitHubAppTokenProvider:
+    """Test cases for GitHubAppTokenProvider."""
+
+    def test_get_token_有効期限内_キャッシュされたトークンが返される(self, github_api, private_key_pem):
+        """Test get_token mints an installation token once and reuses it while it is valid."""
+        provider = GitHubAppTokenProvider(
+            GitHubAppCredentials(app_id="123", private_key=private_key_pem),
+            base_url=github_api["base_url"],
+            clock=lambda: NOW
+        )
+
+        assert provider.get_token() == "ghs_1"
+        assert provider.get_token() == "ghs_1"
+        assert len(github_api["minted"]) == 1
+        assert all(claims["iss"] == "123" for claims in github_api["jwt_claims"])
+
+    def test_get_token_期限直前_新しいトークンが発行される(self, github_api, private_key_pem):
+        """Test get_token refreshes the token shortly before it expires."""
+        now = [NOW]
+        provider = GitHubAppTokenProvider(
+            GitHubAppCredentials(app_id="123", private_key=private_key_pem, installation_id=42),
+            base_url=github_api["base_url"],
+            clock=lambda: now[0]
+        )
+
+        assert provider.get_token() == "ghs_1"
+        now[0] = NOW + timedelta(minutes=54)
+        assert provider.get_token() == "ghs_1"
+        now[0] = NOW + timedelta(minutes=56)
+        assert provider.get_token() == "ghs_2"
+
+    def test_credential_id_トークン更新後_同じIDが返される(self, github_api, private_key_pem):
+        """Test credential_id identifies the installation, so it stays the same when the token is refreshed."""
+        now = [NOW]
+        provider = GitHubAppTokenProvider(
+            GitHubAppCredentials(app_id="123", private_key=private_key_pem),
+            base_url=github_api["base_url"],
+            clock=lambda: now[0]
+        )
+
+        provider.get_token()
+        first_id = provider.credential_id()
+        now[0] = NOW + timedelta(minutes=56)
+        provider.get_token()
+
+        assert provider.credential_id() == first_id == "github-app-installation 42"
+        assert len(github_api["minted"]) == 2
+
+    def test_get_token_複数インストール_GitHubApiErrorが発生する(self, github_api, private_key_pem):
+        """Test get_token asks for the installation ID when the App has several installations."""
+        github_api["installations"].append({"id": 43, "account": {"login": "other"}})
+        provider = GitHubAppTokenProvider(
+            GitHubAppCredentials(app_id="123", private_key=private_key_pem),
+            base_url=github_api["base_url"]
+        )
+
+        with pytest.raises(GitHubApiError, match="org \\(42\\), other \\(43\\)"):
+            provider.get_token()
+
+    def test_get_token_不正な秘密鍵_GitHubApiErrorが発生する(self, github_api):
+        """Test get_token reports a JWT the server rejects."""
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption()
+        ).decode("utf-8")
+        provider = GitHubAppTokenProvider(
+            GitHubAppCredentials(app_id="123", private_key=other_key, installation_id=42),
+            base_url=github_api["base_url"]
+        )
+
+        with pytest.raises(GitHubApiError, match="status 401"):
+            provider.get_token()
@@ -0,0 +1,39 @@
+"""
+Tests for GitHubClientFactory.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from github.Requester import HTTPSRequestsConnectionClass
+
+from scripts.src.infrastructure.services.github_client_factory import GitHubClientFactory
+
+
+class TestGitHubClientFactory:
+    """Test cases for GitHubClientFactory."""
+
+    def test_create_呼び出しごと_新しいクライアントが作成される(self):
+        """Test create builds a new client for each call."""
+        with patch('scripts.src.infrastructure.services.github_client_factory.Github') as mock_github_class:
+            factory = GitHubClientFactory("token")
+
+            factory.create()
+            factory.create()
+
+            assert mock_github_class.call_count == 2
+            mock_github_class.assert_called_with("token")
+
+    def test_create_トランスポート指定_注入した接続クラスが使用され元に戻される(self):
+        """Test create builds clients on the transport connection classes and resets the injection."""
+        from github import Github
+
+        transport = MagicMock()
+        http_class = type("HttpConnection", (), {})
+        https_class = type("HttpsConnection", (), {})
+        transport.connection_classes.return_value = (http_class, https_class)
+        factory = GitHubClientFactory("token", transport)
+
+        client = factory.create()
+
+        assert client.requester._Requester__connectionClass is https_class
+        assert Github("token").requester._Requester__connectionClass is HTTPSRequestsConnectionClass
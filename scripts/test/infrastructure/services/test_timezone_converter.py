@@ -2,7 +2,7 @@
 Tests for TimezoneConverter.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 import pytz
 from scripts.src.infrastructure.services.timezone_converter import TimezoneConverter
 
@@ -42,6 +42,15 @@ class TestTimezoneConverter:
         assert result.hour == 0  # Same as UTC
         assert result.tzinfo.zone == "UTC"
 
+    def test_convert_to_target_timezone_標準ライブラリのUTC日時_ターゲットタイムゾーンに変換される(self):
+        """Test convert_to_target_timezone converts aware datetimes of any tzinfo implementation directly."""
+        converter = TimezoneConverter("Asia/Tokyo")
+
+        result = converter.convert_to_target_timezone(datetime(2023, 1, 1, 15, 30, 0, tzinfo=timezone.utc))
+
+        assert result == pytz.timezone("Asia/Tokyo").localize(datetime(2023, 1, 2, 0, 30, 0))
+        assert result.tzinfo.zone == "Asia/Tokyo"
+
     def test_localize_date_range_日付範囲_ローカライズされた範囲が返される(self):
         """Test localize_date_range returns localized date range."""
         converter = TimezoneConverter("UTC")
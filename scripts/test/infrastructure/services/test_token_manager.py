@@ -5,6 +5,7 @@ Tests for TokenManager.
 import unittest
 from unittest.mock import patch, MagicMock
 
+from scripts.src.infrastructure.services.github_app_token_provider import GitHubAppCredentials
 from scripts.src.infrastructure.services.token_manager import TokenManager
 
 
@@ -81,6 +82,45 @@ class TestTokenManager(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    @patch('scripts.src.infrastructure.services.token_manager.keyring')
+    def test_add_token_保存済みトークンあり_プールに追加される(self, mock_keyring):
+        """Test add_token appends further tokens to the pool entry."""
+        stored = {TokenManager.USERNAME: "first-token"}
+        mock_keyring.get_password.side_effect = lambda service, username: stored.get(username)
+        mock_keyring.set_password.side_effect = lambda service, username, value: stored.__setitem__(username, value)
+
+        count = TokenManager.add_token("second-token")
+        TokenManager.add_token("second-token")
+
+        self.assertEqual(count, 2)
+        self.assertEqual(TokenManager.get_tokens(), ["first-token", "second-token"])
+
+    @patch('scripts.src.infrastructure.services.token_manager.keyring')
+    def test_add_token_保存済みトークンなし_保存トークンになる(self, mock_keyring):
+        """Test add_token stores the first token as the stored token."""
+        mock_keyring.get_password.return_value = None
+
+        TokenManager.add_token("first-token")
+
+        mock_keyring.set_password.assert_called_once_with(
+            TokenManager.SERVICE_NAME,
+            TokenManager.USERNAME,
+            "first-token"
+        )
+
+    @patch('scripts.src.infrastructure.services.token_manager.keyring')
+    def test_store_app_credentials_保存後_同じ認証情報が返される(self, mock_keyring):
+        """Test GitHub App credentials survive a round trip through the keyring."""
+        stored = {}
+        mock_keyring.get_password.side_effect = lambda service, username: stored.get(username)
+        mock_keyring.set_password.side_effect = lambda service, username, value: stored.__setitem__(username, value)
+        credentials = GitHubAppCredentials(app_id="123", private_key="pem", installation_id=45)
+
+        TokenManager.store_app_credentials(credentials)
+
+        self.assertEqual(TokenManager.get_app_credentials(), credentials)
+        self.assertIsNone(TokenManager.get_token())
+
     @patch('scripts.src.infrastructure.services.token_manager.keyring')
     def test_clear_token_成功時_Trueが返される(self, mock_keyring):
         """Test successful token clearing."""
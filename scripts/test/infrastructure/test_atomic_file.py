@@ -0,0 +1,59 @@
+"""
+Tests for write_text_atomically.
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from scripts.src.infrastructure.atomic_file import write_text_atomically
+
+
+class TestWriteTextAtomically:
+    """Test cases for write_text_atomically."""
+
+    def test_write_text_atomically_既存ファイル_内容が置き換えられる(self, tmp_path):
+        """Test write_text_atomically replaces an existing file and leaves no temporary file."""
+        path = tmp_path / "state.json"
+        path.write_text("old", encoding="utf-8")
+
+        write_text_atomically(path, "新しい内容")
+
+        assert path.read_text(encoding="utf-8") == "新しい内容"
+        assert [entry.name for entry in tmp_path.iterdir()] == ["state.json"]
+
+    def test_write_text_atomically_置き換え失敗_元のファイルが残り一時ファイルが削除される(self, tmp_path):
+        """Test write_text_atomically keeps the old file and removes the temporary file when replacing fails."""
+        path = tmp_path / "state.json"
+        path.write_text("old", encoding="utf-8")
+
+        with patch("scripts.src.infrastructure.atomic_file.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_text_atomically(path, "new")
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert os.listdir(tmp_path) == ["state.json"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_write_text_atomically_新規ファイル_umaskに従った権限になる(self, tmp_path):
+        """Test write_text_atomically gives a new file the permissions open() would under the umask."""
+        path = tmp_path / "PR-1.json"
+        umask = os.umask(0)
+        os.umask(umask)
+
+        write_text_atomically(path, "{}")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_write_text_atomically_既存ファイル_元の権限が維持される(self, tmp_path):
+        """Test write_text_atomically keeps the permissions of the file it replaces."""
+        path = tmp_path / "PR-1.json"
+        path.write_text("old", encoding="utf-8")
+        os.chmod(path, 0o640)
+
+        write_text_atomically(path, "new")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
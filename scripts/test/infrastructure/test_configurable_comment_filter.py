@@ -0,0 +1,96 @@
+"""
+Tests for ConfigurableCommentFilter.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from scripts.src.domain.comment_filter_rules import CommentFilterRules
+from scripts.src.domain.review_comment import ReviewComment
+from scripts.src.infrastructure.filters.configurable_comment_filter import ConfigurableCommentFilter
+
+
+def _comment(comment_id, author="human_user", body="Please rename this variable"):
+    return ReviewComment(
+        comment_id=comment_id,
+        file_path="test.py",
+        position=1,
+        commit_id="abc123",
+        author=author,
+        created_at=datetime(2025, 9, 15),
+        body=body,
+        diff_context="diff content"
+    )
+
+
+class TestConfigurableCommentFilter:
+    """Test cases for ConfigurableCommentFilter."""
+
+    def test_rejects_デフォルト規則_Copilotのみ除外される(self):
+        """Test the default rules reject Copilot and keep everyone else."""
+        comment_filter = ConfigurableCommentFilter()
+
+        assert comment_filter.rejects("Copilot", "Bot", "Looks fine")
+        assert comment_filter.rejects("copilot", None, "Looks fine")
+        assert not comment_filter.rejects("dependabot[bot]", "Bot", "LGTM")
+        assert not comment_filter.rejects("human_user", "User", "LGTM")
+
+    def test_rejects_bot規則_接尾辞とアカウント種別で除外される(self):
+        """Test the bot rules reject "[bot]" logins and bot accounts."""
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(
+            excluded_authors=(), exclude_bot_suffix=True, exclude_bot_users=True
+        ))
+
+        assert comment_filter.rejects("renovate[bot]", None, "Update dependency")
+        assert comment_filter.rejects("some-app", "Bot", "Automated review")
+        assert not comment_filter.rejects("human_user", "User", "Automated review")
+        assert not comment_filter.rejects("Copilot", None, "Automated review")
+
+    @pytest.mark.parametrize("body", [
+        "LGTM", "lgtm!", "  Looks good to me.\n", "👍", ":+1: :tada:", "🚀 👍🏽",
+        "```suggestion\n```", "```suggestion:-0+0\n\n```\n"
+    ])
+    def test_rejects_本文プリセット_中身のないコメントが除外される(self, body):
+        """Test the body presets reject approvals, emoji and empty suggestions."""
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(
+            body_presets=("lgtm", "emoji-only", "empty-suggestion")
+        ))
+
+        assert comment_filter.rejects("human_user", "User", body)
+
+    @pytest.mark.parametrize("body", [
+        "LGTM, but please add a test", "👍 but this leaks the file handle",
+        "```suggestion\nreturn None\n```", "Nice"
+    ])
+    def test_rejects_本文プリセット_内容のあるコメントが保持される(self, body):
+        """Test the body presets keep comments with content."""
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(
+            body_presets=("lgtm", "emoji-only", "empty-suggestion")
+        ))
+
+        assert not comment_filter.rejects("human_user", "User", body)
+
+    def test_rejects_本文パターン_大文字小文字を区別せず検索される(self):
+        """Test body patterns are searched case-insensitively."""
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(body_patterns=(r"^nit:?\s*$", "wip")))
+
+        assert comment_filter.rejects("human_user", None, "Nit:")
+        assert comment_filter.rejects("human_user", None, "This is WIP, ignore")
+        assert not comment_filter.rejects("human_user", None, "nit: rename this")
+
+    def test___init___不正な本文パターン_ValueErrorが発生する(self):
+        """Test __init__ rejects invalid body patterns."""
+        with pytest.raises(ValueError, match="Invalid comment body pattern"):
+            ConfigurableCommentFilter(CommentFilterRules(body_patterns=("(unclosed",)))
+
+    def test_filter_comments_規則に一致_一致したコメントが除去される(self):
+        """Test filter_comments applies the author and body rules to review comments."""
+        comment_filter = ConfigurableCommentFilter(CommentFilterRules(
+            exclude_bot_suffix=True, body_presets=("lgtm",)
+        ))
+        comments = [_comment(1), _comment(2, author="Copilot"), _comment(3, author="ci[bot]"), _comment(4, body="LGTM")]
+
+        filtered = comment_filter.filter_comments(comments)
+
+        assert [comment.comment_id for comment in filtered] == [1]
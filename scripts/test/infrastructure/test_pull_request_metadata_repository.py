@@ -6,11 +6,13 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from scripts.src.domain.pull_request_basic_info import PullRequestBasicInfo
 from scripts.src.domain.pull_request_metadata import PullRequestMetadata
 from scripts.src.domain.repository_identifier import RepositoryIdentifier
 from scripts.src.domain.review_comment import ReviewComment
+from scripts.src.domain.interfaces.fetch_metrics_interface import FetchMetricsInterface
 from scripts.src.infrastructure.repositories.pull_request_metadata_repository import PullRequestMetadataRepository
 
 
@@ -328,4 +330,25 @@ class TestPullRequestMetadataRepository:
             result = repo.find_by_pr_number(output_dir, repo_id, 123)
 
             # Assert
-            assert result is None
\ No newline at end of file
+            assert result is None
+
+    def test_save_メトリクス指定_シリアライズと書き込みが計測される(self, tmp_path):
+        """Test save times serialization and disk write as separate phases."""
+        fetch_metrics = MagicMock(spec=FetchMetricsInterface)
+        fetch_metrics.measure.return_value.__enter__.return_value = None
+        fetch_metrics.measure.return_value.__exit__.return_value = False
+        repo = PullRequestMetadataRepository(fetch_metrics)
+        pr_metadata = PullRequestMetadata(
+            number=5,
+            title="Measured PR",
+            closed_at=datetime(2023, 10, 1, 12, 0, 0),
+            is_merged=True,
+            review_comments=[],
+            repository_id=RepositoryIdentifier(owner="test-owner", name="test-repo")
+        )
+
+        repo.save(pr_metadata, tmp_path)
+
+        assert [call.args[0] for call in fetch_metrics.measure.call_args_list] == ["serialization", "disk_write"]
+        saved = json.loads((tmp_path / "pullrequests" / "2023-10-01" / "PR-5.json").read_text(encoding="utf-8"))
+        assert saved["title"] == "Measured PR"
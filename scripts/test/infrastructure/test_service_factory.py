@@ -3,8 +3,20 @@ Tests for ServiceFactory.
 """
 
 import logging
-from unittest.mock import patch, MagicMock
+import time
+from unittest.mock import ANY, patch, MagicMock
+
+import pytest
+import requests
+
+from scripts.src.domain.comment_filter_rules import CommentFilterRules
+from scripts.src.domain.date_partitioning import DatePartitioning
+from scripts.src.infrastructure.collection_options import CollectionOptions
+from scripts.src.infrastructure.http.fetch_metrics import FetchMetrics
+from scripts.src.infrastructure.http.hedging_interceptor import HedgingInterceptor
+from scripts.src.infrastructure.http.http_request import HttpRequest
 from scripts.src.infrastructure.service_factory import ServiceFactory
+from scripts.src.infrastructure.services.github_app_token_provider import GitHubAppCredentials
 
 
 class TestServiceFactory:
@@ -12,16 +24,23 @@ class TestServiceFactory:
 
     def test_create_pr_collection_service_正常作成_サービスが作成される(self):
         """Test create_pr_collection_service creates service correctly."""
-        with patch('scripts.src.infrastructure.service_factory.Github') as mock_github_class, \
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubHttpTransport') as mock_transport_class, \
              patch('scripts.src.infrastructure.service_factory.TimezoneConverter') as mock_timezone_class, \
              patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
              patch('scripts.src.infrastructure.service_factory.PullRequestMetadataRepository') as mock_pr_repo_class, \
-             patch('scripts.src.infrastructure.service_factory.AICommentFilter') as mock_filter_class, \
+             patch('scripts.src.infrastructure.service_factory.PullRequestCatalogRepository') as mock_catalog_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.SyncStateRepository') as mock_sync_state_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.FetchJournal') as mock_journal_class, \
+             patch('scripts.src.infrastructure.service_factory.DeadLetterRepository') as mock_dead_letter_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.ConfigurableCommentFilter') as mock_filter_class, \
              patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
 
             # Setup mock instances
+            mock_client_factory_instance = MagicMock()
+            mock_client_factory_class.return_value = mock_client_factory_instance
             mock_github_instance = MagicMock()
-            mock_github_class.return_value = mock_github_instance
+            mock_client_factory_instance.create.return_value = mock_github_instance
 
             mock_timezone_instance = MagicMock()
             mock_timezone_class.return_value = mock_timezone_instance
@@ -39,21 +58,388 @@ class TestServiceFactory:
             mock_service_class.return_value = mock_service_instance
 
             # Call the method
-            service = ServiceFactory.create_pr_collection_service("token", "UTC")
+            service = ServiceFactory.create_pr_collection_service(CollectionOptions("token"))
 
             # Assertions
             assert service == mock_service_instance
-            mock_github_class.assert_called_once_with("token")
+            mock_client_factory_class.assert_called_once_with("token", mock_transport_class.return_value)
             mock_timezone_class.assert_called_once_with("UTC")
-            mock_github_repo_class.assert_called_once_with(mock_github_instance, mock_timezone_instance)
-            mock_pr_repo_class.assert_called_once_with()  # PullRequestMetadataRepository()
-            mock_filter_class.assert_called_once()
+            mock_github_repo_class.assert_called_once_with(
+                mock_github_instance,
+                mock_timezone_instance,
+                github_client_factory=mock_client_factory_instance.create,
+                listing_strategy="auto",
+                comment_filter=mock_filter_instance,
+                page_concurrency=1,
+                estimate_scan_pages=True,
+                fetch_metrics=None
+            )
+            mock_pr_repo_class.assert_called_once_with(None)  # PullRequestMetadataRepository(fetch_metrics)
+            mock_filter_class.assert_called_once_with(CommentFilterRules())
             mock_service_class.assert_called_once_with(
                 github_repository=mock_github_repo_instance,
                 pr_metadata_repository=mock_pr_repo_instance,
-                comment_filter=mock_filter_instance
+                comment_filter=mock_filter_instance,
+                concurrency=1,
+                detail_fetcher=None,
+                pr_catalog_repository=mock_catalog_repo_class.return_value,
+                sync_state_repository=mock_sync_state_repo_class.return_value,
+                fetch_journal=mock_journal_class.return_value,
+                selection=None,
+                dead_letter_repository=mock_dead_letter_repo_class.return_value,
+                partitioning=None,
+                fetch_budget=None,
+                fetch_metrics=None
+            )
+
+    def test_create_pr_collection_service_カタログ無効_カタログリポジトリが渡されない(self):
+        """Test create_pr_collection_service omits the PR catalog when disabled."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", use_catalog=False))
+
+            _, kwargs = mock_service_class.call_args
+            assert kwargs["pr_catalog_repository"] is None
+
+    def test_create_pr_collection_service_asyncバックエンド_AsyncGitHubRepositoryが使用される(self):
+        """Test create_pr_collection_service wires the async backend."""
+        with patch('scripts.src.infrastructure.service_factory.AsyncGitHubRepository') as mock_async_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.TimezoneConverter') as mock_timezone_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", concurrency=50, backend="async"))
+
+            mock_async_repo_class.assert_called_once_with(
+                "token",
+                mock_timezone_class.return_value,
+                max_connections=50,
+                comment_filter=ANY,
+                request_timeout=HedgingInterceptor.DEFAULT_TIMEOUT_SECONDS
+            )
+            _, kwargs = mock_service_class.call_args
+            assert kwargs["github_repository"] == mock_async_repo_class.return_value
+
+    def test_create_pr_collection_service_HTTPキャッシュ指定_ETagキャッシュが登録される(self, tmp_path):
+        """Test create_pr_collection_service installs the ETag cache in the shared transport."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", http_cache_directory=tmp_path))
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors] == [
+                "RetryInterceptor",
+                "RateLimitSchedulerInterceptor",
+                "ETagCacheInterceptor",
+                "SharedRateLimitBudgetInterceptor",
+                "HedgingInterceptor"
+            ]
+            assert transport._interceptors[2]._cache._cache_directory == tmp_path
+
+    def test_create_pr_collection_service_HTTPキャッシュ無効_ETagキャッシュが登録されない(self):
+        """Test create_pr_collection_service leaves the cache out of the transport when disabled."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", http_cache=False))
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors] == [
+                "RetryInterceptor",
+                "RateLimitSchedulerInterceptor",
+                "SharedRateLimitBudgetInterceptor",
+                "HedgingInterceptor"
+            ]
+
+    def test_create_pr_collection_service_共有予算無効_共有予算が登録されない(self):
+        """Test create_pr_collection_service leaves the shared rate limit budget out when disabled."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", http_cache=False, shared_rate_limit_budget=False))
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors] == [
+                "RetryInterceptor",
+                "RateLimitSchedulerInterceptor",
+                "HedgingInterceptor"
+            ]
+
+    def test_create_pr_collection_service_ヘッジ指定_タイムアウトとヘッジが設定される(self):
+        """Test create_pr_collection_service configures the timeout and hedging of the transport."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", http_cache=False, request_timeout=5.0, hedge_requests=True)
+            )
+
+            transport = mock_client_factory_class.call_args.args[1]
+            hedging = transport._interceptors[-1]
+            assert isinstance(hedging, HedgingInterceptor)
+            assert hedging._timeout == 5.0
+            assert hedging._hedging
+
+    def test_create_http_transport_共有予算の待機がタイムアウトより長い_タイムアウトせず1回だけ送信される(self):
+        """Test the request timeout does not count the wait for the shared rate limit budget to refill."""
+        budget = MagicMock()
+        budget.acquire.side_effect = lambda credential_key, resource: time.sleep(0.3)
+        response = requests.Response()
+        response.status_code = 200
+
+        with patch('scripts.src.infrastructure.service_factory.SharedRateLimitBudget', return_value=budget):
+            transport = ServiceFactory._create_http_transport(1, False, None, request_timeout=0.1)
+        with patch.object(transport._session, "request", return_value=response) as mock_request:
+            result = transport.send(HttpRequest(method="GET", url="https://api.github.com/repos/owner/repo"))
+
+        assert result is response
+        budget.acquire.assert_called_once()
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["timeout"] == 0.1
+
+    def test_create_pr_collection_service_タイムアウトなしでヘッジなし_ヘッジインターセプターが登録されない(self):
+        """Test create_pr_collection_service leaves the hedging interceptor out without timeout and hedging."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", http_cache=False, shared_rate_limit_budget=False, request_timeout=None)
+            )
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors] == [
+                "RetryInterceptor",
+                "RateLimitSchedulerInterceptor"
+            ]
+
+    def test_create_pr_collection_service_リクエスト上限と期限指定_予算が転送とサービスで共有される(self):
+        """Test create_pr_collection_service counts requests innermost against the budget the service checks."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", http_cache=False, max_requests=500, deadline=1800.0)
+            )
+
+            transport = mock_client_factory_class.call_args.args[1]
+            budget_interceptor = transport._interceptors[-1]
+            assert type(budget_interceptor).__name__ == "RequestBudgetInterceptor"
+            fetch_budget = mock_service_class.call_args.kwargs["fetch_budget"]
+            assert budget_interceptor._fetch_budget is fetch_budget
+            assert fetch_budget._max_requests == 500
+            assert fetch_budget._deadline == 1800.0
+
+    def test_create_pr_collection_service_asyncバックエンドでリクエスト上限_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects request budgets for the async backend, which bypasses the transport."""
+        with pytest.raises(ValueError, match="request budgets"):
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", backend="async", max_requests=100))
+
+    def test_create_pr_collection_service_メトリクス指定_転送とリポジトリとサービスで共有される(self):
+        """Test create_pr_collection_service records responses innermost in the metrics the service and repositories time phases in."""
+        fetch_metrics = FetchMetrics()
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.PullRequestMetadataRepository') as mock_pr_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", http_cache=False, max_requests=500, fetch_metrics=fetch_metrics)
+            )
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors[-2:]] == [
+                "RequestBudgetInterceptor",
+                "RequestMetricsInterceptor"
+            ]
+            assert transport._interceptors[-1]._fetch_metrics is fetch_metrics
+            assert mock_github_repo_class.call_args.kwargs["fetch_metrics"] is fetch_metrics
+            mock_pr_repo_class.assert_called_once_with(fetch_metrics)
+            assert mock_service_class.call_args.kwargs["fetch_metrics"] is fetch_metrics
+
+    def test_create_pr_collection_service_asyncバックエンドでメトリクス_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects fetch metrics for the async backend, which bypasses the transport."""
+        with pytest.raises(ValueError, match="fetch metrics"):
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", backend="async", fetch_metrics=FetchMetrics()))
+
+    def test_create_pr_collection_service_asyncバックエンドで複数トークン_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects additional tokens for the async backend, which bypasses the token pool."""
+        with pytest.raises(ValueError, match="multiple tokens"):
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", backend="async", additional_tokens=("second",))
+            )
+
+    def test_create_pr_collection_service_asyncバックエンドでヘッジ_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects hedging for the async backend."""
+        with pytest.raises(ValueError, match="hedged requests"):
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", backend="async", hedge_requests=True))
+
+    def test_create_pr_collection_service_追加トークン指定_トークンプールが登録される(self):
+        """Test create_pr_collection_service spreads requests across all tokens inside the scheduler."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", http_cache=False, shared_rate_limit_budget=False, additional_tokens=("second",))
+            )
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors] == [
+                "RetryInterceptor",
+                "RateLimitSchedulerInterceptor",
+                "TokenPoolInterceptor",
+                "HedgingInterceptor"
+            ]
+            assert transport._interceptors[2]._token_pool.size == 2
+
+    def test_create_pr_collection_service_追加トークンとHTTPキャッシュ_キャッシュがトークンプールの内側に登録される(self, tmp_path):
+        """Test create_pr_collection_service caches responses under the pooled credential that fetched them."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions(
+                    "token", http_cache_directory=tmp_path, shared_rate_limit_budget=False,
+                    additional_tokens=("second",)
+                )
+            )
+
+            transport = mock_client_factory_class.call_args.args[1]
+            assert [type(interceptor).__name__ for interceptor in transport._interceptors] == [
+                "RetryInterceptor",
+                "RateLimitSchedulerInterceptor",
+                "TokenPoolInterceptor",
+                "ETagCacheInterceptor",
+                "HedgingInterceptor"
+            ]
+
+    def test_create_pr_collection_service_GitHubApp指定_インストールトークンがプールに加わる(self):
+        """Test create_pr_collection_service authenticates through the token pool with a GitHub App only."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory') as mock_client_factory_class, \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository'), \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService'):
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions(
+                    None, http_cache=False, shared_rate_limit_budget=False,
+                    github_app=GitHubAppCredentials(app_id="123", private_key="key")
+                )
+            )
+
+            token, transport = mock_client_factory_class.call_args.args
+            assert token is None
+            assert type(transport._interceptors[-2]).__name__ == "TokenPoolInterceptor"
+            assert transport._interceptors[-2]._token_pool.size == 1
+
+    def test_create_pr_collection_service_asyncバックエンドでGitHubApp_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects GitHub App authentication for the async backend."""
+        with pytest.raises(ValueError, match="GitHub App"):
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions(None, backend="async", github_app=GitHubAppCredentials(app_id="123", private_key="key"))
             )
 
+    def test_create_pr_collection_service_graphql方式_GraphQLフェッチャーが使用される(self):
+        """Test create_pr_collection_service wires the GraphQL detail fetcher."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'), \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.GraphQLPullRequestDetailFetcher') as mock_fetcher_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", strategy="graphql", graphql_batch_size=20))
+
+            args, kwargs = mock_fetcher_class.call_args
+            assert args[1] == mock_github_repo_class.return_value
+            assert kwargs["batch_size"] == 20
+            _, kwargs = mock_service_class.call_args
+            assert kwargs["detail_fetcher"] == mock_fetcher_class.return_value
+
+    def test_create_pr_collection_service_コメントフィルター規則指定_取得とサービスで同じフィルターが使用される(self):
+        """Test create_pr_collection_service shares one compiled comment filter between fetching and the service."""
+        rules = CommentFilterRules(exclude_bot_suffix=True)
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'), \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.GraphQLPullRequestDetailFetcher') as mock_fetcher_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(
+                CollectionOptions("token", strategy="graphql", comment_filter_rules=rules)
+            )
+
+            comment_filter = mock_service_class.call_args.kwargs["comment_filter"]
+            assert comment_filter.rules == rules
+            assert mock_github_repo_class.call_args.kwargs["comment_filter"] is comment_filter
+            assert mock_fetcher_class.call_args.kwargs["comment_filter"] is comment_filter
+
+    def test_create_pr_collection_service_repo_comments方式_リポジトリコメントフェッチャーが使用される(self):
+        """Test create_pr_collection_service wires the repository comments detail fetcher."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'), \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.RepositoryCommentsPullRequestDetailFetcher') as mock_fetcher_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", strategy="repo-comments"))
+
+            mock_fetcher_class.assert_called_once_with(mock_github_repo_class.return_value)
+            _, kwargs = mock_service_class.call_args
+            assert kwargs["detail_fetcher"] == mock_fetcher_class.return_value
+
+    def test_create_pr_collection_service_日付分割指定_サービスに渡され走査見積もりが省かれる(self):
+        """Test create_pr_collection_service passes partitioning on and skips the per-listing scan estimate."""
+        partitioning = DatePartitioning(mode="adaptive", target_pr_count=200)
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'), \
+             patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", listing_strategy="search", partitioning=partitioning))
+
+            assert mock_service_class.call_args.kwargs["partitioning"] == partitioning
+            assert mock_github_repo_class.call_args.kwargs["estimate_scan_pages"] is False
+
+    def test_create_pr_collection_service_scan方式で日付分割_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects partitioning scan listings, including the async backend."""
+        import pytest
+
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'):
+            with pytest.raises(ValueError, match="partitioning"):
+                ServiceFactory.create_pr_collection_service(
+                    CollectionOptions("token", listing_strategy="scan", partitioning=DatePartitioning())
+                )
+            with pytest.raises(ValueError, match="partitioning"):
+                ServiceFactory.create_pr_collection_service(
+                    CollectionOptions("token", backend="async", partitioning=DatePartitioning())
+                )
+
+    def test_create_pr_collection_service_未知の取得方式_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects unknown fetch strategies."""
+        import pytest
+
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'):
+            with pytest.raises(ValueError):
+                ServiceFactory.create_pr_collection_service(CollectionOptions("token", strategy="unknown"))
+
+    def test_create_pr_collection_service_asyncバックエンドでsearch方式_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects listing strategies the async backend lacks."""
+        import pytest
+
+        with patch('scripts.src.infrastructure.service_factory.GitHubClientFactory'):
+            with pytest.raises(ValueError):
+                ServiceFactory.create_pr_collection_service(CollectionOptions("token", backend="async", listing_strategy="search"))
+
+    def test_create_pr_collection_service_未知のバックエンド_ValueErrorが発生する(self):
+        """Test create_pr_collection_service rejects unknown backends."""
+        import pytest
+
+        with pytest.raises(ValueError):
+            ServiceFactory.create_pr_collection_service(CollectionOptions("token", backend="unknown"))
+
     def test_setup_logging_verboseモード_デバッグレベルが設定される(self):
         """Test setup_logging sets debug level when verbose is True."""
         logger = ServiceFactory.setup_logging(verbose=True)
@@ -106,4 +492,43 @@ class TestServiceFactory:
                     assert service == mock_service_instance
                     mock_summary_repo_class.assert_called_once()
                     mock_metadata_repo_class.assert_called_once()
-                    mock_service_class.assert_called_once_with(mock_summary_repo_instance, mock_metadata_repo_instance)
\ No newline at end of file
+                    mock_service_class.assert_called_once_with(mock_summary_repo_instance, mock_metadata_repo_instance)
+
+    def test_create_multi_repository_collection_service_正常作成_リポジトリごとにサービスが作成される(self):
+        """Test create_multi_repository_collection_service creates one collection service per call sharing the GitHub repository."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.RateLimitSchedulerInterceptor'), \
+             patch('scripts.src.infrastructure.service_factory.AdaptiveConcurrencyLimiter') as mock_limiter_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+            mock_service_class.side_effect = lambda **kwargs: MagicMock(**kwargs)
+
+            service = ServiceFactory.create_multi_repository_collection_service(
+                CollectionOptions("token", concurrency=3),
+                repository_concurrency=2
+            )
+            first = service._collection_service_factory(CommentFilterRules())
+            second = service._collection_service_factory(CommentFilterRules())
+
+            assert first is not second
+            assert first.fetch_journal is not second.fetch_journal
+            assert first.github_repository == second.github_repository == mock_github_repo_class.return_value
+            mock_github_repo_class.assert_called_once()
+            mock_limiter_class.assert_called_once_with(6)
+
+    def test_create_multi_repository_collection_service_除外規則が異なる_規則ごとにリポジトリとフィルターが作成される(self):
+        """Test create_multi_repository_collection_service applies each repository's comment filter rules."""
+        with patch('scripts.src.infrastructure.service_factory.GitHubRepository') as mock_github_repo_class, \
+             patch('scripts.src.infrastructure.service_factory.PRReviewCollectionService') as mock_service_class:
+            mock_github_repo_class.side_effect = lambda *args, **kwargs: MagicMock(**kwargs)
+            mock_service_class.side_effect = lambda **kwargs: MagicMock(**kwargs)
+            bot_rules = CommentFilterRules(exclude_bot_suffix=True)
+
+            service = ServiceFactory.create_multi_repository_collection_service(CollectionOptions("token"))
+            default_service = service._collection_service_factory(CommentFilterRules())
+            bot_service = service._collection_service_factory(bot_rules)
+
+            assert default_service.comment_filter.rules == CommentFilterRules()
+            assert bot_service.comment_filter.rules == bot_rules
+            assert bot_service.github_repository.comment_filter is bot_service.comment_filter
+            assert default_service.github_repository is service._github_repository
+            assert bot_service.github_repository is not default_service.github_repository
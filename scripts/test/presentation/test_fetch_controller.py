@@ -3,10 +3,17 @@ Tests for FetchController.
 """
 
 import argparse
+import json
 import pytest
 from datetime import datetime
 from unittest.mock import patch, MagicMock
-from scripts.src.presentation.fetch_controller import FetchController, parse_date
+from scripts.src.domain.date_partitioning import DatePartitioning
+from scripts.src.domain.date_range import DateRange
+from scripts.src.domain.fetch_plan import FetchPlan
+from scripts.src.domain.repository_identifier import RepositoryIdentifier
+from scripts.src.presentation.fetch_controller import (
+    FetchController, format_duration, parse_date, parse_duration, parse_non_negative_int, parse_positive_int
+)
 
 
 class TestFetchController:
@@ -43,6 +50,303 @@ class TestFetchController:
 
                 mock_service.collect_review_comments.assert_called_once()
 
+    def test__setup_argument_parser_最小レビューコメント数0_受け付けられる(self):
+        """Test --min-review-comments accepts 0, which sets no minimum."""
+        controller = FetchController()
+
+        parsed_args = controller._parser.parse_args(
+            ['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--min-review-comments', '0']
+        )
+
+        assert parsed_args.min_review_comments == 0
+
+    def test_run_並列数指定_サービスに並列数が渡される(self):
+        """Test run passes --concurrency to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory') as mock_factory:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = [
+                    '--from-date', '2023-01-01', '--to-date', '2023-01-02',
+                    '--token', 'test_token', '--concurrency', '8'
+                ]
+
+                controller.run(args)
+
+                options = mock_factory.create_pr_collection_service.call_args.args[0]
+                assert options.concurrency == 8
+
+    def test_run_graphql方式指定_サービスに取得方式とバッチサイズが渡される(self):
+        """Test run passes --strategy and --graphql-batch-size to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = [
+                    '--from-date', '2023-01-01', '--to-date', '2023-01-02',
+                    '--token', 'test_token', '--strategy', 'graphql', '--graphql-batch-size', '25'
+                ]
+
+                controller.run(args)
+
+                options = mock_create.call_args.args[0]
+                assert options.strategy == "graphql"
+                assert options.graphql_batch_size == 25
+
+    def test_run_トークン複数指定_追加トークンがサービスに渡される(self):
+        """Test run passes every repeated --token to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = [
+                    '--from-date', '2023-01-01', '--to-date', '2023-01-02',
+                    '--token', 'first', '--token', 'second', '--token', 'first'
+                ]
+
+                controller.run(args)
+
+                options = mock_create.call_args.args[0]
+                assert options.github_token == "first"
+                assert options.additional_tokens == ("second",)
+
+    def test_run_コメントフィルター設定_ワークスペース設定の規則がサービスに渡される(self):
+        """Test run passes the comment filter rules of workspace.yml to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig') as mock_config:
+                controller = FetchController()
+                args = ['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token']
+
+                controller.run(args)
+
+                options = mock_create.call_args.args[0]
+                assert options.comment_filter_rules == mock_config.return_value.get_comment_filter_rules.return_value
+
+    def test_run_タイムアウトとヘッジ指定_サービスに渡される(self):
+        """Test run passes --request-timeout and --hedge to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = [
+                    '--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token',
+                    '--request-timeout', '7.5', '--hedge'
+                ]
+
+                controller.run(args)
+
+                options = mock_create.call_args.args[0]
+                assert options.request_timeout == 7.5
+                assert options.hedge_requests is True
+
+    def test_run_日付分割指定_サービスに分割方法が渡される(self):
+        """Test run passes --partition and --partition-size to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = [
+                    '--from-date', '2020-01-01', '--to-date', '2025-12-31', '--token', 'test_token',
+                    '--partition', 'adaptive', '--partition-size', '300'
+                ]
+
+                controller.run(args)
+
+                options = mock_create.call_args.args[0]
+                assert options.partitioning == DatePartitioning(mode="adaptive", target_pr_count=300)
+
+    def test_run_日付分割なし_分割方法にNoneが渡される(self):
+        """Test run lists the date range as one when --partition is not given."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+
+                controller.run(['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token'])
+
+                options = mock_create.call_args.args[0]
+                assert options.partitioning is None
+
+    def test_run_リクエスト上限と期限指定_サービスに渡される(self):
+        """Test run passes --max-requests and --deadline in seconds to the service factory."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = [
+                    '--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token',
+                    '--max-requests', '500', '--deadline', '30m'
+                ]
+
+                controller.run(args)
+
+                options = mock_create.call_args.args[0]
+                assert options.max_requests == 500
+                assert options.deadline == 1800.0
+
+    def test__get_github_tokens_引数なし_キーリングの全トークンが返される(self):
+        """Test _get_github_tokens uses every token stored in the keyring."""
+        with patch('scripts.src.presentation.fetch_controller.TokenManager') as mock_manager:
+            mock_manager.get_tokens.return_value = ["first", "second"]
+            controller = FetchController()
+
+            assert controller._get_github_tokens(None) == ["first", "second"]
+
+    def test__get_github_tokens_GitHubAppのみ_空のリストが返される(self):
+        """Test _get_github_tokens does not require a token when GitHub App credentials are stored."""
+        with patch('scripts.src.presentation.fetch_controller.TokenManager') as mock_manager:
+            with patch.dict('os.environ', {}, clear=True):
+                mock_manager.get_tokens.return_value = []
+                controller = FetchController()
+
+                assert controller._get_github_tokens(None, has_app_credentials=True) == []
+
+    def test_run_同期指定_同期が実行される(self):
+        """Test run syncs instead of collecting when --sync is given."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+                args = ['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token', '--sync']
+
+                controller.run(args)
+
+                mock_service = mock_create.return_value
+                mock_service.sync_review_comments.assert_called_once()
+                mock_service.collect_review_comments.assert_not_called()
+
+    def test_run_失敗PRの再取得指定_デッドレターのPRのみ再取得される(self):
+        """Test run replays the dead-letter list instead of collecting when --retry-failed is given."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig') as mock_config:
+                controller = FetchController()
+                args = ['--token', 'test_token', '--retry-failed']
+
+                controller.run(args)
+
+                mock_service = mock_create.return_value
+                mock_service.retry_failed_prs.assert_called_once()
+                _, retry_kwargs = mock_service.retry_failed_prs.call_args
+                assert retry_kwargs["repository_id"] == mock_config.return_value.get_repository_identifier.return_value
+                mock_service.collect_review_comments.assert_not_called()
+
+    def test_run_失敗PRの再取得と同期を同時指定_エラー終了する(self):
+        """Test run rejects --retry-failed combined with --sync."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('builtins.print') as mock_print:
+                controller = FetchController()
+
+                with pytest.raises(SystemExit):
+                    controller.run(['--token', 'test_token', '--retry-failed', '--sync'])
+
+                mock_print.assert_called_once_with("Error: --retry-failed cannot be combined with --sync or --resume")
+                mock_create.assert_not_called()
+
+    def test_run_計画指定_詳細を取得せず見積もりが表示される(self):
+        """Test run prints the fetch plan with an estimate per strategy instead of collecting when --plan is given."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig') as mock_config:
+                with patch('builtins.print') as mock_print:
+                    repo_id = RepositoryIdentifier(owner="owner", name="repo")
+                    mock_config.return_value.get_repository_identifier.return_value = repo_id
+                    mock_service = mock_create.return_value
+                    mock_service.plan_collection.return_value = FetchPlan(
+                        repository_id=repo_id,
+                        date_range=DateRange(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2)),
+                        catalogued_count=5,
+                        existing_count=5,
+                        counted_count=10,
+                        listing_requests=1,
+                        repository_comment_count=40
+                    )
+                    controller = FetchController()
+                    args = [
+                        '--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token',
+                        '--plan', '--strategy', 'graphql'
+                    ]
+
+                    controller.run(args)
+
+                    mock_service.plan_collection.assert_called_once()
+                    mock_service.collect_review_comments.assert_not_called()
+                    printed = "\n".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+                    assert "5 skipped because their files already exist" in printed
+                    assert "PRs to fetch: 10" in printed
+                    assert "graphql*" in printed
+                    assert "repo-comments" in printed
+
+    def test_run_計画と再開を同時指定_エラー終了する(self):
+        """Test run rejects --plan combined with --resume."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('builtins.print') as mock_print:
+                controller = FetchController()
+
+                with pytest.raises(SystemExit):
+                    controller.run(['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token',
+                                    '--plan', '--resume'])
+
+                mock_print.assert_called_once_with("Error: --plan cannot be combined with --sync, --resume or --retry-failed")
+                mock_create.assert_not_called()
+
+    def test_run_メトリクスJSON指定_集計が表示されファイルに書き出される(self, tmp_path, monkeypatch):
+        """Test run passes fetch metrics to the service factory, prints them and writes them as JSON."""
+        monkeypatch.chdir(tmp_path)
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                with patch('builtins.print') as mock_print:
+                    controller = FetchController()
+                    args = [
+                        '--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token',
+                        '--metrics-json'
+                    ]
+
+                    controller.run(args)
+
+                    fetch_metrics = mock_create.call_args.args[0].fetch_metrics
+                    assert fetch_metrics is not None
+                    mock_create.return_value.collect_review_comments.assert_called_once()
+                    printed = "\n".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+                    assert "Fetch metrics" in printed
+                    assert "Throughput: 0 PRs" in printed
+                    saved = json.loads((tmp_path / "workspace" / "temp" / "fetch-metrics.json").read_text(encoding="utf-8"))
+                    assert set(saved["phase_seconds"]) == set(fetch_metrics.PHASES)
+
+    def test_run_メトリクス指定なし_メトリクスは記録されない(self):
+        """Test run records no fetch metrics unless --metrics or --metrics-json is given."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_pr_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig'):
+                controller = FetchController()
+
+                controller.run(['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token'])
+
+                assert mock_create.call_args.args[0].fetch_metrics is None
+
+    def test_run_複数リポジトリ指定_複数リポジトリ収集サービスが使用される(self):
+        """Test run collects the repositories of --repos without reading workspace.yml."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_multi_repository_collection_service') as mock_create:
+            with patch('scripts.src.presentation.fetch_controller.WorkspaceConfig') as mock_config:
+                controller = FetchController()
+                args = [
+                    '--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token',
+                    '--repos', 'owner/a, owner/b', '--repo-concurrency', '2'
+                ]
+
+                controller.run(args)
+
+                _, create_kwargs = mock_create.call_args
+                assert create_kwargs["repository_concurrency"] == 2
+                _, collect_kwargs = mock_create.return_value.collect_review_comments.call_args
+                assert collect_kwargs["repository_ids"] == [
+                    RepositoryIdentifier(owner="owner", name="a"),
+                    RepositoryIdentifier(owner="owner", name="b")
+                ]
+                mock_config.assert_not_called()
+
+    def test_run_組織指定_組織のリポジトリが収集される(self):
+        """Test run collects every repository listed for --org."""
+        with patch('scripts.src.presentation.fetch_controller.ServiceFactory.create_multi_repository_collection_service') as mock_create:
+            controller = FetchController()
+            args = ['--from-date', '2023-01-01', '--to-date', '2023-01-02', '--token', 'test_token', '--org', 'org']
+
+            controller.run(args)
+
+            mock_service = mock_create.return_value
+            mock_service.list_organization_repositories.assert_called_once_with("org")
+            _, collect_kwargs = mock_service.collect_review_comments.call_args
+            assert collect_kwargs["repository_ids"] == mock_service.list_organization_repositories.return_value
+
     def test_run_エラー発生_適切なエラーメッセージが表示される(self):
         """Test run method handles errors appropriately."""
         controller = FetchController()
@@ -156,4 +460,51 @@ class TestParseDate:
         """Test parse_date raises ArgumentTypeError for invalid date."""
         date_str = "invalid-date"
         with pytest.raises(argparse.ArgumentTypeError):
-            parse_date(date_str)
\ No newline at end of file
+            parse_date(date_str)
+
+
+class TestParsePositiveInt:
+    """Test cases for parse_positive_int function."""
+
+    def test_parse_positive_int_正の整数_整数が返される(self):
+        """Test parse_positive_int parses a positive integer."""
+        assert parse_positive_int("4") == 4
+
+    def test_parse_positive_int_0以下_ArgumentTypeErrorが発生する(self):
+        """Test parse_positive_int rejects values below 1."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_positive_int("0")
+
+    def test_parse_positive_int_整数以外_ArgumentTypeErrorが発生する(self):
+        """Test parse_positive_int rejects non-integer values."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_positive_int("many")
+
+    def test_parse_non_negative_int_0_0が返される(self):
+        """Test parse_non_negative_int accepts zero."""
+        assert parse_non_negative_int("0") == 0
+
+    def test_parse_non_negative_int_負の値_ArgumentTypeErrorが発生する(self):
+        """Test parse_non_negative_int rejects negative values."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_non_negative_int("-1")
+
+    def test_parse_duration_単位付き_秒数が返される(self):
+        """Test parse_duration converts seconds, minutes, hours and plain numbers to seconds."""
+        assert parse_duration("90s") == 90.0
+        assert parse_duration("30m") == 1800.0
+        assert parse_duration("2h") == 7200.0
+        assert parse_duration("45") == 45.0
+
+    def test_parse_duration_不正な値_ArgumentTypeErrorが発生する(self):
+        """Test parse_duration rejects unknown formats and non-positive durations."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_duration("30 minutes")
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_duration("0m")
+
+    def test_format_duration_各単位_大きい2単位で表される(self):
+        """Test format_duration shows seconds, minutes with seconds, or hours with minutes."""
+        assert format_duration(12.4) == "12s"
+        assert format_duration(200) == "3m20s"
+        assert format_duration(3900) == "1h05m"